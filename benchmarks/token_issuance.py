@@ -0,0 +1,81 @@
+"""Tokens per second of `create_access_token_for_user` and `TokenIssuer`.
+
+Run from repository root:
+
+    poetry run python benchmarks/token_issuance.py [tokens]
+
+Asymmetric algorithms are measured only if `cryptography` is installed.
+"""
+
+import datetime
+import sys
+import time
+import uuid
+from typing import Callable, Union
+
+from tvsched.application.models.auth import UserInToken
+from tvsched.application.utils.auth import create_access_token_for_user
+from tvsched.application.utils.token_issuer import TokenIssuer
+from tvsched.entities.auth import Role
+
+EXPIRES_IN = datetime.timedelta(hours=1)
+
+
+def generate_keys() -> dict[str, Union[str, bytes]]:
+    keys: dict[str, Union[str, bytes]] = {
+        "HS256": "s" * 32,
+        "HS384": "s" * 48,
+        "HS512": "s" * 64,
+    }
+
+    try:
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+    except ImportError:
+        return keys
+
+    def to_pem(private_key: object) -> bytes:
+        return private_key.private_bytes(  # type: ignore
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+
+    rsa_key = to_pem(rsa.generate_private_key(public_exponent=65537, key_size=2048))
+    keys["RS256"] = rsa_key
+    keys["PS256"] = rsa_key
+    keys["ES256"] = to_pem(ec.generate_private_key(ec.SECP256R1()))
+    keys["EdDSA"] = to_pem(ed25519.Ed25519PrivateKey.generate())
+
+    return keys
+
+
+def measure(issue: Callable[[], str], tokens: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(tokens):
+        issue()
+
+    return tokens / (time.perf_counter() - started_at)
+
+
+def main(tokens: int) -> None:
+    user = UserInToken(id=uuid.uuid4(), role=Role.USER)
+    created_at = datetime.datetime.utcnow()
+
+    print(f"{'algorithm':<10}{'function, tokens/s':>20}{'issuer, tokens/s':>20}")
+    for algorithm, key in generate_keys().items():
+        issuer = TokenIssuer({"1": key}, "1", algorithm, EXPIRES_IN)
+
+        function_rate = measure(
+            lambda: create_access_token_for_user(
+                user, created_at, key, EXPIRES_IN, algorithm  # type: ignore
+            ),
+            tokens,
+        )
+        issuer_rate = measure(lambda: issuer.issue(user, created_at), tokens)
+
+        print(f"{algorithm:<10}{function_rate:>20.0f}{issuer_rate:>20.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,5 @@
+-- Supports range scans over episode air dates of shows from user schedule
+-- (ScheduleRepo.get_upcoming_episodes_from_schedule).
+-- CONCURRENTLY can not run inside transaction block.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS episodes_show_id_air_date_idx
+    ON episodes (show_id, air_date);
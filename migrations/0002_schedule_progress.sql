@@ -0,0 +1,40 @@
+-- Per (user, show) progress of watching shows from user schedule.
+-- Maintained incrementally by ScheduleRepo and EpisodeRepo writes.
+CREATE TABLE IF NOT EXISTS schedule_progress (
+    user_id uuid NOT NULL,
+    show_id integer NOT NULL REFERENCES shows (id) ON DELETE CASCADE,
+    watched_count integer NOT NULL DEFAULT 0,
+    total_count integer NOT NULL DEFAULT 0,
+    -- first unwatched episode by (season, number), NULL if all episodes are watched
+    next_episode_id integer,
+    PRIMARY KEY (user_id, show_id)
+);
+
+CREATE INDEX IF NOT EXISTS schedule_progress_show_id_idx
+    ON schedule_progress (show_id);
+
+-- Finds next unwatched episode and users who watched deleted episode.
+CREATE INDEX IF NOT EXISTS episodes_show_id_season_number_idx
+    ON episodes (show_id, season, number);
+CREATE INDEX IF NOT EXISTS watched_episodes_episode_id_idx
+    ON watched_episodes (episode_id);
+
+INSERT INTO schedule_progress (user_id, show_id, watched_count, total_count, next_episode_id)
+SELECT sts.user_id, sts.show_id,
+    (
+        SELECT count(*) FROM watched_episodes we
+        JOIN episodes e ON e.id = we.episode_id
+        WHERE we.user_id = sts.user_id AND e.show_id = sts.show_id
+    ),
+    (SELECT count(*) FROM episodes e WHERE e.show_id = sts.show_id),
+    (
+        SELECT e.id FROM episodes e
+        WHERE e.show_id = sts.show_id AND NOT EXISTS (
+            SELECT 1 FROM watched_episodes we
+            WHERE we.user_id = sts.user_id AND we.episode_id = e.id
+        )
+        ORDER BY e.season, e.number, e.id
+        LIMIT 1
+    )
+FROM shows_to_schedules sts
+ON CONFLICT (user_id, show_id) DO NOTHING;
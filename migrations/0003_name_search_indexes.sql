@@ -0,0 +1,14 @@
+-- Trigram indexes for fuzzy search over show and actor names
+-- (ShowRepo.search, ActorRepo.search). They support `<%` word similarity
+-- operator, so query matches words inside name and tolerates typos.
+-- CONCURRENTLY can not run inside transaction block.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS shows_name_trgm_idx
+    ON shows USING gin (name gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS actors_name_trgm_idx
+    ON actors USING gin (name gin_trgm_ops);
+
+-- Finds shows by actors matched in cast search.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS actors_to_shows_actor_id_idx
+    ON actors_to_shows (actor_id);
@@ -0,0 +1,20 @@
+-- Ranked suggested shows precomputed per user by SuggestionRefresher.
+CREATE TABLE IF NOT EXISTS user_suggestions (
+    user_id uuid PRIMARY KEY,
+    show_ids integer[] NOT NULL,
+    computed_at timestamptz NOT NULL
+);
+
+-- Users whose suggestions are stale. Filled by ScheduleRepo and ActorRepo
+-- writes in the same statement as change of schedule or cast.
+CREATE TABLE IF NOT EXISTS suggestion_refresh_queue (
+    user_id uuid PRIMARY KEY,
+    enqueued_at timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS suggestion_refresh_queue_enqueued_at_idx
+    ON suggestion_refresh_queue (enqueued_at);
+
+INSERT INTO suggestion_refresh_queue (user_id)
+SELECT DISTINCT user_id FROM shows_to_schedules
+ON CONFLICT (user_id) DO NOTHING;
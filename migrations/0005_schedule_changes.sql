@@ -0,0 +1,38 @@
+-- Change log of user schedules for delta sync
+-- (ScheduleRepo.get_schedule_changes_since).
+CREATE TABLE IF NOT EXISTS schedule_versions (
+    user_id uuid PRIMARY KEY,
+    -- version of the latest change of user schedule
+    version bigint NOT NULL,
+    -- max version of compacted changes, older cursors get reset
+    purged_version bigint NOT NULL DEFAULT 0
+);
+
+-- The latest change per (user, kind, target). Kind is SHOW for shows
+-- in schedule and WATCHED_EPISODE for watched episodes.
+CREATE TABLE IF NOT EXISTS schedule_changes (
+    user_id uuid NOT NULL,
+    kind text NOT NULL,
+    target_id integer NOT NULL,
+    version bigint NOT NULL,
+    deleted boolean NOT NULL,
+    changed_at timestamptz NOT NULL DEFAULT now(),
+    PRIMARY KEY (user_id, kind, target_id)
+);
+
+CREATE INDEX IF NOT EXISTS schedule_changes_user_id_version_idx
+    ON schedule_changes (user_id, version);
+-- Finds changes to compact (ScheduleRepo.compact_schedule_changes).
+CREATE INDEX IF NOT EXISTS schedule_changes_deleted_changed_at_idx
+    ON schedule_changes (changed_at) WHERE deleted;
+
+-- Current state of schedules is logged as version 1.
+INSERT INTO schedule_changes (user_id, kind, target_id, version, deleted)
+SELECT user_id, 'SHOW', show_id, 1, false FROM shows_to_schedules
+UNION ALL
+SELECT user_id, 'WATCHED_EPISODE', episode_id, 1, false FROM watched_episodes
+ON CONFLICT (user_id, kind, target_id) DO NOTHING;
+
+INSERT INTO schedule_versions (user_id, version)
+SELECT DISTINCT user_id, 1 FROM schedule_changes
+ON CONFLICT (user_id) DO NOTHING;
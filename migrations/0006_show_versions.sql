@@ -0,0 +1,3 @@
+-- Version stamp of show for conditional reads (ShowRepo.get_version).
+-- Bumped by updates of show, its cast and actors from its cast.
+ALTER TABLE shows ADD COLUMN IF NOT EXISTS version bigint NOT NULL DEFAULT 1;
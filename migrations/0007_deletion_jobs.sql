@@ -0,0 +1,26 @@
+-- Soft deletion of shows and users. Rows are hidden from reads at once
+-- and removed with their dependent rows by DeletionWorker in chunks.
+ALTER TABLE shows ADD COLUMN IF NOT EXISTS deleted_at timestamptz;
+ALTER TABLE users ADD COLUMN IF NOT EXISTS deleted_at timestamptz;
+
+-- Resumable deletion of soft-deleted show or user. `step` is index
+-- of the current chunked step of target kind.
+CREATE TABLE IF NOT EXISTS deletion_jobs (
+    id bigserial PRIMARY KEY,
+    kind text NOT NULL,
+    show_id integer,
+    user_id uuid,
+    step integer NOT NULL DEFAULT 0,
+    deleted_rows bigint NOT NULL DEFAULT 0,
+    created_at timestamptz NOT NULL DEFAULT now(),
+    updated_at timestamptz NOT NULL DEFAULT now(),
+    finished_at timestamptz,
+    CHECK ((show_id IS NULL) <> (user_id IS NULL))
+);
+
+CREATE INDEX IF NOT EXISTS deletion_jobs_unfinished_idx
+    ON deletion_jobs (id) WHERE finished_at IS NULL;
+
+-- Finds chunks of schedules with deleted show.
+CREATE INDEX IF NOT EXISTS shows_to_schedules_show_id_idx
+    ON shows_to_schedules (show_id);
@@ -0,0 +1,85 @@
+-- Hash partitioning of watched_episodes by user_id into 16 partitions.
+-- Generated by tvsched.adapters.repos.schedule.partitioning.
+DO $$
+DECLARE
+    definitions text[];
+    definition text;
+BEGIN
+    IF (
+        SELECT count(*) FROM pg_inherits
+        WHERE inhparent = 'watched_episodes'::regclass
+    ) = 16 THEN
+        RETURN;
+    END IF;
+
+    -- reads go on while rows are copied, writes wait
+    LOCK TABLE watched_episodes IN EXCLUSIVE MODE;
+
+    -- constraints of the table and indexes not backing them, foreign keys last
+    SELECT array_agg(d.definition ORDER BY d.position) INTO definitions
+    FROM (
+        SELECT format(
+            'ALTER TABLE watched_episodes ADD CONSTRAINT %I %s',
+            c.conname, pg_get_constraintdef(c.oid)
+        ) AS definition,
+        CASE WHEN c.contype = 'f' THEN 2 ELSE 0 END AS position
+        FROM pg_constraint c
+        WHERE c.conrelid = 'watched_episodes'::regclass
+        AND c.contype IN ('p', 'u', 'c', 'x', 'f')
+        UNION ALL
+        -- indexes of partitioned table are created on ONLY it
+        SELECT replace(pg_get_indexdef(i.indexrelid), ' ON ONLY ', ' ON '), 1
+        FROM pg_index i
+        WHERE i.indrelid = 'watched_episodes'::regclass
+        AND NOT EXISTS (
+            SELECT 1 FROM pg_constraint c
+            WHERE c.conrelid = i.indrelid AND c.conindid = i.indexrelid
+        )
+    ) d;
+
+    CREATE TABLE watched_episodes_new (LIKE watched_episodes INCLUDING DEFAULTS)
+    PARTITION BY HASH (user_id);
+    CREATE TABLE watched_episodes_new_p0 PARTITION OF watched_episodes_new FOR VALUES WITH (MODULUS 16, REMAINDER 0);
+    CREATE TABLE watched_episodes_new_p1 PARTITION OF watched_episodes_new FOR VALUES WITH (MODULUS 16, REMAINDER 1);
+    CREATE TABLE watched_episodes_new_p2 PARTITION OF watched_episodes_new FOR VALUES WITH (MODULUS 16, REMAINDER 2);
+    CREATE TABLE watched_episodes_new_p3 PARTITION OF watched_episodes_new FOR VALUES WITH (MODULUS 16, REMAINDER 3);
+    CREATE TABLE watched_episodes_new_p4 PARTITION OF watched_episodes_new FOR VALUES WITH (MODULUS 16, REMAINDER 4);
+    CREATE TABLE watched_episodes_new_p5 PARTITION OF watched_episodes_new FOR VALUES WITH (MODULUS 16, REMAINDER 5);
+    CREATE TABLE watched_episodes_new_p6 PARTITION OF watched_episodes_new FOR VALUES WITH (MODULUS 16, REMAINDER 6);
+    CREATE TABLE watched_episodes_new_p7 PARTITION OF watched_episodes_new FOR VALUES WITH (MODULUS 16, REMAINDER 7);
+    CREATE TABLE watched_episodes_new_p8 PARTITION OF watched_episodes_new FOR VALUES WITH (MODULUS 16, REMAINDER 8);
+    CREATE TABLE watched_episodes_new_p9 PARTITION OF watched_episodes_new FOR VALUES WITH (MODULUS 16, REMAINDER 9);
+    CREATE TABLE watched_episodes_new_p10 PARTITION OF watched_episodes_new FOR VALUES WITH (MODULUS 16, REMAINDER 10);
+    CREATE TABLE watched_episodes_new_p11 PARTITION OF watched_episodes_new FOR VALUES WITH (MODULUS 16, REMAINDER 11);
+    CREATE TABLE watched_episodes_new_p12 PARTITION OF watched_episodes_new FOR VALUES WITH (MODULUS 16, REMAINDER 12);
+    CREATE TABLE watched_episodes_new_p13 PARTITION OF watched_episodes_new FOR VALUES WITH (MODULUS 16, REMAINDER 13);
+    CREATE TABLE watched_episodes_new_p14 PARTITION OF watched_episodes_new FOR VALUES WITH (MODULUS 16, REMAINDER 14);
+    CREATE TABLE watched_episodes_new_p15 PARTITION OF watched_episodes_new FOR VALUES WITH (MODULUS 16, REMAINDER 15);
+
+    INSERT INTO watched_episodes_new SELECT * FROM watched_episodes;
+
+    DROP TABLE watched_episodes;
+    ALTER TABLE watched_episodes_new RENAME TO watched_episodes;
+    ALTER TABLE watched_episodes_new_p0 RENAME TO watched_episodes_p0;
+    ALTER TABLE watched_episodes_new_p1 RENAME TO watched_episodes_p1;
+    ALTER TABLE watched_episodes_new_p2 RENAME TO watched_episodes_p2;
+    ALTER TABLE watched_episodes_new_p3 RENAME TO watched_episodes_p3;
+    ALTER TABLE watched_episodes_new_p4 RENAME TO watched_episodes_p4;
+    ALTER TABLE watched_episodes_new_p5 RENAME TO watched_episodes_p5;
+    ALTER TABLE watched_episodes_new_p6 RENAME TO watched_episodes_p6;
+    ALTER TABLE watched_episodes_new_p7 RENAME TO watched_episodes_p7;
+    ALTER TABLE watched_episodes_new_p8 RENAME TO watched_episodes_p8;
+    ALTER TABLE watched_episodes_new_p9 RENAME TO watched_episodes_p9;
+    ALTER TABLE watched_episodes_new_p10 RENAME TO watched_episodes_p10;
+    ALTER TABLE watched_episodes_new_p11 RENAME TO watched_episodes_p11;
+    ALTER TABLE watched_episodes_new_p12 RENAME TO watched_episodes_p12;
+    ALTER TABLE watched_episodes_new_p13 RENAME TO watched_episodes_p13;
+    ALTER TABLE watched_episodes_new_p14 RENAME TO watched_episodes_p14;
+    ALTER TABLE watched_episodes_new_p15 RENAME TO watched_episodes_p15;
+
+    -- indexes and constraints are built after copying, once per partition
+    FOREACH definition IN ARRAY COALESCE(definitions, '{}') LOOP
+        EXECUTE definition;
+    END LOOP;
+END
+$$;
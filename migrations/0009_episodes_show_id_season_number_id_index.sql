@@ -0,0 +1,7 @@
+-- Keyset pagination over episodes of show ordered by (season, number, id)
+-- (EpisodeRepo.get_episodes_page). Replaces index on (show_id, season, number),
+-- so ties of season and number are ordered by index too.
+-- CONCURRENTLY can not run inside transaction block.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS episodes_show_id_season_number_id_idx
+    ON episodes (show_id, season, number, id);
+DROP INDEX CONCURRENTLY IF EXISTS episodes_show_id_season_number_idx;
@@ -0,0 +1,14 @@
+-- Sessions of refresh tokens (SessionRepo). Only sha256 hex digest
+-- of token is stored, renewal of access token looks session up
+-- by unique index on it.
+CREATE TABLE IF NOT EXISTS sessions (
+    id bigserial PRIMARY KEY,
+    token_hash text NOT NULL UNIQUE,
+    user_id uuid NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    created_at timestamptz NOT NULL DEFAULT now(),
+    expires_at timestamptz NOT NULL,
+    revoked_at timestamptz
+);
+
+-- Finds sessions of deleted users for cascades.
+CREATE INDEX IF NOT EXISTS sessions_user_id_idx ON sessions (user_id);
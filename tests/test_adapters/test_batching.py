@@ -0,0 +1,87 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from tvsched.adapters.repos.batching import BatchLoader, order_by_ids
+from tvsched.application.exceptions.actor import ActorNotFoundError
+from tvsched.application.models.common import EntitiesByIds
+from tvsched.entities.actor import Actor
+
+
+def test_order_by_ids() -> None:
+    actors = {
+        1: Actor(id=1, name="a", image_url="url"),
+        3: Actor(id=3, name="c", image_url="url"),
+    }
+
+    res = order_by_ids([3, 2, 1, 3], actors)
+
+    assert res == EntitiesByIds(found=[actors[3], actors[1]], missing_ids=[2])
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_merges_gets_of_one_tick() -> None:
+    actors = {
+        1: Actor(id=1, name="a", image_url="url"),
+        2: Actor(id=2, name="b", image_url="url"),
+    }
+    get_many = mock.AsyncMock(side_effect=lambda ids: order_by_ids(ids, actors))
+    loader = BatchLoader(get_many, ActorNotFoundError)
+
+    res = await asyncio.gather(loader.get(2), loader.get(1), loader.get(2))
+
+    assert res == [actors[2], actors[1], actors[2]]
+    get_many.assert_awaited_once_with([2, 1])
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_raises_not_found_error_for_missing_id() -> None:
+    actors = {1: Actor(id=1, name="a", image_url="url")}
+    get_many = mock.AsyncMock(side_effect=lambda ids: order_by_ids(ids, actors))
+    loader = BatchLoader(get_many, ActorNotFoundError)
+
+    found, missing = await asyncio.gather(
+        loader.get(1), loader.get(5), return_exceptions=True
+    )
+
+    assert found == actors[1]
+    assert isinstance(missing, ActorNotFoundError)
+    assert missing.actor_id == 5
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_splits_batches_by_max_size() -> None:
+    actors = {i: Actor(id=i, name=str(i), image_url="url") for i in range(5)}
+    get_many = mock.AsyncMock(side_effect=lambda ids: order_by_ids(ids, actors))
+    loader = BatchLoader(get_many, ActorNotFoundError, max_batch_size=2)
+
+    res = await asyncio.gather(*(loader.get(i) for i in range(5)))
+
+    assert res == [actors[i] for i in range(5)]
+    assert get_many.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_raises_not_found_error_for_id_missing_in_result() -> None:
+    actors = {1: Actor(id=1, name="a", image_url="url")}
+    get_many = mock.AsyncMock(
+        return_value=EntitiesByIds(found=[actors[1]], missing_ids=[])
+    )
+    loader = BatchLoader(get_many, ActorNotFoundError)
+
+    missing, found = await asyncio.gather(
+        loader.get(5), loader.get(1), return_exceptions=True
+    )
+
+    assert found == actors[1]
+    assert isinstance(missing, ActorNotFoundError)
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_cancels_gets_of_cancelled_load() -> None:
+    get_many = mock.AsyncMock(side_effect=asyncio.CancelledError)
+    loader = BatchLoader(get_many, ActorNotFoundError)
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(loader.get(1), timeout=1)
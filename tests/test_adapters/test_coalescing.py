@@ -0,0 +1,123 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from tvsched.adapters.repos.coalescing import SingleFlight, coalesce
+from tvsched.adapters.repos.routing import (
+    ConnectionRouter,
+    ReadConsistency,
+    StalenessPolicy,
+)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_in_flight_call() -> None:
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def fetch() -> list[int]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return [1, 2]
+
+    res = await asyncio.gather(
+        *(single_flight.do("ShowRepo.get", 5, fetch) for _ in range(10))
+    )
+
+    assert res == [[1, 2]] * 10
+    assert calls == 1
+    stats = single_flight.stats("ShowRepo.get")
+    assert stats.calls == 10
+    assert stats.executions == 1
+    assert stats.collapsed == 9
+
+
+@pytest.mark.asyncio
+async def test_single_flight_does_not_share_different_args() -> None:
+    single_flight = SingleFlight()
+    fetch = mock.AsyncMock(side_effect=[1, 2])
+
+    res = await asyncio.gather(
+        single_flight.do("ShowRepo.get", 1, fetch),
+        single_flight.do("ShowRepo.get", 2, fetch),
+    )
+
+    assert res == [1, 2]
+    assert fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_exception() -> None:
+    single_flight = SingleFlight()
+
+    async def fetch() -> None:
+        await asyncio.sleep(0)
+        raise ValueError
+
+    res = await asyncio.gather(
+        single_flight.do("ShowRepo.get", 1, fetch),
+        single_flight.do("ShowRepo.get", 1, fetch),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, ValueError) for r in res)
+    assert single_flight.stats("ShowRepo.get").executions == 1
+
+
+@pytest.mark.asyncio
+async def test_coalesce_skips_reads_pinned_to_primary() -> None:
+    single_flight = SingleFlight()
+    router = ConnectionRouter(mock.AsyncMock())
+    router.pin()
+    fetch = mock.AsyncMock(return_value=1)
+
+    await coalesce(single_flight, router, "ShowRepo.get", 1, fetch)
+
+    fetch.assert_awaited_once_with(router.for_write())
+    assert single_flight.stats("ShowRepo.get").calls == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesce_does_not_share_reads_routed_to_different_targets() -> None:
+    single_flight = SingleFlight()
+    primary = mock.AsyncMock()
+    replica = mock.AsyncMock()
+    replica.fetch_one.return_value = {"lag": 0}
+    policy = StalenessPolicy(consistency=ReadConsistency.REPLICA)
+    router = ConnectionRouter(primary, [replica, primary], policy)
+    fetch = mock.AsyncMock(side_effect=[1, 2])
+
+    res = await asyncio.gather(
+        coalesce(single_flight, router, "ShowRepo.get", 1, fetch),
+        coalesce(single_flight, router, "ShowRepo.get", 1, fetch),
+    )
+
+    assert res == [1, 2]
+    assert {call.args[0] for call in fetch.await_args_list} == {primary, replica}
+
+
+@pytest.mark.asyncio
+async def test_coalesce_runs_shared_read_when_first_caller_is_cancelled() -> None:
+    single_flight = SingleFlight()
+    router = ConnectionRouter(mock.AsyncMock())
+    started = asyncio.Event()
+
+    async def fetch(db: object) -> int:
+        started.set()
+        await asyncio.sleep(0.01)
+        return 1
+
+    first = asyncio.create_task(
+        coalesce(single_flight, router, "ShowRepo.get", 1, fetch)
+    )
+    await started.wait()
+    second = asyncio.create_task(
+        coalesce(single_flight, router, "ShowRepo.get", 1, fetch)
+    )
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == 1
+    assert single_flight.stats("ShowRepo.get").executions == 1
@@ -0,0 +1,79 @@
+import datetime
+from unittest import mock
+
+import pytest
+
+from tvsched.adapters.repos.deletion import DeletionWorker
+from tvsched.adapters.repos.deletion.steps import STEPS
+from tvsched.entities.deletion import DeletionTargetKind
+
+
+def job_record(step: int, deleted_rows: int = 0, finished: bool = False) -> dict:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return dict(
+        id=1,
+        kind="SHOW",
+        show_id=5,
+        user_id=None,
+        step=step,
+        deleted_rows=deleted_rows,
+        created_at=now,
+        updated_at=now,
+        finished_at=now if finished else None,
+    )
+
+
+def transactional_db() -> mock.AsyncMock:
+    db = mock.AsyncMock()
+    db.transaction = mock.MagicMock()
+    return db
+
+
+@pytest.mark.asyncio
+async def test_deletion_worker_deletes_chunk_of_current_step() -> None:
+    db = transactional_db()
+    db.fetch_one.side_effect = [job_record(step=1), job_record(step=1, deleted_rows=2)]
+    db.execute.return_value = 2
+    worker = DeletionWorker(db, mock.Mock(), chunk_size=2)
+
+    job = await worker.delete_chunk()
+
+    assert job is not None and job.step == 1 and not job.finished
+    assert job.steps_count == len(STEPS[DeletionTargetKind.SHOW])
+    step = STEPS[DeletionTargetKind.SHOW][1]
+    db.execute.assert_awaited_once_with(
+        step.query, values=dict(target_id=5, chunk_size=2)
+    )
+    progress = db.fetch_one.await_args_list[1].kwargs["values"]
+    assert progress == dict(id=1, step=1, deleted=2, finished=False)
+
+
+@pytest.mark.asyncio
+async def test_deletion_worker_finishes_job_after_last_step() -> None:
+    db = transactional_db()
+    last_step = len(STEPS[DeletionTargetKind.SHOW]) - 1
+    db.fetch_one.side_effect = [
+        job_record(step=last_step),
+        job_record(step=last_step + 1, deleted_rows=1, finished=True),
+    ]
+    db.execute.return_value = 1
+    worker = DeletionWorker(db, mock.Mock(), chunk_size=1)
+
+    job = await worker.delete_chunk()
+
+    assert job is not None and job.finished
+    db.execute.assert_awaited_once_with(
+        STEPS[DeletionTargetKind.SHOW][last_step].query, values=dict(target_id=5)
+    )
+    progress = db.fetch_one.await_args_list[1].kwargs["values"]
+    assert progress == dict(id=1, step=last_step + 1, deleted=1, finished=True)
+
+
+@pytest.mark.asyncio
+async def test_deletion_worker_without_jobs() -> None:
+    db = transactional_db()
+    db.fetch_one.return_value = None
+    worker = DeletionWorker(db, mock.Mock())
+
+    assert await worker.delete_chunk() is None
+    db.execute.assert_not_awaited()
@@ -0,0 +1,133 @@
+import asyncio
+import datetime
+import json
+from unittest import mock
+
+import pytest
+
+from tvsched.adapters.cache.invalidation import (
+    EntityChanged,
+    EntityKind,
+    InvalidationBus,
+    InvalidationPublisher,
+    publish_changes,
+)
+
+
+def sent_payloads(db: mock.AsyncMock) -> list[dict]:
+    return [
+        json.loads(c.kwargs["values"]["payload"]) for c in db.execute.await_args_list
+    ]
+
+
+@pytest.mark.asyncio
+async def test_publish_sends_notification() -> None:
+    db = mock.AsyncMock()
+    publisher = InvalidationPublisher(channel="test")
+
+    await publisher.publish(db, EntityKind.SHOW, [3])
+
+    assert db.execute.await_args.kwargs["values"]["channel"] == "test"
+    assert sent_payloads(db) == [{"kind": "show", "ids": [3]}]
+
+
+@pytest.mark.asyncio
+async def test_publish_changes_without_publisher() -> None:
+    db = mock.AsyncMock()
+
+    await publish_changes(None, db, EntityKind.SHOW, [3])
+
+    db.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_batch_merges_notifications() -> None:
+    db = mock.AsyncMock()
+    publisher = InvalidationPublisher(max_ids_per_notification=2)
+
+    async with publisher.batch(db):
+        await publisher.publish(db, EntityKind.EPISODE, [3, 1])
+        await publisher.publish(db, EntityKind.EPISODE, [1, 2])
+        await publisher.publish(db, EntityKind.ACTOR, [7])
+        db.execute.assert_not_awaited()
+
+    assert sent_payloads(db) == [
+        {"kind": "episode", "ids": [1, 2]},
+        {"kind": "episode", "ids": [3]},
+        {"kind": "actor", "ids": [7]},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_does_not_notify_after_failure_in_transaction() -> None:
+    db = mock.AsyncMock()
+    db.__aenter__.return_value.raw_connection = mock.Mock(
+        **{"is_in_transaction.return_value": True}
+    )
+    publisher = InvalidationPublisher()
+
+    with pytest.raises(ValueError):
+        async with publisher.batch(db):
+            await publisher.publish(db, EntityKind.SHOW, [3])
+            raise ValueError()
+
+    db.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_batch_logs_failed_notification_after_failure() -> None:
+    db = mock.AsyncMock()
+    db.__aenter__.return_value.raw_connection = mock.Mock(
+        **{"is_in_transaction.return_value": False}
+    )
+    db.execute.side_effect = OSError()
+    logger = mock.Mock()
+    publisher = InvalidationPublisher(logger=logger)
+
+    with pytest.raises(ValueError):
+        async with publisher.batch(db):
+            await publisher.publish(db, EntityKind.SHOW, [3])
+            raise ValueError()
+
+    assert sent_payloads(db) == [{"kind": "show", "ids": [3]}]
+    logger.exception.assert_called_once()
+
+
+def test_bus_dispatches_notification() -> None:
+    logger = mock.Mock()
+    subscriber = mock.Mock()
+    bus = InvalidationBus("postgresql://", logger)
+    bus.subscribe(subscriber)
+
+    bus._on_notification(
+        None, 1, "tvsched_invalidation", '{"kind": "show", "ids": [1]}'
+    )
+    bus._on_notification(None, 1, "tvsched_invalidation", "not json")
+
+    subscriber.on_entity_changed.assert_called_once_with(
+        EntityChanged(kind=EntityKind.SHOW, ids=(1,))
+    )
+    logger.error.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_bus_reconnects_with_backoff_after_any_error() -> None:
+    logger = mock.Mock()
+    bus = InvalidationBus(
+        "postgresql://",
+        logger,
+        reconnect_delay=datetime.timedelta(seconds=1),
+        max_reconnect_delay=datetime.timedelta(seconds=3),
+    )
+    listen = mock.AsyncMock(
+        side_effect=[ValueError, RuntimeError, ValueError, None, asyncio.CancelledError]
+    )
+
+    with mock.patch.object(bus, "_listen", listen), mock.patch(
+        "tvsched.adapters.cache.invalidation.asyncio.sleep"
+    ) as sleep:
+        with pytest.raises(asyncio.CancelledError):
+            await bus._listen_forever()
+
+    assert [c.args[0] for c in sleep.await_args_list] == [1, 2, 3, 1]
+    assert logger.exception.call_count == 3
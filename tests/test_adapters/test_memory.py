@@ -0,0 +1,280 @@
+import datetime
+import uuid
+from typing import Any, AsyncIterator
+
+import pytest
+import pytest_asyncio
+
+from tvsched.adapters.repos.memory import (
+    MemoryActorRepo,
+    MemoryEpisodeRepo,
+    MemoryScheduleRepo,
+    MemorySessionRepo,
+    MemoryShowRepo,
+    MemoryStore,
+    MemoryUserRepo,
+    ReadOnlyStoreError,
+)
+from tvsched.adapters.repos.sqlite import (
+    SQLiteActorRepo,
+    SQLiteDatabase,
+    SQLiteEpisodeRepo,
+    SQLiteScheduleRepo,
+    SQLiteShowRepo,
+    SQLiteUserRepo,
+)
+from tvsched.application.exceptions.actor import ActorAlreadyInShowCastError
+from tvsched.application.exceptions.auth import (
+    InvalidRefreshTokenError,
+    PasswordHashNotUpdatedError,
+)
+from tvsched.application.exceptions.schedule import (
+    EpisodeOrScheduleNotFoundError,
+    ShowAlreadyExistsInScheduleError,
+)
+from tvsched.application.models.actor import (
+    ActorAdd,
+    ActorInShowCast,
+    ActorUpdate,
+    ShowCast,
+)
+from tvsched.application.models.auth import (
+    SessionAdd,
+    SessionInRepo,
+    UserInRepoAdd,
+    UserInToken,
+)
+from tvsched.application.models.episode import (
+    EpisodeAdd,
+    EpisodesCursor,
+    EpisodeUpdate,
+    SeasonAirDatesShift,
+)
+from tvsched.application.models.schedule import EpisodeInSchedule, ShowInSchedule
+from tvsched.application.models.show import ShowAdd, ShowUpdate
+from tvsched.application.use_cases.schedule.add_show_to_schedule_use_case import (
+    IAddShowToScheduleUseCaseRepo,
+)
+from tvsched.entities.auth import Role
+
+AIR_DATE = datetime.datetime(2022, 1, 1)
+
+
+class Repos:
+    def __init__(self, shows: Any, actors: Any, episodes: Any, schedule: Any) -> None:
+        self.shows = shows
+        self.actors = actors
+        self.episodes = episodes
+        self.schedule = schedule
+
+
+async def fill(repos: Repos, users: Any) -> uuid.UUID:
+    for name in ["Game of Thrones", "Breaking Bad", "Better Call Saul"]:
+        await repos.shows.add(ShowAdd(name, 5, "url"))
+    for name in ["Peter Dinklage", "Bryan Cranston", "Bob Odenkirk"]:
+        await repos.actors.add(ActorAdd(name, "url"))
+    for show_id, actor_id in [(1, 1), (2, 2), (2, 3), (3, 3)]:
+        cast = ActorInShowCast(show_id=show_id, actor_id=actor_id)
+        await repos.actors.add_actor_to_show_cast(cast)
+    for show_id in [1, 2]:
+        for season, number in [(2, 1), (1, 2), (1, 1)]:
+            air_date = AIR_DATE + datetime.timedelta(days=10 * season + number)
+            episode = EpisodeAdd("e", season, number, air_date, show_id)
+            await repos.episodes.add(episode)
+    await users.add_user(UserInRepoAdd("user", "hash", Role.USER))
+    user_id = (await users.get_user_by_username("user")).id
+
+    for show_id in [1, 2]:
+        await repos.schedule.add_show_to_schedule(ShowInSchedule(show_id, user_id))
+    await repos.schedule.mark_episode_as_watched(EpisodeInSchedule(3, user_id))
+    await repos.schedule.mark_episode_as_watched(EpisodeInSchedule(6, user_id))
+
+    return user_id
+
+
+async def read(repos: Repos, user_id: uuid.UUID) -> list[Any]:
+    starts_at, ends_at = AIR_DATE, AIR_DATE + datetime.timedelta(days=15)
+    schedule = repos.schedule
+    return [
+        await repos.shows.get(2),
+        await repos.shows.get_version(2),
+        await repos.shows.get_versioned(2),
+        await repos.shows.get_details(2, user_id=user_id),
+        await repos.shows.get_details(3),
+        await repos.shows.get_many([3, 7, 1]),
+        await repos.shows.get_shows(limit=2, offset=1),
+        await repos.shows.search("odenkirk", limit=5, include_cast=True),
+        await repos.actors.get_many([2, 1]),
+        await repos.actors.search("brian cranston", limit=5),
+        await repos.episodes.get_episodes(1),
+        await repos.episodes.get_many([4, 2]),
+        await repos.episodes.get_episodes_page(2, limit=2),
+        await repos.episodes.get_episodes_page(
+            2, season=1, after=EpisodesCursor(1, 1, 6), limit=2
+        ),
+        await repos.episodes.get_season_summaries(2),
+        await schedule.get_shows_from_schedule(user_id),
+        await schedule.get_suggested_shows(user_id),
+        await schedule.get_upcoming_episodes_from_schedule(
+            user_id, starts_at, ends_at, limit=3
+        ),
+        await schedule.get_first_unwatched_episodes_from_schedule(user_id),
+        await schedule.get_schedule_progress(user_id),
+        await schedule.get_schedule_version(user_id),
+        await schedule.get_schedule_changes_since(user_id, 1),
+    ]
+
+
+async def write(repos: Repos, user_id: uuid.UUID) -> None:
+    await repos.shows.update(ShowUpdate(id=1, name="Game of Thrones 2"))
+    await repos.actors.update(ActorUpdate(id=3, name="Bob"))
+    await repos.episodes.update_many(
+        [EpisodeUpdate(id=1, number=3), EpisodeUpdate(id=2, season=3)]
+    )
+    await repos.episodes.shift_season_air_dates(
+        SeasonAirDatesShift(show_id=2, season=1, delta=datetime.timedelta(days=-1))
+    )
+    await repos.episodes.delete(6)
+    await repos.schedule.mark_episode_as_unwatched(EpisodeInSchedule(3, user_id))
+    await repos.schedule.delete_show_from_schedule(ShowInSchedule(1, user_id))
+    await repos.schedule.add_show_to_schedule(ShowInSchedule(3, user_id))
+    changes = await repos.actors.set_show_cast(ShowCast(3, [1, 3, 9]))
+    assert changes.missing_actor_ids == [9]
+    await repos.actors.delete(2)
+    await repos.shows.delete(1)
+
+
+@pytest_asyncio.fixture
+async def memory() -> AsyncIterator[tuple[MemoryStore, uuid.UUID]]:
+    store = MemoryStore()
+    repos = Repos(
+        MemoryShowRepo(store),
+        MemoryActorRepo(store),
+        MemoryEpisodeRepo(store),
+        MemoryScheduleRepo(store),
+    )
+    user_id = await fill(repos, MemoryUserRepo(store))
+    yield store, user_id
+
+
+@pytest.mark.asyncio
+async def test_memory_repos_match_sqlite_repos() -> None:
+    store = MemoryStore()
+    memory = Repos(
+        MemoryShowRepo(store),
+        MemoryActorRepo(store),
+        MemoryEpisodeRepo(store),
+        MemoryScheduleRepo(store),
+    )
+    async with SQLiteDatabase() as db:
+        sqlite = Repos(
+            SQLiteShowRepo(db),
+            SQLiteActorRepo(db),
+            SQLiteEpisodeRepo(db),
+            SQLiteScheduleRepo(db),
+        )
+        memory_user_id = await fill(memory, MemoryUserRepo(store))
+        sqlite_user_id = await fill(sqlite, SQLiteUserRepo(db))
+
+        assert await read(memory, memory_user_id) == await read(sqlite, sqlite_user_id)
+
+        await write(memory, memory_user_id)
+        await write(sqlite, sqlite_user_id)
+
+        assert await read(memory, memory_user_id) == await read(sqlite, sqlite_user_id)
+
+
+@pytest.mark.asyncio
+async def test_memory_repos_raise_domain_errors(
+    memory: tuple[MemoryStore, uuid.UUID],
+) -> None:
+    store, user_id = memory
+
+    with pytest.raises(ActorAlreadyInShowCastError):
+        await MemoryActorRepo(store).add_actor_to_show_cast(ActorInShowCast(1, 1))
+    with pytest.raises(ShowAlreadyExistsInScheduleError):
+        await MemoryScheduleRepo(store).add_to_schedule(ShowInSchedule(1, user_id))
+    with pytest.raises(EpisodeOrScheduleNotFoundError):
+        await MemoryScheduleRepo(store).mark_episode_as_watched(
+            EpisodeInSchedule(1, uuid.uuid4())
+        )
+
+
+@pytest.mark.asyncio
+async def test_memory_store_serves_reads_from_snapshot(
+    memory: tuple[MemoryStore, uuid.UUID],
+) -> None:
+    store, user_id = memory
+
+    replica = MemoryStore(store.snapshot(), read_only=True)
+    repo: IAddShowToScheduleUseCaseRepo = MemoryScheduleRepo(replica)
+
+    assert await MemoryScheduleRepo(replica).get_schedule_progress(
+        user_id
+    ) == await MemoryScheduleRepo(store).get_schedule_progress(user_id)
+    assert await MemoryShowRepo(replica).get_version(2) == "3"
+    with pytest.raises(ReadOnlyStoreError):
+        await repo.add_to_schedule(ShowInSchedule(3, user_id))
+    with pytest.raises(PasswordHashNotUpdatedError):
+        await MemoryUserRepo(replica).update_password_hash(user_id, "hash")
+
+    await MemoryShowRepo(MemoryStore(replica.snapshot())).add(ShowAdd("a", 1, "url"))
+
+
+@pytest.mark.asyncio
+async def test_memory_repos_complete_names_by_popularity(
+    memory: tuple[MemoryStore, uuid.UUID],
+) -> None:
+    store, _ = memory
+    shows = MemoryShowRepo(store)
+    actors = MemoryActorRepo(store)
+
+    names = [c.name for c in await shows.complete_show_names("b", 5)]
+    assert names == ["Breaking Bad", "Better Call Saul"]
+    names = [c.name for c in await actors.complete_actor_names("b", 5)]
+    assert names == ["Bob Odenkirk", "Bryan Cranston"]
+
+    await shows.delete(2)
+
+    names = [c.name for c in await actors.complete_actor_names("b", 5)]
+    assert names == ["Bob Odenkirk", "Bryan Cranston"]
+    assert [c.name for c in await shows.complete_show_names("b", 5)] == [
+        "Better Call Saul"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_memory_schedule_repo_precomputes_suggestions_on_read(
+    memory: tuple[MemoryStore, uuid.UUID],
+) -> None:
+    store, user_id = memory
+
+    suggested = await MemoryScheduleRepo(store).get_precomputed_suggested_shows(user_id)
+
+    assert [s.id for s in suggested.shows] == [3]
+    assert suggested.computed_at is not None
+
+
+@pytest.mark.asyncio
+async def test_memory_session_repo_revokes_sessions(
+    memory: tuple[MemoryStore, uuid.UUID],
+) -> None:
+    store, user_id = memory
+    sessions = MemorySessionRepo(store)
+    expires_at = datetime.datetime(2030, 1, 1, tzinfo=datetime.timezone.utc)
+
+    await sessions.add_session(SessionAdd("hash1", user_id, expires_at))
+    await sessions.add_session(SessionAdd("hash2", user_id, expires_at))
+    await sessions.revoke_session("hash1")
+
+    replica = MemorySessionRepo(MemoryStore(store.snapshot(), read_only=True))
+    expected = SessionInRepo(2, UserInToken(user_id, Role.USER), expires_at)
+    assert await sessions.get_session("hash2") == expected
+    assert await replica.get_session("hash2") == expected
+    with pytest.raises(InvalidRefreshTokenError):
+        await sessions.get_session("hash1")
+
+    await MemoryUserRepo(store).delete_user(user_id)
+
+    with pytest.raises(InvalidRefreshTokenError):
+        await sessions.get_session("hash2")
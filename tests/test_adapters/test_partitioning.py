@@ -0,0 +1,32 @@
+import pathlib
+
+import pytest
+
+from tvsched.adapters.repos.schedule.partitioning import (
+    DEFAULT_PARTITIONS,
+    partition_watched_episodes,
+)
+
+MIGRATION = (
+    pathlib.Path(__file__).parents[2]
+    / "migrations"
+    / "0008_partition_watched_episodes.sql"
+)
+
+
+def test_partition_watched_episodes_creates_all_partitions() -> None:
+    ddl = partition_watched_episodes(3)
+
+    for remainder in range(3):
+        assert f"(MODULUS 3, REMAINDER {remainder})" in ddl
+        assert f"RENAME TO watched_episodes_p{remainder};" in ddl
+    assert "REMAINDER 3" not in ddl
+
+
+def test_partition_watched_episodes_with_invalid_count() -> None:
+    with pytest.raises(ValueError):
+        partition_watched_episodes(0)
+
+
+def test_migration_is_generated_for_default_partitions() -> None:
+    assert MIGRATION.read_text() == partition_watched_episodes(DEFAULT_PARTITIONS)
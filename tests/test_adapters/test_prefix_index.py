@@ -0,0 +1,75 @@
+from unittest import mock
+
+import pytest
+
+from tvsched.adapters.cache.invalidation import EntityChanged, EntityKind
+from tvsched.adapters.cache.prefix_index import PrefixIndex
+from tvsched.adapters.cache.type_ahead import TypeAheadIndex
+from tvsched.application.models.common import NameCompletion
+
+
+def make_index(**kwargs: int) -> PrefixIndex:
+    index = PrefixIndex(**kwargs)
+    index.build(
+        [
+            (1, "Game of Thrones", 10),
+            (2, "The Crown", 30),
+            (3, "Gambit", 20),
+            (4, "Amélie", 5),
+        ]
+    )
+    return index
+
+
+def test_prefix_index_completes_by_weight() -> None:
+    index = make_index()
+
+    assert index.complete("ga", 10) == [(3, "Gambit"), (1, "Game of Thrones")]
+    assert index.complete("GAME ", 10) == [(1, "Game of Thrones")]
+    assert index.complete("thr", 10) == [(1, "Game of Thrones")]
+    assert index.complete("ame", 10) == [(4, "Amélie")]
+    assert index.complete("x", 10) == []
+    assert index.complete("", 10) == []
+
+
+@pytest.mark.parametrize("hot_prefix_length", [0, 3])
+def test_prefix_index_updates(hot_prefix_length: int) -> None:
+    index = make_index(hot_prefix_length=hot_prefix_length, max_k=2, hot_depth=2)
+
+    index.upsert(5, "Gamers", 25)
+    index.upsert(3, "Gambit", 1)
+    assert index.complete("g", 2) == [(5, "Gamers"), (1, "Game of Thrones")]
+
+    index.remove(5)
+    index.remove(1)
+    assert index.complete("g", 2) == [(3, "Gambit")]
+
+    index.upsert(2, "Gaming", 30)
+    assert index.complete("g", 2) == [(2, "Gaming"), (3, "Gambit")]
+    assert index.complete("the", 2) == []
+
+
+def test_prefix_index_is_bounded() -> None:
+    index = make_index(max_entries=2)
+
+    assert len(index) == 2
+    assert index.complete("g", 10) == [(3, "Gambit")]
+    assert not index.upsert(5, "Gamers", 100)
+    assert index.upsert(3, "Gamers", 100)
+
+
+@pytest.mark.asyncio
+async def test_type_ahead_index_refreshes_changed_names() -> None:
+    db = mock.AsyncMock()
+    db.fetch_all.return_value = [{"id": 1, "name": "Game of Thrones", "weight": 3}]
+    logger = mock.Mock()
+    type_ahead = TypeAheadIndex(db, logger)
+
+    type_ahead.on_entity_changed(EntityChanged(kind=EntityKind.SHOW, ids=(1, 2)))
+    await type_ahead.wait_refreshed()
+
+    assert db.fetch_all.await_args.kwargs["values"] == dict(ids=[1, 2])
+    assert await type_ahead.complete_show_names("game", 5) == [
+        NameCompletion(id=1, name="Game of Thrones")
+    ]
+    assert await type_ahead.complete_actor_names("game", 5) == []
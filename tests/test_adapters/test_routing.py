@@ -0,0 +1,120 @@
+import asyncio
+import datetime
+from unittest import mock
+
+import pytest
+from databases import Database
+
+from tvsched.adapters.repos.routing import (
+    ConnectionRouter,
+    PoolConnection,
+    ReadConsistency,
+    StalenessPolicy,
+)
+
+
+@pytest.mark.asyncio
+async def test_connection_router_reads_from_replica() -> None:
+    primary = mock.AsyncMock()
+    replica = mock.AsyncMock()
+    replica.fetch_one.return_value = {"lag": 0}
+    router = ConnectionRouter(primary, [replica])
+
+    db = await router.for_read()
+
+    assert db is replica
+    replica.fetch_one.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_connection_router_pins_reads_after_write_to_primary() -> None:
+    primary = mock.AsyncMock()
+    replica = mock.AsyncMock()
+    replica.fetch_one.return_value = {"lag": 0}
+    router = ConnectionRouter(primary, [replica])
+
+    assert router.for_write() is primary
+    assert await router.for_read() is primary
+    assert await router.unit_of_work().for_read() is replica
+
+
+@pytest.mark.asyncio
+async def test_connection_router_pins_reads_only_in_context_of_write() -> None:
+    primary = mock.AsyncMock()
+    replica = mock.AsyncMock()
+    replica.fetch_one.return_value = {"lag": 0}
+    router = ConnectionRouter(primary, [replica])
+
+    async def write_and_read() -> object:
+        router.for_write()
+        return await router.for_read()
+
+    assert await asyncio.create_task(write_and_read()) is primary
+    assert not router.pinned
+    assert await router.for_read() is replica
+
+
+@pytest.mark.asyncio
+async def test_connection_router_pins_only_own_unit_of_work() -> None:
+    primary = mock.AsyncMock()
+    router = ConnectionRouter.of(primary)
+    unit_of_work = router.unit_of_work()
+    other = ConnectionRouter.of(primary)
+
+    unit_of_work.for_write()
+
+    assert unit_of_work.pinned
+    assert not router.pinned
+    assert not other.pinned
+
+
+@pytest.mark.asyncio
+async def test_connection_router_treats_unreachable_replica_as_stale() -> None:
+    primary = mock.AsyncMock()
+    replica = mock.AsyncMock()
+    replica.fetch_one.side_effect = OSError()
+    router = ConnectionRouter(primary, [replica])
+
+    assert await router.for_read() is primary
+
+
+@pytest.mark.asyncio
+async def test_connection_router_skips_stale_replica() -> None:
+    primary = mock.AsyncMock()
+    stale_replica = mock.AsyncMock()
+    stale_replica.fetch_one.return_value = {"lag": 10}
+    fresh_replica = mock.AsyncMock()
+    fresh_replica.fetch_one.return_value = {"lag": 0.5}
+    policy = StalenessPolicy(max_lag=datetime.timedelta(seconds=1))
+    router = ConnectionRouter(primary, [stale_replica, fresh_replica], policy)
+
+    assert await router.for_read() is fresh_replica
+    assert await router.for_read() is fresh_replica
+
+
+@pytest.mark.asyncio
+async def test_connection_router_with_primary_consistency() -> None:
+    primary = mock.AsyncMock()
+    replica = mock.AsyncMock()
+    policy = StalenessPolicy(consistency=ReadConsistency.PRIMARY)
+    router = ConnectionRouter(primary, [replica], policy)
+
+    assert await router.for_read() is primary
+    replica.fetch_one.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_connection_router_gives_own_pool_connection_to_each_task() -> None:
+    router = ConnectionRouter(Database("postgresql://localhost/tvsched"))
+    db = router.for_write()
+    assert isinstance(db, PoolConnection)
+    parent_connection = db.connection()
+
+    async def connection_of_task() -> object:
+        connection = (await router.for_read()).connection()
+        assert (await router.for_read()).connection() is connection
+        return connection
+
+    first, second = await asyncio.gather(connection_of_task(), connection_of_task())
+
+    assert len({id(parent_connection), id(first), id(second)}) == 3
@@ -0,0 +1,96 @@
+import asyncio
+import datetime
+import os
+import uuid
+from typing import AsyncIterator
+
+import pytest
+import pytest_asyncio
+from databases import Database
+
+from tvsched.adapters.repos.episode import EpisodeRepo
+from tvsched.adapters.repos.routing import ConnectionRouter
+from tvsched.adapters.repos.schedule import ScheduleRepo
+from tvsched.adapters.repos.show import ShowRepo
+from tvsched.application.models.episode import EpisodeAdd
+from tvsched.application.models.schedule import EpisodeInSchedule, ShowInSchedule
+from tvsched.application.models.show import ShowAdd
+
+# url of migrated Postgres database, tests add and delete own rows in it
+DATABASE_URL = os.environ.get("TVSCHED_TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    DATABASE_URL is None, reason="set TVSCHED_TEST_DATABASE_URL to run"
+)
+
+EPISODES_COUNT = 2
+
+
+@pytest_asyncio.fixture
+async def database() -> AsyncIterator[Database]:
+    async with Database(DATABASE_URL, min_size=2, max_size=EPISODES_COUNT + 1) as db:
+        yield db
+
+
+@pytest.mark.asyncio
+async def test_schedule_repo_marks_episodes_of_one_show_concurrently(
+    database: Database,
+) -> None:
+    db = ConnectionRouter(database)
+    user_id = uuid.uuid4()
+    await database.execute(
+        "INSERT INTO users (id, username, password_hash, role)"
+        " VALUES (:id, :username, 'hash', 'USER');",
+        dict(id=user_id, username=str(user_id)),
+    )
+    show_id = await database.fetch_val(
+        "INSERT INTO shows (name, seasons_count, image_url)"
+        " VALUES (:name, 1, 'url') RETURNING id;",
+        dict(name=str(user_id)),
+    )
+
+    try:
+        episodes = EpisodeRepo(db)
+        for number in range(1, EPISODES_COUNT + 1):
+            await episodes.add(
+                EpisodeAdd("e", 1, number, datetime.datetime(2022, 1, 1), show_id)
+            )
+        episode_ids = [e.id for e in await episodes.get_episodes(show_id)]
+        repo = ScheduleRepo(db)
+        await repo.add_show_to_schedule(ShowInSchedule(show_id, user_id))
+
+        # progress row is held locked until both marks wait for it,
+        # so marks run at the same time however they are scheduled
+        async with database.transaction():
+            await database.execute(
+                "SELECT 1 FROM schedule_progress"
+                " WHERE user_id = :user_id AND show_id = :show_id FOR UPDATE;",
+                dict(user_id=user_id, show_id=show_id),
+            )
+            marks = asyncio.gather(
+                *(
+                    repo.mark_episode_as_watched(EpisodeInSchedule(e, user_id))
+                    for e in episode_ids
+                )
+            )
+            while (
+                await database.fetch_val(
+                    "SELECT count(*) FROM pg_locks"
+                    " WHERE NOT granted AND pid <> pg_backend_pid();"
+                )
+                < EPISODES_COUNT
+            ):
+                await asyncio.sleep(0.01)
+        await marks
+
+        progress = await database.fetch_one(
+            "SELECT watched_count, next_episode_id FROM schedule_progress"
+            " WHERE user_id = :user_id AND show_id = :show_id;",
+            dict(user_id=user_id, show_id=show_id),
+        )
+        assert progress is not None
+        assert progress["watched_count"] == EPISODES_COUNT
+        assert progress["next_episode_id"] is None
+    finally:
+        await ShowRepo(db).delete(show_id)
+        await database.execute("DELETE FROM users WHERE id = :id;", dict(id=user_id))
@@ -0,0 +1,71 @@
+import datetime
+import uuid
+from unittest import mock
+
+import pytest
+
+from tvsched.adapters.cache.invalidation import EntityChanged, EntityKind
+from tvsched.adapters.repos.session import CachedSessionRepo
+from tvsched.application.models.auth import SessionInRepo, UserInToken
+from tvsched.entities.auth import Role
+
+SESSION = SessionInRepo(
+    id=1,
+    user=UserInToken(id=uuid.uuid4(), role=Role.USER),
+    expires_at=datetime.datetime(2030, 1, 1, tzinfo=datetime.timezone.utc),
+)
+
+
+@pytest.mark.asyncio
+async def test_cached_session_repo_reads_session_once() -> None:
+    repo = mock.AsyncMock()
+    repo.get_session.return_value = SESSION
+    cache = CachedSessionRepo(repo)
+
+    assert await cache.get_session("hash") == SESSION
+    assert await cache.get_session("hash") == SESSION
+
+    repo.get_session.assert_awaited_once_with("hash")
+
+
+@pytest.mark.asyncio
+async def test_cached_session_repo_evicts_revoked_sessions() -> None:
+    repo = mock.AsyncMock()
+    repo.get_session.return_value = SESSION
+    cache = CachedSessionRepo(repo)
+
+    await cache.get_session("hash")
+    await cache.revoke_session("hash")
+    await cache.get_session("hash")
+    cache.on_entity_changed(EntityChanged(EntityKind.SHOW, (1,)))
+    await cache.get_session("hash")
+    cache.on_entity_changed(EntityChanged(EntityKind.SESSION, (1,)))
+    await cache.get_session("hash")
+    cache.on_flush()
+    await cache.get_session("hash")
+
+    repo.revoke_session.assert_awaited_once_with("hash")
+    assert repo.get_session.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_cached_session_repo_expires_and_bounds_sessions() -> None:
+    repo = mock.AsyncMock()
+    repo.get_session.return_value = SESSION
+    cache = CachedSessionRepo(repo, ttl=datetime.timedelta(0))
+
+    await cache.get_session("hash")
+    await cache.get_session("hash")
+
+    assert repo.get_session.await_count == 2
+
+    cache = CachedSessionRepo(repo, max_size=1)
+    other = SessionInRepo(2, SESSION.user, SESSION.expires_at)
+    repo.get_session.side_effect = [SESSION, other, SESSION]
+
+    await cache.get_session("hash")
+    await cache.get_session("other")
+    await cache.get_session("other")
+    await cache.get_session("hash")
+
+    assert repo.get_session.await_count == 5
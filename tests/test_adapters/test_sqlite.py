@@ -0,0 +1,294 @@
+import datetime
+import uuid
+from typing import AsyncIterator
+from unittest import mock
+
+import pytest
+import pytest_asyncio
+
+from tvsched.adapters.repos.schedule.utils import make_schedule_version
+from tvsched.adapters.repos.sqlite import (
+    SQLiteActorRepo,
+    SQLiteDatabase,
+    SQLiteEpisodeRepo,
+    SQLiteScheduleRepo,
+    SQLiteSessionRepo,
+    SQLiteShowRepo,
+    SQLiteUserRepo,
+)
+from tvsched.adapters.repos.sqlite.functions import word_similarity
+from tvsched.application.exceptions.actor import (
+    ActorAlreadyInShowCastError,
+    ActorOrShowNotFoundError,
+)
+from tvsched.application.exceptions.auth import (
+    InvalidRefreshTokenError,
+    UserAlreadyExistsError,
+)
+from tvsched.application.exceptions.schedule import (
+    EpisodeAlreadyMarkedAsWatchedError,
+    ShowAlreadyExistsInScheduleError,
+    ShowOrScheduleNotFoundError,
+)
+from tvsched.application.exceptions.show import ShowNotFoundError
+from tvsched.application.models.actor import (
+    ActorAdd,
+    ActorInShowCast,
+    ActorUpdate,
+    ShowCast,
+    ShowCastChanges,
+)
+from tvsched.application.models.auth import (
+    SessionAdd,
+    SessionInRepo,
+    UserInRepoAdd,
+    UserInToken,
+)
+from tvsched.application.models.common import Versioned
+from tvsched.application.models.episode import (
+    EpisodeAdd,
+    EpisodesCursor,
+    EpisodeUpdate,
+)
+from tvsched.application.models.schedule import EpisodeInSchedule, ShowInSchedule
+from tvsched.application.models.show import ShowAdd
+from tvsched.entities.auth import Role
+from tvsched.entities.schedule import ScheduleChangeKind, ShowProgress
+
+AIR_DATE = datetime.datetime(2022, 1, 1)
+
+
+@pytest_asyncio.fixture
+async def db() -> AsyncIterator[SQLiteDatabase]:
+    async with SQLiteDatabase() as db:
+        await SQLiteShowRepo(db).add(ShowAdd("Game of Thrones", 8, "url1"))
+        await SQLiteShowRepo(db).add(ShowAdd("Breaking Bad", 5, "url2"))
+        actors = SQLiteActorRepo(db)
+        await actors.add(ActorAdd("Peter Dinklage", "url3"))
+        await actors.add(ActorAdd("Bryan Cranston", "url4"))
+        await actors.add_actor_to_show_cast(ActorInShowCast(show_id=1, actor_id=1))
+        await actors.add_actor_to_show_cast(ActorInShowCast(show_id=2, actor_id=2))
+        episodes = SQLiteEpisodeRepo(db)
+        for season, number in [(2, 1), (1, 2), (1, 1)]:
+            await episodes.add(EpisodeAdd("e", season, number, AIR_DATE, show_id=1))
+        yield db
+
+
+async def add_user(db: SQLiteDatabase) -> uuid.UUID:
+    users = SQLiteUserRepo(db)
+    await users.add_user(UserInRepoAdd("user", "hash", Role.USER))
+    user = await users.get_user_by_username("user")
+
+    return user.id
+
+
+@pytest.mark.asyncio
+async def test_sqlite_database_requires_returning_support() -> None:
+    with mock.patch("sqlite3.sqlite_version_info", (3, 34, 1)):
+        with pytest.raises(RuntimeError, match="3.35.0"):
+            await SQLiteDatabase().connect()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_show_repo_reads_shows_with_cast(db: SQLiteDatabase) -> None:
+    repo = SQLiteShowRepo(db)
+
+    show = await repo.get(1)
+    shows = await repo.get_many([2, 5, 1])
+
+    assert show.name == "Game of Thrones" and show.cast[0].name == "Peter Dinklage"
+    assert [s.id for s in shows.found] == [2, 1] and shows.missing_ids == [5]
+    assert [s.id for s in await repo.get_shows(limit=1, offset=1)] == [2]
+    assert [s.id for s in await repo.search("thrnes", limit=10)] == [1]
+    assert await repo.search("cranston", limit=10) == []
+    searched = await repo.search("cranston", limit=10, include_cast=True)
+    assert [s.id for s in searched] == [2]
+    with pytest.raises(ShowNotFoundError):
+        await repo.get(5)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_actor_repo_bumps_show_versions(db: SQLiteDatabase) -> None:
+    shows = SQLiteShowRepo(db)
+    actors = SQLiteActorRepo(db)
+    cast = ActorInShowCast(show_id=1, actor_id=2)
+
+    await actors.update(ActorUpdate(id=1, name="Peter"))
+    await actors.add_actor_to_show_cast(cast)
+
+    assert await shows.get_version(1) == "4"
+    assert await shows.get_versioned(1) == Versioned(
+        version="4", entity=await shows.get(1)
+    )
+    assert [a.name for a in (await shows.get(1)).cast] == ["Peter", "Bryan Cranston"]
+    with pytest.raises(ActorAlreadyInShowCastError):
+        await actors.add_actor_to_show_cast(cast)
+    with pytest.raises(ActorOrShowNotFoundError):
+        await actors.add_actor_to_show_cast(ActorInShowCast(show_id=5, actor_id=1))
+
+    await actors.delete(2)
+
+    assert await shows.get_version(1) == "5"
+    assert await shows.get_version(2) == "3"
+
+
+@pytest.mark.asyncio
+async def test_sqlite_actor_repo_sets_show_cast(db: SQLiteDatabase) -> None:
+    shows = SQLiteShowRepo(db)
+    actors = SQLiteActorRepo(db)
+
+    changes = await actors.set_show_cast(ShowCast(show_id=1, actor_ids=[2, 7, 2]))
+
+    assert changes == ShowCastChanges(
+        added_actor_ids=[2], removed_actor_ids=[1], missing_actor_ids=[7]
+    )
+    assert [a.id for a in (await shows.get(1)).cast] == [2]
+    assert await shows.get_version(1) == "3"
+
+    changes = await actors.set_show_cast(ShowCast(show_id=1, actor_ids=[2]))
+
+    assert changes == ShowCastChanges([], [], [])
+    assert await shows.get_version(1) == "3"
+    with pytest.raises(ShowNotFoundError):
+        await actors.set_show_cast(ShowCast(show_id=5, actor_ids=[1]))
+
+
+@pytest.mark.asyncio
+async def test_sqlite_show_repo_reads_show_details(db: SQLiteDatabase) -> None:
+    user_id = await add_user(db)
+    repo = SQLiteShowRepo(db)
+    await SQLiteScheduleRepo(db).add_show_to_schedule(ShowInSchedule(1, user_id))
+    await SQLiteScheduleRepo(db).mark_episode_as_watched(EpisodeInSchedule(2, user_id))
+
+    details = await repo.get_details(1, user_id=user_id)
+
+    assert details.show == await repo.get(1)
+    assert [(s.number, [e.id for e in s.episodes]) for s in details.seasons] == [
+        (1, [3, 2]),
+        (2, [1]),
+    ]
+    assert details.watched_episode_ids == [2]
+    assert (await repo.get_details(1)).watched_episode_ids is None
+    with pytest.raises(ShowNotFoundError):
+        await repo.get_details(5)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_episode_repo_paginates_episodes(db: SQLiteDatabase) -> None:
+    repo = SQLiteEpisodeRepo(db)
+
+    page = await repo.get_episodes_page(1, limit=2)
+
+    assert [e.id for e in page.episodes] == [3, 2]
+    assert page.next_cursor == EpisodesCursor(season=1, number=2, id=2)
+
+    page = await repo.get_episodes_page(1, after=page.next_cursor, limit=2)
+
+    assert [e.id for e in page.episodes] == [1] and page.next_cursor is None
+    page = await repo.get_episodes_page(1, season=1, limit=2)
+    assert [e.id for e in page.episodes] == [3, 2] and page.next_cursor is None
+    summaries = await repo.get_season_summaries(1)
+    assert [(s.number, s.episodes_count) for s in summaries] == [(1, 2), (2, 1)]
+    assert summaries[0].first_air_date == AIR_DATE
+
+
+@pytest.mark.asyncio
+async def test_sqlite_schedule_repo_tracks_progress(db: SQLiteDatabase) -> None:
+    user_id = await add_user(db)
+    repo = SQLiteScheduleRepo(db)
+    show_in_schedule = ShowInSchedule(show_id=1, user_id=user_id)
+
+    await repo.add_show_to_schedule(show_in_schedule)
+    version = await repo.get_schedule_version(user_id)
+    await repo.mark_episode_as_watched(EpisodeInSchedule(3, user_id))
+
+    with pytest.raises(ShowAlreadyExistsInScheduleError):
+        await repo.add_show_to_schedule(show_in_schedule)
+    with pytest.raises(ShowOrScheduleNotFoundError):
+        await repo.add_show_to_schedule(ShowInSchedule(show_id=5, user_id=user_id))
+    with pytest.raises(EpisodeAlreadyMarkedAsWatchedError):
+        await repo.mark_episode_as_watched(EpisodeInSchedule(3, user_id))
+    assert [s.id for s in await repo.get_shows_from_schedule(user_id)] == [1]
+    assert await repo.get_schedule_progress(user_id) == [
+        ShowProgress(show_id=1, watched_count=1, total_count=3, next_episode_id=2)
+    ]
+    assert [
+        e.id for e in await repo.get_first_unwatched_episodes_from_schedule(user_id)
+    ] == [2]
+    # watched episodes do not change shows from schedule
+    assert await repo.get_schedule_version(user_id) == version
+
+    await SQLiteEpisodeRepo(db).update(EpisodeUpdate(id=1, season=1, number=0))
+
+    assert (await repo.get_schedule_progress(user_id))[0].next_episode_id == 1
+
+
+@pytest.mark.asyncio
+async def test_sqlite_schedule_repo_logs_changes(db: SQLiteDatabase) -> None:
+    user_id = await add_user(db)
+    repo = SQLiteScheduleRepo(db)
+
+    await repo.add_show_to_schedule(ShowInSchedule(show_id=1, user_id=user_id))
+    await repo.mark_episode_as_watched(EpisodeInSchedule(3, user_id))
+    await SQLiteShowRepo(db).delete(1)
+
+    changes = await repo.get_schedule_changes_since(user_id, version=2)
+    assert changes.version == 4 and not changes.reset
+    assert [(c.kind, c.target_id, c.deleted) for c in changes.changes] == [
+        (ScheduleChangeKind.SHOW, 1, True),
+        (ScheduleChangeKind.WATCHED_EPISODE, 3, True),
+    ]
+
+    future = datetime.datetime.now() + datetime.timedelta(days=1)
+    assert await repo.compact_schedule_changes(future) == 2
+
+    changes = await repo.get_schedule_changes_since(user_id, version=2)
+    assert changes.version == 4 and changes.reset and changes.changes == []
+    assert await repo.get_schedule_version(user_id) == make_schedule_version([])
+
+
+@pytest.mark.asyncio
+async def test_sqlite_user_repo_raises_on_duplicate_user(db: SQLiteDatabase) -> None:
+    await add_user(db)
+
+    with pytest.raises(UserAlreadyExistsError):
+        await add_user(db)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_user_repo_updates_password_hash(db: SQLiteDatabase) -> None:
+    user_id = await add_user(db)
+    users = SQLiteUserRepo(db)
+
+    await users.update_password_hash(user_id, "new hash")
+    await users.update_password_hash(uuid.uuid4(), "other hash")
+
+    assert (await users.get_user_by_username("user")).password_hash == "new hash"
+
+
+@pytest.mark.asyncio
+async def test_sqlite_session_repo_revokes_sessions(db: SQLiteDatabase) -> None:
+    user_id = await add_user(db)
+    sessions = SQLiteSessionRepo(db)
+    expires_at = datetime.datetime(2030, 1, 1, tzinfo=datetime.timezone.utc)
+
+    await sessions.add_session(SessionAdd("hash1", user_id, expires_at))
+    await sessions.add_session(SessionAdd("hash2", user_id, expires_at))
+    await sessions.revoke_session("hash1")
+
+    assert await sessions.get_session("hash2") == SessionInRepo(
+        2, UserInToken(user_id, Role.USER), expires_at
+    )
+    with pytest.raises(InvalidRefreshTokenError):
+        await sessions.get_session("hash1")
+
+    await SQLiteUserRepo(db).delete_user(user_id)
+
+    with pytest.raises(InvalidRefreshTokenError):
+        await sessions.get_session("hash2")
+
+
+def test_word_similarity_matches_words_with_typos() -> None:
+    assert word_similarity("breaking", "Breaking Bad") == 1.0
+    assert word_similarity("braking bad", "Breaking Bad") > 0.5
+    assert word_similarity("thrones", "Breaking Bad") < 0.5
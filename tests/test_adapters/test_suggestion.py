@@ -0,0 +1,52 @@
+import uuid
+from unittest import mock
+
+import pytest
+
+from tvsched.adapters.cache.invalidation import EntityChanged, EntityKind
+from tvsched.adapters.repos.suggestion import CoCastGraph, CoCastSuggestionRepo
+
+CAST_EDGES = [(1, 10), (1, 11), (2, 10), (2, 11), (3, 11), (3, 12), (4, 13)]
+
+
+def test_co_cast_graph_scores_shared_actors() -> None:
+    graph = CoCastGraph(CAST_EDGES)
+
+    assert graph.score([1]) == [(2, 2), (3, 1)]
+    assert graph.score([1], limit=1) == [(2, 2)]
+    assert graph.score([1, 3]) == [(2, 2)]
+    assert graph.score([5]) == []
+
+
+@pytest.mark.parametrize("max_overrides", [0, 100])
+def test_co_cast_graph_set_cast(max_overrides: int) -> None:
+    graph = CoCastGraph(CAST_EDGES, max_overrides=max_overrides)
+
+    graph.set_cast(4, [10, 13])
+    graph.set_cast(2, [])
+    graph.set_cast(7, [12])
+
+    assert list(graph.get_cast(4)) == [10, 13]
+    assert list(graph.get_cast(2)) == []
+    assert graph.score([1]) == [(3, 1), (4, 1)]
+    assert graph.score([3]) == [(1, 1), (7, 1)]
+
+
+@pytest.mark.asyncio
+async def test_co_cast_suggestion_repo_reloads_changed_casts() -> None:
+    db = mock.AsyncMock()
+    repo = CoCastSuggestionRepo(db, mock.Mock())
+    repo.graph.build(CAST_EDGES)
+
+    db.fetch_all.return_value = [{"show_id": 4, "actor_id": 10}]
+    repo.on_entity_changed(EntityChanged(kind=EntityKind.SHOW, ids=(4, 2)))
+    await repo.wait_refreshed()
+
+    assert list(repo.graph.get_cast(4)) == [10]
+    assert list(repo.graph.get_cast(2)) == []
+
+    db.fetch_all.side_effect = [[{"show_id": 1}], []]
+    shows = await repo.get_suggested_shows(uuid.uuid4())
+
+    assert shows == []
+    assert db.fetch_all.await_args.kwargs["values"] == dict(show_ids=[3, 4])
@@ -0,0 +1,75 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# wall-clock time depends on machine and its load, so budgets are checked
+# only on request, e.g. on dedicated CI runner:
+#
+#     TVSCHED_CHECK_IMPORT_TIME=1 pytest tests/test_import_time.py
+CHECK_IMPORT_TIME = os.environ.get("TVSCHED_CHECK_IMPORT_TIME") == "1"
+
+# seconds to import package with all its submodules in fresh interpreter,
+# budgets are several times bigger than usual time to tolerate slow machines
+IMPORT_TIME_BUDGETS = {
+    "tvsched.entities": 0.5,
+    "tvsched.application": 1.0,
+    "tvsched.adapters": 3.0,
+}
+
+# dependencies needed only by adapters and loaded on first use of auth
+HEAVY_MODULES = ["asyncpg", "databases", "sqlalchemy", "jwt", "passlib"]
+
+IMPORT_PACKAGE_CODE = """
+import importlib, json, pkgutil, sys, time
+
+start = time.perf_counter()
+package = importlib.import_module(sys.argv[1])
+for info in pkgutil.walk_packages(package.__path__, package.__name__ + "."):
+    importlib.import_module(info.name)
+elapsed = time.perf_counter() - start
+
+print(json.dumps({"elapsed": elapsed, "modules": list(sys.modules)}))
+"""
+
+
+def import_package(package: str) -> tuple[float, set[str]]:
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_PACKAGE_CODE, package],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    data = json.loads(result.stdout)
+
+    return data["elapsed"], {m.split(".")[0] for m in data["modules"]}
+
+
+@pytest.mark.skipif(
+    not CHECK_IMPORT_TIME, reason="set TVSCHED_CHECK_IMPORT_TIME=1 to check budgets"
+)
+@pytest.mark.parametrize("package,budget", IMPORT_TIME_BUDGETS.items())
+def test_package_imports_within_budget(package: str, budget: float) -> None:
+    elapsed, _ = import_package(package)
+
+    assert elapsed < budget, f"{package} imported in {elapsed:.3f}s"
+
+
+@pytest.mark.parametrize("package", ["tvsched.entities", "tvsched.application"])
+def test_package_does_not_import_heavy_modules(package: str) -> None:
+    _, modules = import_package(package)
+
+    assert modules.isdisjoint(HEAVY_MODULES), modules & set(HEAVY_MODULES)
+
+
+def test_adapter_package_imports_repos_on_first_access() -> None:
+    code = (
+        "import sys, tvsched.adapters.repos.show as show;"
+        "assert 'asyncpg' not in sys.modules;"
+        "show.ShowRepo;"
+        "assert 'asyncpg' in sys.modules"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)
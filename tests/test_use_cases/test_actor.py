@@ -7,7 +7,15 @@ from tvsched.application.exceptions.actor import (
     ActorNotFoundError,
     ActorOrShowNotFoundError,
 )
-from tvsched.application.models.actor import ActorAdd, ActorInShowCast, ActorUpdate
+from tvsched.application.exceptions.show import ShowNotFoundError
+from tvsched.application.models.actor import (
+    ActorAdd,
+    ActorInShowCast,
+    ActorUpdate,
+    ShowCast,
+    ShowCastChanges,
+)
+from tvsched.application.models.common import EntitiesByIds, NameCompletion
 from tvsched.application.use_cases.actor.add_actor_to_show_cast_use_case import (
     AddActorToShowCastUseCase,
 )
@@ -15,8 +23,20 @@ from tvsched.application.use_cases.actor.add_actor_use_case import AddActorUseCa
 from tvsched.application.use_cases.actor.delete_actor_from_show_cast_use_case import (
     DeleteActorFromShowCastUseCase,
 )
+from tvsched.application.use_cases.actor.complete_actor_names_use_case import (
+    CompleteActorNamesUseCase,
+)
 from tvsched.application.use_cases.actor.delete_actor_use_case import DeleteActorUseCase
+from tvsched.application.use_cases.actor.get_actors_by_ids_use_case import (
+    GetActorsByIdsUseCase,
+)
 from tvsched.application.use_cases.actor.get_actor_use_case import GetActorUseCase
+from tvsched.application.use_cases.actor.search_actors_use_case import (
+    SearchActorsUseCase,
+)
+from tvsched.application.use_cases.actor.set_show_cast_use_case import (
+    SetShowCastUseCase,
+)
 from tvsched.application.use_cases.actor.update_actor_use_case import UpdateActorUseCase
 from tvsched.entities.actor import Actor
 
@@ -156,3 +176,120 @@ async def test_delete_actor_from_show_cast_use_case() -> None:
 
     repo.delete_actor_from_show_cast.assert_awaited_once_with(actor_in_cast)
     assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_actors_by_ids_use_case() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = GetActorsByIdsUseCase(repo, logger)
+
+    actor_ids = [2, 1]
+    expected = EntitiesByIds(
+        found=[
+            Actor(id=2, name="Emilia", image_url="url"),
+            Actor(id=1, name="James", image_url="url"),
+        ],
+        missing_ids=[],
+    )
+    repo.get_many.return_value = expected
+
+    actors = await use_case.execute(actor_ids)
+
+    assert actors == expected
+    repo.get_many.assert_awaited_once_with(actor_ids)
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_actors_by_ids_use_case_when_actor_not_found() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = GetActorsByIdsUseCase(repo, logger)
+
+    actor_ids = [1, 3]
+    expected = EntitiesByIds(
+        found=[Actor(id=1, name="James", image_url="url")], missing_ids=[3]
+    )
+    repo.get_many.return_value = expected
+
+    actors = await use_case.execute(actor_ids)
+
+    assert actors == expected
+    repo.get_many.assert_awaited_once_with(actor_ids)
+    assert logger.info.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_search_actors_use_case() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = SearchActorsUseCase(repo, logger)
+
+    actors = [Actor(id=1, name="Kit Harington", image_url="url")]
+    repo.search.return_value = actors
+
+    res = await use_case.execute("  kit   harington ", limit=5)
+
+    assert res == actors
+    repo.search.assert_awaited_once_with("kit harington", limit=5)
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_search_actors_use_case_with_blank_query() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = SearchActorsUseCase(repo, logger)
+
+    res = await use_case.execute("  ")
+
+    assert res == []
+    repo.search.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_complete_actor_names_use_case() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = CompleteActorNamesUseCase(repo, logger)
+
+    completions = [NameCompletion(id=1, name="Game")]
+    repo.complete_actor_names.return_value = completions
+
+    res = await use_case.execute("ga", limit=5)
+
+    assert res == completions
+    repo.complete_actor_names.assert_awaited_once_with("ga", limit=5)
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_set_show_cast_use_case() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = SetShowCastUseCase(repo, logger)
+
+    show_cast = ShowCast(show_id=5, actor_ids=[1, 2, 3])
+    changes = ShowCastChanges(
+        added_actor_ids=[2], removed_actor_ids=[4], missing_actor_ids=[3]
+    )
+    repo.set_show_cast.return_value = changes
+
+    res = await use_case.execute(show_cast)
+
+    assert res == changes
+    repo.set_show_cast.assert_awaited_once_with(show_cast)
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_set_show_cast_use_case_when_show_not_exists() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = SetShowCastUseCase(repo, logger)
+
+    repo.set_show_cast.side_effect = ShowNotFoundError(show_id=5)
+
+    with pytest.raises(ShowNotFoundError):
+        await use_case.execute(ShowCast(show_id=5, actor_ids=[1]))
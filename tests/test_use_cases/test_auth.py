@@ -2,21 +2,48 @@ import datetime
 from unittest import mock
 import uuid
 
+import jwt
 import pytest
-from tvsched.application.exceptions.auth import UserAlreadyExistsError, UserNotFoundError
+from tvsched.application.exceptions.auth import (
+    InvalidAccessTokenError,
+    InvalidRefreshTokenError,
+    PasswordHashNotUpdatedError,
+    UserAlreadyExistsError,
+    UserNotFoundError,
+)
 
 from tvsched.application.models.auth import (
     UserAdd,
+    SessionInRepo,
     UserInRepo,
     UserLogIn,
     UserWithRoleAdd,
     UserInRepoAdd,
+    UserInToken,
 )
 from tvsched.application.use_cases.auth.add_user_use_case import AddUserUseCase
 from tvsched.application.use_cases.auth.add_user_with_role_use_case import (
     AddUserWithRoleUseCase,
 )
+from tvsched.application.use_cases.auth.delete_user_use_case import DeleteUserUseCase
 from tvsched.application.use_cases.auth.log_in_user_use_case import LogInUserUseCase
+from tvsched.application.use_cases.auth.log_in_user_with_refresh_token_use_case import (
+    LogInUserWithRefreshTokenUseCase,
+)
+from tvsched.application.use_cases.auth.refresh_access_token_use_case import (
+    RefreshAccessTokenUseCase,
+)
+from tvsched.application.use_cases.auth.revoke_refresh_token_use_case import (
+    RevokeRefreshTokenUseCase,
+)
+from tvsched.application.utils.auth import (
+    calibrate_password_hash_rounds,
+    create_access_token_for_user,
+    hash_password,
+    hash_refresh_token,
+    verify_password,
+)
+from tvsched.application.utils.token_issuer import TokenIssuer
 from tvsched.entities.auth import Role
 
 
@@ -189,3 +216,298 @@ async def test_log_in_user_use_case_when_user_not_exist() -> None:
 
     repo.get_user_by_username.assert_awaited_once_with(username)
     assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_log_in_user_use_case_rehashes_password_with_other_rounds() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = LogInUserUseCase(
+        repo,
+        logger,
+        jwt_secret="secret",
+        jwt_expires_in=datetime.timedelta(seconds=3600),
+        jwt_algorithm="HS256",
+        password_hash_rounds=4,
+    )
+
+    user_id = uuid.UUID("b6ed747f-d3d9-4962-a090-29e2623a3f63")
+    password = "password"
+    password_hash = "$2b$12$7H.90bastmQ1Lqo0sVLxguLfmdW6pqLTT7Ky8IzPi/B/h.BRLTKgm"
+    repo.get_user_by_username.return_value = UserInRepo(
+        id=user_id, username="user", password_hash=password_hash, role=Role.USER
+    )
+
+    await use_case.execute(UserLogIn(username="user", password=password))
+
+    repo.update_password_hash.assert_awaited_once()
+    updated_user_id, new_password_hash = repo.update_password_hash.await_args.args
+    assert updated_user_id == user_id
+    assert new_password_hash.startswith("$2b$04$")
+    assert verify_password(password, new_password_hash)
+    assert logger.info.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_log_in_user_use_case_keeps_password_hash_with_same_rounds() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = LogInUserUseCase(
+        repo,
+        logger,
+        jwt_secret="secret",
+        jwt_expires_in=datetime.timedelta(seconds=3600),
+        jwt_algorithm="HS256",
+        password_hash_rounds=4,
+    )
+
+    password_hash = hash_password("password", rounds=4)
+    repo.get_user_by_username.return_value = UserInRepo(
+        id=uuid.uuid4(), username="user", password_hash=password_hash, role=Role.USER
+    )
+
+    await use_case.execute(UserLogIn(username="user", password="password"))
+
+    repo.update_password_hash.assert_not_awaited()
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_log_in_user_use_case_when_rehash_fails() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = LogInUserUseCase(
+        repo,
+        logger,
+        jwt_secret="secret",
+        jwt_expires_in=datetime.timedelta(seconds=3600),
+        jwt_algorithm="HS256",
+        password_hash_rounds=4,
+    )
+
+    user_id = uuid.uuid4()
+    password_hash = hash_password("password", rounds=5)
+    repo.get_user_by_username.return_value = UserInRepo(
+        id=user_id, username="user", password_hash=password_hash, role=Role.USER
+    )
+    repo.update_password_hash.side_effect = PasswordHashNotUpdatedError(user_id)
+
+    token = await use_case.execute(UserLogIn(username="user", password="password"))
+
+    assert token
+    repo.update_password_hash.assert_awaited_once()
+    assert logger.warning.call_args.kwargs == {"exc_info": True}
+    assert logger.info.call_count == 3
+
+
+def test_calibrate_password_hash_rounds() -> None:
+    assert calibrate_password_hash_rounds(datetime.timedelta(0)) == 4
+    rounds = calibrate_password_hash_rounds(
+        datetime.timedelta(hours=1), max_rounds=6, samples=3
+    )
+    assert rounds == 6
+
+
+def test_token_issuer_issues_tokens_like_create_access_token_for_user() -> None:
+    issuer = TokenIssuer(
+        {"1": "secret"}, "1", "HS256", datetime.timedelta(seconds=3600)
+    )
+    user = UserInToken(id=uuid.uuid4(), role=Role.ADMIN)
+    created_at = datetime.datetime.utcnow()
+
+    token = issuer.issue(user, created_at)
+    expected = create_access_token_for_user(
+        user, created_at, "secret", datetime.timedelta(seconds=3600), "HS256"
+    )
+
+    options = {"verify_exp": False}
+    assert jwt.decode(token, "secret", ["HS256"], options=options) == jwt.decode(
+        expected, "secret", ["HS256"], options=options
+    )
+    assert jwt.get_unverified_header(token)["kid"] == "1"
+    assert issuer.decode(token) == user
+
+
+def test_token_issuer_rotates_keys() -> None:
+    issuer = TokenIssuer({"1": "old"}, "1", "HS256", datetime.timedelta(seconds=3600))
+    user = UserInToken(id=uuid.uuid4(), role=Role.USER)
+    old_token = issuer.issue(user, datetime.datetime.utcnow())
+
+    issuer.rotate("2", "new")
+    new_token = issuer.issue(user, datetime.datetime.utcnow())
+
+    assert jwt.get_unverified_header(new_token)["kid"] == "2"
+    assert issuer.decode(old_token) == issuer.decode(new_token) == user
+    with pytest.raises(ValueError):
+        issuer.retire("2")
+
+    issuer.retire("1")
+
+    assert issuer.decode(new_token) == user
+    with pytest.raises(InvalidAccessTokenError):
+        issuer.decode(old_token)
+
+
+def test_token_issuer_rejects_invalid_tokens_and_keys() -> None:
+    issuer = TokenIssuer({"1": "secret"}, "1", "HS256", datetime.timedelta(seconds=1))
+    user = UserInToken(id=uuid.uuid4(), role=Role.USER)
+    expired_at = datetime.datetime.utcnow() - datetime.timedelta(seconds=10)
+
+    with pytest.raises(InvalidAccessTokenError):
+        issuer.decode(issuer.issue(user, expired_at))
+    with pytest.raises(InvalidAccessTokenError):
+        issuer.decode("token")
+    with pytest.raises(ValueError):
+        TokenIssuer({"1": "secret"}, "2", "HS256", datetime.timedelta(seconds=1))
+    with pytest.raises(ValueError):
+        TokenIssuer({"1": "secret"}, "1", "none", datetime.timedelta(seconds=1))
+    with pytest.raises(jwt.InvalidKeyError):
+        issuer.rotate("2", "-----BEGIN PUBLIC KEY-----\nMFkw\n-----END PUBLIC KEY-----")
+
+
+def test_token_issuer_rejects_public_key() -> None:
+    pytest.importorskip("cryptography")
+    public_key = (
+        "-----BEGIN PUBLIC KEY-----\n"
+        "MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEET2JR2Hi9/Aierbir/y723YBB1Cz\n"
+        "co/2UdGaZyD+UaPne50mmoIRALXbIrtjnMcsISbvw1bcz6PBmdHlO/HEDA==\n"
+        "-----END PUBLIC KEY-----"
+    )
+
+    with pytest.raises(jwt.InvalidKeyError):
+        TokenIssuer({"1": public_key}, "1", "ES256", datetime.timedelta(seconds=1))
+
+
+@pytest.mark.asyncio
+async def test_log_in_user_use_case_with_token_issuer() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    issuer = TokenIssuer(
+        {"1": "secret"}, "1", "HS256", datetime.timedelta(seconds=3600)
+    )
+    use_case = LogInUserUseCase(
+        repo,
+        logger,
+        jwt_secret="secret",
+        jwt_expires_in=datetime.timedelta(seconds=3600),
+        jwt_algorithm="HS256",
+        token_issuer=issuer,
+    )
+
+    user_id = uuid.uuid4()
+    repo.get_user_by_username.return_value = UserInRepo(
+        id=user_id,
+        username="user",
+        password_hash=hash_password("password", rounds=4),
+        role=Role.USER,
+    )
+
+    token = await use_case.execute(UserLogIn(username="user", password="password"))
+
+    assert issuer.decode(token) == UserInToken(id=user_id, role=Role.USER)
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_delete_user_use_case() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = DeleteUserUseCase(repo, logger)
+
+    user_id = uuid.uuid4()
+
+    await use_case.execute(user_id)
+
+    repo.delete_user.assert_awaited_once_with(user_id)
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_log_in_user_with_refresh_token_use_case() -> None:
+    repo = mock.AsyncMock()
+    session_repo = mock.AsyncMock()
+    logger = mock.Mock()
+    issuer = TokenIssuer(
+        {"1": "secret"}, "1", "HS256", datetime.timedelta(seconds=3600)
+    )
+    use_case = LogInUserWithRefreshTokenUseCase(
+        repo,
+        session_repo,
+        logger,
+        token_issuer=issuer,
+        refresh_token_expires_in=datetime.timedelta(days=30),
+    )
+
+    user_id = uuid.uuid4()
+    repo.get_user_by_username.return_value = UserInRepo(
+        id=user_id,
+        username="user",
+        password_hash=hash_password("password", rounds=4),
+        role=Role.USER,
+    )
+
+    tokens = await use_case.execute(UserLogIn(username="user", password="password"))
+
+    assert issuer.decode(tokens.access_token) == UserInToken(user_id, Role.USER)
+    session = session_repo.add_session.await_args.args[0]
+    assert session.token_hash == hash_refresh_token(tokens.refresh_token)
+    assert session.user_id == user_id
+    assert logger.info.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_refresh_access_token_use_case() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    issuer = TokenIssuer(
+        {"1": "secret"}, "1", "HS256", datetime.timedelta(seconds=3600)
+    )
+    use_case = RefreshAccessTokenUseCase(repo, logger, issuer)
+
+    user = UserInToken(id=uuid.uuid4(), role=Role.ADMIN)
+    expires_at = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(
+        days=1
+    )
+    repo.get_session.return_value = SessionInRepo(1, user, expires_at)
+
+    token = await use_case.execute("refresh token")
+
+    assert issuer.decode(token) == user
+    repo.get_session.assert_awaited_once_with(hash_refresh_token("refresh token"))
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_access_token_use_case_when_session_is_invalid() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    issuer = TokenIssuer(
+        {"1": "secret"}, "1", "HS256", datetime.timedelta(seconds=3600)
+    )
+    use_case = RefreshAccessTokenUseCase(repo, logger, issuer)
+
+    user = UserInToken(id=uuid.uuid4(), role=Role.USER)
+    expired_at = datetime.datetime.now(datetime.timezone.utc)
+    repo.get_session.return_value = SessionInRepo(1, user, expired_at)
+
+    with pytest.raises(InvalidRefreshTokenError):
+        await use_case.execute("refresh token")
+
+    repo.get_session.side_effect = InvalidRefreshTokenError()
+
+    with pytest.raises(InvalidRefreshTokenError):
+        await use_case.execute("refresh token")
+
+    assert logger.info.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_revoke_refresh_token_use_case() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = RevokeRefreshTokenUseCase(repo, logger)
+
+    await use_case.execute("refresh token")
+
+    repo.revoke_session.assert_awaited_once_with(hash_refresh_token("refresh token"))
+    assert logger.info.call_count == 2
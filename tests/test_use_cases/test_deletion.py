@@ -0,0 +1,39 @@
+import datetime
+from unittest import mock
+
+import pytest
+
+from tvsched.application.use_cases.deletion.get_deletion_jobs_use_case import (
+    GetDeletionJobsUseCase,
+)
+from tvsched.entities.deletion import DeletionJob, DeletionTargetKind
+
+
+@pytest.mark.asyncio
+async def test_get_deletion_jobs_use_case() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = GetDeletionJobsUseCase(repo, logger)
+
+    jobs = [
+        DeletionJob(
+            id=1,
+            kind=DeletionTargetKind.SHOW,
+            show_id=5,
+            user_id=None,
+            step=2,
+            steps_count=4,
+            deleted_rows=1000,
+            created_at=datetime.datetime(2022, 1, 1),
+            finished_at=None,
+        )
+    ]
+    repo.get_deletion_jobs.return_value = jobs
+
+    res = await use_case.execute(unfinished_only=True, limit=10)
+
+    assert res == jobs
+    repo.get_deletion_jobs.assert_awaited_once_with(
+        unfinished_only=True, limit=10, offset=None
+    )
+    assert logger.info.call_count == 2
@@ -5,19 +5,41 @@ import pytest
 
 from tvsched.application.exceptions.episode import EpisodeNotFoundError
 from tvsched.application.exceptions.show import ShowNotFoundError
-from tvsched.application.models.episode import EpisodeAdd, EpisodeUpdate
+from tvsched.application.models.common import EntitiesByIds
+from tvsched.application.models.episode import (
+    EpisodeAdd,
+    EpisodesCursor,
+    EpisodesPage,
+    EpisodeUpdate,
+    SeasonAirDatesShift,
+)
 from tvsched.application.use_cases.episode.add_episode_use_case import AddEpisodeUseCase
 from tvsched.application.use_cases.episode.delete_episode_use_case import (
     DeleteEpisodeUseCase,
 )
 from tvsched.application.use_cases.episode.get_episode_use_case import GetEpisodeUseCase
+from tvsched.application.use_cases.episode.get_episodes_by_ids_use_case import (
+    GetEpisodesByIdsUseCase,
+)
+from tvsched.application.use_cases.episode.get_episodes_page_use_case import (
+    GetEpisodesPageUseCase,
+)
 from tvsched.application.use_cases.episode.get_episodes_use_case import (
     GetEpisodesFromShowUseCase,
 )
+from tvsched.application.use_cases.episode.get_season_summaries_use_case import (
+    GetSeasonSummariesUseCase,
+)
 from tvsched.application.use_cases.episode.update_episode_use_case import (
     UpdateEpisodeUseCase,
 )
-from tvsched.entities.episode import Episode
+from tvsched.application.use_cases.episode.shift_season_air_dates_use_case import (
+    ShiftSeasonAirDatesUseCase,
+)
+from tvsched.application.use_cases.episode.update_episodes_use_case import (
+    UpdateEpisodesUseCase,
+)
+from tvsched.entities.episode import Episode, SeasonSummary
 
 
 @pytest.mark.asyncio
@@ -135,3 +157,96 @@ async def test_get_episodes_from_show_use_case() -> None:
     assert res == episodes
     repo.get_episodes_from_show.assert_awaited_once_with(show_id)
     assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_episodes_by_ids_use_case() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = GetEpisodesByIdsUseCase(repo, logger)
+
+    episode_ids = [3, 1]
+    expected = EntitiesByIds(
+        found=[
+            Episode(
+                id=3,
+                name="name",
+                season=1,
+                number=3,
+                air_date=datetime.datetime.now(),
+                show_id=5,
+            )
+        ],
+        missing_ids=[1],
+    )
+    repo.get_many.return_value = expected
+
+    episodes = await use_case.execute(episode_ids)
+
+    assert episodes == expected
+    repo.get_many.assert_awaited_once_with(episode_ids)
+    assert logger.info.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_update_episodes_use_case() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = UpdateEpisodesUseCase(repo, logger)
+
+    episodes = [EpisodeUpdate(id=1, name="test"), EpisodeUpdate(id=2, season=3)]
+
+    await use_case.execute(episodes)
+
+    repo.update_many.assert_awaited_once_with(episodes)
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_shift_season_air_dates_use_case() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = ShiftSeasonAirDatesUseCase(repo, logger)
+
+    shift = SeasonAirDatesShift(show_id=1, season=2, delta=datetime.timedelta(days=7))
+    repo.shift_season_air_dates.return_value = 10
+
+    res = await use_case.execute(shift)
+
+    assert res == 10
+    repo.shift_season_air_dates.assert_awaited_once_with(shift)
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_episodes_page_use_case() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = GetEpisodesPageUseCase(repo, logger)
+
+    after = EpisodesCursor(season=2, number=10, id=35)
+    page = EpisodesPage(episodes=[], next_cursor=None)
+    repo.get_episodes_page.return_value = page
+
+    res = await use_case.execute(1, season=2, after=after, limit=20)
+
+    assert res == page
+    repo.get_episodes_page.assert_awaited_once_with(1, season=2, after=after, limit=20)
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_season_summaries_use_case() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = GetSeasonSummariesUseCase(repo, logger)
+
+    air_date = datetime.datetime(2022, 1, 1)
+    summaries = [SeasonSummary(1, 10, air_date, air_date + datetime.timedelta(days=63))]
+    repo.get_season_summaries.return_value = summaries
+
+    res = await use_case.execute(1)
+
+    assert res == summaries
+    repo.get_season_summaries.assert_awaited_once_with(1)
+    assert logger.info.call_count == 2
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import uuid
 from unittest import mock
@@ -10,7 +11,12 @@ from tvsched.application.exceptions.schedule import (
     ShowOrScheduleNotFoundError,
     ShowAlreadyExistsInScheduleError,
 )
-from tvsched.application.models.schedule import EpisodeInSchedule, ShowInSchedule
+from tvsched.application.models.common import Versioned
+from tvsched.application.models.schedule import (
+    EpisodeInSchedule,
+    SchedulePage,
+    ShowInSchedule,
+)
 from tvsched.application.use_cases.schedule.get_first_unwatched_episodes_use_case import (
     GetFirstUnwatchedEpisodesFromScheduleUseCase,
 )
@@ -32,8 +38,36 @@ from tvsched.application.use_cases.schedule.get_suggested_shows_use_case import
 from tvsched.application.use_cases.schedule.delete_show_from_schedule_use_case import (
     DeleteShowFromScheduleUseCase,
 )
+from tvsched.application.use_cases.schedule.get_schedule_page_use_case import (
+    GetSchedulePageUseCase,
+)
+from tvsched.application.use_cases.schedule.get_schedule_progress_use_case import (
+    GetScheduleProgressUseCase,
+)
+from tvsched.application.use_cases.schedule.get_upcoming_episodes_use_case import (
+    GetUpcomingEpisodesFromScheduleUseCase,
+)
+from tvsched.application.use_cases.schedule.get_precomputed_suggested_shows_use_case import (
+    GetPrecomputedSuggestedShowsUseCase,
+)
+from tvsched.application.use_cases.schedule.compact_schedule_changes_use_case import (
+    CompactScheduleChangesUseCase,
+)
+from tvsched.application.use_cases.schedule.get_schedule_changes_since_use_case import (
+    GetScheduleChangesSinceUseCase,
+)
+from tvsched.application.use_cases.schedule.get_versioned_shows_from_schedule_use_case import (
+    GetVersionedShowsFromScheduleUseCase,
+)
 from tvsched.entities.actor import Actor
 from tvsched.entities.episode import Episode
+from tvsched.entities.schedule import (
+    ScheduleChange,
+    ScheduleChangeKind,
+    ScheduleChanges,
+    ShowProgress,
+    SuggestedShows,
+)
 from tvsched.entities.show import Show
 
 
@@ -239,3 +273,221 @@ async def test_get_first_unwatched_episodes_from_schedule_use_case() -> None:
     assert res == episodes
     repo.get_first_unwatched_episodes_from_schedule.assert_awaited_once_with(user_id)
     assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_upcoming_episodes_from_schedule_use_case() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = GetUpcomingEpisodesFromScheduleUseCase(repo, logger)
+
+    user_id = uuid.uuid4()
+    starts_at = datetime.datetime(2022, 1, 1)
+    episodes = [
+        Episode(
+            id=1,
+            name="name",
+            season=1,
+            number=1,
+            air_date=datetime.datetime(2022, 1, 3),
+            show_id=1,
+        )
+    ]
+    repo.get_upcoming_episodes_from_schedule.return_value = episodes
+
+    res = await use_case.execute(user_id, starts_at=starts_at, limit=10)
+
+    assert res == episodes
+    repo.get_upcoming_episodes_from_schedule.assert_awaited_once_with(
+        user_id,
+        starts_at=starts_at,
+        ends_at=datetime.datetime(2022, 1, 8),
+        limit=10,
+        offset=None,
+    )
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_schedule_progress_use_case() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = GetScheduleProgressUseCase(repo, logger)
+
+    user_id = uuid.uuid4()
+    progress = [
+        ShowProgress(show_id=1, watched_count=12, total_count=60, next_episode_id=13),
+        ShowProgress(show_id=2, watched_count=8, total_count=8, next_episode_id=None),
+    ]
+    repo.get_schedule_progress.return_value = progress
+
+    res = await use_case.execute(user_id)
+
+    assert res == progress
+    repo.get_schedule_progress.assert_awaited_once_with(user_id)
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_precomputed_suggested_shows_use_case() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = GetPrecomputedSuggestedShowsUseCase(repo, logger)
+
+    user_id = uuid.uuid4()
+    suggested = SuggestedShows(
+        shows=[
+            Show(
+                id=2,
+                name="GOT",
+                seasons_count=8,
+                image_url="url",
+                cast=[Actor(id=1, name="name", image_url="test_url")],
+            )
+        ],
+        computed_at=datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc),
+    )
+    repo.get_precomputed_suggested_shows.return_value = suggested
+
+    res = await use_case.execute(user_id)
+
+    assert res == suggested
+    repo.get_precomputed_suggested_shows.assert_awaited_once_with(user_id)
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_schedule_changes_since_use_case() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = GetScheduleChangesSinceUseCase(repo, logger)
+
+    user_id = uuid.uuid4()
+    changes = ScheduleChanges(
+        version=12,
+        reset=False,
+        changes=[
+            ScheduleChange(
+                kind=ScheduleChangeKind.SHOW, target_id=3, version=11, deleted=True
+            ),
+            ScheduleChange(
+                kind=ScheduleChangeKind.WATCHED_EPISODE,
+                target_id=8,
+                version=12,
+                deleted=False,
+            ),
+        ],
+    )
+    repo.get_schedule_changes_since.return_value = changes
+
+    res = await use_case.execute(user_id, 10)
+
+    assert res == changes
+    repo.get_schedule_changes_since.assert_awaited_once_with(user_id, 10)
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_compact_schedule_changes_use_case() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = CompactScheduleChangesUseCase(repo, logger)
+
+    repo.compact_schedule_changes.side_effect = [100, 100, 30]
+
+    res = await use_case.execute(datetime.timedelta(days=7), batch_size=100)
+
+    assert res == 230
+    assert repo.compact_schedule_changes.await_count == 3
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_versioned_shows_from_schedule_use_case_when_not_modified() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = GetVersionedShowsFromScheduleUseCase(repo, logger)
+
+    user_id = uuid.uuid4()
+    repo.get_schedule_version.return_value = "3.2.5"
+
+    res = await use_case.execute(user_id, if_version="3.2.5")
+
+    assert res == Versioned(version="3.2.5", entity=None)
+    assert res.not_modified
+    repo.get_schedule_version.assert_awaited_once_with(user_id)
+    repo.get_shows_from_schedule.assert_not_awaited()
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_versioned_shows_from_schedule_use_case_when_modified() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = GetVersionedShowsFromScheduleUseCase(repo, logger)
+
+    user_id = uuid.uuid4()
+    shows = [
+        Show(
+            id=1,
+            name="GOT",
+            seasons_count=8,
+            image_url="url",
+            cast=[Actor(id=1, name="name", image_url="test_url")],
+        )
+    ]
+    repo.get_schedule_version.return_value = "4.2.5"
+    repo.get_shows_from_schedule.return_value = shows
+
+    res = await use_case.execute(user_id, if_version="3.2.5")
+
+    assert res == Versioned(version="4.2.5", entity=shows)
+    repo.get_shows_from_schedule.assert_awaited_once_with(user_id)
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_schedule_page_use_case_runs_reads_concurrently() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = GetSchedulePageUseCase(repo, logger, budget=2)
+
+    running = 0
+    max_running = 0
+
+    async def read(user_id: uuid.UUID) -> list:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return []
+
+    repo.get_shows_from_schedule.side_effect = read
+    repo.get_schedule_progress.side_effect = read
+    repo.get_first_unwatched_episodes_from_schedule.side_effect = read
+    user_id = uuid.uuid4()
+
+    res = await use_case.execute(user_id)
+
+    assert res == SchedulePage(shows=[], progress=[], first_unwatched_episodes=[])
+    assert max_running == 2
+    repo.get_schedule_progress.assert_awaited_once_with(user_id)
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_schedule_page_use_case_raises_error_of_first_failed_read() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = GetSchedulePageUseCase(repo, logger)
+
+    async def fail_later(user_id: uuid.UUID) -> list:
+        await asyncio.sleep(0.01)
+        raise LookupError("shows")
+
+    repo.get_shows_from_schedule.side_effect = fail_later
+    repo.get_first_unwatched_episodes_from_schedule.side_effect = ValueError()
+
+    with pytest.raises(LookupError):
+        await use_case.execute(uuid.uuid4())
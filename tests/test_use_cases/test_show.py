@@ -1,3 +1,4 @@
+import uuid
 from unittest import mock
 
 import pytest
@@ -5,13 +6,33 @@ import pytest
 from tvsched.application.exceptions.show import (
     ShowNotFoundError,
 )
+from tvsched.application.models.common import (
+    EntitiesByIds,
+    NameCompletion,
+    Versioned,
+)
 from tvsched.application.models.show import ShowAdd, ShowUpdate
 from tvsched.application.use_cases.show.add_show_use_case import AddShowUseCase
+from tvsched.application.use_cases.show.complete_show_names_use_case import (
+    CompleteShowNamesUseCase,
+)
 from tvsched.application.use_cases.show.delete_show_use_case import DeleteShowUseCase
+from tvsched.application.use_cases.show.get_show_details_use_case import (
+    GetShowDetailsUseCase,
+)
+from tvsched.application.use_cases.show.get_shows_by_ids_use_case import (
+    GetShowsByIdsUseCase,
+)
 from tvsched.application.use_cases.show.get_shows_use_case import GetShowsUseCase
+from tvsched.application.use_cases.show.search_shows_use_case import (
+    SearchShowsUseCase,
+)
 from tvsched.application.use_cases.show.update_show_use_case import UpdateShowUseCase
+from tvsched.application.use_cases.show.get_versioned_show_use_case import (
+    GetVersionedShowUseCase,
+)
 from tvsched.entities.actor import Actor
-from tvsched.entities.show import Show
+from tvsched.entities.show import Show, ShowDetails
 from tvsched.application.use_cases.show.get_show_use_case import GetShowUseCase
 
 
@@ -55,6 +76,38 @@ async def test_get_show_use_case_when_show_not_exists() -> None:
     assert logger.info.call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_get_show_details_use_case() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = GetShowDetailsUseCase(repo, logger)
+
+    show = Show(id=5, name="Game of Thrones", seasons_count=8, image_url="url", cast=[])
+    details = ShowDetails(show=show, seasons=[], watched_episode_ids=[])
+    repo.get_details.return_value = details
+    user_id = uuid.uuid4()
+
+    res = await use_case.execute(5, user_id=user_id)
+
+    assert res == details
+    repo.get_details.assert_awaited_once_with(5, user_id=user_id)
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_show_details_use_case_when_show_not_exists() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = GetShowDetailsUseCase(repo, logger)
+
+    repo.get_details.side_effect = ShowNotFoundError(6)
+
+    with pytest.raises(ShowNotFoundError):
+        await use_case.execute(6)
+
+    repo.get_details.assert_awaited_once_with(6, user_id=None)
+
+
 @pytest.mark.asyncio
 async def test_get_shows_use_case() -> None:
     repo = mock.AsyncMock()
@@ -169,3 +222,155 @@ async def test_update_show_use_case() -> None:
 
     repo.update.assert_awaited_once_with(show)
     assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_shows_by_ids_use_case() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = GetShowsByIdsUseCase(repo, logger)
+
+    show_ids = [2, 1]
+    expected = EntitiesByIds(
+        found=[
+            Show(
+                id=2,
+                name="GOT",
+                seasons_count=8,
+                image_url="url",
+                cast=[Actor(id=1, name="name", image_url="test_url")],
+            )
+        ],
+        missing_ids=[1],
+    )
+    repo.get_many.return_value = expected
+
+    res = await use_case.execute(show_ids)
+
+    assert res == expected
+    repo.get_many.assert_awaited_once_with(show_ids)
+    assert logger.info.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_search_shows_use_case() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = SearchShowsUseCase(repo, logger)
+
+    shows = [
+        Show(
+            id=2,
+            name="Game of Thrones",
+            seasons_count=8,
+            image_url="url",
+            cast=[Actor(id=1, name="Kit Harington", image_url="url")],
+        )
+    ]
+    repo.search.return_value = shows
+
+    res = await use_case.execute("harington", limit=5, include_cast=True)
+
+    assert res == shows
+    repo.search.assert_awaited_once_with("harington", limit=5, include_cast=True)
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_search_shows_use_case_with_blank_query() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = SearchShowsUseCase(repo, logger)
+
+    res = await use_case.execute("")
+
+    assert res == []
+    repo.search.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_complete_show_names_use_case() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = CompleteShowNamesUseCase(repo, logger)
+
+    completions = [NameCompletion(id=1, name="Game")]
+    repo.complete_show_names.return_value = completions
+
+    res = await use_case.execute("ga", limit=5)
+
+    assert res == completions
+    repo.complete_show_names.assert_awaited_once_with("ga", limit=5)
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_versioned_show_use_case_when_not_modified() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = GetVersionedShowUseCase(repo, logger)
+
+    repo.get_version.return_value = "7"
+
+    res = await use_case.execute(5, if_version="7")
+
+    assert res == Versioned(version="7", entity=None)
+    assert res.not_modified
+    repo.get_version.assert_awaited_once_with(5)
+    repo.get_versioned.assert_not_awaited()
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_versioned_show_use_case_when_modified() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = GetVersionedShowUseCase(repo, logger)
+
+    show = Show(
+        id=5,
+        name="Game of Thrones",
+        seasons_count=8,
+        image_url="url",
+        cast=[Actor(id=2, name="Peter", image_url="url")],
+    )
+    repo.get_version.return_value = "8"
+    repo.get_versioned.return_value = Versioned(version="9", entity=show)
+
+    res = await use_case.execute(5, if_version="7")
+
+    assert res == Versioned(version="9", entity=show)
+    assert not res.not_modified
+    repo.get_versioned.assert_awaited_once_with(5)
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_versioned_show_use_case_without_known_version() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = GetVersionedShowUseCase(repo, logger)
+
+    show = Show(id=5, name="Game of Thrones", seasons_count=8, image_url="url", cast=[])
+    repo.get_versioned.return_value = Versioned(version="8", entity=show)
+
+    res = await use_case.execute(5)
+
+    assert res == Versioned(version="8", entity=show)
+    repo.get_version.assert_not_awaited()
+    assert logger.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_versioned_show_use_case_when_show_not_exists() -> None:
+    repo = mock.AsyncMock()
+    logger = mock.Mock()
+    use_case = GetVersionedShowUseCase(repo, logger)
+
+    repo.get_version.side_effect = ShowNotFoundError(6)
+
+    with pytest.raises(ShowNotFoundError):
+        await use_case.execute(6, if_version="1")
+
+    repo.get_versioned.assert_not_awaited()
+    assert logger.info.call_count == 2
@@ -0,0 +1,34 @@
+import typing
+
+from tvsched.adapters.lazy import lazy_exports
+
+if typing.TYPE_CHECKING:
+    from tvsched.adapters.cache.invalidation import (
+        EntityChanged,
+        EntityKind,
+        InvalidationBus,
+        InvalidationPublisher,
+    )
+    from tvsched.adapters.cache.prefix_index import PrefixIndex
+    from tvsched.adapters.cache.type_ahead import TypeAheadIndex
+
+__all__ = [
+    "EntityChanged",
+    "EntityKind",
+    "InvalidationBus",
+    "InvalidationPublisher",
+    "PrefixIndex",
+    "TypeAheadIndex",
+]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "EntityChanged": "invalidation",
+        "EntityKind": "invalidation",
+        "InvalidationBus": "invalidation",
+        "InvalidationPublisher": "invalidation",
+        "PrefixIndex": "prefix_index",
+        "TypeAheadIndex": "type_ahead",
+    },
+)
@@ -0,0 +1,290 @@
+import asyncio
+import contextlib
+import contextvars
+import datetime
+import enum
+import json
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterable, Optional, Protocol
+
+import asyncpg
+from databases.core import Connection
+
+from tvsched.application.interfaces import ILogger
+
+DEFAULT_CHANNEL = "tvsched_invalidation"
+
+
+class EntityKind(str, enum.Enum):
+    """Kind of cached entity."""
+
+    SHOW = "show"
+    EPISODE = "episode"
+    ACTOR = "actor"
+    SESSION = "session"
+
+
+@dataclass(frozen=True)
+class EntityChanged:
+    """Entities with ids `ids` of kind `kind` were added, updated or deleted."""
+
+    kind: EntityKind
+    ids: tuple[int, ...]
+
+
+class IInvalidationSubscriber(Protocol):
+    """In-process cache which must be invalidated on entity changes."""
+
+    def on_entity_changed(self, event: EntityChanged) -> None:
+        """Invalidates cached entities from `event`.
+
+        Args:
+            event (EntityChanged)
+        """
+
+    def on_flush(self) -> None:
+        """Invalidates all cached entities.
+
+        Called when changes could be missed, for example
+        after reconnect of listening connection.
+        """
+
+
+class _PendingChanges:
+    def __init__(self) -> None:
+        self.ids: dict[EntityKind, set[int]] = {}
+
+    def add(self, kind: EntityKind, ids: Iterable[int]) -> None:
+        self.ids.setdefault(kind, set()).update(ids)
+
+
+class InvalidationPublisher:
+    """Publishes entity changed events to all workers with NOTIFY.
+
+    Events published inside transaction are delivered after its commit
+    and are not delivered if it was rolled back.
+    """
+
+    def __init__(
+        self,
+        channel: str = DEFAULT_CHANNEL,
+        max_ids_per_notification: int = 500,
+        logger: Optional[ILogger] = None,
+    ) -> None:
+        self._channel = channel
+        self._logger = logger
+        self._max_ids_per_notification = max_ids_per_notification
+        self._pending: contextvars.ContextVar[Optional[_PendingChanges]] = (
+            contextvars.ContextVar("pending_invalidations", default=None)
+        )
+
+    async def publish(
+        self, db: Connection, kind: EntityKind, ids: Iterable[int]
+    ) -> None:
+        """Publishes change of entities of kind `kind` with ids `ids`.
+
+        Inside `batch` event is deferred until the end of batch.
+
+        Args:
+            db (Connection): connection used for write
+            kind (EntityKind)
+            ids (Iterable[int])
+        """
+
+        pending = self._pending.get()
+        if pending is not None:
+            pending.add(kind, ids)
+            return
+
+        changes = _PendingChanges()
+        changes.add(kind, ids)
+        await self._notify(db, changes)
+
+    @contextlib.asynccontextmanager
+    async def batch(self, db: Connection) -> AsyncIterator[None]:
+        """Collects events published inside block and sends them
+        with as few notifications as possible at the end of block.
+
+        Use it for bulk imports.
+
+        If block failed, events are sent only when `db` is not in transaction,
+        because then changes made before failure are already committed.
+        Failure to send them is logged, so it does not mask error of block.
+
+        Args:
+            db (Connection): connection for sending notifications
+        """
+
+        changes = _PendingChanges()
+        token = self._pending.set(changes)
+        try:
+            yield
+        except BaseException:
+            self._pending.reset(token)
+            await self._notify_after_failure(db, changes)
+            raise
+
+        self._pending.reset(token)
+        await self._notify(db, changes)
+
+    async def _notify_after_failure(
+        self, db: Connection, changes: _PendingChanges
+    ) -> None:
+        if not changes.ids:
+            return
+
+        try:
+            async with db as connection:
+                if connection.raw_connection.is_in_transaction():
+                    return
+
+            await self._notify(db, changes)
+        except Exception:
+            if self._logger is not None:
+                self._logger.exception("Failed to publish invalidations of batch")
+
+    async def _notify(self, db: Connection, changes: _PendingChanges) -> None:
+        query = "SELECT pg_notify(:channel, :payload);"
+
+        size = self._max_ids_per_notification
+        for kind, ids in changes.ids.items():
+            sorted_ids = sorted(ids)
+            for i in range(0, len(sorted_ids), size):
+                payload = json.dumps(
+                    {"kind": kind.value, "ids": sorted_ids[i : i + size]}
+                )
+                values = dict(channel=self._channel, payload=payload)
+                await db.execute(query, values=values)
+
+
+async def publish_changes(
+    publisher: Optional[InvalidationPublisher],
+    db: Connection,
+    kind: EntityKind,
+    ids: Iterable[int],
+) -> None:
+    """Publishes change of entities if repo is configured with `publisher`.
+
+    Args:
+        publisher (Optional[InvalidationPublisher])
+        db (Connection): connection used for write
+        kind (EntityKind)
+        ids (Iterable[int])
+    """
+
+    if publisher is not None:
+        await publisher.publish(db, kind, ids)
+
+
+class InvalidationBus:
+    """Delivers entity changed events published by any worker to local subscribers.
+
+    Listens for notifications on dedicated connection. All subscribers are
+    flushed after every (re)connect because notifications sent while
+    connection was lost are never delivered. Failed reconnects are retried
+    with delay doubled after every failure up to `max_reconnect_delay`.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        logger: ILogger,
+        channel: str = DEFAULT_CHANNEL,
+        reconnect_delay: datetime.timedelta = datetime.timedelta(seconds=1),
+        max_reconnect_delay: datetime.timedelta = datetime.timedelta(seconds=30),
+    ) -> None:
+        self._dsn = dsn
+        self._logger = logger
+        self._channel = channel
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+        self._subscribers: list[IInvalidationSubscriber] = []
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def subscribe(self, subscriber: IInvalidationSubscriber) -> None:
+        """Adds subscriber.
+
+        Args:
+            subscriber (IInvalidationSubscriber)
+        """
+
+        self._subscribers.append(subscriber)
+
+    def start(self) -> None:
+        """Starts listening in background task."""
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen_forever())
+
+    async def stop(self) -> None:
+        """Stops listening."""
+
+        task = self._task
+        self._task = None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def dispatch(self, event: EntityChanged) -> None:
+        """Delivers `event` to all subscribers.
+
+        Args:
+            event (EntityChanged)
+        """
+
+        for subscriber in self._subscribers:
+            subscriber.on_entity_changed(event)
+
+    def flush(self) -> None:
+        """Flushes all subscribers."""
+
+        for subscriber in self._subscribers:
+            subscriber.on_flush()
+
+    async def _listen_forever(self) -> None:
+        delay = self._reconnect_delay.total_seconds()
+        max_delay = self._max_reconnect_delay.total_seconds()
+
+        while True:
+            try:
+                await self._listen()
+                # connection was established, so next reconnect is not delayed long
+                delay = self._reconnect_delay.total_seconds()
+            except Exception:
+                # listener must survive any failure, e.g. invalid dsn
+                # or error of subscriber, otherwise caches are never flushed
+                self._logger.exception("Invalidation listener failed")
+
+            self._logger.info(f"Reconnect invalidation listener in {delay} seconds")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_delay)
+
+    async def _listen(self) -> None:
+        connection = await asyncpg.connect(self._dsn)
+        closed = asyncio.Event()
+        connection.add_termination_listener(lambda _: closed.set())
+
+        try:
+            await connection.add_listener(self._channel, self._on_notification)
+            self.flush()
+            self._logger.info(f"Start listening for invalidations on {self._channel}")
+            await closed.wait()
+            self._logger.warning("Invalidation listener connection was closed")
+        finally:
+            if not connection.is_closed():
+                await connection.close()
+
+    def _on_notification(
+        self, connection: object, pid: int, channel: str, payload: str
+    ) -> None:
+        try:
+            data = json.loads(payload)
+            event = EntityChanged(
+                kind=EntityKind(data["kind"]), ids=tuple(int(i) for i in data["ids"])
+            )
+        except (ValueError, KeyError, TypeError):
+            self._logger.error(f"Invalid invalidation payload {payload}")
+            return
+
+        self.dispatch(event)
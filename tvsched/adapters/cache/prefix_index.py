@@ -0,0 +1,236 @@
+import bisect
+import heapq
+import string
+import unicodedata
+from dataclasses import dataclass
+from typing import Iterable
+
+_MAX_CHAR = chr(0x10FFFF)
+_ASCII_PUNCTUATION = str.maketrans(string.punctuation, " " * len(string.punctuation))
+
+
+def normalize_name(name: str) -> str:
+    """Normalizes name for prefix matching.
+
+    Removes accents, folds case and replaces punctuation with spaces.
+
+    Example:
+        >>> normalize_name("  Amélie: The-Movie ")
+        'amelie the movie'
+
+    Args:
+        name (str)
+
+    Returns:
+        str
+    """
+
+    if name.isascii():
+        return " ".join(name.translate(_ASCII_PUNCTUATION).lower().split())
+
+    decomposed = unicodedata.normalize("NFKD", name)
+    chars = (
+        c if c.isalnum() else " " for c in decomposed if not unicodedata.combining(c)
+    )
+
+    return " ".join("".join(chars).casefold().split())
+
+
+@dataclass(frozen=True)
+class _Entry:
+    name: str
+    weight: int
+    keys: tuple[str, ...]
+
+
+class PrefixIndex:
+    """Sorted array of normalized names for top-k prefix completions.
+
+    Every name is indexed by its suffixes starting at word boundaries,
+    so prefix matches beginning of any word of name. Top lists of short
+    prefixes, which match too many names to rank them per query,
+    are precomputed with `hot_depth` reserve and maintained on updates,
+    so removal of top name rarely needs to rescan prefix range.
+
+    Memory is bounded by `max_entries` names, `max_words` keys per name
+    and `max_key_length` chars per key.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1_000_000,
+        max_words: int = 4,
+        max_key_length: int = 48,
+        hot_prefix_length: int = 3,
+        max_k: int = 10,
+        hot_depth: int = 40,
+    ) -> None:
+        self._max_entries = max_entries
+        self._max_words = max_words
+        self._max_key_length = max_key_length
+        self._hot_prefix_length = hot_prefix_length
+        self._max_k = max_k
+        self._hot_depth = max(hot_depth, max_k)
+        self._entries: dict[int, _Entry] = {}
+        self._keys: list[tuple[str, int]] = []
+        self._hot: dict[str, list[int]] = {}
+        # hot prefixes whose top lists contain all matching names
+        self._exhaustive: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def build(self, entries: Iterable[tuple[int, str, int]]) -> None:
+        """Replaces content of index with `entries`.
+
+        Entries over `max_entries` with the lowest weights are dropped.
+
+        Args:
+            entries (Iterable[tuple[int, str, int]]): id, name and weight
+        """
+
+        top = heapq.nlargest(self._max_entries, entries, key=lambda e: (e[2], -e[0]))
+
+        self._entries = {}
+        keys = []
+        for id_, name, weight in top:
+            entry = self._make_entry(name, weight)
+            self._entries[id_] = entry
+            keys.extend((key, id_) for key in entry.keys)
+
+        keys.sort()
+        self._keys = keys
+
+        self._hot = {}
+        self._exhaustive = set()
+        for n in range(1, self._hot_prefix_length + 1):
+            # keys with the same prefix are adjacent in sorted array
+            for prefix in {key[:n] for key, _ in keys if len(key) >= n}:
+                self._rescan_hot(prefix)
+
+    def upsert(self, id_: int, name: str, weight: int) -> bool:
+        """Adds or replaces name with id `id_`.
+
+        Args:
+            id_ (int)
+            name (str)
+            weight (int): popularity, completions with bigger weight go first
+
+        Returns:
+            bool: False if index is full and name was not added
+        """
+
+        if id_ not in self._entries and len(self._entries) >= self._max_entries:
+            return False
+
+        self.remove(id_)
+
+        entry = self._make_entry(name, weight)
+        self._entries[id_] = entry
+        for key in entry.keys:
+            bisect.insort(self._keys, (key, id_))
+            for prefix in self._hot_prefixes(key):
+                self._offer_hot(prefix, id_)
+
+        return True
+
+    def remove(self, id_: int) -> None:
+        """Removes name with id `id_` if it is in index.
+
+        Args:
+            id_ (int)
+        """
+
+        entry = self._entries.pop(id_, None)
+        if entry is None:
+            return
+
+        for key in entry.keys:
+            i = bisect.bisect_left(self._keys, (key, id_))
+            if i < len(self._keys) and self._keys[i] == (key, id_):
+                del self._keys[i]
+
+        hot_prefixes = {p for key in entry.keys for p in self._hot_prefixes(key)}
+        for prefix in hot_prefixes:
+            ids = self._hot.get(prefix, [])
+            if id_ not in ids:
+                continue
+
+            ids.remove(id_)
+            if len(ids) < self._max_k and prefix not in self._exhaustive:
+                self._rescan_hot(prefix)
+
+    def complete(self, prefix: str, k: int) -> list[tuple[int, str]]:
+        """Returns up to `k` names starting with `prefix` by descending weight.
+
+        Args:
+            prefix (str): not normalized prefix
+            k (int)
+
+        Returns:
+            list[tuple[int, str]]: ids and names
+        """
+
+        normalized = normalize_name(prefix)[: self._max_key_length]
+        if not normalized or k <= 0:
+            return []
+
+        if len(normalized) <= self._hot_prefix_length and k <= self._max_k:
+            ids = self._hot.get(normalized, [])[:k]
+        else:
+            ids = self._scan(normalized, k)
+
+        return [(id_, self._entries[id_].name) for id_ in ids]
+
+    def _make_entry(self, name: str, weight: int) -> _Entry:
+        words = normalize_name(name).split()
+        keys = {
+            " ".join(words[i:])[: self._max_key_length]
+            for i in range(min(len(words), self._max_words))
+        }
+
+        return _Entry(name=name, weight=weight, keys=tuple(sorted(keys)))
+
+    def _hot_prefixes(self, key: str) -> list[str]:
+        return [key[:n] for n in range(1, min(len(key), self._hot_prefix_length) + 1)]
+
+    def _scan(self, prefix: str, k: int) -> list[int]:
+        lo = bisect.bisect_left(self._keys, (prefix,))
+        hi = bisect.bisect_left(self._keys, (prefix + _MAX_CHAR,), lo)
+        ids = {id_ for _, id_ in self._keys[lo:hi]}
+
+        return heapq.nsmallest(k, ids, key=self._rank)
+
+    def _rescan_hot(self, prefix: str) -> None:
+        ids = self._scan(prefix, self._hot_depth)
+        self._hot[prefix] = ids
+        if len(ids) < self._hot_depth:
+            self._exhaustive.add(prefix)
+        else:
+            self._exhaustive.discard(prefix)
+
+    def _offer_hot(self, prefix: str, id_: int) -> None:
+        if prefix not in self._hot:
+            self._hot[prefix] = []
+            self._exhaustive.add(prefix)
+
+        ids = self._hot[prefix]
+        if id_ in ids:
+            return
+
+        ranks = [self._rank(i) for i in ids]
+        rank = self._rank(id_)
+        i = bisect.bisect_left(ranks, rank)
+        if i == len(ids) and prefix not in self._exhaustive:
+            # names after the last one are unknown
+            return
+
+        ids.insert(i, id_)
+        if len(ids) > self._hot_depth:
+            ids.pop()
+            self._exhaustive.discard(prefix)
+
+    def _rank(self, id_: int) -> tuple[int, str, int]:
+        entry = self._entries[id_]
+        # bigger weight first, ties are ordered by name and id
+        return (-entry.weight, entry.name, id_)
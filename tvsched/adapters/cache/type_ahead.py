@@ -0,0 +1,186 @@
+import asyncio
+from typing import Any, Optional, Union
+
+from databases.core import Connection
+
+from tvsched.adapters.cache.invalidation import EntityChanged, EntityKind
+from tvsched.adapters.cache.prefix_index import PrefixIndex
+from tvsched.adapters.repos.routing import ConnectionRouter
+from tvsched.application.interfaces import ILogger
+from tvsched.application.models.common import NameCompletion
+
+# popularity of show is number of schedules with it, popularity of actor
+# is number of schedules with shows from actor filmography
+_SHOW_NAMES_QUERY = """
+SELECT s.id, s.name, count(sts.user_id) AS weight
+FROM (SELECT * FROM shows WHERE deleted_at IS NULL) s
+LEFT JOIN shows_to_schedules sts ON sts.show_id = s.id
+{where}
+GROUP BY s.id, s.name;
+"""
+
+_ACTOR_NAMES_QUERY = """
+SELECT a.id, a.name, count(sts.user_id) AS weight
+FROM actors a
+LEFT JOIN actors_to_shows ats ON ats.actor_id = a.id
+LEFT JOIN shows_to_schedules sts ON sts.show_id = ats.show_id
+{where}
+GROUP BY a.id;
+"""
+
+_QUERIES = {EntityKind.SHOW: _SHOW_NAMES_QUERY, EntityKind.ACTOR: _ACTOR_NAMES_QUERY}
+_ALIASES = {EntityKind.SHOW: "s", EntityKind.ACTOR: "a"}
+
+
+class TypeAheadIndex:
+    """Type-ahead completions of show and actor names weighted by popularity.
+
+    Names are served from in-process prefix indexes built from repo
+    by `build`. Subscribe it to `InvalidationBus` to apply show and actor
+    changes of all workers incrementally and rebuild indexes after flush.
+    Popularity is refreshed only for changed entities and on rebuild.
+    """
+
+    def __init__(
+        self,
+        db: Union[Connection, ConnectionRouter],
+        logger: ILogger,
+        max_entries: int = 1_000_000,
+    ) -> None:
+        self._db = ConnectionRouter.of(db)
+        self._logger = logger
+        self._max_entries = max_entries
+        self._indexes = {
+            EntityKind.SHOW: PrefixIndex(max_entries=max_entries),
+            EntityKind.ACTOR: PrefixIndex(max_entries=max_entries),
+        }
+        self._dirty: dict[EntityKind, set[int]] = {kind: set() for kind in _QUERIES}
+        self._rebuild_required = False
+        self._refresh_task: Optional["asyncio.Task[None]"] = None
+
+    async def complete_show_names(
+        self, prefix: str, limit: int
+    ) -> list[NameCompletion]:
+        """Returns names of the most popular shows with word starting with `prefix`.
+
+        Args:
+            prefix (str)
+            limit (int): max number of names
+
+        Returns:
+            list[NameCompletion]
+        """
+
+        return self._complete(EntityKind.SHOW, prefix, limit)
+
+    async def complete_actor_names(
+        self, prefix: str, limit: int
+    ) -> list[NameCompletion]:
+        """Returns names of the most popular actors with word starting with `prefix`.
+
+        Args:
+            prefix (str)
+            limit (int): max number of names
+
+        Returns:
+            list[NameCompletion]
+        """
+
+        return self._complete(EntityKind.ACTOR, prefix, limit)
+
+    async def build(self) -> None:
+        """Builds indexes from all shows and actors in repo."""
+
+        loop = asyncio.get_running_loop()
+        for kind in _QUERIES:
+            records = await self._fetch_names(kind)
+            entries = [(r["id"], r["name"], r["weight"]) for r in records]
+
+            index = PrefixIndex(max_entries=self._max_entries)
+            # building of large index is CPU bound, so it does not block loop
+            await loop.run_in_executor(None, index.build, entries)
+            self._indexes[kind] = index
+
+            self._logger.info(f"Built {kind.value} names index of {len(index)} names")
+
+    def on_entity_changed(self, event: EntityChanged) -> None:
+        """Schedules refresh of changed show and actor names.
+
+        Args:
+            event (EntityChanged)
+        """
+
+        dirty = self._dirty.get(event.kind)
+        if dirty is None:
+            return
+
+        dirty.update(event.ids)
+        self._schedule_refresh()
+
+    def on_flush(self) -> None:
+        """Schedules rebuild of indexes."""
+
+        self._rebuild_required = True
+        self._schedule_refresh()
+
+    async def wait_refreshed(self) -> None:
+        """Waits until scheduled refresh is finished."""
+
+        task = self._refresh_task
+        if task is not None:
+            await asyncio.shield(task)
+
+    def _complete(
+        self, kind: EntityKind, prefix: str, limit: int
+    ) -> list[NameCompletion]:
+        completions = self._indexes[kind].complete(prefix, limit)
+
+        return [NameCompletion(id=id_, name=name) for id_, name in completions]
+
+    def _schedule_refresh(self) -> None:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(self._refresh())
+
+    async def _refresh(self) -> None:
+        # changes received during refresh are applied by the next iteration
+        while self._rebuild_required or any(self._dirty.values()):
+            try:
+                if self._rebuild_required:
+                    self._rebuild_required = False
+                    for ids in self._dirty.values():
+                        ids.clear()
+                    await self.build()
+                    continue
+
+                for kind, ids in self._dirty.items():
+                    changed_ids = list(ids)
+                    ids.clear()
+                    if changed_ids:
+                        await self._refresh_names(kind, changed_ids)
+            except Exception:
+                self._logger.exception("Failed to refresh names index")
+                self._rebuild_required = True
+                await asyncio.sleep(1)
+
+    async def _refresh_names(self, kind: EntityKind, ids: list[int]) -> None:
+        records = await self._fetch_names(kind, ids)
+
+        index = self._indexes[kind]
+        found_ids = set()
+        for r in records:
+            found_ids.add(r["id"])
+            if not index.upsert(r["id"], r["name"], r["weight"]):
+                self._logger.warning(f"{kind.value} names index is full")
+
+        for id_ in set(ids) - found_ids:
+            index.remove(id_)
+
+    async def _fetch_names(
+        self, kind: EntityKind, ids: Optional[list[int]] = None
+    ) -> list[Any]:
+        where = "" if ids is None else f"WHERE {_ALIASES[kind]}.id = ANY(:ids)"
+        query = _QUERIES[kind].format(where=where)
+        values = {} if ids is None else dict(ids=ids)
+
+        db = await self._db.for_read()
+        return await db.fetch_all(query, values=values)
@@ -0,0 +1,38 @@
+"""Lazy exports of adapter packages.
+
+Package of adapter re-exports its classes, but submodules are imported on
+first access to exported name. So importing light submodule of package,
+like `tvsched.adapters.repos.show.utils`, does not import drivers
+(`asyncpg`, `databases`) needed only by repos of the package.
+"""
+
+import importlib
+from typing import Any, Callable, Mapping
+
+
+def lazy_exports(package: str, exports: Mapping[str, str]) -> Callable[[str], Any]:
+    """Returns module `__getattr__` which imports exported names on first access.
+
+    Example:
+        >>> __getattr__ = lazy_exports("json", {"JSONDecoder": "decoder"})
+        >>> __getattr__("JSONDecoder").__name__
+        'JSONDecoder'
+
+    Args:
+        package (str): name of package, `__name__` of its `__init__`
+        exports (Mapping[str, str]): names of submodules by exported names
+
+    Returns:
+        Callable[[str], Any]
+    """
+
+    def __getattr__(name: str) -> Any:
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        module = importlib.import_module(f"{package}.{submodule}")
+
+        return getattr(module, name)
+
+    return __getattr__
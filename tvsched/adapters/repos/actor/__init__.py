@@ -1,3 +1,15 @@
-from tvsched.adapters.repos.actor.repo import ActorRepo
+import typing
+
+from tvsched.adapters.lazy import lazy_exports
+
+if typing.TYPE_CHECKING:
+    from tvsched.adapters.repos.actor.repo import ActorRepo
 
 __all__ = ["ActorRepo"]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "ActorRepo": "repo",
+    },
+)
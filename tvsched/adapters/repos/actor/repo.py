@@ -1,24 +1,51 @@
 import typing
+from typing import Any, Mapping, Optional, Sequence, Union
 
 import asyncpg
 from databases.core import Connection
 
+from tvsched.adapters.cache.invalidation import (
+    EntityKind,
+    InvalidationPublisher,
+    publish_changes,
+)
 from tvsched.adapters.repos.actor.models import ActorRecord
 from tvsched.adapters.repos.actor.utils import (
     map_actor_record_to_model,
 )
+from tvsched.adapters.repos.batching import order_by_ids
+from tvsched.adapters.repos.routing import ConnectionRouter
+from tvsched.adapters.repos.show.versions import bump_show_versions
+from tvsched.adapters.repos.suggestion.queue import (
+    cast_change_shows,
+    enqueue_users,
+    show_audience,
+)
 from tvsched.application.exceptions.actor import (
     ActorAlreadyInShowCastError,
     ActorNotFoundError,
     ActorOrShowNotFoundError,
 )
-from tvsched.application.models.actor import ActorAdd, ActorInShowCast, ActorUpdate
+from tvsched.application.exceptions.show import ShowNotFoundError
+from tvsched.application.models.actor import (
+    ActorAdd,
+    ActorInShowCast,
+    ActorUpdate,
+    ShowCast,
+    ShowCastChanges,
+)
+from tvsched.application.models.common import EntitiesByIds
 from tvsched.entities.actor import Actor
 
 
 class ActorRepo:
-    def __init__(self, db: Connection) -> None:
-        self._db = db
+    def __init__(
+        self,
+        db: Union[Connection, ConnectionRouter],
+        invalidation: Optional[InvalidationPublisher] = None,
+    ) -> None:
+        self._db = ConnectionRouter.of(db)
+        self._invalidation = invalidation
 
     async def get(self, actor_id: int) -> Actor:
         """Returns actor from repo by `actor_id`.
@@ -39,7 +66,8 @@ class ActorRepo:
         """
 
         values = dict(id=actor_id)
-        record = await self._db.fetch_one(query, values=values)
+        db = await self._db.for_read()
+        record = await db.fetch_one(query, values=values)
 
         if record is None:
             raise ActorNotFoundError(actor_id=actor_id)
@@ -49,6 +77,56 @@ class ActorRepo:
 
         return actor
 
+    async def get_many(self, actor_ids: Sequence[int]) -> EntitiesByIds[Actor]:
+        """Returns actors from repo by `actor_ids` with one query.
+
+        Args:
+            actor_ids (Sequence[int])
+
+        Returns:
+            EntitiesByIds[Actor]: actors ordered as `actor_ids` and ids of not found actors
+        """
+
+        query = """
+        SELECT * FROM actors
+        WHERE id = ANY(:ids);
+        """
+
+        values = dict(ids=list(actor_ids))
+        db = await self._db.for_read()
+        records = await db.fetch_all(query, values=values)
+
+        records = typing.cast(list[ActorRecord], records)
+        actors = {r["id"]: map_actor_record_to_model(r) for r in records}
+
+        return order_by_ids(actor_ids, actors)
+
+    async def search(self, query: str, limit: int) -> list[Actor]:
+        """Returns actors with name similar to `query` ordered by relevance.
+
+        Args:
+            query (str): words of actor name, may contain typos
+            limit (int): max number of actors
+
+        Returns:
+            list[Actor]
+        """
+
+        sql_query = """
+        SELECT * FROM actors
+        WHERE :query <% name
+        ORDER BY word_similarity(:query, name) DESC, id
+        LIMIT :limit;
+        """
+
+        values = dict(query=query, limit=limit)
+        db = await self._db.for_read()
+        records = await db.fetch_all(sql_query, values=values)
+        records = typing.cast(list[ActorRecord], records)
+        actors = [map_actor_record_to_model(r) for r in records]
+
+        return actors
+
     async def add(self, actor: ActorAdd) -> None:
         """Adds new actor to repo.
 
@@ -61,14 +139,17 @@ class ActorRepo:
 
         query = """
         INSERT INTO actors (name, image_url)
-        VALUES (:name, :image_url);
+        VALUES (:name, :image_url)
+        RETURNING id;
         """
 
         values = dict(
             name=actor.name,
             image_url=actor.image_url,
         )
-        await self._db.execute(query, values=values)
+        db = self._db.for_write()
+        actor_id = await db.execute(query, values=values)
+        await publish_changes(self._invalidation, db, EntityKind.ACTOR, [actor_id])
 
     async def update(self, actor: ActorUpdate) -> None:
         """Updates actor in repo.
@@ -91,14 +172,24 @@ class ActorRepo:
             values["image_url"] = image_url
 
         query = f"""
-        UPDATE actors
-        SET {", ".join(columns_to_update)}
-        WHERE id = :id;
+        WITH updated AS (
+            UPDATE actors
+            SET {", ".join(columns_to_update)}
+            WHERE id = :id
+            RETURNING ARRAY(
+                SELECT show_id FROM actors_to_shows WHERE actor_id = :id
+            ) AS show_ids
+        ), bumped AS (
+            {bump_show_versions("SELECT unnest(show_ids) FROM updated")}
+        )
+        SELECT show_ids FROM updated;
         """
 
         values["id"] = actor.id
 
-        await self._db.execute(query, values=values)
+        db = self._db.for_write()
+        record = await db.fetch_one(query, values=values)
+        await self._publish_actor_changes(db, actor.id, record)
 
     async def delete(self, actor_id: int) -> None:
         """Deletes actor with id `actor_id` from repo.
@@ -107,13 +198,25 @@ class ActorRepo:
             actor_id (int)
         """
 
-        query = """
-        DELETE FROM actors
-        WHERE id = :id;
+        query = f"""
+        WITH deleted AS (
+            DELETE FROM actors
+            WHERE id = :id
+            RETURNING ARRAY(
+                SELECT show_id FROM actors_to_shows WHERE actor_id = :id
+            ) AS show_ids
+        ), bumped AS (
+            {bump_show_versions("SELECT unnest(show_ids) FROM deleted")}
+        ), queued AS (
+            {enqueue_users(show_audience("SELECT unnest(show_ids) FROM deleted"))}
+        )
+        SELECT show_ids FROM deleted;
         """
 
         values = dict(id=actor_id)
-        await self._db.execute(query, values=values)
+        db = self._db.for_write()
+        record = await db.fetch_one(query, values=values)
+        await self._publish_actor_changes(db, actor_id, record)
 
     async def add_actor_to_show_cast(self, actor_in_cast: ActorInShowCast) -> None:
         """Adds actor with id `actor_in_cast.actor_id` to show cast with id `actor_in_cast.show_id`.
@@ -122,20 +225,30 @@ class ActorRepo:
             actor_in_cast (ActorInShowCast): data for adding actor to show cast
         """
 
-        query = """
-        INSERT INTO actors_to_shows (show_id, actor_id)
-        VALUES (:show_id, :actor_id);
+        query = f"""
+        WITH added AS (
+            INSERT INTO actors_to_shows (show_id, actor_id)
+            VALUES (:show_id, :actor_id)
+            RETURNING show_id, actor_id
+        ), bumped AS (
+            {bump_show_versions("SELECT show_id FROM added")}
+        )
+        {enqueue_users(show_audience(cast_change_shows("added")))};
         """
 
         values = dict(show_id=actor_in_cast.show_id, actor_id=actor_in_cast.actor_id)
 
+        db = self._db.for_write()
         try:
-            await self._db.execute(query, values=values)
+            await db.execute(query, values=values)
         except asyncpg.exceptions.ForeignKeyViolationError:
             raise ActorOrShowNotFoundError(actor_in_cast)
         except asyncpg.exceptions.UniqueViolationError:
             raise ActorAlreadyInShowCastError(actor_in_cast)
 
+        show_ids = [actor_in_cast.show_id]
+        await publish_changes(self._invalidation, db, EntityKind.SHOW, show_ids)
+
     async def delete_actor_from_show_cast(self, actor_in_cast: ActorInShowCast) -> None:
         """Deletes actor with id `actor_in_cast.actor_id` from show cast with id `actor_in_cast.show_id`.
 
@@ -143,10 +256,112 @@ class ActorRepo:
             actor_in_cast (ActorInShowCast): data for deleting actor from show cast
         """
 
-        query = """
-        DELETE FROM actors_to_shows
-        WHERE show_id = :show_id AND actor_id = :actor_id;
+        query = f"""
+        WITH deleted AS (
+            DELETE FROM actors_to_shows
+            WHERE show_id = :show_id AND actor_id = :actor_id
+            RETURNING show_id, actor_id
+        ), bumped AS (
+            {bump_show_versions("SELECT show_id FROM deleted")}
+        )
+        {enqueue_users(show_audience(cast_change_shows("deleted")))};
         """
 
         values = dict(show_id=actor_in_cast.show_id, actor_id=actor_in_cast.actor_id)
-        await self._db.execute(query, values=values)
+        db = self._db.for_write()
+        await db.execute(query, values=values)
+
+        show_ids = [actor_in_cast.show_id]
+        await publish_changes(self._invalidation, db, EntityKind.SHOW, show_ids)
+
+    async def set_show_cast(self, show_cast: ShowCast) -> ShowCastChanges:
+        """Replaces cast of show with id `show_cast.show_id` with actors by `show_cast.actor_ids`.
+
+        Diff of cast is computed and applied by one statement. Show row is
+        locked, so concurrent replaces of the same cast are applied one by one.
+
+        Args:
+            show_cast (ShowCast): show id and ids of actors of new cast
+
+        Raises:
+            ShowNotFoundError: will be raised if show not in repo
+
+        Returns:
+            ShowCastChanges: ids of added, removed and missing actors
+        """
+
+        query = f"""
+        WITH show AS (
+            SELECT id FROM shows
+            WHERE id = :show_id AND deleted_at IS NULL
+            FOR UPDATE
+        ), desired AS (
+            SELECT DISTINCT unnest(CAST(:actor_ids AS integer[])) AS actor_id
+        ), found AS (
+            SELECT id AS actor_id FROM actors
+            WHERE id IN (SELECT actor_id FROM desired)
+            FOR KEY SHARE
+        ), deleted AS (
+            DELETE FROM actors_to_shows
+            WHERE show_id IN (SELECT id FROM show)
+            AND actor_id NOT IN (SELECT actor_id FROM found)
+            RETURNING show_id, actor_id
+        ), added AS (
+            INSERT INTO actors_to_shows (show_id, actor_id)
+            SELECT show.id, found.actor_id FROM show, found
+            ON CONFLICT DO NOTHING
+            RETURNING show_id, actor_id
+        ), changed AS (
+            SELECT show_id, actor_id FROM added
+            UNION ALL
+            SELECT show_id, actor_id FROM deleted
+        ), bumped AS (
+            {bump_show_versions("SELECT show_id FROM changed")}
+        ), queued AS (
+            {enqueue_users(show_audience(cast_change_shows("changed")))}
+        )
+        SELECT
+            EXISTS (SELECT 1 FROM show) AS show_exists,
+            ARRAY(SELECT actor_id FROM added ORDER BY actor_id) AS added_actor_ids,
+            ARRAY(SELECT actor_id FROM deleted ORDER BY actor_id) AS removed_actor_ids,
+            ARRAY(
+                SELECT actor_id FROM desired
+                EXCEPT
+                SELECT actor_id FROM found
+                ORDER BY actor_id
+            ) AS missing_actor_ids;
+        """
+
+        values = dict(show_id=show_cast.show_id, actor_ids=list(show_cast.actor_ids))
+        db = self._db.for_write()
+        record = await db.fetch_one(query, values=values)
+        record = typing.cast(Mapping[str, Any], record)
+
+        if not record["show_exists"]:
+            raise ShowNotFoundError(show_id=show_cast.show_id)
+
+        changes = ShowCastChanges(
+            added_actor_ids=list(record["added_actor_ids"]),
+            removed_actor_ids=list(record["removed_actor_ids"]),
+            missing_actor_ids=list(record["missing_actor_ids"]),
+        )
+        if changes.added_actor_ids or changes.removed_actor_ids:
+            show_ids = [show_cast.show_id]
+            await publish_changes(self._invalidation, db, EntityKind.SHOW, show_ids)
+
+        return changes
+
+    async def _publish_actor_changes(
+        self, db: Connection, actor_id: int, record: Optional[Mapping[str, Any]]
+    ) -> None:
+        """Publishes change of actor and shows with actor in cast,
+        because shows contain their cast.
+        """
+
+        if record is None:
+            return
+
+        await publish_changes(self._invalidation, db, EntityKind.ACTOR, [actor_id])
+        await publish_changes(
+            self._invalidation, db, EntityKind.SHOW, record["show_ids"]
+        )
@@ -0,0 +1,114 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Iterable, Mapping, Protocol, TypeVar
+
+from tvsched.application.models.common import EntitiesByIds
+
+T = TypeVar("T")
+
+
+class _Entity(Protocol):
+    @property
+    def id(self) -> int:
+        raise NotImplementedError  # fix return type error
+
+
+E = TypeVar("E", bound=_Entity)
+
+
+def order_by_ids(ids: Iterable[int], entities: Mapping[int, T]) -> EntitiesByIds[T]:
+    """Orders entities as `ids` and collects ids missing in `entities`.
+
+    Example:
+        >>> order_by_ids([3, 1, 2, 3], {1: "a", 3: "c"})
+        EntitiesByIds(found=['c', 'a'], missing_ids=[2])
+
+    Args:
+        ids (Iterable[int]): requested ids, duplicates are ignored
+        entities (Mapping[int, T]): found entities by id
+
+    Returns:
+        EntitiesByIds[T]
+    """
+
+    found = []
+    missing_ids = []
+    for id_ in dict.fromkeys(ids):
+        entity = entities.get(id_)
+        if entity is None:
+            missing_ids.append(id_)
+        else:
+            found.append(entity)
+
+    return EntitiesByIds(found=found, missing_ids=missing_ids)
+
+
+class BatchLoader(Generic[E]):
+    """Merges concurrent single gets within one event loop tick into one batched get.
+
+    Instance has the same `get` method as repos, so it can be passed to use cases
+    instead of repo, for example `BatchLoader(show_repo.get_many, ShowNotFoundError)`
+    for `GetShowUseCase`.
+    """
+
+    def __init__(
+        self,
+        get_many: Callable[[list[int]], Awaitable[EntitiesByIds[E]]],
+        not_found_error: Callable[[int], Exception],
+        max_batch_size: int = 500,
+    ) -> None:
+        self._get_many = get_many
+        self._not_found_error = not_found_error
+        self._max_batch_size = max_batch_size
+        self._pending: dict[int, "asyncio.Future[E]"] = {}
+
+    async def get(self, id_: int) -> E:
+        """Returns entity by `id_` loaded within batch of current event loop tick.
+
+        Args:
+            id_ (int)
+
+        Raises:
+            Exception: error created by `not_found_error` if entity not found
+
+        Returns:
+            E
+        """
+
+        future = self._pending.get(id_)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            future = loop.create_future()
+            self._pending[id_] = future
+
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        pending = self._pending
+        self._pending = {}
+
+        ids = list(pending)
+        for i in range(0, len(ids), self._max_batch_size):
+            batch = {id_: pending[id_] for id_ in ids[i : i + self._max_batch_size]}
+            asyncio.ensure_future(self._load(batch))
+
+    async def _load(self, batch: dict[int, "asyncio.Future[E]"]) -> None:
+        try:
+            res = await self._get_many(list(batch))
+            found = {entity.id: entity for entity in res.found}
+            for id_, future in batch.items():
+                entity = found.get(id_)
+                if entity is None:
+                    future.set_exception(self._not_found_error(id_))
+                else:
+                    future.set_result(entity)
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # load was cancelled, futures must not wait for it forever
+            for future in batch.values():
+                if not future.done():
+                    future.cancel()
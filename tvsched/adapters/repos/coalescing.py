@@ -0,0 +1,127 @@
+import asyncio
+import dataclasses
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar
+
+from databases.core import Connection
+
+from tvsched.adapters.repos.routing import ConnectionRouter
+
+T = TypeVar("T")
+
+
+@dataclasses.dataclass
+class SingleFlightStats:
+    """Counters of coalesced repo calls.
+
+    Attributes:
+        calls (int): number of calls
+        executions (int): number of calls which really executed query
+    """
+
+    calls: int = 0
+    executions: int = 0
+
+    @property
+    def collapsed(self) -> int:
+        """Number of calls which shared result of another in-flight call."""
+
+        return self.calls - self.executions
+
+
+class SingleFlight:
+    """Coalesces concurrent identical reads into one in-flight query.
+
+    Concurrent calls with the same name and args share one execution and
+    its result (or exception). Shared result must not be mutated by callers.
+    Execution runs in own task, so cancellation of one caller, even of
+    the one which started it, does not cancel execution for other callers.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[tuple[str, Hashable], "asyncio.Future[Any]"] = {}
+        self._stats: dict[str, SingleFlightStats] = {}
+
+    def stats(self, name: str) -> SingleFlightStats:
+        """Returns counters of calls with name `name`.
+
+        Args:
+            name (str)
+
+        Returns:
+            SingleFlightStats
+        """
+
+        return self._stats.setdefault(name, SingleFlightStats())
+
+    @property
+    def all_stats(self) -> dict[str, SingleFlightStats]:
+        """Counters of calls by name."""
+
+        return dict(self._stats)
+
+    async def do(self, name: str, args: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Executes `fn` or joins already in-flight execution with the same key.
+
+        Args:
+            name (str): name of coalesced operation, for example repo method
+            args (Hashable): arguments of operation
+            fn (Callable[[], Awaitable[T]]): executes operation
+
+        Returns:
+            T: result of execution
+        """
+
+        stats = self.stats(name)
+        stats.calls += 1
+
+        key = (name, args)
+        future = self._in_flight.get(key)
+        if future is None:
+            stats.executions += 1
+            future = asyncio.ensure_future(fn())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda f: self._forget(key, f))
+
+        return await asyncio.shield(future)
+
+    def _forget(self, key: tuple[str, Hashable], future: "asyncio.Future[Any]") -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+
+        # marks exception as retrieved when all callers were cancelled
+        if not future.cancelled():
+            future.exception()
+
+
+async def coalesce(
+    single_flight: Optional[SingleFlight],
+    router: ConnectionRouter,
+    name: str,
+    args: Hashable,
+    fn: Callable[[Connection], Awaitable[T]],
+) -> T:
+    """Executes read `fn` through `single_flight` if it is configured.
+
+    `fn` gets connection for read from `router`. Reads of unit of work
+    pinned to primary are not coalesced, so they always see own writes.
+    Only reads routed to the same connection or pool are coalesced.
+    Shared read runs in task of `single_flight`, so it uses own connection
+    of pool instead of connection of caller, which may be released when
+    caller is cancelled.
+
+    Args:
+        single_flight (Optional[SingleFlight])
+        router (ConnectionRouter): router of repo executing read
+        name (str): name of repo method
+        args (Hashable): arguments of repo method
+        fn (Callable[[Connection], Awaitable[T]]): executes read on connection
+
+    Returns:
+        T
+    """
+
+    db = await router.for_read()
+    if single_flight is None or router.pinned:
+        return await fn(db)
+
+    return await single_flight.do(name, (db, args), lambda: fn(db))
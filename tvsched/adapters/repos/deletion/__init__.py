@@ -0,0 +1,17 @@
+import typing
+
+from tvsched.adapters.lazy import lazy_exports
+
+if typing.TYPE_CHECKING:
+    from tvsched.adapters.repos.deletion.repo import DeletionJobRepo
+    from tvsched.adapters.repos.deletion.worker import DeletionWorker
+
+__all__ = ["DeletionJobRepo", "DeletionWorker"]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "DeletionJobRepo": "repo",
+        "DeletionWorker": "worker",
+    },
+)
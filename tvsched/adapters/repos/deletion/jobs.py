@@ -0,0 +1,26 @@
+"""SQL for starting background deletion of soft-deleted shows and users.
+
+Kept apart from steps, so repos of deleted entities do not import
+repos used by steps.
+"""
+
+from tvsched.entities.deletion import DeletionTargetKind
+
+
+def start_deletion_job(kind: DeletionTargetKind, deleted: str) -> str:
+    """Returns statement which creates jobs deleting rows of CTE `deleted`.
+
+    Args:
+        kind (DeletionTargetKind)
+        deleted (str): name of CTE with soft-deleted rows returning column `id`
+
+    Returns:
+        str
+    """
+
+    target = "show_id" if kind is DeletionTargetKind.SHOW else "user_id"
+
+    return f"""
+    INSERT INTO deletion_jobs (kind, {target})
+    SELECT '{kind.value}', id FROM {deleted}
+    """
@@ -0,0 +1,15 @@
+import datetime
+import uuid
+from typing import Optional, TypedDict
+
+
+class DeletionJobRecord(TypedDict):
+    id: int
+    kind: str
+    show_id: Optional[int]
+    user_id: Optional[uuid.UUID]
+    step: int
+    deleted_rows: int
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
+    finished_at: Optional[datetime.datetime]
@@ -0,0 +1,73 @@
+import typing
+import uuid
+from typing import Optional, Union
+
+from databases.core import Connection
+
+from tvsched.adapters.repos.deletion.jobs import start_deletion_job
+from tvsched.adapters.repos.deletion.models import DeletionJobRecord
+from tvsched.adapters.repos.deletion.utils import map_deletion_job_record_to_model
+from tvsched.adapters.repos.routing import ConnectionRouter
+from tvsched.entities.deletion import DeletionJob, DeletionTargetKind
+
+
+class DeletionJobRepo:
+    """Starts and reports background deletions run by `DeletionWorker`.
+
+    Shows are soft-deleted by `ShowRepo.delete`.
+    """
+
+    def __init__(self, db: Union[Connection, ConnectionRouter]) -> None:
+        self._db = ConnectionRouter.of(db)
+
+    async def delete_user(self, user_id: uuid.UUID) -> None:
+        """Soft-deletes user with id `user_id` and starts deletion of user data.
+
+        Args:
+            user_id (uuid.UUID)
+        """
+
+        query = f"""
+        WITH deleted AS (
+            UPDATE users SET deleted_at = now()
+            WHERE id = :user_id AND deleted_at IS NULL
+            RETURNING id
+        )
+        {start_deletion_job(DeletionTargetKind.USER, "deleted")};
+        """
+
+        values = dict(user_id=user_id)
+        db = self._db.for_write()
+        await db.execute(query, values=values)
+
+    async def get_deletion_jobs(
+        self,
+        unfinished_only: bool = False,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> list[DeletionJob]:
+        """Returns deletion jobs from the newest.
+
+        Args:
+            unfinished_only (bool): if True only running jobs will be returned
+            limit (Optional[int]): max number of jobs. If None all jobs will be returned
+            offset (Optional[int])
+
+        Returns:
+            list[DeletionJob]
+        """
+
+        query = f"""
+        SELECT * FROM deletion_jobs
+        {"WHERE finished_at IS NULL" if unfinished_only else ""}
+        ORDER BY id DESC
+        LIMIT :limit
+        OFFSET :offset;
+        """
+
+        values = dict(limit=limit, offset=offset)
+        db = await self._db.for_read()
+        records = await db.fetch_all(query, values=values)
+        records = typing.cast(list[DeletionJobRecord], records)
+
+        return [map_deletion_job_record_to_model(r) for r in records]
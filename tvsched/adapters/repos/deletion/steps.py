@@ -0,0 +1,155 @@
+"""SQL steps of background deletion of shows and users.
+
+Every chunked step deletes up to `:chunk_size` dependent rows of
+soft-deleted target with id `:target_id` and returns number of deleted
+rows, so step is done when it deletes less than a chunk. Steps go from dependent rows
+to target row itself, so the last step finishes job.
+"""
+
+from typing import NamedTuple
+
+from tvsched.adapters.repos.schedule.changes import log_schedule_change
+from tvsched.adapters.repos.suggestion.queue import enqueue_users
+from tvsched.entities.deletion import DeletionTargetKind
+from tvsched.entities.schedule import ScheduleChangeKind
+
+
+class DeletionStep(NamedTuple):
+    """Step of deletion job.
+
+    Not chunked step deletes its rows at once and does not take `:chunk_size`.
+    """
+
+    name: str
+    query: str
+    chunked: bool = True
+
+
+_SHOW_SCHEDULES = f"""
+WITH deleted AS (
+    DELETE FROM shows_to_schedules
+    WHERE (user_id, show_id) IN (
+        SELECT user_id, show_id FROM shows_to_schedules
+        WHERE show_id = :target_id
+        LIMIT :chunk_size
+    )
+    RETURNING user_id, show_id
+), queued AS (
+    {enqueue_users("SELECT user_id FROM deleted")}
+), {log_schedule_change("deleted", ScheduleChangeKind.SHOW, "show_id", True)},
+progress AS (
+    DELETE FROM schedule_progress p
+    USING deleted d
+    WHERE p.user_id = d.user_id AND p.show_id = d.show_id
+)
+SELECT count(*) FROM deleted;
+"""
+
+_SHOW_WATCHED_EPISODES = f"""
+WITH deleted AS (
+    DELETE FROM watched_episodes
+    WHERE (user_id, episode_id) IN (
+        SELECT we.user_id, we.episode_id
+        FROM episodes e
+        JOIN watched_episodes we ON we.episode_id = e.id
+        WHERE e.show_id = :target_id
+        LIMIT :chunk_size
+    )
+    RETURNING user_id, episode_id
+), {log_schedule_change(
+    "deleted", ScheduleChangeKind.WATCHED_EPISODE, "episode_id", True
+)}
+SELECT count(*) FROM deleted;
+"""
+
+_SHOW_EPISODES = """
+WITH deleted AS (
+    DELETE FROM episodes
+    WHERE id IN (
+        SELECT id FROM episodes
+        WHERE show_id = :target_id
+        LIMIT :chunk_size
+    )
+    RETURNING id
+)
+SELECT count(*) FROM deleted;
+"""
+
+# cast of show is deleted by cascade, it is not bigger than a chunk
+_SHOW = """
+WITH deleted AS (
+    DELETE FROM shows WHERE id = :target_id RETURNING id
+)
+SELECT count(*) FROM deleted;
+"""
+
+_USER_WATCHED_EPISODES = """
+WITH deleted AS (
+    DELETE FROM watched_episodes
+    WHERE (user_id, episode_id) IN (
+        SELECT user_id, episode_id FROM watched_episodes
+        WHERE user_id = :target_id
+        LIMIT :chunk_size
+    )
+    RETURNING user_id
+)
+SELECT count(*) FROM deleted;
+"""
+
+_USER_SCHEDULE = """
+WITH deleted AS (
+    DELETE FROM shows_to_schedules
+    WHERE (user_id, show_id) IN (
+        SELECT user_id, show_id FROM shows_to_schedules
+        WHERE user_id = :target_id
+        LIMIT :chunk_size
+    )
+    RETURNING user_id, show_id
+), progress AS (
+    DELETE FROM schedule_progress p
+    USING deleted d
+    WHERE p.user_id = d.user_id AND p.show_id = d.show_id
+)
+SELECT count(*) FROM deleted;
+"""
+
+_USER_SCHEDULE_CHANGES = """
+WITH deleted AS (
+    DELETE FROM schedule_changes
+    WHERE (user_id, kind, target_id) IN (
+        SELECT user_id, kind, target_id FROM schedule_changes
+        WHERE user_id = :target_id
+        LIMIT :chunk_size
+    )
+    RETURNING user_id
+)
+SELECT count(*) FROM deleted;
+"""
+
+_USER = """
+WITH suggestions AS (
+    DELETE FROM user_suggestions WHERE user_id = :target_id
+), queue AS (
+    DELETE FROM suggestion_refresh_queue WHERE user_id = :target_id
+), versions AS (
+    DELETE FROM schedule_versions WHERE user_id = :target_id
+), deleted AS (
+    DELETE FROM users WHERE id = :target_id RETURNING id
+)
+SELECT count(*) FROM deleted;
+"""
+
+STEPS: dict[DeletionTargetKind, list[DeletionStep]] = {
+    DeletionTargetKind.SHOW: [
+        DeletionStep("schedules", _SHOW_SCHEDULES),
+        DeletionStep("watched episodes", _SHOW_WATCHED_EPISODES),
+        DeletionStep("episodes", _SHOW_EPISODES),
+        DeletionStep("show", _SHOW, chunked=False),
+    ],
+    DeletionTargetKind.USER: [
+        DeletionStep("watched episodes", _USER_WATCHED_EPISODES),
+        DeletionStep("schedule", _USER_SCHEDULE),
+        DeletionStep("schedule changes", _USER_SCHEDULE_CHANGES),
+        DeletionStep("user", _USER, chunked=False),
+    ],
+}
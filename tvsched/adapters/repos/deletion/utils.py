@@ -0,0 +1,28 @@
+from tvsched.adapters.repos.deletion.models import DeletionJobRecord
+from tvsched.adapters.repos.deletion.steps import STEPS
+from tvsched.entities.deletion import DeletionJob, DeletionTargetKind
+
+
+def map_deletion_job_record_to_model(record: DeletionJobRecord) -> DeletionJob:
+    """Maps db deletion job record to entity.
+
+    Args:
+        record (DeletionJobRecord)
+
+    Returns:
+        DeletionJob
+    """
+
+    kind = DeletionTargetKind(record["kind"])
+
+    return DeletionJob(
+        id=record["id"],
+        kind=kind,
+        show_id=record["show_id"],
+        user_id=record["user_id"],
+        step=record["step"],
+        steps_count=len(STEPS[kind]),
+        deleted_rows=record["deleted_rows"],
+        created_at=record["created_at"],
+        finished_at=record["finished_at"],
+    )
@@ -0,0 +1,146 @@
+import asyncio
+import contextlib
+import datetime
+import time
+import typing
+from typing import Optional, Union
+
+from databases.core import Connection
+
+from tvsched.adapters.repos.deletion.models import DeletionJobRecord
+from tvsched.adapters.repos.deletion.steps import STEPS
+from tvsched.adapters.repos.deletion.utils import map_deletion_job_record_to_model
+from tvsched.adapters.repos.routing import ConnectionRouter
+from tvsched.application.interfaces import ILogger
+from tvsched.entities.deletion import DeletionJob, DeletionTargetKind
+
+
+class DeletionWorker:
+    """Deletes dependent rows of soft-deleted shows and users in chunks.
+
+    Every chunk is deleted in its own short transaction together with
+    progress of its job, so interrupted job resumes from the next chunk.
+    Job is locked while chunk is deleted, so several workers run
+    different jobs concurrently. Worker pauses for `pause` between chunks
+    and at least as long as chunks take `max_load` share of time,
+    so deletion does not saturate primary.
+    """
+
+    _claim_query = """
+    SELECT * FROM deletion_jobs
+    WHERE finished_at IS NULL
+    ORDER BY id
+    LIMIT 1
+    FOR UPDATE SKIP LOCKED;
+    """
+
+    _progress_query = """
+    UPDATE deletion_jobs
+    SET step = :step,
+        deleted_rows = deleted_rows + :deleted,
+        updated_at = now(),
+        finished_at = CASE WHEN :finished THEN now() END
+    WHERE id = :id
+    RETURNING *;
+    """
+
+    def __init__(
+        self,
+        db: Union[Connection, ConnectionRouter],
+        logger: ILogger,
+        chunk_size: int = 1000,
+        pause: datetime.timedelta = datetime.timedelta(milliseconds=100),
+        max_load: float = 0.5,
+        poll_interval: datetime.timedelta = datetime.timedelta(seconds=5),
+    ) -> None:
+        self._db = ConnectionRouter.of(db)
+        self._logger = logger
+        self._chunk_size = chunk_size
+        self._pause = pause
+        self._max_load = max_load
+        self._poll_interval = poll_interval
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    async def delete_chunk(self) -> Optional[DeletionJob]:
+        """Deletes the next chunk of the oldest unfinished job.
+
+        Returns:
+            Optional[DeletionJob]: job with updated progress or None
+                if there are no unfinished jobs
+        """
+
+        db = self._db.for_write()
+        async with db.transaction():
+            record = await db.fetch_one(self._claim_query)
+            if record is None:
+                return None
+
+            record = typing.cast(DeletionJobRecord, record)
+            kind = DeletionTargetKind(record["kind"])
+            steps = STEPS[kind]
+            if kind is DeletionTargetKind.SHOW:
+                target_id: object = record["show_id"]
+            else:
+                target_id = record["user_id"]
+
+            step = record["step"]
+            query, chunked = steps[step].query, steps[step].chunked
+            values = dict(target_id=target_id)
+            if chunked:
+                values["chunk_size"] = self._chunk_size
+
+            deleted = await db.execute(query, values=values)
+            if not chunked or deleted < self._chunk_size:
+                step += 1
+
+            values = dict(
+                id=record["id"],
+                step=step,
+                deleted=deleted,
+                finished=step == len(steps),
+            )
+            record = await db.fetch_one(self._progress_query, values=values)
+            record = typing.cast(DeletionJobRecord, record)
+
+        return map_deletion_job_record_to_model(record)
+
+    def start(self) -> None:
+        """Starts deleting in background task."""
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._delete_forever())
+
+    async def stop(self) -> None:
+        """Stops deleting, current chunk is rolled back or committed."""
+
+        task = self._task
+        self._task = None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _delete_forever(self) -> None:
+        logger = self._logger
+
+        while True:
+            started_at = time.monotonic()
+            try:
+                job = await self.delete_chunk()
+            except Exception:
+                logger.exception("Failed to delete chunk")
+                job = None
+
+            if job is None:
+                await asyncio.sleep(self._poll_interval.total_seconds())
+                continue
+
+            logger.info(
+                f"Deletion job {job.id} of {job.kind.value} "
+                f"{job.show_id or job.user_id}: step {job.step} of "
+                f"{job.steps_count}, deleted {job.deleted_rows} rows"
+            )
+
+            elapsed = time.monotonic() - started_at
+            throttle = elapsed * (1 - self._max_load) / self._max_load
+            await asyncio.sleep(max(self._pause.total_seconds(), throttle))
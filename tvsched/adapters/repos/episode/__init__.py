@@ -1,3 +1,15 @@
-from tvsched.adapters.repos.episode.repo import EpisodeRepo
+import typing
+
+from tvsched.adapters.lazy import lazy_exports
+
+if typing.TYPE_CHECKING:
+    from tvsched.adapters.repos.episode.repo import EpisodeRepo
 
 __all__ = ["EpisodeRepo"]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "EpisodeRepo": "repo",
+    },
+)
@@ -8,3 +8,10 @@ class EpisodeRecord(TypedDict):
     number: int
     air_date: int
     show_id: int
+
+
+class SeasonSummaryRecord(TypedDict):
+    season: int
+    episodes_count: int
+    first_air_date: int
+    last_air_date: int
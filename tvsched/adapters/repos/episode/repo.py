@@ -1,19 +1,50 @@
 import typing
+from typing import Optional, Sequence, Union
 
 from databases.core import Connection
 
-from tvsched.adapters.repos.episode.models import EpisodeRecord
+from tvsched.adapters.cache.invalidation import (
+    EntityKind,
+    InvalidationPublisher,
+    publish_changes,
+)
+from tvsched.adapters.repos.batching import order_by_ids
+from tvsched.adapters.repos.coalescing import SingleFlight, coalesce
+from tvsched.adapters.repos.episode.models import EpisodeRecord, SeasonSummaryRecord
 from tvsched.adapters.repos.episode.utils import (
     map_episode_record_to_model,
+    map_season_summary_record_to_model,
+    merge_episode_updates,
+    paginate_episodes,
+)
+from tvsched.adapters.repos.routing import ConnectionRouter
+from tvsched.adapters.repos.schedule.progress import (
+    next_unwatched_episode,
+    precedes_next_episode,
+    refresh_show_progress,
 )
 from tvsched.application.exceptions.episode import EpisodeNotFoundError
-from tvsched.application.models.episode import EpisodeAdd, EpisodeUpdate
-from tvsched.entities.episode import Episode
+from tvsched.application.models.common import EntitiesByIds
+from tvsched.application.models.episode import (
+    EpisodeAdd,
+    EpisodesCursor,
+    EpisodesPage,
+    EpisodeUpdate,
+    SeasonAirDatesShift,
+)
+from tvsched.entities.episode import Episode, SeasonSummary
 
 
 class EpisodeRepo:
-    def __init__(self, db: Connection) -> None:
-        self._db = db
+    def __init__(
+        self,
+        db: Union[Connection, ConnectionRouter],
+        single_flight: Optional[SingleFlight] = None,
+        invalidation: Optional[InvalidationPublisher] = None,
+    ) -> None:
+        self._db = ConnectionRouter.of(db)
+        self._single_flight = single_flight
+        self._invalidation = invalidation
 
     async def get(self, episode_id: int) -> Episode:
         """Returns episode from repo by `episode_id`.
@@ -29,12 +60,14 @@ class EpisodeRepo:
         """
 
         query = """
-        SELECT * FROM episodes
-        WHERE id = :id;
+        SELECT e.* FROM episodes e
+        JOIN shows s ON s.id = e.show_id AND s.deleted_at IS NULL
+        WHERE e.id = :id;
         """
 
         values = dict(id=episode_id)
-        record = await self._db.fetch_one(query, values=values)
+        db = await self._db.for_read()
+        record = await db.fetch_one(query, values=values)
 
         if record is None:
             raise EpisodeNotFoundError(episode_id=episode_id)
@@ -44,8 +77,35 @@ class EpisodeRepo:
 
         return episode
 
+    async def get_many(self, episode_ids: Sequence[int]) -> EntitiesByIds[Episode]:
+        """Returns episodes from repo by `episode_ids` with one query.
+
+        Args:
+            episode_ids (Sequence[int])
+
+        Returns:
+            EntitiesByIds[Episode]: episodes ordered as `episode_ids`
+                and ids of not found episodes
+        """
+
+        query = """
+        SELECT e.* FROM episodes e
+        JOIN shows s ON s.id = e.show_id AND s.deleted_at IS NULL
+        WHERE e.id = ANY(:ids);
+        """
+
+        values = dict(ids=list(episode_ids))
+        db = await self._db.for_read()
+        records = await db.fetch_all(query, values=values)
+
+        records = typing.cast(list[EpisodeRecord], records)
+        episodes = {r["id"]: map_episode_record_to_model(r) for r in records}
+
+        return order_by_ids(episode_ids, episodes)
+
     async def get_episodes(self, show_id: int) -> list[Episode]:
-        """Returns list of tv show episodes with tv show id `show_id`.
+        """Returns list of tv show episodes with tv show id `show_id`
+        ordered by season and number.
 
         Args:
             show_id (int)
@@ -55,18 +115,113 @@ class EpisodeRepo:
         """
 
         query = """
-        SELECT * FROM episodes
-        WHERE show_id = :show_id;
+        SELECT e.* FROM episodes e
+        JOIN shows s ON s.id = e.show_id AND s.deleted_at IS NULL
+        WHERE e.show_id = :show_id
+        ORDER BY e.season, e.number, e.id;
         """
 
         values = dict(show_id=show_id)
-        records = await self._db.fetch_all(query, values=values)
+        records = await coalesce(
+            self._single_flight,
+            self._db,
+            "EpisodeRepo.get_episodes",
+            show_id,
+            lambda db: db.fetch_all(query, values=values),
+        )
 
         records = typing.cast(list[EpisodeRecord], records)
         episodes = [map_episode_record_to_model(r) for r in records]
 
         return episodes
 
+    async def get_episodes_page(
+        self,
+        show_id: int,
+        season: Optional[int] = None,
+        after: Optional[EpisodesCursor] = None,
+        limit: int = 100,
+    ) -> EpisodesPage:
+        """Returns page of episodes of show with id `show_id`
+        ordered by season, number and id.
+
+        Pages are selected by keyset on (season, number, id) using index
+        on (show_id, season, number, id), so reading any page is as cheap
+        as reading the first one.
+
+        Args:
+            show_id (int)
+            season (Optional[int]): if not None only episodes of the season are returned
+            after (Optional[EpisodesCursor]): cursor of previous page.
+                If None the first page is returned
+            limit (int): max number of episodes of page
+
+        Returns:
+            EpisodesPage
+        """
+
+        conditions = ["e.show_id = :show_id"]
+        values: dict[str, typing.Any] = dict(show_id=show_id, limit=limit + 1)
+
+        if season is not None:
+            conditions.append("e.season = :season")
+            values["season"] = season
+
+        if after is not None:
+            conditions.append(
+                "(e.season, e.number, e.id) > (:after_season, :after_number, :after_id)"
+            )
+            values.update(
+                after_season=after.season,
+                after_number=after.number,
+                after_id=after.id,
+            )
+
+        query = f"""
+        SELECT e.* FROM episodes e
+        JOIN shows s ON s.id = e.show_id AND s.deleted_at IS NULL
+        WHERE {" AND ".join(conditions)}
+        ORDER BY e.season, e.number, e.id
+        LIMIT :limit;
+        """
+
+        db = await self._db.for_read()
+        records = await db.fetch_all(query, values=values)
+
+        records = typing.cast(list[EpisodeRecord], records)
+        episodes = [map_episode_record_to_model(r) for r in records]
+
+        return paginate_episodes(episodes, limit)
+
+    async def get_season_summaries(self, show_id: int) -> list[SeasonSummary]:
+        """Returns number of episodes and range of air dates of every season
+        of show with id `show_id` ordered by season.
+
+        Args:
+            show_id (int)
+
+        Returns:
+            list[SeasonSummary]
+        """
+
+        query = """
+        SELECT e.season, count(*) AS episodes_count,
+        min(e.air_date) AS first_air_date, max(e.air_date) AS last_air_date
+        FROM episodes e
+        JOIN shows s ON s.id = e.show_id AND s.deleted_at IS NULL
+        WHERE e.show_id = :show_id
+        GROUP BY e.season
+        ORDER BY e.season;
+        """
+
+        values = dict(show_id=show_id)
+        db = await self._db.for_read()
+        records = await db.fetch_all(query, values=values)
+
+        records = typing.cast(list[SeasonSummaryRecord], records)
+
+        return [map_season_summary_record_to_model(r) for r in records]
+
     async def add(self, episode: EpisodeAdd) -> None:
         """Adds new episode to repo.
 
@@ -77,9 +232,23 @@ class EpisodeRepo:
             Episode
         """
 
-        query = """
-        INSERT INTO episodes (name, season, number, air_date, show_id)
-        VALUES (:name, :season, :number, :air_date, :show_id);
+        query = f"""
+        WITH added AS (
+            INSERT INTO episodes (name, season, number, air_date, show_id)
+            VALUES (:name, :season, :number, :air_date, :show_id)
+            RETURNING id, season, number, show_id
+        ), progress AS (
+            UPDATE schedule_progress p
+            SET total_count = p.total_count + 1,
+                next_episode_id = CASE
+                    WHEN p.next_episode_id IS NULL OR {precedes_next_episode("added")}
+                    THEN added.id
+                    ELSE p.next_episode_id
+                END
+            FROM added
+            WHERE p.show_id = added.show_id
+        )
+        SELECT id FROM added;
         """
 
         values = dict(
@@ -89,7 +258,9 @@ class EpisodeRepo:
             air_date=int(episode.air_date.timestamp()),
             show_id=episode.show_id,
         )
-        await self._db.execute(query, values=values)
+        db = self._db.for_write()
+        episode_id = await db.execute(query, values=values)
+        await publish_changes(self._invalidation, db, EntityKind.EPISODE, [episode_id])
 
     async def update(self, episode: EpisodeUpdate) -> None:
         """Updates episode in repo.
@@ -127,14 +298,127 @@ class EpisodeRepo:
             values["show_id"] = show_id
 
         query = f"""
-        UPDATE episodes
+        UPDATE episodes e
         SET {", ".join(columns_to_update)}
-        WHERE id = :id;
+        FROM (SELECT id, show_id FROM episodes WHERE id = :id FOR UPDATE) old
+        WHERE e.id = old.id
+        RETURNING old.show_id AS old_show_id, e.show_id;
         """
 
         values["id"] = episode.id
 
-        await self._db.execute(query, values=values)
+        db = self._db.for_write()
+        async with db.transaction():
+            record = await db.fetch_one(query, values=values)
+
+            changes_order = season is not None or number is not None
+            if record is not None and (changes_order or show_id is not None):
+                show_ids = {record["old_show_id"], record["show_id"]}
+                await refresh_show_progress(db, show_ids)
+
+        if record is not None:
+            episode_ids = [episode.id]
+            await publish_changes(
+                self._invalidation, db, EntityKind.EPISODE, episode_ids
+            )
+
+    async def update_many(self, episodes: Sequence[EpisodeUpdate]) -> None:
+        """Updates episodes in repo with one statement in transaction.
+
+        If several updates have the same episode id, they are applied in order.
+
+        Args:
+            episodes (Sequence[EpisodeUpdate]): data for updating episodes in repo
+        """
+
+        merged = merge_episode_updates(episodes)
+        if not merged:
+            return
+
+        # rows are locked in order of ids, so concurrent updates
+        # of overlapping episodes do not deadlock
+        query = """
+        UPDATE episodes e
+        SET name = COALESCE(u.name, e.name),
+            season = COALESCE(u.season, e.season),
+            number = COALESCE(u.number, e.number),
+            air_date = COALESCE(u.air_date, e.air_date),
+            show_id = COALESCE(u.show_id, e.show_id)
+        FROM unnest(
+            CAST(:ids AS integer[]),
+            CAST(:names AS text[]),
+            CAST(:seasons AS integer[]),
+            CAST(:numbers AS integer[]),
+            CAST(:air_dates AS bigint[]),
+            CAST(:show_ids AS integer[])
+        ) AS u(id, name, season, number, air_date, show_id),
+        (
+            SELECT id, show_id FROM episodes WHERE id = ANY(:ids)
+            ORDER BY id FOR UPDATE
+        ) old
+        WHERE e.id = u.id AND old.id = u.id
+        RETURNING e.id, old.show_id AS old_show_id, e.show_id,
+        (u.season IS NOT NULL OR u.number IS NOT NULL OR u.show_id IS NOT NULL)
+        AS changes_order;
+        """
+
+        values = dict(
+            ids=[e.id for e in merged],
+            names=[e.name for e in merged],
+            seasons=[e.season for e in merged],
+            numbers=[e.number for e in merged],
+            air_dates=[
+                None if e.air_date is None else int(e.air_date.timestamp())
+                for e in merged
+            ],
+            show_ids=[e.show_id for e in merged],
+        )
+
+        db = self._db.for_write()
+        async with db.transaction():
+            records = await db.fetch_all(query, values=values)
+
+            show_ids = set()
+            for r in records:
+                if r["changes_order"]:
+                    show_ids.update((r["old_show_id"], r["show_id"]))
+            if show_ids:
+                await refresh_show_progress(db, show_ids)
+
+        episode_ids = [r["id"] for r in records]
+        await publish_changes(self._invalidation, db, EntityKind.EPISODE, episode_ids)
+
+    async def shift_season_air_dates(self, shift: SeasonAirDatesShift) -> int:
+        """Shifts air dates of all episodes of show season by `shift.delta`
+        without reading episodes.
+
+        Args:
+            shift (SeasonAirDatesShift): data for shifting season air dates
+
+        Returns:
+            int: number of shifted episodes
+        """
+
+        query = """
+        UPDATE episodes
+        SET air_date = air_date + :delta
+        WHERE show_id = :show_id AND season = :season
+        RETURNING id;
+        """
+
+        values = dict(
+            show_id=shift.show_id,
+            season=shift.season,
+            delta=int(shift.delta.total_seconds()),
+        )
+        db = self._db.for_write()
+        records = await db.fetch_all(query, values=values)
+
+        # order of episodes is not changed, so schedule progress stays valid
+        episode_ids = [r["id"] for r in records]
+        await publish_changes(self._invalidation, db, EntityKind.EPISODE, episode_ids)
+
+        return len(episode_ids)
 
     async def delete(self, episode_id: int) -> None:
         """Deletes episode with id `episode_id` from repo.
@@ -143,10 +427,33 @@ class EpisodeRepo:
             episode_id (int)
         """
 
-        query = """
-        DELETE FROM episodes
-        WHERE id = :id
+        query = f"""
+        WITH deleted AS (
+            DELETE FROM episodes
+            WHERE id = :id
+            RETURNING id, show_id
+        ), progress AS (
+            UPDATE schedule_progress p
+            SET total_count = p.total_count - 1,
+                watched_count = p.watched_count - (
+                    SELECT count(*) FROM watched_episodes we
+                    WHERE we.user_id = p.user_id AND we.episode_id = d.id
+                ),
+                next_episode_id = CASE
+                    WHEN p.next_episode_id = d.id
+                    THEN {next_unwatched_episode("AND e.id <> d.id")}
+                    ELSE p.next_episode_id
+                END
+            FROM deleted d
+            WHERE p.show_id = d.show_id
+        )
+        SELECT id FROM deleted;
         """
 
         values = dict(id=episode_id)
-        await self._db.execute(query, values=values)
+        db = self._db.for_write()
+        deleted_id = await db.execute(query, values=values)
+        if deleted_id is not None:
+            await publish_changes(
+                self._invalidation, db, EntityKind.EPISODE, [deleted_id]
+            )
@@ -1,7 +1,15 @@
+import dataclasses
 import datetime
+import itertools as it
+from typing import Iterable, Sequence
 
-from tvsched.adapters.repos.episode.models import EpisodeRecord
-from tvsched.entities.episode import Episode
+from tvsched.adapters.repos.episode.models import EpisodeRecord, SeasonSummaryRecord
+from tvsched.application.models.episode import (
+    EpisodesCursor,
+    EpisodesPage,
+    EpisodeUpdate,
+)
+from tvsched.entities.episode import Episode, Season, SeasonSummary
 
 
 def map_episode_record_to_model(record: EpisodeRecord) -> Episode:
@@ -22,3 +30,120 @@ def map_episode_record_to_model(record: EpisodeRecord) -> Episode:
         air_date=datetime.datetime.fromtimestamp(record["air_date"]),
         show_id=record["show_id"],
     )
+
+
+def map_season_summary_record_to_model(record: SeasonSummaryRecord) -> SeasonSummary:
+    """Maps db season summary record to entity.
+
+    Args:
+        record (SeasonSummaryRecord)
+
+    Returns:
+        SeasonSummary
+    """
+
+    return SeasonSummary(
+        number=record["season"],
+        episodes_count=record["episodes_count"],
+        first_air_date=datetime.datetime.fromtimestamp(record["first_air_date"]),
+        last_air_date=datetime.datetime.fromtimestamp(record["last_air_date"]),
+    )
+
+
+def merge_episode_updates(episodes: Iterable[EpisodeUpdate]) -> list[EpisodeUpdate]:
+    """Merges updates of the same episode, so every episode is updated once.
+
+    Fields of later updates override fields of earlier ones.
+
+    Example:
+        >>> merged = merge_episode_updates([
+        ...     EpisodeUpdate(id=1, name="a", season=2),
+        ...     EpisodeUpdate(id=2, number=3),
+        ...     EpisodeUpdate(id=1, name="b"),
+        ... ])
+        >>> assert merged == [
+        ...     EpisodeUpdate(id=1, name="b", season=2),
+        ...     EpisodeUpdate(id=2, number=3),
+        ... ]
+
+    Args:
+        episodes (Iterable[EpisodeUpdate])
+
+    Returns:
+        list[EpisodeUpdate]: updates ordered by first update of episode
+    """
+
+    merged: dict[int, EpisodeUpdate] = {}
+    for episode in episodes:
+        previous = merged.get(episode.id)
+        if previous is not None:
+            changes = {
+                k: v for k, v in dataclasses.asdict(episode).items() if v is not None
+            }
+            episode = dataclasses.replace(previous, **changes)
+        merged[episode.id] = episode
+
+    return list(merged.values())
+
+
+def group_episodes_by_season(episodes: Iterable[Episode]) -> list[Season]:
+    """Groups episodes ordered by season and number into seasons.
+
+    Example:
+        >>> air_date = datetime.datetime(2022, 1, 1)
+        >>> episodes = [
+        ...     Episode(id=3, name="a", season=1, number=1, air_date=air_date, show_id=1),
+        ...     Episode(id=1, name="b", season=1, number=2, air_date=air_date, show_id=1),
+        ...     Episode(id=2, name="c", season=2, number=1, air_date=air_date, show_id=1),
+        ... ]
+        >>> seasons = group_episodes_by_season(episodes)
+        >>> [(s.number, [e.id for e in s.episodes]) for s in seasons]
+        [(1, [3, 1]), (2, [2])]
+
+    Args:
+        episodes (Iterable[Episode]): episodes ordered by season and number
+
+    Returns:
+        list[Season]
+    """
+
+    return [
+        Season(number=season, episodes=list(g))
+        for season, g in it.groupby(episodes, lambda e: e.season)
+    ]
+
+
+def paginate_episodes(episodes: Sequence[Episode], limit: int) -> EpisodesPage:
+    """Returns page of the first `limit` episodes.
+
+    Repos select one episode more than `limit` to find out
+    whether there is the next page without counting episodes.
+
+    Example:
+        >>> air_date = datetime.datetime(2022, 1, 1)
+        >>> episodes = [
+        ...     Episode(id=i, name="e", season=1, number=i, air_date=air_date, show_id=1)
+        ...     for i in range(1, 4)
+        ... ]
+        >>> paginate_episodes(episodes, limit=2).next_cursor
+        EpisodesCursor(season=1, number=2, id=2)
+        >>> paginate_episodes(episodes, limit=3).next_cursor is None
+        True
+
+    Args:
+        episodes (Sequence[Episode]): up to `limit + 1` episodes
+            ordered by season, number and id
+        limit (int): max number of episodes of page
+
+    Returns:
+        EpisodesPage
+    """
+
+    page = list(episodes[:limit])
+    if len(episodes) <= limit or not page:
+        return EpisodesPage(episodes=page, next_cursor=None)
+
+    last = page[-1]
+    cursor = EpisodesCursor(season=last.season, number=last.number, id=last.id)
+
+    return EpisodesPage(episodes=page, next_cursor=cursor)
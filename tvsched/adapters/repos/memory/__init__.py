@@ -0,0 +1,46 @@
+import typing
+
+from tvsched.adapters.lazy import lazy_exports
+
+if typing.TYPE_CHECKING:
+    from tvsched.adapters.repos.memory.actor import MemoryActorRepo
+    from tvsched.adapters.repos.memory.deletion import MemoryDeletionJobRepo
+    from tvsched.adapters.repos.memory.episode import MemoryEpisodeRepo
+    from tvsched.adapters.repos.memory.schedule import MemoryScheduleRepo
+    from tvsched.adapters.repos.memory.session import MemorySessionRepo
+    from tvsched.adapters.repos.memory.show import MemoryShowRepo
+    from tvsched.adapters.repos.memory.fetch import fetch_snapshot
+    from tvsched.adapters.repos.memory.snapshot import MemorySnapshot
+    from tvsched.adapters.repos.memory.store import MemoryStore, ReadOnlyStoreError
+    from tvsched.adapters.repos.memory.user import MemoryUserRepo
+
+__all__ = [
+    "MemoryActorRepo",
+    "MemoryDeletionJobRepo",
+    "MemoryEpisodeRepo",
+    "MemoryScheduleRepo",
+    "MemorySessionRepo",
+    "MemoryShowRepo",
+    "MemorySnapshot",
+    "MemoryStore",
+    "MemoryUserRepo",
+    "ReadOnlyStoreError",
+    "fetch_snapshot",
+]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "MemoryActorRepo": "actor",
+        "MemoryDeletionJobRepo": "deletion",
+        "MemoryEpisodeRepo": "episode",
+        "MemoryScheduleRepo": "schedule",
+        "MemorySessionRepo": "session",
+        "MemoryShowRepo": "show",
+        "MemorySnapshot": "snapshot",
+        "fetch_snapshot": "fetch",
+        "MemoryStore": "store",
+        "ReadOnlyStoreError": "store",
+        "MemoryUserRepo": "user",
+    },
+)
@@ -0,0 +1,207 @@
+import dataclasses
+from typing import Sequence
+
+from tvsched.adapters.repos.batching import order_by_ids
+from tvsched.adapters.repos.memory.store import MemoryStore
+from tvsched.adapters.repos.sqlite.functions import (
+    WORD_SIMILARITY_THRESHOLD,
+    word_similarity,
+)
+from tvsched.application.exceptions.actor import (
+    ActorAlreadyInShowCastError,
+    ActorNotFoundError,
+    ActorOrShowNotFoundError,
+)
+from tvsched.application.exceptions.show import ShowNotFoundError
+from tvsched.application.models.actor import (
+    ActorAdd,
+    ActorInShowCast,
+    ActorUpdate,
+    ShowCast,
+    ShowCastChanges,
+)
+from tvsched.application.models.common import EntitiesByIds, NameCompletion
+from tvsched.entities.actor import Actor
+
+
+class MemoryActorRepo:
+    def __init__(self, store: MemoryStore) -> None:
+        self._store = store
+
+    async def get(self, actor_id: int) -> Actor:
+        """Returns actor from repo by `actor_id`.
+
+        Args:
+            actor_id (int)
+
+        Raises:
+            ActorNotFoundError: will be raised if actor with id `actor_id` not in repo
+
+        Returns:
+            Actor
+        """
+
+        actor = self._store.actors.get(actor_id)
+        if actor is None:
+            raise ActorNotFoundError(actor_id=actor_id)
+
+        return actor
+
+    async def get_many(self, actor_ids: Sequence[int]) -> EntitiesByIds[Actor]:
+        """Returns actors from repo by `actor_ids`.
+
+        Args:
+            actor_ids (Sequence[int])
+
+        Returns:
+            EntitiesByIds[Actor]: actors ordered as `actor_ids` and ids of not found actors
+        """
+
+        return order_by_ids(actor_ids, self._store.actors)
+
+    async def search(self, query: str, limit: int) -> list[Actor]:
+        """Returns actors with name similar to `query` ordered by relevance.
+
+        Args:
+            query (str): words of actor name, may contain typos
+            limit (int): max number of actors
+
+        Returns:
+            list[Actor]
+        """
+
+        ranks = (
+            (-word_similarity(query, a.name), a.id) for a in self._store.actors.values()
+        )
+        matches = sorted(r for r in ranks if -r[0] >= WORD_SIMILARITY_THRESHOLD)
+
+        return [self._store.actors[actor_id] for _, actor_id in matches[:limit]]
+
+    async def complete_actor_names(
+        self, prefix: str, limit: int
+    ) -> list[NameCompletion]:
+        """Returns names of the most popular actors with word starting with `prefix`.
+
+        Args:
+            prefix (str)
+            limit (int): max number of names
+
+        Returns:
+            list[NameCompletion]
+        """
+
+        completions = self._store.actor_names.complete(prefix, limit)
+
+        return [NameCompletion(id=id_, name=name) for id_, name in completions]
+
+    async def add(self, actor: ActorAdd) -> None:
+        """Adds new actor to repo.
+
+        Args:
+            actor (ActorAdd): data for adding actor to repo.
+        """
+
+        store = self._store
+        store.check_writable()
+
+        actor_id = store.next_id("actors")
+        store.put_actor(Actor(id=actor_id, name=actor.name, image_url=actor.image_url))
+
+    async def update(self, actor: ActorUpdate) -> None:
+        """Updates actor in repo.
+
+        Args:
+            actor (ActorAdd): data for updating actor in repo
+        """
+
+        store = self._store
+        store.check_writable()
+
+        old = store.actors.get(actor.id)
+        if old is None:
+            return
+
+        changes = {
+            k: v
+            for k, v in dataclasses.asdict(actor).items()
+            if k != "id" and v is not None
+        }
+        store.put_actor(dataclasses.replace(old, **changes))
+        # shows contain their cast
+        store.bump_show_versions(store.filmography[actor.id])
+
+    async def delete(self, actor_id: int) -> None:
+        """Deletes actor with id `actor_id` from repo.
+
+        Args:
+            actor_id (int)
+        """
+
+        self._store.check_writable()
+        self._store.delete_actor(actor_id)
+
+    async def add_actor_to_show_cast(self, actor_in_cast: ActorInShowCast) -> None:
+        """Adds actor with id `actor_in_cast.actor_id` to show cast with id `actor_in_cast.show_id`.
+
+        Args:
+            actor_in_cast (ActorInShowCast): data for adding actor to show cast
+
+        Raises:
+            ActorOrShowNotFoundError: will be raised if actor or show not in repo
+            ActorAlreadyInShowCastError: will be raised if actor already in show cast
+        """
+
+        store = self._store
+        store.check_writable()
+
+        show_id, actor_id = actor_in_cast.show_id, actor_in_cast.actor_id
+        if show_id not in store.shows or actor_id not in store.actors:
+            raise ActorOrShowNotFoundError(actor_in_cast)
+        if show_id in store.filmography[actor_id]:
+            raise ActorAlreadyInShowCastError(actor_in_cast)
+
+        store.add_to_cast(show_id, actor_id)
+
+    async def delete_actor_from_show_cast(self, actor_in_cast: ActorInShowCast) -> None:
+        """Deletes actor with id `actor_in_cast.actor_id` from show cast with id `actor_in_cast.show_id`.
+
+        Args:
+            actor_in_cast (ActorInShowCast): data for deleting actor from show cast
+        """
+
+        store = self._store
+        store.check_writable()
+
+        show_id, actor_id = actor_in_cast.show_id, actor_in_cast.actor_id
+        if show_id in store.filmography.get(actor_id, ()):
+            store.delete_from_cast(show_id, actor_id)
+
+    async def set_show_cast(self, show_cast: ShowCast) -> ShowCastChanges:
+        """Replaces cast of show with id `show_cast.show_id` with actors by `show_cast.actor_ids`.
+
+        Args:
+            show_cast (ShowCast): show id and ids of actors of new cast
+
+        Raises:
+            ShowNotFoundError: will be raised if show not in repo
+
+        Returns:
+            ShowCastChanges: ids of added, removed and missing actors
+        """
+
+        store = self._store
+        store.check_writable()
+
+        show_id = show_cast.show_id
+        if show_id not in store.shows:
+            raise ShowNotFoundError(show_id=show_id)
+
+        desired = set(show_cast.actor_ids)
+        found = {actor_id for actor_id in desired if actor_id in store.actors}
+        added, removed = store.set_cast(show_id, found)
+
+        return ShowCastChanges(
+            added_actor_ids=added,
+            removed_actor_ids=removed,
+            missing_actor_ids=sorted(desired - found),
+        )
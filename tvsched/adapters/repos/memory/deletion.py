@@ -0,0 +1,29 @@
+from typing import Optional
+
+from tvsched.entities.deletion import DeletionJob
+
+
+class MemoryDeletionJobRepo:
+    """Deletion jobs of in-memory repos.
+
+    In-memory repos delete shows and users at once, so there are no jobs.
+    """
+
+    async def get_deletion_jobs(
+        self,
+        unfinished_only: bool = False,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> list[DeletionJob]:
+        """Returns deletion jobs from the newest.
+
+        Args:
+            unfinished_only (bool): if True only running jobs will be returned
+            limit (Optional[int]): max number of jobs. If None all jobs will be returned
+            offset (Optional[int])
+
+        Returns:
+            list[DeletionJob]: always empty list
+        """
+
+        return []
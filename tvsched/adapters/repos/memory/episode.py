@@ -0,0 +1,239 @@
+import bisect
+import dataclasses
+import itertools as it
+from typing import Optional, Sequence
+
+from tvsched.adapters.repos.batching import order_by_ids
+from tvsched.adapters.repos.episode.utils import (
+    merge_episode_updates,
+    paginate_episodes,
+)
+from tvsched.adapters.repos.memory.store import MemoryStore
+from tvsched.application.exceptions.episode import EpisodeNotFoundError
+from tvsched.application.exceptions.show import ShowNotFoundError
+from tvsched.application.models.common import EntitiesByIds
+from tvsched.application.models.episode import (
+    EpisodeAdd,
+    EpisodesCursor,
+    EpisodesPage,
+    EpisodeUpdate,
+    SeasonAirDatesShift,
+)
+from tvsched.entities.episode import Episode, SeasonSummary
+
+
+class MemoryEpisodeRepo:
+    def __init__(self, store: MemoryStore) -> None:
+        self._store = store
+
+    async def get(self, episode_id: int) -> Episode:
+        """Returns episode from repo by `episode_id`.
+
+        Args:
+            episode_id (int)
+
+        Raises:
+            EpisodeNotFoundError: will be raised if episode with id `episode_id` not in repo
+
+        Returns:
+            Episode
+        """
+
+        episode = self._store.episodes.get(episode_id)
+        if episode is None:
+            raise EpisodeNotFoundError(episode_id=episode_id)
+
+        return episode
+
+    async def get_many(self, episode_ids: Sequence[int]) -> EntitiesByIds[Episode]:
+        """Returns episodes from repo by `episode_ids`.
+
+        Args:
+            episode_ids (Sequence[int])
+
+        Returns:
+            EntitiesByIds[Episode]: episodes ordered as `episode_ids`
+                and ids of not found episodes
+        """
+
+        return order_by_ids(episode_ids, self._store.episodes)
+
+    async def get_episodes(self, show_id: int) -> list[Episode]:
+        """Returns list of tv show episodes with tv show id `show_id`
+        ordered by season and number.
+
+        Args:
+            show_id (int)
+
+        Returns:
+            list[Episode]
+        """
+
+        keys = self._store.episodes_of_show.get(show_id, [])
+
+        return [self._store.episodes[key[2]] for key in keys]
+
+    get_episodes_from_show = get_episodes
+
+    async def get_episodes_page(
+        self,
+        show_id: int,
+        season: Optional[int] = None,
+        after: Optional[EpisodesCursor] = None,
+        limit: int = 100,
+    ) -> EpisodesPage:
+        """Returns page of episodes of show with id `show_id`
+        ordered by season, number and id.
+
+        Start and end of page are found by binary search
+        over ordered keys of episodes of show.
+
+        Args:
+            show_id (int)
+            season (Optional[int]): if not None only episodes of the season are returned
+            after (Optional[EpisodesCursor]): cursor of previous page.
+                If None the first page is returned
+            limit (int): max number of episodes of page
+
+        Returns:
+            EpisodesPage
+        """
+
+        keys = self._store.episodes_of_show.get(show_id, [])
+
+        start, end = 0, len(keys)
+        if season is not None:
+            start = bisect.bisect_left(keys, (season,))
+            end = bisect.bisect_left(keys, (season + 1,))
+        if after is not None:
+            cursor = (after.season, after.number, after.id)
+            start = max(start, bisect.bisect_right(keys, cursor))
+
+        end = min(end, start + limit + 1)
+        episodes = [self._store.episodes[key[2]] for key in keys[start:end]]
+
+        return paginate_episodes(episodes, limit)
+
+    async def get_season_summaries(self, show_id: int) -> list[SeasonSummary]:
+        """Returns number of episodes and range of air dates of every season
+        of show with id `show_id` ordered by season.
+
+        Args:
+            show_id (int)
+
+        Returns:
+            list[SeasonSummary]
+        """
+
+        keys = self._store.episodes_of_show.get(show_id, [])
+
+        summaries = []
+        for season, season_keys in it.groupby(keys, lambda key: key[0]):
+            air_dates = [self._store.episodes[key[2]].air_date for key in season_keys]
+            summary = SeasonSummary(
+                number=season,
+                episodes_count=len(air_dates),
+                first_air_date=min(air_dates),
+                last_air_date=max(air_dates),
+            )
+            summaries.append(summary)
+
+        return summaries
+
+    async def add(self, episode: EpisodeAdd) -> None:
+        """Adds new episode to repo.
+
+        Args:
+            episode (EpisodeAdd): data for adding episode to repo.
+
+        Raises:
+            ShowNotFoundError: will be raised if show with id `episode.show_id`
+                not in repo
+        """
+
+        store = self._store
+        store.check_writable()
+
+        if episode.show_id not in store.shows:
+            raise ShowNotFoundError(show_id=episode.show_id)
+
+        store.put_episode(
+            Episode(
+                id=store.next_id("episodes"),
+                name=episode.name,
+                season=episode.season,
+                number=episode.number,
+                air_date=episode.air_date,
+                show_id=episode.show_id,
+            )
+        )
+
+    async def update(self, episode: EpisodeUpdate) -> None:
+        """Updates episode in repo.
+
+        Args:
+            episode (EpisodeAdd): data for updating episode to repo
+        """
+
+        await self.update_many([episode])
+
+    async def update_many(self, episodes: Sequence[EpisodeUpdate]) -> None:
+        """Updates episodes in repo at once.
+
+        If several updates have the same episode id, they are applied in order.
+        Updates moving episodes to not existing shows are skipped.
+
+        Args:
+            episodes (Sequence[EpisodeUpdate]): data for updating episodes in repo
+        """
+
+        store = self._store
+        store.check_writable()
+
+        for update in merge_episode_updates(episodes):
+            old = store.episodes.get(update.id)
+            if old is None:
+                continue
+
+            changes = {
+                k: v
+                for k, v in dataclasses.asdict(update).items()
+                if k != "id" and v is not None
+            }
+            new = dataclasses.replace(old, **changes)
+            if new.show_id in store.shows:
+                store.put_episode(new)
+
+    async def shift_season_air_dates(self, shift: SeasonAirDatesShift) -> int:
+        """Shifts air dates of all episodes of show season by `shift.delta`.
+
+        Args:
+            shift (SeasonAirDatesShift): data for shifting season air dates
+
+        Returns:
+            int: number of shifted episodes
+        """
+
+        store = self._store
+        store.check_writable()
+
+        # episodes of season are adjacent in order of episodes of show
+        keys = store.episodes_of_show.get(shift.show_id, [])
+        start = bisect.bisect_left(keys, (shift.season,))
+        end = bisect.bisect_left(keys, (shift.season + 1,))
+        for _, _, episode_id in keys[start:end]:
+            episode = store.episodes[episode_id]
+            air_date = episode.air_date + shift.delta
+            store.episodes[episode_id] = dataclasses.replace(episode, air_date=air_date)
+
+        return end - start
+
+    async def delete(self, episode_id: int) -> None:
+        """Deletes episode with id `episode_id` from repo.
+
+        Args:
+            episode_id (int)
+        """
+
+        self._store.check_writable()
+        self._store.delete_episode(episode_id)
@@ -0,0 +1,124 @@
+"""Loading of `MemorySnapshot` from Postgres."""
+
+import datetime
+from typing import Union
+
+from databases.core import Connection
+
+from tvsched.adapters.repos.memory.snapshot import (
+    LoggedScheduleChange,
+    MemorySnapshot,
+    ScheduleVersion,
+    SessionRow,
+    ShowRow,
+)
+from tvsched.adapters.repos.routing import ConnectionRouter
+from tvsched.application.models.actor import ActorInShowCast
+from tvsched.application.models.auth import UserInRepo
+from tvsched.application.models.schedule import EpisodeInSchedule, ShowInSchedule
+from tvsched.entities.actor import Actor
+from tvsched.entities.auth import Role
+from tvsched.entities.episode import Episode
+from tvsched.entities.schedule import ScheduleChange, ScheduleChangeKind
+
+
+async def fetch_snapshot(db: Union[Connection, ConnectionRouter]) -> MemorySnapshot:
+    """Reads consistent snapshot of all not deleted rows from Postgres.
+
+    Args:
+        db (Union[Connection, ConnectionRouter])
+
+    Returns:
+        MemorySnapshot
+    """
+
+    conn = await ConnectionRouter.of(db).for_read()
+
+    # tables are read from one snapshot of database
+    async with conn.transaction(isolation="repeatable_read", readonly=True):
+        shows = await conn.fetch_all(
+            "SELECT id, name, seasons_count, image_url, version FROM shows"
+            " WHERE deleted_at IS NULL;"
+        )
+        actors = await conn.fetch_all("SELECT id, name, image_url FROM actors;")
+        cast = await conn.fetch_all(
+            "SELECT ats.show_id, ats.actor_id FROM actors_to_shows ats"
+            " JOIN shows s ON s.id = ats.show_id WHERE s.deleted_at IS NULL;"
+        )
+        episodes = await conn.fetch_all(
+            "SELECT e.* FROM episodes e"
+            " JOIN shows s ON s.id = e.show_id WHERE s.deleted_at IS NULL;"
+        )
+        users = await conn.fetch_all(
+            "SELECT id, username, password_hash, role FROM users"
+            " WHERE deleted_at IS NULL;"
+        )
+        schedules = await conn.fetch_all(
+            "SELECT sts.user_id, sts.show_id FROM shows_to_schedules sts"
+            " JOIN shows s ON s.id = sts.show_id"
+            " JOIN users u ON u.id = sts.user_id"
+            " WHERE s.deleted_at IS NULL AND u.deleted_at IS NULL;"
+        )
+        watched_episodes = await conn.fetch_all(
+            "SELECT we.user_id, we.episode_id FROM watched_episodes we"
+            " JOIN episodes e ON e.id = we.episode_id"
+            " JOIN shows s ON s.id = e.show_id"
+            " JOIN users u ON u.id = we.user_id"
+            " WHERE s.deleted_at IS NULL AND u.deleted_at IS NULL;"
+        )
+        versions = await conn.fetch_all(
+            "SELECT v.user_id, v.version, v.purged_version FROM schedule_versions v"
+            " JOIN users u ON u.id = v.user_id WHERE u.deleted_at IS NULL;"
+        )
+        changes = await conn.fetch_all(
+            "SELECT c.* FROM schedule_changes c"
+            " JOIN users u ON u.id = c.user_id WHERE u.deleted_at IS NULL;"
+        )
+        sessions = await conn.fetch_all(
+            "SELECT s.id, s.token_hash, s.user_id, s.expires_at FROM sessions s"
+            " JOIN users u ON u.id = s.user_id"
+            " WHERE s.revoked_at IS NULL AND u.deleted_at IS NULL;"
+        )
+
+    return MemorySnapshot(
+        shows=[ShowRow(**r) for r in shows],
+        actors=[Actor(**r) for r in actors],
+        cast=[ActorInShowCast(**r) for r in cast],
+        episodes=[
+            Episode(
+                id=r["id"],
+                name=r["name"],
+                season=r["season"],
+                number=r["number"],
+                air_date=datetime.datetime.fromtimestamp(r["air_date"]),
+                show_id=r["show_id"],
+            )
+            for r in episodes
+        ],
+        users=[
+            UserInRepo(
+                id=r["id"],
+                username=r["username"],
+                password_hash=r["password_hash"],
+                role=Role(r["role"]),
+            )
+            for r in users
+        ],
+        schedules=[ShowInSchedule(**r) for r in schedules],
+        watched_episodes=[EpisodeInSchedule(**r) for r in watched_episodes],
+        schedule_versions=[ScheduleVersion(**r) for r in versions],
+        schedule_changes=[
+            LoggedScheduleChange(
+                user_id=r["user_id"],
+                change=ScheduleChange(
+                    kind=ScheduleChangeKind(r["kind"]),
+                    target_id=r["target_id"],
+                    version=r["version"],
+                    deleted=r["deleted"],
+                ),
+                changed_at=r["changed_at"],
+            )
+            for r in changes
+        ],
+        sessions=[SessionRow(**r) for r in sessions],
+    )
@@ -0,0 +1,374 @@
+import dataclasses
+import datetime
+import itertools as it
+import uuid
+from typing import Optional
+
+from tvsched.adapters.repos.memory.show import get_shows_from_schedule
+from tvsched.adapters.repos.memory.store import MemoryStore
+from tvsched.adapters.repos.schedule.models import ScheduleShowVersionRecord
+from tvsched.adapters.repos.schedule.utils import make_schedule_version
+from tvsched.application.exceptions.schedule import (
+    EpisodeAlreadyMarkedAsWatchedError,
+    EpisodeOrScheduleNotFoundError,
+    ShowAlreadyExistsInScheduleError,
+    ShowOrScheduleNotFoundError,
+)
+from tvsched.application.models.schedule import EpisodeInSchedule, ShowInSchedule
+from tvsched.entities.episode import Episode
+from tvsched.entities.schedule import (
+    ScheduleChangeKind,
+    ScheduleChanges,
+    ShowProgress,
+    SuggestedShows,
+)
+from tvsched.entities.show import Show
+
+
+class MemoryScheduleRepo:
+    def __init__(self, store: MemoryStore, suggestions_limit: int = 50) -> None:
+        self._store = store
+        self._suggestions_limit = suggestions_limit
+
+    async def get_shows_from_schedule(
+        self,
+        user_id: uuid.UUID,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> list[Show]:
+        """Returns list of shows from user schedule ordered by id.
+
+        Args:
+            user_id (uuid.UUID): user schedule user user_id
+
+        Returns:
+            list[Show]
+        """
+
+        return get_shows_from_schedule(self._store, user_id, limit, offset)
+
+    async def add_show_to_schedule(self, show_in_schedule: ShowInSchedule) -> None:
+        """Adds show with id `show_in_schedule.show_id` to user schedule
+        with id `show_in_schedule.user_id`.
+
+        Args:
+            show_in_schedule (ShowInSchedule): data for adding show to schedule
+
+        Raises:
+            ShowOrScheduleNotFoundError: will be raised if show or user not in repo
+            ShowAlreadyExistsInScheduleError: will be raised if show already
+                in schedule
+        """
+
+        store = self._store
+        store.check_writable()
+
+        user_id, show_id = show_in_schedule.user_id, show_in_schedule.show_id
+        if user_id not in store.users or show_id not in store.shows:
+            raise ShowOrScheduleNotFoundError(show_in_schedule)
+        if show_id in store.schedules[user_id]:
+            raise ShowAlreadyExistsInScheduleError(show_in_schedule)
+
+        store.add_to_schedule(user_id, show_id)
+        store.log_schedule_changes(ScheduleChangeKind.SHOW, [(user_id, show_id)], False)
+
+    add_to_schedule = add_show_to_schedule
+
+    async def delete_show_from_schedule(self, show_in_schedule: ShowInSchedule) -> None:
+        """Deletes show with id `show_in_schedule.show_id` from user schedule
+        with id `show_in_schedule.user_id`.
+
+        Args:
+            show_in_schedule (ShowInSchedule): data for deleting show to schedule
+        """
+
+        store = self._store
+        store.check_writable()
+
+        user_id, show_id = show_in_schedule.user_id, show_in_schedule.show_id
+        if show_id not in store.schedules.get(user_id, ()):
+            return
+
+        store.delete_from_schedule(user_id, show_id)
+        store.log_schedule_changes(ScheduleChangeKind.SHOW, [(user_id, show_id)], True)
+
+    delete_from_schedule = delete_show_from_schedule
+
+    async def get_suggested_shows(self, user_id: uuid.UUID) -> list[Show]:
+        """Returns shows with actors from casts of shows from user schedule.
+
+        Args:
+            user_id (uuid.UUID)
+
+        Returns:
+            list[Show]
+        """
+
+        store = self._store
+        actor_ids = {a for s in store.schedules.get(user_id, ()) for a in store.cast[s]}
+        show_ids = {s for a in actor_ids for s in store.filmography[a]}
+
+        return store.get_shows(sorted(show_ids))
+
+    async def get_precomputed_suggested_shows(
+        self, user_id: uuid.UUID
+    ) -> SuggestedShows:
+        """Returns shows ranked by number of actors shared with shows
+        from user schedule.
+
+        Suggestions are computed on read from in-memory co-cast graph.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+
+        Returns:
+            SuggestedShows: ranked shows and time of computation
+        """
+
+        store = self._store
+        computed_at = datetime.datetime.now(datetime.timezone.utc)
+        scores = store.co_cast.score(
+            store.schedules.get(user_id, ()), self._suggestions_limit
+        )
+
+        return SuggestedShows(
+            shows=store.get_shows(show_id for show_id, _ in scores),
+            computed_at=computed_at,
+        )
+
+    async def get_upcoming_episodes_from_schedule(
+        self,
+        user_id: uuid.UUID,
+        starts_at: datetime.datetime,
+        ends_at: datetime.datetime,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> list[Episode]:
+        """Returns episodes of shows from user schedule which air
+        from `starts_at` (inclusive) to `ends_at` (exclusive) ordered by air date.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+            starts_at (datetime.datetime)
+            ends_at (datetime.datetime)
+            limit (Optional[int]): max number of episodes. If None all episodes will be returned
+            offset (Optional[int])
+
+        Returns:
+            list[Episode]
+        """
+
+        store = self._store
+        starts, ends = starts_at.timestamp(), ends_at.timestamp()
+        episodes = (
+            store.episodes[key[2]]
+            for show_id in store.schedules.get(user_id, ())
+            for key in store.episodes_of_show[show_id]
+        )
+        upcoming = sorted(
+            (e for e in episodes if starts <= e.air_date.timestamp() < ends),
+            key=lambda e: (e.air_date.timestamp(), e.id),
+        )
+        stop = None if limit is None else (offset or 0) + limit
+
+        return upcoming[offset:stop]
+
+    async def get_first_unwatched_episodes_from_schedule(
+        self, user_id: uuid.UUID
+    ) -> list[Episode]:
+        """Returns first unwatched episode of each show from user schedule
+        ordered by show id.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+
+        Returns:
+            list[Episode]
+        """
+
+        store = self._store
+        next_episode_ids = (
+            self._get_next_episode_id(user_id, show_id)
+            for show_id in sorted(store.schedules.get(user_id, ()))
+        )
+
+        return [store.episodes[e] for e in next_episode_ids if e is not None]
+
+    async def mark_episode_as_watched(
+        self, episode_in_schedule: EpisodeInSchedule
+    ) -> None:
+        """Marks episode with `episode_id` as watched in repo.
+
+        Args:
+            episode_in_schedule (EpisodeInSchedule): data for marking episode
+                as watched in schedule
+
+        Raises:
+            EpisodeOrScheduleNotFoundError: will be raised if episode or schedule does not exists
+            EpisodeAlreadyExistsInScheduleError: will be raised if episode already marked as watched in schedule
+        """
+
+        store = self._store
+        store.check_writable()
+
+        user_id, episode_id = (
+            episode_in_schedule.user_id,
+            episode_in_schedule.episode_id,
+        )
+        if user_id not in store.users or episode_id not in store.episodes:
+            raise EpisodeOrScheduleNotFoundError(episode_in_schedule)
+        if episode_id in store.watched[user_id]:
+            raise EpisodeAlreadyMarkedAsWatchedError(episode_in_schedule)
+
+        store.mark_watched(user_id, episode_id)
+        store.log_schedule_changes(
+            ScheduleChangeKind.WATCHED_EPISODE, [(user_id, episode_id)], False
+        )
+
+    async def mark_episode_as_unwatched(
+        self, episode_in_schedule: EpisodeInSchedule
+    ) -> None:
+        """Marks episode with `episode_id` as unwatched in repo.
+
+        Args:
+            episode_in_schedule (EpisodeInSchedule): data for marking episode
+                as watched in schedule
+        """
+
+        store = self._store
+        store.check_writable()
+
+        user_id, episode_id = (
+            episode_in_schedule.user_id,
+            episode_in_schedule.episode_id,
+        )
+        if episode_id not in store.watched.get(user_id, ()):
+            return
+
+        store.mark_unwatched(user_id, episode_id)
+        store.log_schedule_changes(
+            ScheduleChangeKind.WATCHED_EPISODE, [(user_id, episode_id)], True
+        )
+
+    async def get_schedule_progress(self, user_id: uuid.UUID) -> list[ShowProgress]:
+        """Returns progress of watching each show from user schedule.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+
+        Returns:
+            list[ShowProgress]
+        """
+
+        store = self._store
+        watched = store.watched.get(user_id, set())
+        progress = []
+        for show_id in sorted(store.schedules.get(user_id, ())):
+            keys = store.episodes_of_show[show_id]
+            progress.append(
+                ShowProgress(
+                    show_id=show_id,
+                    watched_count=sum(1 for key in keys if key[2] in watched),
+                    total_count=len(keys),
+                    next_episode_id=self._get_next_episode_id(user_id, show_id),
+                )
+            )
+
+        return progress
+
+    async def get_schedule_version(self, user_id: uuid.UUID) -> str:
+        """Returns version stamp of shows from user schedule without loading them.
+
+        Stamp is built only from ids and versions of shows from schedule,
+        see `make_schedule_version`.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+
+        Returns:
+            str: version stamp, changes on every change of shows in schedule
+                or of scheduled shows and their casts
+        """
+
+        shows = self._store.shows
+        show_ids = self._store.schedules.get(user_id, set())
+
+        return make_schedule_version(
+            ScheduleShowVersionRecord(id=s, version=shows[s].version) for s in show_ids
+        )
+
+    async def get_schedule_changes_since(
+        self, user_id: uuid.UUID, version: int
+    ) -> ScheduleChanges:
+        """Returns changes of user schedule after version `version`.
+
+        If changes after `version` were compacted or `version` is unknown,
+        returns reset flag and whole schedule state as changes.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+            version (int): version of schedule known by client, 0 for first sync
+
+        Returns:
+            ScheduleChanges
+        """
+
+        store = self._store
+        current = store.schedule_versions.get(user_id)
+        if current is None:
+            return ScheduleChanges(version=0, reset=version > 0, changes=[])
+
+        reset = version < current.purged_version or version > current.version
+        logged = store.schedule_changes.get(user_id, {}).values()
+        if reset:
+            changes = [c.change for c in logged if not c.change.deleted]
+        else:
+            changes = [c.change for c in logged if c.change.version > version]
+        changes.sort(key=lambda c: c.version)
+
+        return ScheduleChanges(version=current.version, reset=reset, changes=changes)
+
+    async def compact_schedule_changes(
+        self, changed_before: datetime.datetime, batch_size: int = 10_000
+    ) -> int:
+        """Deletes changes about deleted shows and unwatched episodes
+        made before `changed_before`.
+
+        Purged versions are remembered, so clients with older cursors
+        get reset of their state.
+
+        Args:
+            changed_before (datetime.datetime)
+            batch_size (int): max number of deleted changes
+
+        Returns:
+            int: number of deleted changes
+        """
+
+        store = self._store
+        store.check_writable()
+
+        before = changed_before.timestamp()
+        purgeable = (
+            (user_id, key, logged)
+            for user_id, changes in store.schedule_changes.items()
+            for key, logged in changes.items()
+            if logged.change.deleted and logged.changed_at.timestamp() < before
+        )
+        purged = list(it.islice(purgeable, batch_size))
+
+        for user_id, key, logged in purged:
+            del store.schedule_changes[user_id][key]
+            version = store.schedule_versions[user_id]
+            purged_version = max(version.purged_version, logged.change.version)
+            store.schedule_versions[user_id] = dataclasses.replace(
+                version, purged_version=purged_version
+            )
+
+        return len(purged)
+
+    def _get_next_episode_id(self, user_id: uuid.UUID, show_id: int) -> Optional[int]:
+        watched = self._store.watched[user_id]
+        keys = self._store.episodes_of_show[show_id]
+
+        return next((key[2] for key in keys if key[2] not in watched), None)
@@ -0,0 +1,65 @@
+from tvsched.adapters.repos.memory.snapshot import SessionRow
+from tvsched.adapters.repos.memory.store import MemoryStore
+from tvsched.application.exceptions.auth import InvalidRefreshTokenError
+from tvsched.application.models.auth import SessionAdd, SessionInRepo, UserInToken
+
+
+class MemorySessionRepo:
+    def __init__(self, store: MemoryStore) -> None:
+        self._store = store
+
+    async def add_session(self, session: SessionAdd) -> None:
+        """Adds session to repo.
+
+        Args:
+            session (SessionAdd)
+        """
+
+        store = self._store
+        store.check_writable()
+
+        store.put_session(
+            SessionRow(
+                id=store.next_id("sessions"),
+                token_hash=session.token_hash,
+                user_id=session.user_id,
+                expires_at=session.expires_at,
+            )
+        )
+
+    async def get_session(self, token_hash: str) -> SessionInRepo:
+        """Returns session by hash of its refresh token.
+
+        Args:
+            token_hash (str): sha256 hex digest of refresh token
+
+        Raises:
+            InvalidRefreshTokenError: will be raised if session not in repo
+
+        Returns:
+            SessionInRepo
+        """
+
+        store = self._store
+
+        row = store.sessions.get(token_hash)
+        if row is None:
+            raise InvalidRefreshTokenError()
+
+        user = store.users[row.user_id]
+
+        return SessionInRepo(
+            id=row.id,
+            user=UserInToken(id=user.id, role=user.role),
+            expires_at=row.expires_at,
+        )
+
+    async def revoke_session(self, token_hash: str) -> None:
+        """Revokes session by hash of its refresh token.
+
+        Args:
+            token_hash (str): sha256 hex digest of refresh token
+        """
+
+        self._store.check_writable()
+        self._store.delete_session(token_hash)
@@ -0,0 +1,300 @@
+import dataclasses
+import itertools as it
+import uuid
+from typing import Optional, Sequence
+
+from tvsched.adapters.repos.batching import order_by_ids
+from tvsched.adapters.repos.episode.utils import group_episodes_by_season
+from tvsched.adapters.repos.memory.snapshot import ShowRow
+from tvsched.adapters.repos.memory.store import MemoryStore
+from tvsched.adapters.repos.sqlite.functions import (
+    WORD_SIMILARITY_THRESHOLD,
+    word_similarity,
+)
+from tvsched.application.exceptions.show import ShowNotFoundError
+from tvsched.application.models.common import (
+    EntitiesByIds,
+    NameCompletion,
+    Versioned,
+)
+from tvsched.application.models.show import ShowAdd, ShowUpdate
+from tvsched.entities.show import Show, ShowDetails
+
+
+class MemoryShowRepo:
+    def __init__(self, store: MemoryStore) -> None:
+        self._store = store
+
+    async def get(self, show_id: int) -> Show:
+        """Returns show from repo by `show_id`.
+
+        Args:
+            show_id (show)
+
+        Raises:
+            ShowNotFoundError: will be raised if show with id `show_id` not in repo
+
+        Returns:
+            Show
+        """
+
+        show = self._store.get_show(show_id)
+        if show is None:
+            raise ShowNotFoundError(show_id=show_id)
+
+        return show
+
+    async def get_versioned(self, show_id: int) -> Versioned[Show]:
+        """Returns show from repo by `show_id` with its version stamp.
+
+        Args:
+            show_id (show)
+
+        Raises:
+            ShowNotFoundError: will be raised if show with id `show_id` not in repo
+
+        Returns:
+            Versioned[Show]
+        """
+
+        show = self._store.get_show(show_id)
+        if show is None:
+            raise ShowNotFoundError(show_id=show_id)
+
+        version = str(self._store.shows[show_id].version)
+
+        return Versioned(version=version, entity=show)
+
+    async def get_details(
+        self, show_id: int, user_id: Optional[uuid.UUID] = None
+    ) -> ShowDetails:
+        """Returns show with its cast and episodes grouped by seasons.
+
+        Args:
+            show_id (int)
+            user_id (Optional[uuid.UUID]): if not None ids of episodes
+                watched by user are returned too
+
+        Raises:
+            ShowNotFoundError: will be raised if show with id `show_id` not in repo
+
+        Returns:
+            ShowDetails
+        """
+
+        store = self._store
+
+        row = store.shows.get(show_id)
+        if row is None:
+            raise ShowNotFoundError(show_id=show_id)
+
+        show = Show(
+            id=row.id,
+            name=row.name,
+            seasons_count=row.seasons_count,
+            image_url=row.image_url,
+            cast=[store.actors[a] for a in store.cast[show_id]],
+        )
+        episode_ids = [key[2] for key in store.episodes_of_show[show_id]]
+        watched_episode_ids = None
+        if user_id is not None:
+            watched = store.watched.get(user_id, set())
+            watched_episode_ids = sorted(e for e in episode_ids if e in watched)
+
+        return ShowDetails(
+            show=show,
+            seasons=group_episodes_by_season(store.episodes[e] for e in episode_ids),
+            watched_episode_ids=watched_episode_ids,
+        )
+
+    async def get_version(self, show_id: int) -> str:
+        """Returns version stamp of show with id `show_id` without loading its cast.
+
+        Args:
+            show_id (int)
+
+        Raises:
+            ShowNotFoundError: will be raised if show with id `show_id` not in repo
+
+        Returns:
+            str: version stamp, changes on every update of show or its cast
+        """
+
+        row = self._store.shows.get(show_id)
+        if row is None:
+            raise ShowNotFoundError(show_id=show_id)
+
+        return str(row.version)
+
+    async def get_many(self, show_ids: Sequence[int]) -> EntitiesByIds[Show]:
+        """Returns shows from repo by `show_ids`.
+
+        Args:
+            show_ids (Sequence[int])
+
+        Returns:
+            EntitiesByIds[Show]: shows ordered as `show_ids` and ids of not found shows
+        """
+
+        shows = {s.id: s for s in self._store.get_shows(set(show_ids))}
+
+        return order_by_ids(show_ids, shows)
+
+    async def get_shows(
+        self, limit: Optional[int] = None, offset: Optional[int] = None
+    ) -> list[Show]:
+        """Returns list of shows from repo ordered by id.
+
+        Args:
+            limit (Optional[int]): max number of shows. If None all shows will be returned
+            offset (Optional[int])
+
+        Returns:
+            list[Show]
+        """
+
+        show_ids = (s for s in sorted(self._store.shows) if self._store.cast[s])
+        stop = None if limit is None else (offset or 0) + limit
+
+        return self._store.get_shows(it.islice(show_ids, offset, stop))
+
+    async def search(
+        self, query: str, limit: int, include_cast: bool = False
+    ) -> list[Show]:
+        """Returns shows with name similar to `query` ordered by relevance.
+
+        Args:
+            query (str): words of show name, may contain typos
+            limit (int): max number of shows
+            include_cast (bool): if True shows with actor name
+                similar to `query` will be returned too
+
+        Returns:
+            list[Show]
+        """
+
+        store = self._store
+        ranks = {s.id: word_similarity(query, s.name) for s in store.shows.values()}
+        if include_cast:
+            for actor in store.actors.values():
+                rank = word_similarity(query, actor.name)
+                for show_id in store.filmography[actor.id]:
+                    ranks[show_id] = max(ranks[show_id], rank)
+
+        matches = sorted(
+            (-rank, show_id)
+            for show_id, rank in ranks.items()
+            if rank >= WORD_SIMILARITY_THRESHOLD
+        )
+
+        return store.get_shows(show_id for _, show_id in matches[:limit])
+
+    async def complete_show_names(
+        self, prefix: str, limit: int
+    ) -> list[NameCompletion]:
+        """Returns names of the most popular shows with word starting with `prefix`.
+
+        Args:
+            prefix (str)
+            limit (int): max number of names
+
+        Returns:
+            list[NameCompletion]
+        """
+
+        completions = self._store.show_names.complete(prefix, limit)
+
+        return [NameCompletion(id=id_, name=name) for id_, name in completions]
+
+    async def add(self, show: ShowAdd) -> None:
+        """Adds show to repo.
+
+        Args:
+            show (ShowAdd): data for adding show to repo
+        """
+
+        store = self._store
+        store.check_writable()
+
+        row = ShowRow(
+            id=store.next_id("shows"),
+            name=show.name,
+            seasons_count=show.seasons_count,
+            image_url=show.image_url,
+        )
+        store.put_show(row)
+
+    async def delete(self, show_id: int) -> None:
+        """Deletes show from repo by `show_id`.
+
+        Episodes, cast and schedules with show are deleted with it at once.
+
+        Args:
+            show_id (show)
+        """
+
+        self._store.check_writable()
+        self._store.delete_show(show_id)
+
+    async def update(self, show: ShowUpdate) -> None:
+        """Updates show in repo.
+
+        Args:
+            show (ShowAdd): data for updating show to repo
+        """
+
+        store = self._store
+        store.check_writable()
+
+        row = store.shows.get(show.id)
+        if row is None:
+            return
+
+        changes = {
+            k: v
+            for k, v in dataclasses.asdict(show).items()
+            if k != "id" and v is not None
+        }
+        store.put_show(dataclasses.replace(row, version=row.version + 1, **changes))
+
+    async def get_shows_from_schedule(
+        self,
+        user_id: uuid.UUID,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> list[Show]:
+        """Returns list of shows from user schedule ordered by id.
+
+        Args:
+            user_id (uuid.UUID): user schedule user user_id
+
+        Returns:
+            list[Show]
+        """
+
+        return get_shows_from_schedule(self._store, user_id, limit, offset)
+
+
+def get_shows_from_schedule(
+    store: MemoryStore,
+    user_id: uuid.UUID,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+) -> list[Show]:
+    """Returns list of shows from user schedule ordered by id.
+
+    Args:
+        store (MemoryStore)
+        user_id (uuid.UUID): user schedule user id
+        limit (Optional[int]): max number of shows. If None all shows will be returned
+        offset (Optional[int])
+
+    Returns:
+        list[Show]
+    """
+
+    show_ids = sorted(store.schedules.get(user_id, ()))
+    visible_show_ids = (s for s in show_ids if store.cast[s])
+    stop = None if limit is None else (offset or 0) + limit
+
+    return store.get_shows(it.islice(visible_show_ids, offset, stop))
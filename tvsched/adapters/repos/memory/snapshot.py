@@ -0,0 +1,67 @@
+"""Snapshot of repo data for loading `MemoryStore`."""
+
+import datetime
+import uuid
+from dataclasses import dataclass, field
+
+from tvsched.application.models.actor import ActorInShowCast
+from tvsched.application.models.auth import UserInRepo
+from tvsched.application.models.schedule import EpisodeInSchedule, ShowInSchedule
+from tvsched.entities.actor import Actor
+from tvsched.entities.episode import Episode
+from tvsched.entities.schedule import ScheduleChange
+
+
+@dataclass(frozen=True)
+class ShowRow:
+    """Show without cast, cast is stored as `ActorInShowCast` rows."""
+
+    id: int
+    name: str
+    seasons_count: int
+    image_url: str
+    version: int = 1
+
+
+@dataclass(frozen=True)
+class ScheduleVersion:
+    """The last version of user schedule and the last compacted version."""
+
+    user_id: uuid.UUID
+    version: int
+    purged_version: int = 0
+
+
+@dataclass(frozen=True)
+class LoggedScheduleChange:
+    """Change of user schedule from change log."""
+
+    user_id: uuid.UUID
+    change: ScheduleChange
+    changed_at: datetime.datetime
+
+
+@dataclass(frozen=True)
+class SessionRow:
+    """Not revoked session of refresh token with sha256 hash `token_hash`."""
+
+    id: int
+    token_hash: str
+    user_id: uuid.UUID
+    expires_at: datetime.datetime
+
+
+@dataclass(frozen=True)
+class MemorySnapshot:
+    """All rows of repo, ids of new rows continue after the max ids."""
+
+    shows: list[ShowRow] = field(default_factory=list)
+    actors: list[Actor] = field(default_factory=list)
+    cast: list[ActorInShowCast] = field(default_factory=list)
+    episodes: list[Episode] = field(default_factory=list)
+    users: list[UserInRepo] = field(default_factory=list)
+    schedules: list[ShowInSchedule] = field(default_factory=list)
+    watched_episodes: list[EpisodeInSchedule] = field(default_factory=list)
+    schedule_versions: list[ScheduleVersion] = field(default_factory=list)
+    schedule_changes: list[LoggedScheduleChange] = field(default_factory=list)
+    sessions: list[SessionRow] = field(default_factory=list)
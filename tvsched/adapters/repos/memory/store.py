@@ -0,0 +1,578 @@
+import bisect
+import dataclasses
+import datetime
+import uuid
+from typing import Iterable, Optional
+
+from tvsched.adapters.cache.prefix_index import PrefixIndex
+from tvsched.adapters.repos.memory.snapshot import (
+    LoggedScheduleChange,
+    MemorySnapshot,
+    ScheduleVersion,
+    SessionRow,
+    ShowRow,
+)
+from tvsched.adapters.repos.suggestion.graph import CoCastGraph
+from tvsched.application.models.actor import ActorInShowCast
+from tvsched.application.models.auth import UserInRepo
+from tvsched.application.models.schedule import EpisodeInSchedule, ShowInSchedule
+from tvsched.entities.actor import Actor
+from tvsched.entities.episode import Episode
+from tvsched.entities.schedule import ScheduleChange, ScheduleChangeKind
+from tvsched.entities.show import Show
+
+EpisodeKey = tuple[int, int, int]
+
+
+class ReadOnlyStoreError(Exception):
+    """Will be raised on write to read-only `MemoryStore`."""
+
+
+def episode_key(episode: Episode) -> EpisodeKey:
+    """Returns key which orders episodes of show by season and number.
+
+    Args:
+        episode (Episode)
+
+    Returns:
+        EpisodeKey: season, number and id
+    """
+
+    return episode.season, episode.number, episode.id
+
+
+class MemoryStore:
+    """Rows of all repos in memory with hash and secondary indexes.
+
+    Store keeps the same relations as Postgres schema: deleting show,
+    actor, episode or user deletes dependent rows like cascades do.
+    Every write of in-memory repos is applied at once between awaits,
+    so it is atomic for other coroutines.
+
+    Store loaded from snapshot with `read_only` serves reads as replica
+    and raises `ReadOnlyStoreError` on writes.
+    """
+
+    def __init__(
+        self, snapshot: Optional[MemorySnapshot] = None, read_only: bool = False
+    ) -> None:
+        self.read_only = read_only
+
+        self.shows: dict[int, ShowRow] = {}
+        self.actors: dict[int, Actor] = {}
+        self.episodes: dict[int, Episode] = {}
+        self.users: dict[uuid.UUID, UserInRepo] = {}
+        self.schedule_versions: dict[uuid.UUID, ScheduleVersion] = {}
+        self.sessions: dict[str, SessionRow] = {}
+
+        # secondary indexes
+        self.user_ids_by_name: dict[str, uuid.UUID] = {}
+        self.cast: dict[int, list[int]] = {}
+        self.filmography: dict[int, set[int]] = {}
+        self.episodes_of_show: dict[int, list[EpisodeKey]] = {}
+        self.schedules: dict[uuid.UUID, set[int]] = {}
+        self.audience: dict[int, set[uuid.UUID]] = {}
+        self.watched: dict[uuid.UUID, set[int]] = {}
+        self.watchers: dict[int, set[uuid.UUID]] = {}
+        self.schedule_changes: dict[
+            uuid.UUID, dict[tuple[ScheduleChangeKind, int], LoggedScheduleChange]
+        ] = {}
+        self.show_names = PrefixIndex()
+        self.actor_names = PrefixIndex()
+        self.co_cast = CoCastGraph()
+        self.sessions_of_user: dict[uuid.UUID, set[str]] = {}
+
+        self._last_ids = dict(shows=0, actors=0, episodes=0, sessions=0)
+
+        if snapshot is not None:
+            self._load(snapshot)
+
+    def check_writable(self) -> None:
+        """Raises `ReadOnlyStoreError` if store is read-only."""
+
+        if self.read_only:
+            raise ReadOnlyStoreError("Memory store is read-only")
+
+    def next_id(self, table: str) -> int:
+        """Returns id for new row of `table`.
+
+        Args:
+            table (str): shows, actors, episodes or sessions
+
+        Returns:
+            int
+        """
+
+        self._last_ids[table] += 1
+
+        return self._last_ids[table]
+
+    def snapshot(self) -> MemorySnapshot:
+        """Returns snapshot of all rows of store.
+
+        Returns:
+            MemorySnapshot
+        """
+
+        return MemorySnapshot(
+            shows=list(self.shows.values()),
+            actors=list(self.actors.values()),
+            cast=[
+                ActorInShowCast(show_id=s, actor_id=a)
+                for s, actor_ids in self.cast.items()
+                for a in actor_ids
+            ],
+            episodes=list(self.episodes.values()),
+            users=list(self.users.values()),
+            schedules=[
+                ShowInSchedule(show_id=s, user_id=u)
+                for u, show_ids in self.schedules.items()
+                for s in show_ids
+            ],
+            watched_episodes=[
+                EpisodeInSchedule(episode_id=e, user_id=u)
+                for u, episode_ids in self.watched.items()
+                for e in episode_ids
+            ],
+            schedule_versions=list(self.schedule_versions.values()),
+            schedule_changes=[
+                c
+                for changes in self.schedule_changes.values()
+                for c in changes.values()
+            ],
+            sessions=list(self.sessions.values()),
+        )
+
+    def get_show(self, show_id: int) -> Optional[Show]:
+        """Returns show with its cast ordered by actor id.
+
+        Shows without cast are not returned like by Postgres repos,
+        which join shows with their cast.
+
+        Args:
+            show_id (int)
+
+        Returns:
+            Optional[Show]
+        """
+
+        row = self.shows.get(show_id)
+        actor_ids = self.cast.get(show_id)
+        if row is None or not actor_ids:
+            return None
+
+        return Show(
+            id=row.id,
+            name=row.name,
+            seasons_count=row.seasons_count,
+            image_url=row.image_url,
+            cast=[self.actors[a] for a in actor_ids],
+        )
+
+    def get_shows(self, show_ids: Iterable[int]) -> list[Show]:
+        """Returns shows with cast in order of `show_ids`, skips not found shows.
+
+        Args:
+            show_ids (Iterable[int])
+
+        Returns:
+            list[Show]
+        """
+
+        shows = (self.get_show(s) for s in show_ids)
+
+        return [s for s in shows if s is not None]
+
+    def put_show(self, row: ShowRow) -> None:
+        """Adds or replaces show.
+
+        Args:
+            row (ShowRow)
+        """
+
+        self.shows[row.id] = row
+        self.cast.setdefault(row.id, [])
+        self.episodes_of_show.setdefault(row.id, [])
+        self.audience.setdefault(row.id, set())
+        self._last_ids["shows"] = max(self._last_ids["shows"], row.id)
+        self._refresh_names([row.id])
+
+    def bump_show_versions(self, show_ids: Iterable[int]) -> None:
+        """Increments versions of shows with ids `show_ids`.
+
+        Args:
+            show_ids (Iterable[int])
+        """
+
+        for show_id in show_ids:
+            row = self.shows[show_id]
+            self.shows[show_id] = dataclasses.replace(row, version=row.version + 1)
+
+    def delete_show(self, show_id: int) -> None:
+        """Deletes show with its cast, episodes and schedules with it.
+
+        Deletions from schedules are logged for delta sync.
+
+        Args:
+            show_id (int)
+        """
+
+        if show_id not in self.shows:
+            return
+
+        audience = self.audience.pop(show_id)
+        for user_id in audience:
+            self.schedules[user_id].discard(show_id)
+        self.log_schedule_changes(
+            ScheduleChangeKind.SHOW, ((u, show_id) for u in audience), True
+        )
+
+        for key in list(self.episodes_of_show[show_id]):
+            self.delete_episode(key[2], log=True)
+        del self.episodes_of_show[show_id]
+
+        actor_ids = self.cast.pop(show_id)
+        for actor_id in actor_ids:
+            self.filmography[actor_id].discard(show_id)
+        self.co_cast.set_cast(show_id, [])
+
+        del self.shows[show_id]
+        self.show_names.remove(show_id)
+        self._refresh_actor_names(actor_ids)
+
+    def put_actor(self, actor: Actor) -> None:
+        """Adds or replaces actor.
+
+        Args:
+            actor (Actor)
+        """
+
+        self.actors[actor.id] = actor
+        self.filmography.setdefault(actor.id, set())
+        self._last_ids["actors"] = max(self._last_ids["actors"], actor.id)
+        self._refresh_actor_names([actor.id])
+
+    def delete_actor(self, actor_id: int) -> None:
+        """Deletes actor and removes actor from casts of shows.
+
+        Args:
+            actor_id (int)
+        """
+
+        if actor_id not in self.actors:
+            return
+
+        for show_id in list(self.filmography[actor_id]):
+            self.delete_from_cast(show_id, actor_id)
+        del self.filmography[actor_id]
+        del self.actors[actor_id]
+        self.actor_names.remove(actor_id)
+
+    def add_to_cast(self, show_id: int, actor_id: int) -> None:
+        """Adds actor to show cast and increments show version.
+
+        Args:
+            show_id (int)
+            actor_id (int)
+        """
+
+        bisect.insort(self.cast[show_id], actor_id)
+        self.filmography[actor_id].add(show_id)
+        self.co_cast.set_cast(show_id, self.cast[show_id])
+        self.bump_show_versions([show_id])
+        self._refresh_actor_names([actor_id])
+
+    def delete_from_cast(self, show_id: int, actor_id: int) -> None:
+        """Deletes actor from show cast and increments show version.
+
+        Args:
+            show_id (int)
+            actor_id (int)
+        """
+
+        self.cast[show_id].remove(actor_id)
+        self.filmography[actor_id].discard(show_id)
+        self.co_cast.set_cast(show_id, self.cast[show_id])
+        self.bump_show_versions([show_id])
+        self._refresh_actor_names([actor_id])
+
+    def set_cast(
+        self, show_id: int, actor_ids: Iterable[int]
+    ) -> tuple[list[int], list[int]]:
+        """Replaces show cast and increments show version once if cast changed.
+
+        Args:
+            show_id (int)
+            actor_ids (Iterable[int]): ids of actors of new cast
+
+        Returns:
+            tuple[list[int], list[int]]: sorted ids of added and removed actors
+        """
+
+        old, new = set(self.cast[show_id]), set(actor_ids)
+        added, removed = sorted(new - old), sorted(old - new)
+        if not added and not removed:
+            return added, removed
+
+        self.cast[show_id] = sorted(new)
+        for actor_id in added:
+            self.filmography[actor_id].add(show_id)
+        for actor_id in removed:
+            self.filmography[actor_id].discard(show_id)
+        self.co_cast.set_cast(show_id, self.cast[show_id])
+        self.bump_show_versions([show_id])
+        self._refresh_actor_names(added + removed)
+
+        return added, removed
+
+    def put_episode(self, episode: Episode) -> None:
+        """Adds or replaces episode, moves it in order of episodes of its show.
+
+        Args:
+            episode (Episode)
+        """
+
+        old = self.episodes.get(episode.id)
+        if old is not None:
+            self._unindex_episode(old)
+
+        self.episodes[episode.id] = episode
+        bisect.insort(self.episodes_of_show[episode.show_id], episode_key(episode))
+        self.watchers.setdefault(episode.id, set())
+        self._last_ids["episodes"] = max(self._last_ids["episodes"], episode.id)
+
+    def delete_episode(self, episode_id: int, log: bool = False) -> None:
+        """Deletes episode and marks it as unwatched for all users.
+
+        Args:
+            episode_id (int)
+            log (bool): if True marks are logged as deleted for delta sync
+        """
+
+        episode = self.episodes.pop(episode_id, None)
+        if episode is None:
+            return
+
+        self._unindex_episode(episode)
+        watchers = self.watchers.pop(episode_id)
+        for user_id in watchers:
+            self.watched[user_id].discard(episode_id)
+        if log:
+            self.log_schedule_changes(
+                ScheduleChangeKind.WATCHED_EPISODE,
+                ((u, episode_id) for u in watchers),
+                True,
+            )
+
+    def put_user(self, user: UserInRepo) -> None:
+        """Adds user with empty schedule.
+
+        Args:
+            user (UserInRepo)
+        """
+
+        self.users[user.id] = user
+        self.user_ids_by_name[user.username] = user.id
+        self.schedules.setdefault(user.id, set())
+        self.watched.setdefault(user.id, set())
+
+    def delete_user(self, user_id: uuid.UUID) -> None:
+        """Deletes user with schedule, watched episodes, change log and sessions.
+
+        Args:
+            user_id (uuid.UUID)
+        """
+
+        user = self.users.pop(user_id, None)
+        if user is None:
+            return
+
+        del self.user_ids_by_name[user.username]
+        show_ids = self.schedules.pop(user_id)
+        for show_id in show_ids:
+            self.audience[show_id].discard(user_id)
+        for episode_id in self.watched.pop(user_id):
+            self.watchers[episode_id].discard(user_id)
+        self.schedule_versions.pop(user_id, None)
+        self.schedule_changes.pop(user_id, None)
+        for token_hash in self.sessions_of_user.pop(user_id, set()):
+            del self.sessions[token_hash]
+        self._refresh_names(show_ids)
+
+    def put_session(self, row: SessionRow) -> None:
+        """Adds session of existing user.
+
+        Args:
+            row (SessionRow)
+        """
+
+        self.sessions[row.token_hash] = row
+        self.sessions_of_user.setdefault(row.user_id, set()).add(row.token_hash)
+        self._last_ids["sessions"] = max(self._last_ids["sessions"], row.id)
+
+    def delete_session(self, token_hash: str) -> None:
+        """Deletes session by hash of its refresh token.
+
+        Args:
+            token_hash (str)
+        """
+
+        row = self.sessions.pop(token_hash, None)
+        if row is not None:
+            self.sessions_of_user[row.user_id].discard(token_hash)
+
+    def add_to_schedule(self, user_id: uuid.UUID, show_id: int) -> None:
+        """Adds show to user schedule.
+
+        Args:
+            user_id (uuid.UUID)
+            show_id (int)
+        """
+
+        self.schedules[user_id].add(show_id)
+        self.audience[show_id].add(user_id)
+        self._refresh_names([show_id])
+
+    def delete_from_schedule(self, user_id: uuid.UUID, show_id: int) -> None:
+        """Deletes show from user schedule.
+
+        Args:
+            user_id (uuid.UUID)
+            show_id (int)
+        """
+
+        self.schedules[user_id].discard(show_id)
+        self.audience[show_id].discard(user_id)
+        self._refresh_names([show_id])
+
+    def mark_watched(self, user_id: uuid.UUID, episode_id: int) -> None:
+        """Marks episode as watched by user.
+
+        Args:
+            user_id (uuid.UUID)
+            episode_id (int)
+        """
+
+        self.watched[user_id].add(episode_id)
+        self.watchers[episode_id].add(user_id)
+
+    def mark_unwatched(self, user_id: uuid.UUID, episode_id: int) -> None:
+        """Marks episode as unwatched by user.
+
+        Args:
+            user_id (uuid.UUID)
+            episode_id (int)
+        """
+
+        self.watched[user_id].discard(episode_id)
+        self.watchers[episode_id].discard(user_id)
+
+    def log_schedule_changes(
+        self,
+        kind: ScheduleChangeKind,
+        changed: Iterable[tuple[uuid.UUID, int]],
+        deleted: bool,
+    ) -> None:
+        """Logs change of targets with the next version of their user schedule.
+
+        Args:
+            kind (ScheduleChangeKind)
+            changed (Iterable[tuple[uuid.UUID, int]]): user id and id of changed
+                show or episode
+            deleted (bool): True if targets were deleted from schedule
+        """
+
+        targets_by_user: dict[uuid.UUID, list[int]] = {}
+        for user_id, target_id in changed:
+            targets_by_user.setdefault(user_id, []).append(target_id)
+
+        changed_at = datetime.datetime.now(datetime.timezone.utc)
+        for user_id, target_ids in targets_by_user.items():
+            version = self.schedule_versions.get(user_id, ScheduleVersion(user_id, 0))
+            version = dataclasses.replace(version, version=version.version + 1)
+            self.schedule_versions[user_id] = version
+
+            changes = self.schedule_changes.setdefault(user_id, {})
+            for target_id in target_ids:
+                # the latest change of target replaces previous one at the end
+                changes.pop((kind, target_id), None)
+                change = ScheduleChange(kind, target_id, version.version, deleted)
+                changes[kind, target_id] = LoggedScheduleChange(
+                    user_id=user_id, change=change, changed_at=changed_at
+                )
+
+    def _unindex_episode(self, episode: Episode) -> None:
+        keys = self.episodes_of_show[episode.show_id]
+        del keys[bisect.bisect_left(keys, episode_key(episode))]
+
+    def _refresh_names(self, show_ids: Iterable[int]) -> None:
+        # popularity of show is number of schedules with it, popularity of actor
+        # is number of schedules with shows from actor filmography
+        actor_ids = set()
+        for show_id in show_ids:
+            row = self.shows[show_id]
+            self.show_names.upsert(show_id, row.name, len(self.audience[show_id]))
+            actor_ids.update(self.cast[show_id])
+        self._refresh_actor_names(actor_ids)
+
+    def _refresh_actor_names(self, actor_ids: Iterable[int]) -> None:
+        for actor_id in actor_ids:
+            weight = sum(len(self.audience[s]) for s in self.filmography[actor_id])
+            self.actor_names.upsert(actor_id, self.actors[actor_id].name, weight)
+
+    def _load(self, snapshot: MemorySnapshot) -> None:
+        # indexes are filled directly and sorted once
+        for row in snapshot.shows:
+            self.shows[row.id] = row
+            self.cast[row.id] = []
+            self.episodes_of_show[row.id] = []
+            self.audience[row.id] = set()
+        for actor in snapshot.actors:
+            self.actors[actor.id] = actor
+            self.filmography[actor.id] = set()
+        for cast in snapshot.cast:
+            self.cast[cast.show_id].append(cast.actor_id)
+            self.filmography[cast.actor_id].add(cast.show_id)
+        for episode in snapshot.episodes:
+            self.episodes[episode.id] = episode
+            self.episodes_of_show[episode.show_id].append(episode_key(episode))
+            self.watchers[episode.id] = set()
+        for user in snapshot.users:
+            self.put_user(user)
+        for show_in_schedule in snapshot.schedules:
+            self.schedules[show_in_schedule.user_id].add(show_in_schedule.show_id)
+            self.audience[show_in_schedule.show_id].add(show_in_schedule.user_id)
+        for watched in snapshot.watched_episodes:
+            self.mark_watched(watched.user_id, watched.episode_id)
+        for version in snapshot.schedule_versions:
+            self.schedule_versions[version.user_id] = version
+        for logged in sorted(snapshot.schedule_changes, key=lambda c: c.change.version):
+            key = (logged.change.kind, logged.change.target_id)
+            self.schedule_changes.setdefault(logged.user_id, {})[key] = logged
+        for session in snapshot.sessions:
+            self.put_session(session)
+
+        for actor_ids in self.cast.values():
+            actor_ids.sort()
+        for keys in self.episodes_of_show.values():
+            keys.sort()
+        self.co_cast.build(
+            (s, a) for s, actor_ids in self.cast.items() for a in actor_ids
+        )
+        self.show_names.build(
+            (s.id, s.name, len(self.audience[s.id])) for s in self.shows.values()
+        )
+        self.actor_names.build(
+            (
+                a.id,
+                a.name,
+                sum(len(self.audience[s]) for s in self.filmography[a.id]),
+            )
+            for a in self.actors.values()
+        )
+        self._last_ids = dict(
+            shows=max(self.shows, default=0),
+            actors=max(self.actors, default=0),
+            episodes=max(self.episodes, default=0),
+            sessions=max((s.id for s in self.sessions.values()), default=0),
+        )
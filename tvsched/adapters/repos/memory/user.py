@@ -0,0 +1,94 @@
+import dataclasses
+import uuid
+
+from tvsched.adapters.repos.memory.store import MemoryStore, ReadOnlyStoreError
+from tvsched.application.exceptions.auth import (
+    PasswordHashNotUpdatedError,
+    UserAlreadyExistsError,
+    UserNotFoundError,
+)
+from tvsched.application.models.auth import UserInRepo, UserInRepoAdd
+
+
+class MemoryUserRepo:
+    def __init__(self, store: MemoryStore) -> None:
+        self._store = store
+
+    async def add_user(self, user: UserInRepoAdd) -> None:
+        """Adds user to repo.
+
+        Args:
+            user (UserInRepoAdd): data for adding user to repo.
+
+        Raises:
+            UserAlreadyExistsError: will be raised when user already exists.
+        """
+
+        store = self._store
+        store.check_writable()
+
+        if user.username in store.user_ids_by_name:
+            raise UserAlreadyExistsError(user.username)
+
+        store.put_user(
+            UserInRepo(
+                id=uuid.uuid4(),
+                username=user.username,
+                password_hash=user.password_hash,
+                role=user.role,
+            )
+        )
+
+    async def get_user_by_username(self, username: str) -> UserInRepo:
+        """Returns user by username from repo.
+
+        Args:
+            username (str)
+
+        Raises:
+            UserNotFoundError: will be raised if user with name `username` not in repo
+
+        Returns:
+            UserInRepo
+        """
+
+        user_id = self._store.user_ids_by_name.get(username)
+        if user_id is None:
+            raise UserNotFoundError(username)
+
+        return self._store.users[user_id]
+
+    async def delete_user(self, user_id: uuid.UUID) -> None:
+        """Deletes user with id `user_id` with schedule and watched episodes.
+
+        Args:
+            user_id (uuid.UUID)
+        """
+
+        self._store.check_writable()
+        self._store.delete_user(user_id)
+
+    async def update_password_hash(
+        self, user_id: uuid.UUID, password_hash: str
+    ) -> None:
+        """Replaces password hash of user with id `user_id`.
+
+        Does nothing if user not in repo.
+
+        Args:
+            user_id (uuid.UUID)
+            password_hash (str)
+
+        Raises:
+            PasswordHashNotUpdatedError: will be raised if store is read-only
+        """
+
+        store = self._store
+        try:
+            store.check_writable()
+        except ReadOnlyStoreError as e:
+            raise PasswordHashNotUpdatedError(user_id) from e
+
+        user = store.users.get(user_id)
+        if user is not None:
+            store.put_user(dataclasses.replace(user, password_hash=password_hash))
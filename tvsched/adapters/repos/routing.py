@@ -0,0 +1,294 @@
+import asyncio
+import contextvars
+import dataclasses
+import datetime
+import enum
+import itertools
+import time
+import weakref
+from typing import Any, AsyncGenerator, Optional, Sequence, Union
+
+import asyncpg
+from databases.core import Connection, Database, Transaction
+
+
+class ReadConsistency(str, enum.Enum):
+    """Where read-only repo queries are allowed to go."""
+
+    PRIMARY = "PRIMARY"
+    REPLICA = "REPLICA"
+    BOUNDED_STALENESS = "BOUNDED_STALENESS"
+
+
+@dataclasses.dataclass(frozen=True)
+class StalenessPolicy:
+    """Policy of routing read-only repo queries to replicas.
+
+    Attributes:
+        consistency (ReadConsistency): PRIMARY sends all reads to primary,
+            REPLICA sends reads to replicas regardless of replication lag,
+            BOUNDED_STALENESS sends reads only to replicas with lag not greater
+            than `max_lag`.
+        max_lag (datetime.timedelta): max replication lag for BOUNDED_STALENESS.
+        lag_check_interval (datetime.timedelta): how long measured replica lag
+            is trusted before it will be measured again.
+    """
+
+    consistency: ReadConsistency = ReadConsistency.BOUNDED_STALENESS
+    max_lag: datetime.timedelta = datetime.timedelta(seconds=1)
+    lag_check_interval: datetime.timedelta = datetime.timedelta(seconds=5)
+
+
+class PoolConnection(Connection):
+    """Connection to pool which runs queries of every task on own connection.
+
+    `Database.connection` of databases before 0.6 keeps connection in
+    context variable, so tasks started by `fan_out` inherit connection
+    of parent task and their queries wait for each other. Connection of
+    every task is acquired here explicitly, regardless of databases version.
+    """
+
+    def __init__(self, database: Database) -> None:
+        # query interface is delegated to connections of tasks,
+        # so state of base connection is not initialized
+        self._database = database
+        self._task_connections: (
+            "weakref.WeakKeyDictionary[asyncio.Task[Any], Connection]"
+        ) = weakref.WeakKeyDictionary()
+
+    @property
+    def database(self) -> Database:
+        return self._database
+
+    def connection(self) -> Connection:
+        """Returns connection of current task to pool.
+
+        Returns:
+            Connection
+        """
+
+        task = asyncio.current_task()
+        if task is None:
+            return self._database.connection()
+
+        connection = self._task_connections.get(task)
+        if connection is None:
+            # empty context does not contain connection of parent task
+            connection = contextvars.Context().run(self._database.connection)
+            self._task_connections[task] = connection
+
+        return connection
+
+    async def __aenter__(self) -> Connection:
+        return await self.connection().__aenter__()
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.connection().__aexit__(*args)
+
+    async def fetch_all(self, query: Any, values: Optional[dict] = None) -> list[Any]:
+        async with self.connection() as connection:
+            return await connection.fetch_all(query, values)
+
+    async def fetch_one(self, query: Any, values: Optional[dict] = None) -> Any:
+        async with self.connection() as connection:
+            return await connection.fetch_one(query, values)
+
+    async def fetch_val(
+        self, query: Any, values: Optional[dict] = None, column: Any = 0
+    ) -> Any:
+        async with self.connection() as connection:
+            return await connection.fetch_val(query, values, column)
+
+    async def execute(self, query: Any, values: Optional[dict] = None) -> Any:
+        async with self.connection() as connection:
+            return await connection.execute(query, values)
+
+    async def execute_many(self, query: Any, values: list) -> None:
+        async with self.connection() as connection:
+            await connection.execute_many(query, values)
+
+    async def iterate(
+        self, query: Any, values: Optional[dict] = None
+    ) -> AsyncGenerator[Any, None]:
+        async with self.connection() as connection:
+            async for record in connection.iterate(query, values):
+                yield record
+
+    def transaction(
+        self, *, force_rollback: bool = False, **kwargs: Any
+    ) -> Transaction:
+        return self.connection().transaction(force_rollback=force_rollback, **kwargs)
+
+    @property
+    def raw_connection(self) -> Any:
+        return self.connection().raw_connection
+
+
+def _connection_of(db: Union[Connection, Database]) -> Connection:
+    if isinstance(db, Database):
+        return PoolConnection(db)
+
+    return db
+
+
+# ids of units of work pinned to primary in current context; pin lasts in
+# context of request task, not for life of router, which may be shared by
+# long-lived repos
+_pinned_units: contextvars.ContextVar[frozenset[int]] = contextvars.ContextVar(
+    "router_pinned_units", default=frozenset()
+)
+_unit_ids = itertools.count()
+
+
+class _ReplicaSet:
+    """Replicas with measured replication lag shared between units of work."""
+
+    def __init__(self, replicas: Sequence[Connection], policy: StalenessPolicy) -> None:
+        self.replicas = list(replicas)
+        self.policy = policy
+        self.next_index = 0
+        self.lags: dict[int, tuple[float, float]] = {}
+
+
+class ConnectionRouter:
+    """Routes repo queries between primary and read replicas.
+
+    Write queries always go to primary. Read-only queries go to replicas
+    according to staleness policy. After the first write following reads of
+    router are pinned to primary in current context, so request task always
+    reads its own writes, while other requests served by the same router
+    keep reading from replicas. Tasks started after write inherit the pin.
+    Use `unit_of_work` to get router which is not pinned in current context
+    and shares replicas and measured lags.
+
+    Primary and replicas may be connection pools (`Database`): then every
+    task acquires its own connection (see `PoolConnection`), so independent
+    reads of one unit of work started with `fan_out` run concurrently
+    instead of waiting for each other on one connection.
+    """
+
+    _lag_query = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END AS lag;
+    """
+
+    def __init__(
+        self,
+        primary: Union[Connection, Database],
+        replicas: Sequence[Union[Connection, Database]] = (),
+        policy: StalenessPolicy = StalenessPolicy(),
+        *,
+        _replica_set: Optional[_ReplicaSet] = None,
+    ) -> None:
+        self._primary = _connection_of(primary)
+        self._replica_set = _replica_set or _ReplicaSet(
+            [_connection_of(replica) for replica in replicas], policy
+        )
+        self._unit_id = next(_unit_ids)
+
+    @classmethod
+    def of(cls, db: Union[Connection, "ConnectionRouter"]) -> "ConnectionRouter":
+        """Returns `db` if it is router, otherwise router without replicas.
+
+        Args:
+            db (Union[Connection, ConnectionRouter])
+
+        Returns:
+            ConnectionRouter
+        """
+
+        if isinstance(db, ConnectionRouter):
+            return db
+
+        return cls(db)
+
+    def unit_of_work(self) -> "ConnectionRouter":
+        """Returns router for new unit of work which is not pinned to primary.
+
+        Returns:
+            ConnectionRouter
+        """
+
+        return ConnectionRouter(self._primary, _replica_set=self._replica_set)
+
+    @property
+    def pinned(self) -> bool:
+        """True if reads of this router go to primary in current context."""
+
+        return self._unit_id in _pinned_units.get()
+
+    def pin(self) -> None:
+        """Pins all following reads of this router in current context to primary."""
+
+        pinned_units = _pinned_units.get()
+        if self._unit_id not in pinned_units:
+            _pinned_units.set(pinned_units | {self._unit_id})
+
+    def for_write(self) -> Connection:
+        """Returns primary connection and pins following reads to it.
+
+        Returns:
+            Connection
+        """
+
+        self.pin()
+        return self._primary
+
+    async def for_read(self) -> Connection:
+        """Returns connection for read-only query.
+
+        Returns:
+            Connection: replica allowed by staleness policy or primary
+        """
+
+        replica_set = self._replica_set
+        replicas = replica_set.replicas
+        consistency = replica_set.policy.consistency
+
+        if self.pinned or not replicas or consistency is ReadConsistency.PRIMARY:
+            return self._primary
+
+        for _ in range(len(replicas)):
+            index = replica_set.next_index
+            replica_set.next_index = (index + 1) % len(replicas)
+
+            if consistency is ReadConsistency.REPLICA or await self._is_fresh(index):
+                return replicas[index]
+
+        return self._primary
+
+    async def _is_fresh(self, index: int) -> bool:
+        replica_set = self._replica_set
+        policy = replica_set.policy
+        now = time.monotonic()
+
+        measured = replica_set.lags.get(index)
+        if (
+            measured is None
+            or now - measured[0] > policy.lag_check_interval.total_seconds()
+        ):
+            lag = await self._measure_lag(replica_set.replicas[index])
+            measured = (now, lag)
+            replica_set.lags[index] = measured
+
+        return measured[1] <= policy.max_lag.total_seconds()
+
+    async def _measure_lag(self, replica: Connection) -> float:
+        try:
+            record = await replica.fetch_one(self._lag_query)
+        except (
+            OSError,
+            asyncio.TimeoutError,
+            asyncpg.PostgresError,
+            asyncpg.InterfaceError,
+        ):
+            # unreachable replica is treated as infinitely stale until next check
+            return float("inf")
+
+        if record is None:
+            return float("inf")
+
+        return float(record["lag"])
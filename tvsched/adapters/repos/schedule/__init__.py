@@ -1,3 +1,15 @@
-from tvsched.adapters.repos.schedule.repo import ScheduleRepo
+import typing
+
+from tvsched.adapters.lazy import lazy_exports
+
+if typing.TYPE_CHECKING:
+    from tvsched.adapters.repos.schedule.repo import ScheduleRepo
 
 __all__ = ["ScheduleRepo"]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "ScheduleRepo": "repo",
+    },
+)
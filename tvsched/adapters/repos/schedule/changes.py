@@ -0,0 +1,44 @@
+"""SQL for logging changes of user schedule for delta sync.
+
+Change log keeps only the latest change per (user, kind, target) and
+every change gets the next version of user schedule. Version row of user
+is locked by change, so changes of one user commit in order of versions.
+"""
+
+from tvsched.entities.schedule import ScheduleChangeKind
+
+
+def log_schedule_change(
+    changed: str, kind: ScheduleChangeKind, target: str, deleted: bool
+) -> str:
+    """Returns CTEs `versions` and `changes` which log change of rows
+    from CTE `changed` with the next version of their user schedule.
+
+    Args:
+        changed (str): name of CTE returning column `user_id`
+        kind (ScheduleChangeKind)
+        target (str): column of `changed` with id of changed show or episode
+        deleted (bool): True if target was deleted from schedule
+
+    Returns:
+        str
+    """
+
+    return f"""versions AS (
+        INSERT INTO schedule_versions (user_id, version)
+        SELECT DISTINCT user_id, 1 FROM {changed}
+        ON CONFLICT (user_id) DO UPDATE
+        SET version = schedule_versions.version + 1
+        RETURNING user_id, version
+    ), changes AS (
+        INSERT INTO schedule_changes
+        (user_id, kind, target_id, version, deleted, changed_at)
+        SELECT c.user_id, '{kind.value}', c.{target}, v.version,
+        {"true" if deleted else "false"}, now()
+        FROM {changed} c
+        JOIN versions v ON v.user_id = c.user_id
+        ON CONFLICT (user_id, kind, target_id) DO UPDATE
+        SET version = EXCLUDED.version,
+            deleted = EXCLUDED.deleted,
+            changed_at = EXCLUDED.changed_at
+    )"""
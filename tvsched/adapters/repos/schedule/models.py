@@ -0,0 +1,22 @@
+from typing import Optional, TypedDict
+
+
+class ShowProgressRecord(TypedDict):
+    show_id: int
+    watched_count: int
+    total_count: int
+    next_episode_id: Optional[int]
+
+
+class ScheduleChangeRecord(TypedDict):
+    current_version: int
+    reset: bool
+    kind: Optional[str]
+    target_id: Optional[int]
+    version: Optional[int]
+    deleted: Optional[bool]
+
+
+class ScheduleShowVersionRecord(TypedDict):
+    id: int
+    version: int
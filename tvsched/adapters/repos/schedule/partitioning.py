@@ -0,0 +1,124 @@
+"""DDL for hash partitioning of `watched_episodes` by user id.
+
+All queries of `ScheduleRepo` select watched episodes of one user,
+so they are pruned to one partition, and indexes and vacuum of every
+partition scale with its size. Migration from unpartitioned table or
+from partitioned table with another number of partitions copies rows
+into new partitions while table is locked for writes. Constraints and
+indexes of the table are read from the catalog before it is replaced
+and recreated as they were, once rows are copied.
+
+Migration is generated for configured number of partitions:
+
+    python -m tvsched.adapters.repos.schedule.partitioning 32
+"""
+
+import argparse
+
+DEFAULT_PARTITIONS = 16
+
+
+def partition_watched_episodes(partitions: int = DEFAULT_PARTITIONS) -> str:
+    """Returns DDL which partitions `watched_episodes` by hash of user id.
+
+    DDL does nothing if table already has `partitions` partitions.
+
+    Example:
+        >>> "MODULUS 4, REMAINDER 3" in partition_watched_episodes(4)
+        True
+
+    Args:
+        partitions (int): number of partitions
+
+    Raises:
+        ValueError: will be raised if `partitions` is less than 1
+
+    Returns:
+        str
+    """
+
+    if partitions < 1:
+        raise ValueError(f"Number of partitions must be positive, got {partitions}")
+
+    create_partitions = "\n".join(
+        f"    CREATE TABLE watched_episodes_new_p{i}"
+        f" PARTITION OF watched_episodes_new"
+        f" FOR VALUES WITH (MODULUS {partitions}, REMAINDER {i});"
+        for i in range(partitions)
+    )
+    rename_partitions = "\n".join(
+        f"    ALTER TABLE watched_episodes_new_p{i}"
+        f" RENAME TO watched_episodes_p{i};"
+        for i in range(partitions)
+    )
+
+    return f"""-- Hash partitioning of watched_episodes by user_id into {partitions} partitions.
+-- Generated by tvsched.adapters.repos.schedule.partitioning.
+DO $$
+DECLARE
+    definitions text[];
+    definition text;
+BEGIN
+    IF (
+        SELECT count(*) FROM pg_inherits
+        WHERE inhparent = 'watched_episodes'::regclass
+    ) = {partitions} THEN
+        RETURN;
+    END IF;
+
+    -- reads go on while rows are copied, writes wait
+    LOCK TABLE watched_episodes IN EXCLUSIVE MODE;
+
+    -- constraints of the table and indexes not backing them, foreign keys last
+    SELECT array_agg(d.definition ORDER BY d.position) INTO definitions
+    FROM (
+        SELECT format(
+            'ALTER TABLE watched_episodes ADD CONSTRAINT %I %s',
+            c.conname, pg_get_constraintdef(c.oid)
+        ) AS definition,
+        CASE WHEN c.contype = 'f' THEN 2 ELSE 0 END AS position
+        FROM pg_constraint c
+        WHERE c.conrelid = 'watched_episodes'::regclass
+        AND c.contype IN ('p', 'u', 'c', 'x', 'f')
+        UNION ALL
+        -- indexes of partitioned table are created on ONLY it
+        SELECT replace(pg_get_indexdef(i.indexrelid), ' ON ONLY ', ' ON '), 1
+        FROM pg_index i
+        WHERE i.indrelid = 'watched_episodes'::regclass
+        AND NOT EXISTS (
+            SELECT 1 FROM pg_constraint c
+            WHERE c.conrelid = i.indrelid AND c.conindid = i.indexrelid
+        )
+    ) d;
+
+    CREATE TABLE watched_episodes_new (LIKE watched_episodes INCLUDING DEFAULTS)
+    PARTITION BY HASH (user_id);
+{create_partitions}
+
+    INSERT INTO watched_episodes_new SELECT * FROM watched_episodes;
+
+    DROP TABLE watched_episodes;
+    ALTER TABLE watched_episodes_new RENAME TO watched_episodes;
+{rename_partitions}
+
+    -- indexes and constraints are built after copying, once per partition
+    FOREACH definition IN ARRAY COALESCE(definitions, '{{}}') LOOP
+        EXECUTE definition;
+    END LOOP;
+END
+$$;
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Prints migration partitioning watched_episodes by user_id"
+    )
+    parser.add_argument("partitions", type=int, nargs="?", default=DEFAULT_PARTITIONS)
+    args = parser.parse_args()
+
+    print(partition_watched_episodes(args.partitions), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""SQL for incremental maintenance of `schedule_progress` table.
+
+Fragments reference progress row with alias `p`.
+"""
+
+from typing import Iterable
+
+from databases.core import Connection
+
+WATCHED_COUNT = """(
+    SELECT count(*) FROM watched_episodes we
+    JOIN episodes e ON e.id = we.episode_id
+    WHERE we.user_id = p.user_id AND e.show_id = p.show_id
+)"""
+
+TOTAL_COUNT = """(
+    SELECT count(*) FROM episodes e
+    WHERE e.show_id = p.show_id
+)"""
+
+# locks progress row of user `:user_id` for show of episode `:episode_id`,
+# so concurrent marks of episodes of one show are applied one by one and
+# next statement sees watched episodes committed by the previous mark
+LOCK_EPISODE_PROGRESS = """
+SELECT 1 FROM schedule_progress p
+JOIN episodes w ON w.show_id = p.show_id
+WHERE w.id = :episode_id AND p.user_id = :user_id
+FOR UPDATE OF p;
+"""
+
+
+def next_unwatched_episode(condition: str = "") -> str:
+    """Returns subquery of id of first unwatched by user episode of show.
+
+    Args:
+        condition (str): additional condition for episodes with alias `e`
+
+    Returns:
+        str
+    """
+
+    return f"""(
+        SELECT e.id FROM episodes e
+        WHERE e.show_id = p.show_id {condition}
+        AND NOT EXISTS (
+            SELECT 1 FROM watched_episodes we
+            WHERE we.user_id = p.user_id AND we.episode_id = e.id
+        )
+        ORDER BY e.season, e.number, e.id
+        LIMIT 1
+    )"""
+
+
+def precedes_next_episode(alias: str) -> str:
+    """Returns condition which is true if episode with alias `alias`
+    goes before next unwatched episode of progress row.
+
+    Args:
+        alias (str): alias of episode
+
+    Returns:
+        str
+    """
+
+    return f"""({alias}.season, {alias}.number, {alias}.id) < (
+        SELECT n.season, n.number, n.id FROM episodes n
+        WHERE n.id = p.next_episode_id
+    )"""
+
+
+async def refresh_show_progress(db: Connection, show_ids: Iterable[int]) -> None:
+    """Recomputes progress of all users for shows with ids `show_ids`.
+
+    Used when episodes move between shows or change their order,
+    so progress can't be updated incrementally.
+
+    Args:
+        db (Connection)
+        show_ids (Iterable[int])
+    """
+
+    query = f"""
+    UPDATE schedule_progress p
+    SET watched_count = {WATCHED_COUNT},
+        total_count = {TOTAL_COUNT},
+        next_episode_id = {next_unwatched_episode()}
+    WHERE p.show_id = ANY(:show_ids);
+    """
+
+    values = dict(show_ids=list(show_ids))
+    await db.execute(query, values=values)
@@ -1,15 +1,39 @@
+import datetime
 import typing
 import uuid
-from typing import Optional
+from typing import Optional, Union
 import asyncpg
 
 from databases.core import Connection
 
+from tvsched.adapters.repos.coalescing import SingleFlight, coalesce
+from tvsched.adapters.repos.episode.models import EpisodeRecord
+from tvsched.adapters.repos.routing import ConnectionRouter
+from tvsched.adapters.repos.schedule.changes import log_schedule_change
+from tvsched.adapters.repos.schedule.models import (
+    ScheduleChangeRecord,
+    ScheduleShowVersionRecord,
+    ShowProgressRecord,
+)
+from tvsched.adapters.repos.schedule.progress import (
+    LOCK_EPISODE_PROGRESS,
+    TOTAL_COUNT,
+    WATCHED_COUNT,
+    next_unwatched_episode,
+    precedes_next_episode,
+)
+from tvsched.adapters.repos.schedule.utils import (
+    make_schedule_version,
+    map_episode_record_to_model,
+    map_schedule_change_records_to_model,
+    map_show_progress_record_to_model,
+)
 from tvsched.adapters.repos.show.models import ShowRecord
 from tvsched.adapters.repos.show.utils import (
     group_show_records,
     map_show_records_to_model,
 )
+from tvsched.adapters.repos.suggestion.queue import enqueue_users
 from tvsched.application.exceptions.schedule import (
     EpisodeAlreadyMarkedAsWatchedError,
     EpisodeOrScheduleNotFoundError,
@@ -18,12 +42,22 @@ from tvsched.application.exceptions.schedule import (
 )
 from tvsched.application.models.schedule import EpisodeInSchedule, ShowInSchedule
 from tvsched.entities.episode import Episode
+from tvsched.entities.schedule import (
+    ScheduleChangeKind,
+    ScheduleChanges,
+    ShowProgress,
+)
 from tvsched.entities.show import Show
 
 
 class ScheduleRepo:
-    def __init__(self, db: Connection) -> None:
-        self._db = db
+    def __init__(
+        self,
+        db: Union[Connection, ConnectionRouter],
+        single_flight: Optional[SingleFlight] = None,
+    ) -> None:
+        self._db = ConnectionRouter.of(db)
+        self._single_flight = single_flight
 
     async def get_shows_from_schedule(
         self,
@@ -47,13 +81,19 @@ class ScheduleRepo:
         JOIN actors_to_shows ats ON ats.show_id = s.id
         JOIN actors a ON ats.actor_id = a.id
         JOIN shows_to_schedules sts ON sts.show_id = s.id
-        WHERE sts.user_id = :user_id
+        WHERE sts.user_id = :user_id AND s.deleted_at IS NULL
         LIMIT :limit
         OFFSET :offset;
         """
 
         values = dict(user_id=user_id, limit=limit, offset=offset)
-        records = await self._db.fetch_all(query, values)
+        records = await coalesce(
+            self._single_flight,
+            self._db,
+            "ScheduleRepo.get_shows_from_schedule",
+            (user_id, limit, offset),
+            lambda db: db.fetch_all(query, values),
+        )
         records = typing.cast(list[ShowRecord], records)
         grouped_records = group_show_records(records)
         shows = [map_show_records_to_model(rs) for rs in grouped_records]
@@ -68,19 +108,36 @@ class ScheduleRepo:
             show_in_schedule (ShowInSchedule): data for adding show to schedule
         """
 
-        query = """
-        INSERT INTO shows_to_schedules (user_id, show_id)
-        VALUES (:user_id, :show_id);
+        query = f"""
+        WITH added AS (
+            INSERT INTO shows_to_schedules (user_id, show_id)
+            VALUES (:user_id, (
+                SELECT id FROM shows WHERE id = :show_id AND deleted_at IS NULL
+            ))
+            RETURNING user_id, show_id
+        ), queued AS (
+            {enqueue_users("SELECT user_id FROM added")}
+        ), {log_schedule_change("added", ScheduleChangeKind.SHOW, "show_id", False)}
+        INSERT INTO schedule_progress
+        (user_id, show_id, watched_count, total_count, next_episode_id)
+        SELECT p.user_id, p.show_id, {WATCHED_COUNT}, {TOTAL_COUNT},
+        {next_unwatched_episode()}
+        FROM added p
+        ON CONFLICT (user_id, show_id) DO NOTHING;
         """
 
         values = dict(
             user_id=show_in_schedule.user_id, show_id=show_in_schedule.show_id
         )
+        db = self._db.for_write()
         try:
-            await self._db.execute(query, values)
+            await db.execute(query, values)
         except asyncpg.exceptions.UniqueViolationError:
             raise ShowAlreadyExistsInScheduleError(show_in_schedule)
-        except asyncpg.exceptions.ForeignKeyViolationError:
+        except (
+            asyncpg.exceptions.ForeignKeyViolationError,
+            asyncpg.exceptions.NotNullViolationError,
+        ):
             raise ShowOrScheduleNotFoundError(show_in_schedule)
 
     async def delete_show_from_schedule(self, show_in_schedule: ShowInSchedule) -> None:
@@ -91,15 +148,24 @@ class ScheduleRepo:
             show_in_schedule (ShowInSchedule): data for deleting show to schedule
         """
 
-        query = """
-        DELETE FROM shows_to_schedules
-        WHERE user_id = :user_id AND show_id = :show_id;
+        query = f"""
+        WITH deleted AS (
+            DELETE FROM shows_to_schedules
+            WHERE user_id = :user_id AND show_id = :show_id
+            RETURNING user_id, show_id
+        ), queued AS (
+            {enqueue_users("SELECT user_id FROM deleted")}
+        ), {log_schedule_change("deleted", ScheduleChangeKind.SHOW, "show_id", True)}
+        DELETE FROM schedule_progress p
+        USING deleted d
+        WHERE p.user_id = d.user_id AND p.show_id = d.show_id;
         """
 
         values = dict(
             user_id=show_in_schedule.user_id, show_id=show_in_schedule.show_id
         )
-        await self._db.execute(query, values)
+        db = self._db.for_write()
+        await db.execute(query, values)
 
     async def get_suggested_shows(self, user_id: uuid.UUID) -> list[Show]:
         """Returns list of suggested shows for user with id `user_id`.
@@ -129,17 +195,72 @@ class ScheduleRepo:
                 JOIN actors a2 ON a2.id = ats2.actor_id
                 WHERE u.id = :user_id
             )
-        ) res ON res.id = s.id;
+        ) res ON res.id = s.id
+        WHERE s.deleted_at IS NULL;
         """
 
         values = dict(user_id=user_id)
-        records = await self._db.fetch_all(query, values)
+        records = await coalesce(
+            self._single_flight,
+            self._db,
+            "ScheduleRepo.get_suggested_shows",
+            user_id,
+            lambda db: db.fetch_all(query, values),
+        )
         records = typing.cast(list[ShowRecord], records)
         grouped_records = group_show_records(records)
         shows = [map_show_records_to_model(rs) for rs in grouped_records]
 
         return shows
 
+    async def get_upcoming_episodes_from_schedule(
+        self,
+        user_id: uuid.UUID,
+        starts_at: datetime.datetime,
+        ends_at: datetime.datetime,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> list[Episode]:
+        """Returns episodes of shows from user schedule which air
+        from `starts_at` (inclusive) to `ends_at` (exclusive) ordered by air date.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+            starts_at (datetime.datetime)
+            ends_at (datetime.datetime)
+            limit (Optional[int]): max number of episodes. If None all episodes will be returned
+            offset (Optional[int])
+
+        Returns:
+            list[Episode]
+        """
+
+        query = """
+        SELECT e.*
+        FROM shows_to_schedules sts
+        JOIN shows s ON s.id = sts.show_id AND s.deleted_at IS NULL
+        JOIN episodes e ON e.show_id = sts.show_id
+        WHERE sts.user_id = :user_id
+        AND e.air_date >= :starts_at AND e.air_date < :ends_at
+        ORDER BY e.air_date, e.id
+        LIMIT :limit
+        OFFSET :offset;
+        """
+
+        values = dict(
+            user_id=user_id,
+            starts_at=int(starts_at.timestamp()),
+            ends_at=int(ends_at.timestamp()),
+            limit=limit,
+            offset=offset,
+        )
+        db = await self._db.for_read()
+        records = await db.fetch_all(query, values)
+        records = typing.cast(list[EpisodeRecord], records)
+        episodes = [map_episode_record_to_model(r) for r in records]
+
+        return episodes
+
     async def mark_episode_as_watched(
         self, episode_in_schedule: EpisodeInSchedule
     ) -> None:
@@ -149,14 +270,35 @@ class ScheduleRepo:
             episode_in_schedule (EpisodeInSchedule): data for marking episode
                 as watched in schedule
 
+        Progress row is locked before episode is marked, and next unwatched
+        episode is searched by separate statement, so it sees episodes
+        marked by concurrent calls for the same show.
+
         Raises:
             EpisodeOrScheduleNotFoundError: will be raised if episode or schedule does not exists
             EpisodeAlreadyExistsInScheduleError: will be raised if episode already marked as watched in schedule
         """
 
-        query = """
-        INSERT INTO watched_episodes (user_id, episode_id)
-        VALUES (:user_id, :episode_id);
+        query = f"""
+        WITH added AS (
+            INSERT INTO watched_episodes (user_id, episode_id)
+            VALUES (:user_id, :episode_id)
+            RETURNING user_id, episode_id
+        ), {log_schedule_change(
+            "added", ScheduleChangeKind.WATCHED_EPISODE, "episode_id", False
+        )}
+        SELECT count(*) FROM added;
+        """
+
+        progress_query = f"""
+        UPDATE schedule_progress p
+        SET watched_count = p.watched_count + 1,
+            next_episode_id = CASE
+                WHEN p.next_episode_id = w.id THEN {next_unwatched_episode()}
+                ELSE p.next_episode_id
+            END
+        FROM episodes w
+        WHERE w.id = :episode_id AND p.user_id = :user_id AND p.show_id = w.show_id;
         """
 
         values = dict(
@@ -164,12 +306,17 @@ class ScheduleRepo:
             episode_id=episode_in_schedule.episode_id,
         )
 
-        try:
-            await self._db.execute(query, values)
-        except asyncpg.exceptions.ForeignKeyViolationError:
-            raise EpisodeOrScheduleNotFoundError(episode_in_schedule)
-        except asyncpg.exceptions.UniqueViolationError:
-            raise EpisodeAlreadyMarkedAsWatchedError(episode_in_schedule)
+        db = self._db.for_write()
+        async with db.transaction():
+            await db.execute(LOCK_EPISODE_PROGRESS, values)
+            try:
+                await db.execute(query, values)
+            except asyncpg.exceptions.ForeignKeyViolationError:
+                raise EpisodeOrScheduleNotFoundError(episode_in_schedule)
+            except asyncpg.exceptions.UniqueViolationError:
+                raise EpisodeAlreadyMarkedAsWatchedError(episode_in_schedule)
+
+            await db.execute(progress_query, values)
 
     async def mark_episode_as_unwatched(
         self, episode_in_schedule: EpisodeInSchedule
@@ -181,9 +328,24 @@ class ScheduleRepo:
                 as watched in schedule
         """
 
-        query = """
-        DELETE FROM watched_episodes
-        WHERE user_id = :user_id AND episode_id = :episode_id;
+        query = f"""
+        WITH deleted AS (
+            DELETE FROM watched_episodes
+            WHERE user_id = :user_id AND episode_id = :episode_id
+            RETURNING user_id, episode_id
+        ), {log_schedule_change(
+            "deleted", ScheduleChangeKind.WATCHED_EPISODE, "episode_id", True
+        )}
+        UPDATE schedule_progress p
+        SET watched_count = p.watched_count - 1,
+            next_episode_id = CASE
+                WHEN p.next_episode_id IS NULL OR {precedes_next_episode("u")}
+                THEN u.id
+                ELSE p.next_episode_id
+            END
+        FROM deleted d
+        JOIN episodes u ON u.id = d.episode_id
+        WHERE p.user_id = d.user_id AND p.show_id = u.show_id;
         """
 
         values = dict(
@@ -191,4 +353,179 @@ class ScheduleRepo:
             episode_id=episode_in_schedule.episode_id,
         )
 
-        await self._db.execute(query, values)
+        db = self._db.for_write()
+        async with db.transaction():
+            await db.execute(LOCK_EPISODE_PROGRESS, values)
+            await db.execute(query, values)
+
+    async def get_schedule_progress(self, user_id: uuid.UUID) -> list[ShowProgress]:
+        """Returns progress of watching each show from user schedule.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+
+        Returns:
+            list[ShowProgress]
+        """
+
+        query = """
+        SELECT p.show_id, p.watched_count, p.total_count, p.next_episode_id
+        FROM schedule_progress p
+        JOIN shows s ON s.id = p.show_id AND s.deleted_at IS NULL
+        WHERE p.user_id = :user_id
+        ORDER BY p.show_id;
+        """
+
+        values = dict(user_id=user_id)
+        db = await self._db.for_read()
+        records = await db.fetch_all(query, values)
+        records = typing.cast(list[ShowProgressRecord], records)
+        progress = [map_show_progress_record_to_model(r) for r in records]
+
+        return progress
+
+    async def get_first_unwatched_episodes_from_schedule(
+        self, user_id: uuid.UUID
+    ) -> list[Episode]:
+        """Returns first unwatched episode of each show from user schedule
+        ordered by show id.
+
+        Episodes are read by maintained schedule progress,
+        so watched episodes are not scanned.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+
+        Returns:
+            list[Episode]
+        """
+
+        query = """
+        SELECT e.* FROM schedule_progress p
+        JOIN shows s ON s.id = p.show_id AND s.deleted_at IS NULL
+        JOIN episodes e ON e.id = p.next_episode_id
+        WHERE p.user_id = :user_id
+        ORDER BY p.show_id;
+        """
+
+        values = dict(user_id=user_id)
+        db = await self._db.for_read()
+        records = await db.fetch_all(query, values)
+        records = typing.cast(list[EpisodeRecord], records)
+
+        return [map_episode_record_to_model(r) for r in records]
+
+    async def get_schedule_version(self, user_id: uuid.UUID) -> str:
+        """Returns version stamp of shows from user schedule without loading them.
+
+        Stamp is built only from ids and versions of shows from schedule,
+        see `make_schedule_version`.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+
+        Returns:
+            str: version stamp, changes on every change of shows in schedule
+                or of scheduled shows and their casts
+        """
+
+        query = """
+        SELECT s.id, s.version
+        FROM shows_to_schedules sts
+        JOIN shows s ON s.id = sts.show_id
+        WHERE sts.user_id = :user_id AND s.deleted_at IS NULL;
+        """
+
+        values = dict(user_id=user_id)
+        db = await self._db.for_read()
+        records = await db.fetch_all(query, values)
+        records = typing.cast(list[ScheduleShowVersionRecord], records)
+
+        return make_schedule_version(records)
+
+    async def get_schedule_changes_since(
+        self, user_id: uuid.UUID, version: int
+    ) -> ScheduleChanges:
+        """Returns changes of user schedule after version `version`.
+
+        If changes after `version` were compacted or `version` is unknown,
+        returns reset flag and whole schedule state as changes.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+            version (int): version of schedule known by client, 0 for first sync
+
+        Returns:
+            ScheduleChanges
+        """
+
+        query = """
+        SELECT v.version AS current_version, r.reset,
+        c.kind, c.target_id, c.version, c.deleted
+        FROM schedule_versions v
+        CROSS JOIN LATERAL (
+            SELECT :version < v.purged_version OR :version > v.version AS reset
+        ) r
+        LEFT JOIN schedule_changes c ON c.user_id = v.user_id AND CASE
+            WHEN r.reset THEN NOT c.deleted
+            ELSE c.version > :version
+        END
+        WHERE v.user_id = :user_id
+        ORDER BY c.version;
+        """
+
+        values = dict(user_id=user_id, version=version)
+        # version known by client may be ahead of lagging replica,
+        # which would be seen as unknown version, so replicas are not used
+        db = self._db.for_write()
+        records = await db.fetch_all(query, values)
+        records = typing.cast(list[ScheduleChangeRecord], records)
+
+        if not records:
+            return ScheduleChanges(version=0, reset=version > 0, changes=[])
+
+        return map_schedule_change_records_to_model(records)
+
+    async def compact_schedule_changes(
+        self, changed_before: datetime.datetime, batch_size: int = 10_000
+    ) -> int:
+        """Deletes changes about deleted shows and unwatched episodes
+        made before `changed_before`.
+
+        Purged versions are remembered, so clients with older cursors
+        get reset of their state.
+
+        Args:
+            changed_before (datetime.datetime)
+            batch_size (int): max number of deleted changes
+
+        Returns:
+            int: number of deleted changes
+        """
+
+        query = """
+        WITH purged AS (
+            DELETE FROM schedule_changes
+            WHERE (user_id, kind, target_id) IN (
+                SELECT user_id, kind, target_id FROM schedule_changes
+                WHERE deleted AND changed_at < :changed_before
+                LIMIT :batch_size
+            )
+            RETURNING user_id, version
+        ), versions AS (
+            UPDATE schedule_versions v
+            SET purged_version = GREATEST(v.purged_version, p.version)
+            FROM (
+                SELECT user_id, max(version) AS version FROM purged
+                GROUP BY user_id
+            ) p
+            WHERE v.user_id = p.user_id
+        )
+        SELECT count(*) FROM purged;
+        """
+
+        values = dict(changed_before=changed_before, batch_size=batch_size)
+        db = self._db.for_write()
+        purged = await db.execute(query, values)
+
+        return purged
@@ -1,7 +1,21 @@
 import datetime
+import hashlib
+import typing
+from typing import Iterable, Sequence
 
 from tvsched.adapters.repos.episode.models import EpisodeRecord
+from tvsched.adapters.repos.schedule.models import (
+    ScheduleChangeRecord,
+    ScheduleShowVersionRecord,
+    ShowProgressRecord,
+)
 from tvsched.entities.episode import Episode
+from tvsched.entities.schedule import (
+    ScheduleChange,
+    ScheduleChangeKind,
+    ScheduleChanges,
+    ShowProgress,
+)
 
 
 def map_episode_record_to_model(record: EpisodeRecord) -> Episode:
@@ -22,3 +36,74 @@ def map_episode_record_to_model(record: EpisodeRecord) -> Episode:
         air_date=datetime.datetime.fromtimestamp(record["air_date"]),
         show_id=record["show_id"],
     )
+
+
+def map_show_progress_record_to_model(record: ShowProgressRecord) -> ShowProgress:
+    """Maps db show progress record to entity.
+
+    Args:
+        record (ShowProgressRecord)
+
+    Returns:
+        ShowProgress
+    """
+
+    return ShowProgress(
+        show_id=record["show_id"],
+        watched_count=record["watched_count"],
+        total_count=record["total_count"],
+        next_episode_id=record["next_episode_id"],
+    )
+
+
+def map_schedule_change_records_to_model(
+    records: Sequence[ScheduleChangeRecord],
+) -> ScheduleChanges:
+    """Maps db schedule change records of one user to entity.
+
+    Every record contains current version of schedule and reset flag,
+    change columns are null if there are no changes.
+
+    Args:
+        records (Sequence[ScheduleChangeRecord])
+
+    Returns:
+        ScheduleChanges
+    """
+
+    changes = [
+        ScheduleChange(
+            kind=ScheduleChangeKind(r["kind"]),
+            target_id=typing.cast(int, r["target_id"]),
+            version=typing.cast(int, r["version"]),
+            deleted=typing.cast(bool, r["deleted"]),
+        )
+        for r in records
+        if r["kind"] is not None
+    ]
+    record = records[0]
+
+    return ScheduleChanges(
+        version=record["current_version"], reset=record["reset"], changes=changes
+    )
+
+
+def make_schedule_version(records: Iterable[ScheduleShowVersionRecord]) -> str:
+    """Returns version stamp of schedule from ids and versions of its shows.
+
+    Stamp is digest of shows from schedule with their versions, so it changes
+    when show is added to or deleted from schedule or when scheduled show or
+    its cast is updated, but not when episodes are marked as watched.
+
+    Args:
+        records (Iterable[ScheduleShowVersionRecord])
+
+    Returns:
+        str
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+    for show_id, version in sorted((r["id"], r["version"]) for r in records):
+        digest.update(f"{show_id}:{version};".encode())
+
+    return digest.hexdigest()
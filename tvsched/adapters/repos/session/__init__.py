@@ -0,0 +1,17 @@
+import typing
+
+from tvsched.adapters.lazy import lazy_exports
+
+if typing.TYPE_CHECKING:
+    from tvsched.adapters.repos.session.cache import CachedSessionRepo
+    from tvsched.adapters.repos.session.repo import SessionRepo
+
+__all__ = ["CachedSessionRepo", "SessionRepo"]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "CachedSessionRepo": "cache",
+        "SessionRepo": "repo",
+    },
+)
@@ -0,0 +1,105 @@
+import datetime
+import time
+
+from tvsched.adapters.cache.invalidation import EntityChanged, EntityKind
+from tvsched.adapters.repos.session.repo import SessionRepo
+from tvsched.application.models.auth import SessionAdd, SessionInRepo
+
+
+class CachedSessionRepo:
+    """Caches sessions read by `SessionRepo` in process.
+
+    Renewal of access token by cached session does not query database.
+    Subscribe it to `InvalidationBus`, so sessions revoked on any worker
+    are evicted. Sessions are cached at most `ttl`, which bounds delay of
+    changes not published as invalidations, like deletion of user.
+    """
+
+    def __init__(
+        self,
+        repo: SessionRepo,
+        ttl: datetime.timedelta = datetime.timedelta(minutes=1),
+        max_size: int = 100_000,
+    ) -> None:
+        self._repo = repo
+        self._ttl = ttl.total_seconds()
+        self._max_size = max_size
+        # sessions with monotonic time of caching by token hashes
+        self._sessions: dict[str, tuple[SessionInRepo, float]] = {}
+        self._token_hashes: dict[int, str] = {}
+
+    async def add_session(self, session: SessionAdd) -> None:
+        """Adds session to repo.
+
+        Args:
+            session (SessionAdd)
+        """
+
+        await self._repo.add_session(session)
+
+    async def get_session(self, token_hash: str) -> SessionInRepo:
+        """Returns session by hash of its refresh token.
+
+        Args:
+            token_hash (str): sha256 hex digest of refresh token
+
+        Raises:
+            InvalidRefreshTokenError: will be raised if session not in repo,
+                revoked or its user is deleted
+
+        Returns:
+            SessionInRepo
+        """
+
+        cached = self._sessions.get(token_hash)
+        if cached is not None:
+            session, cached_at = cached
+            if time.monotonic() - cached_at < self._ttl:
+                return session
+            self._evict(token_hash)
+
+        session = await self._repo.get_session(token_hash)
+
+        if len(self._sessions) >= self._max_size:
+            # the oldest cached session
+            self._evict(next(iter(self._sessions)))
+        self._sessions[token_hash] = (session, time.monotonic())
+        self._token_hashes[session.id] = token_hash
+
+        return session
+
+    async def revoke_session(self, token_hash: str) -> None:
+        """Revokes session by hash of its refresh token.
+
+        Args:
+            token_hash (str): sha256 hex digest of refresh token
+        """
+
+        self._evict(token_hash)
+        await self._repo.revoke_session(token_hash)
+
+    def on_entity_changed(self, event: EntityChanged) -> None:
+        """Evicts revoked sessions.
+
+        Args:
+            event (EntityChanged)
+        """
+
+        if event.kind is not EntityKind.SESSION:
+            return
+
+        for session_id in event.ids:
+            token_hash = self._token_hashes.get(session_id)
+            if token_hash is not None:
+                self._evict(token_hash)
+
+    def on_flush(self) -> None:
+        """Evicts all sessions."""
+
+        self._sessions.clear()
+        self._token_hashes.clear()
+
+    def _evict(self, token_hash: str) -> None:
+        cached = self._sessions.pop(token_hash, None)
+        if cached is not None:
+            self._token_hashes.pop(cached[0].id, None)
@@ -0,0 +1,10 @@
+import datetime
+import uuid
+from typing import TypedDict
+
+
+class SessionRecord(TypedDict):
+    id: int
+    user_id: uuid.UUID
+    role: str
+    expires_at: datetime.datetime
@@ -0,0 +1,105 @@
+import typing
+from typing import Optional, Union
+
+from databases.core import Connection
+
+from tvsched.adapters.cache.invalidation import (
+    EntityKind,
+    InvalidationPublisher,
+    publish_changes,
+)
+from tvsched.adapters.repos.routing import ConnectionRouter
+from tvsched.adapters.repos.session.models import SessionRecord
+from tvsched.adapters.repos.session.utils import map_session_record_to_model
+from tvsched.application.exceptions.auth import InvalidRefreshTokenError
+from tvsched.application.models.auth import SessionAdd, SessionInRepo
+
+
+class SessionRepo:
+    """Sessions of refresh tokens.
+
+    Revoked sessions are published as changes of `EntityKind.SESSION`,
+    so `CachedSessionRepo` of every worker evicts them.
+    """
+
+    def __init__(
+        self,
+        db: Union[Connection, ConnectionRouter],
+        invalidation: Optional[InvalidationPublisher] = None,
+    ) -> None:
+        self._db = ConnectionRouter.of(db)
+        self._invalidation = invalidation
+
+    async def add_session(self, session: SessionAdd) -> None:
+        """Adds session to repo.
+
+        Args:
+            session (SessionAdd)
+        """
+
+        query = """
+        INSERT INTO sessions (token_hash, user_id, expires_at)
+        VALUES (:token_hash, :user_id, :expires_at);
+        """
+
+        values = dict(
+            token_hash=session.token_hash,
+            user_id=session.user_id,
+            expires_at=session.expires_at,
+        )
+        db = self._db.for_write()
+        await db.execute(query, values=values)
+
+    async def get_session(self, token_hash: str) -> SessionInRepo:
+        """Returns session by hash of its refresh token.
+
+        Args:
+            token_hash (str): sha256 hex digest of refresh token
+
+        Raises:
+            InvalidRefreshTokenError: will be raised if session not in repo,
+                revoked or its user is deleted
+
+        Returns:
+            SessionInRepo
+        """
+
+        query = """
+        SELECT s.id, s.user_id, u.role, s.expires_at FROM sessions s
+        JOIN users u ON u.id = s.user_id
+        WHERE s.token_hash = :token_hash
+            AND s.revoked_at IS NULL
+            AND u.deleted_at IS NULL;
+        """
+
+        values = dict(token_hash=token_hash)
+        # revocation must be seen at once, so replicas are not used
+        db = self._db.for_write()
+        record = await db.fetch_one(query, values=values)
+
+        if record is None:
+            raise InvalidRefreshTokenError()
+
+        return map_session_record_to_model(typing.cast(SessionRecord, record))
+
+    async def revoke_session(self, token_hash: str) -> None:
+        """Revokes session by hash of its refresh token.
+
+        Does nothing if session not in repo or already revoked.
+
+        Args:
+            token_hash (str): sha256 hex digest of refresh token
+        """
+
+        query = """
+        UPDATE sessions SET revoked_at = now()
+        WHERE token_hash = :token_hash AND revoked_at IS NULL
+        RETURNING id;
+        """
+
+        values = dict(token_hash=token_hash)
+        db = self._db.for_write()
+        records = await db.fetch_all(query, values=values)
+
+        session_ids = [r["id"] for r in records]
+        await publish_changes(self._invalidation, db, EntityKind.SESSION, session_ids)
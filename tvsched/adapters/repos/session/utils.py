@@ -0,0 +1,20 @@
+from tvsched.adapters.repos.session.models import SessionRecord
+from tvsched.application.models.auth import SessionInRepo, UserInToken
+from tvsched.entities.auth import Role
+
+
+def map_session_record_to_model(record: SessionRecord) -> SessionInRepo:
+    """Maps db session record joined with user role to model.
+
+    Args:
+        record (SessionRecord)
+
+    Returns:
+        SessionInRepo
+    """
+
+    return SessionInRepo(
+        id=record["id"],
+        user=UserInToken(id=record["user_id"], role=Role(record["role"])),
+        expires_at=record["expires_at"],
+    )
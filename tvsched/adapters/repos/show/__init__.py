@@ -1,3 +1,15 @@
-from tvsched.adapters.repos.show.repo import ShowRepo
+import typing
+
+from tvsched.adapters.lazy import lazy_exports
+
+if typing.TYPE_CHECKING:
+    from tvsched.adapters.repos.show.repo import ShowRepo
 
 __all__ = ["ShowRepo"]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "ShowRepo": "repo",
+    },
+)
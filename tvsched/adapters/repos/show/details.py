@@ -0,0 +1,65 @@
+"""Mapping of show detail records: show with its cast and seasons of episodes."""
+
+from typing import Iterable, Optional
+
+from tvsched.adapters.repos.actor.models import ActorRecord
+from tvsched.adapters.repos.actor.utils import map_actor_record_to_model
+from tvsched.adapters.repos.episode.models import EpisodeRecord
+from tvsched.adapters.repos.episode.utils import (
+    group_episodes_by_season,
+    map_episode_record_to_model,
+)
+from tvsched.adapters.repos.show.models import ShowDetailsRecord
+from tvsched.entities.show import Show, ShowDetails
+
+
+def map_show_details_records_to_model(
+    record: ShowDetailsRecord,
+    cast: Iterable[ActorRecord],
+    episodes: Iterable[EpisodeRecord],
+    watched_episode_ids: Optional[Iterable[int]],
+) -> ShowDetails:
+    """Maps records of show, its cast and episodes from repo to model.
+
+    Example:
+        >>> details = map_show_details_records_to_model(
+        ...     {"id": 1, "name": "show1", "seasons_count": 8, "image_url": "url1"},
+        ...     [{"id": 1, "name": "actor1", "image_url": "url2"}],
+        ...     [
+        ...         {"id": 2, "name": "e", "season": 1, "number": 1, "air_date": 0, "show_id": 1},
+        ...         {"id": 1, "name": "e", "season": 2, "number": 1, "air_date": 0, "show_id": 1},
+        ...     ],
+        ...     None,
+        ... )
+        >>> details.show.cast
+        [Actor(id=1, name='actor1', image_url='url2')]
+        >>> [(s.number, [e.id for e in s.episodes]) for s in details.seasons]
+        [(1, [2]), (2, [1])]
+
+    Args:
+        record (ShowDetailsRecord)
+        cast (Iterable[ActorRecord])
+        episodes (Iterable[EpisodeRecord]): episodes ordered by season and number
+        watched_episode_ids (Optional[Iterable[int]])
+
+    Returns:
+        ShowDetails
+    """
+
+    show = Show(
+        id=record["id"],
+        name=record["name"],
+        seasons_count=record["seasons_count"],
+        image_url=record["image_url"],
+        cast=[map_actor_record_to_model(r) for r in cast],
+    )
+
+    return ShowDetails(
+        show=show,
+        seasons=group_episodes_by_season(
+            map_episode_record_to_model(r) for r in episodes
+        ),
+        watched_episode_ids=(
+            None if watched_episode_ids is None else list(watched_episode_ids)
+        ),
+    )
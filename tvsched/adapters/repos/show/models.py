@@ -6,6 +6,14 @@ class ShowRecord(TypedDict):
     name: str
     seasons_count: int
     image_url: str
+    version: int
     actor_id: int
     actor_name: str
     actor_image_url: str
+
+
+class ShowDetailsRecord(TypedDict):
+    id: int
+    name: str
+    seasons_count: int
+    image_url: str
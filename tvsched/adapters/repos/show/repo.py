@@ -1,22 +1,42 @@
-from typing import Optional
+import json
+from typing import Optional, Sequence, Union
 import typing
 import uuid
 
 from databases.core import Connection
 
-from tvsched.adapters.repos.show.models import ShowRecord
+from tvsched.adapters.cache.invalidation import (
+    EntityKind,
+    InvalidationPublisher,
+    publish_changes,
+)
+from tvsched.adapters.repos.batching import order_by_ids
+from tvsched.adapters.repos.coalescing import SingleFlight, coalesce
+from tvsched.adapters.repos.deletion.jobs import start_deletion_job
+from tvsched.adapters.repos.routing import ConnectionRouter
+from tvsched.adapters.repos.show.details import map_show_details_records_to_model
+from tvsched.adapters.repos.show.models import ShowDetailsRecord, ShowRecord
 from tvsched.adapters.repos.show.utils import (
     group_show_records,
     map_show_records_to_model,
 )
 from tvsched.application.exceptions.show import ShowNotFoundError
+from tvsched.application.models.common import EntitiesByIds, Versioned
 from tvsched.application.models.show import ShowAdd, ShowUpdate
-from tvsched.entities.show import Show
+from tvsched.entities.deletion import DeletionTargetKind
+from tvsched.entities.show import Show, ShowDetails
 
 
 class ShowRepo:
-    def __init__(self, db: Connection) -> None:
-        self._db = db
+    def __init__(
+        self,
+        db: Union[Connection, ConnectionRouter],
+        single_flight: Optional[SingleFlight] = None,
+        invalidation: Optional[InvalidationPublisher] = None,
+    ) -> None:
+        self._db = ConnectionRouter.of(db)
+        self._single_flight = single_flight
+        self._invalidation = invalidation
 
     async def get(self, show_id: int) -> Show:
         """Returns show from repo by `show_id`.
@@ -37,11 +57,17 @@ class ShowRepo:
         FROM shows s
         JOIN actors_to_shows ats ON ats.show_id = s.id
         JOIN actors a ON ats.actor_id = a.id
-        WHERE s.id = :show_id;
+        WHERE s.id = :show_id AND s.deleted_at IS NULL;
         """
 
         values = dict(show_id=show_id)
-        records = await self._db.fetch_all(query, values=values)
+        records = await coalesce(
+            self._single_flight,
+            self._db,
+            "ShowRepo.get",
+            show_id,
+            lambda db: db.fetch_all(query, values=values),
+        )
         records = typing.cast(list[ShowRecord], records)
 
         if not records:
@@ -51,6 +77,160 @@ class ShowRepo:
 
         return show
 
+    async def get_versioned(self, show_id: int) -> Versioned[Show]:
+        """Returns show from repo by `show_id` with its version stamp.
+
+        Show and version are read by one query, which is not coalesced
+        with other reads, so version is always version of returned show.
+
+        Args:
+            show_id (show)
+
+        Raises:
+            ShowNotFoundError: will be raised if show with id `show_id` not in repo
+
+        Returns:
+            Versioned[Show]
+        """
+
+        query = """
+        SELECT s.*, a.id as actor_id, a.name as actor_name,
+        a.image_url as actor_image_url
+        FROM shows s
+        JOIN actors_to_shows ats ON ats.show_id = s.id
+        JOIN actors a ON ats.actor_id = a.id
+        WHERE s.id = :show_id AND s.deleted_at IS NULL;
+        """
+
+        values = dict(show_id=show_id)
+        db = await self._db.for_read()
+        records = await db.fetch_all(query, values=values)
+        records = typing.cast(list[ShowRecord], records)
+
+        if not records:
+            raise ShowNotFoundError(show_id=show_id)
+
+        show = map_show_records_to_model(records)
+
+        return Versioned(version=str(records[0]["version"]), entity=show)
+
+    async def get_details(
+        self, show_id: int, user_id: Optional[uuid.UUID] = None
+    ) -> ShowDetails:
+        """Returns show with its cast and episodes grouped by seasons with one query.
+
+        Cast and episodes are aggregated to JSON by database, so rows of show
+        are not repeated for every actor and episode.
+
+        Args:
+            show_id (int)
+            user_id (Optional[uuid.UUID]): if not None ids of episodes
+                watched by user are returned too
+
+        Raises:
+            ShowNotFoundError: will be raised if show with id `show_id` not in repo
+
+        Returns:
+            ShowDetails
+        """
+
+        query = """
+        SELECT s.id, s.name, s.seasons_count, s.image_url,
+        (
+            SELECT COALESCE(json_agg(a ORDER BY a.id), '[]')
+            FROM actors_to_shows ats
+            JOIN actors a ON a.id = ats.actor_id
+            WHERE ats.show_id = s.id
+        ) AS cast_json,
+        (
+            SELECT COALESCE(json_agg(e ORDER BY e.season, e.number, e.id), '[]')
+            FROM episodes e
+            WHERE e.show_id = s.id
+        ) AS episodes_json,
+        CASE WHEN CAST(:user_id AS uuid) IS NOT NULL THEN ARRAY(
+            SELECT we.episode_id FROM watched_episodes we
+            JOIN episodes e ON e.id = we.episode_id
+            WHERE we.user_id = :user_id AND e.show_id = s.id
+            ORDER BY we.episode_id
+        ) END AS watched_episode_ids
+        FROM shows s
+        WHERE s.id = :show_id AND s.deleted_at IS NULL;
+        """
+
+        values = dict(show_id=show_id, user_id=user_id)
+        record = await coalesce(
+            self._single_flight,
+            self._db,
+            "ShowRepo.get_details",
+            (show_id, user_id),
+            lambda db: db.fetch_one(query, values=values),
+        )
+
+        if record is None:
+            raise ShowNotFoundError(show_id=show_id)
+
+        return map_show_details_records_to_model(
+            typing.cast(ShowDetailsRecord, record),
+            json.loads(record["cast_json"]),
+            json.loads(record["episodes_json"]),
+            record["watched_episode_ids"],
+        )
+
+    async def get_version(self, show_id: int) -> str:
+        """Returns version stamp of show with id `show_id` without loading its cast.
+
+        Args:
+            show_id (int)
+
+        Raises:
+            ShowNotFoundError: will be raised if show with id `show_id` not in repo
+
+        Returns:
+            str: version stamp, changes on every update of show or its cast
+        """
+
+        query = """
+        SELECT version FROM shows WHERE id = :show_id AND deleted_at IS NULL;
+        """
+
+        values = dict(show_id=show_id)
+        db = await self._db.for_read()
+        version = await db.fetch_val(query, values=values)
+
+        if version is None:
+            raise ShowNotFoundError(show_id=show_id)
+
+        return str(version)
+
+    async def get_many(self, show_ids: Sequence[int]) -> EntitiesByIds[Show]:
+        """Returns shows from repo by `show_ids` with one query.
+
+        Args:
+            show_ids (Sequence[int])
+
+        Returns:
+            EntitiesByIds[Show]: shows ordered as `show_ids` and ids of not found shows
+        """
+
+        query = """
+        SELECT s.*, a.id as actor_id, a.name as actor_name,
+        a.image_url as actor_image_url
+        FROM shows s
+        JOIN actors_to_shows ats ON ats.show_id = s.id
+        JOIN actors a ON ats.actor_id = a.id
+        WHERE s.id = ANY(:show_ids) AND s.deleted_at IS NULL
+        ORDER BY s.id;
+        """
+
+        values = dict(show_ids=list(show_ids))
+        db = await self._db.for_read()
+        records = await db.fetch_all(query, values=values)
+        records = typing.cast(list[ShowRecord], records)
+        grouped_records = group_show_records(records)
+        shows = {rs[0]["id"]: map_show_records_to_model(rs) for rs in grouped_records}
+
+        return order_by_ids(show_ids, shows)
+
     async def get_shows(
         self, limit: Optional[int] = None, offset: Optional[int] = None
     ) -> list[Show]:
@@ -70,12 +250,68 @@ class ShowRepo:
         FROM shows s
         JOIN actors_to_shows ats ON ats.show_id = s.id
         JOIN actors a ON ats.actor_id = a.id
+        WHERE s.deleted_at IS NULL
         LIMIT :limit
         OFFSET :offset;
         """
 
         values = dict(limit=limit, offset=offset)
-        records = await self._db.fetch_all(query, values)
+        db = await self._db.for_read()
+        records = await db.fetch_all(query, values)
+        records = typing.cast(list[ShowRecord], records)
+        grouped_records = group_show_records(records)
+        res = [map_show_records_to_model(rs) for rs in grouped_records]
+
+        return res
+
+    async def search(
+        self, query: str, limit: int, include_cast: bool = False
+    ) -> list[Show]:
+        """Returns shows with name similar to `query` ordered by relevance.
+
+        Args:
+            query (str): words of show name, may contain typos
+            limit (int): max number of shows
+            include_cast (bool): if True shows with actor name
+                similar to `query` will be returned too
+
+        Returns:
+            list[Show]
+        """
+
+        cast_matches = """
+            UNION ALL
+            SELECT ats.show_id AS id, word_similarity(:query, a.name) AS rank
+            FROM actors a
+            JOIN actors_to_shows ats ON ats.actor_id = a.id
+            WHERE :query <% a.name
+        """
+
+        sql_query = f"""
+        WITH matches AS (
+            SELECT s.id, word_similarity(:query, s.name) AS rank
+            FROM shows s
+            WHERE :query <% s.name AND s.deleted_at IS NULL
+            {cast_matches if include_cast else ""}
+        ), ranked AS (
+            SELECT id, max(rank) AS rank
+            FROM matches
+            GROUP BY id
+            ORDER BY rank DESC, id
+            LIMIT :limit
+        )
+        SELECT s.*, a.id as actor_id, a.name as actor_name,
+        a.image_url as actor_image_url
+        FROM ranked r
+        JOIN shows s ON s.id = r.id AND s.deleted_at IS NULL
+        JOIN actors_to_shows ats ON ats.show_id = s.id
+        JOIN actors a ON ats.actor_id = a.id
+        ORDER BY r.rank DESC, s.id;
+        """
+
+        values = dict(query=query, limit=limit)
+        db = await self._db.for_read()
+        records = await db.fetch_all(sql_query, values=values)
         records = typing.cast(list[ShowRecord], records)
         grouped_records = group_show_records(records)
         res = [map_show_records_to_model(rs) for rs in grouped_records]
@@ -95,17 +331,23 @@ class ShowRepo:
 
         query = """
         INSERT INTO shows (name, seasons_count, image_url)
-        VALUES (:name, :seasons_count, :image_url);
+        VALUES (:name, :seasons_count, :image_url)
+        RETURNING id;
         """
 
         values = dict(
             name=show.name, seasons_count=show.seasons_count, image_url=show.image_url
         )
-        await self._db.execute(query, values=values)
+        db = self._db.for_write()
+        show_id = await db.execute(query, values=values)
+        await publish_changes(self._invalidation, db, EntityKind.SHOW, [show_id])
 
     async def delete(self, show_id: int) -> None:
         """Deletes show from repo by `show_id`.
 
+        Show is hidden at once, its episodes and schedules with it
+        are deleted in background by `DeletionWorker`.
+
         Args:
             show_id (show)
 
@@ -113,12 +355,19 @@ class ShowRepo:
             Show
         """
 
-        query = """
-        DELETE FROM shows WHERE id = :show_id;
+        query = f"""
+        WITH deleted AS (
+            UPDATE shows SET deleted_at = now()
+            WHERE id = :show_id AND deleted_at IS NULL
+            RETURNING id
+        )
+        {start_deletion_job(DeletionTargetKind.SHOW, "deleted")};
         """
 
         values = dict(show_id=show_id)
-        await self._db.execute(query, values=values)
+        db = self._db.for_write()
+        await db.execute(query, values=values)
+        await publish_changes(self._invalidation, db, EntityKind.SHOW, [show_id])
 
     async def update(self, show: ShowUpdate) -> None:
         """Updates show in repo.
@@ -145,15 +394,19 @@ class ShowRepo:
             columns_to_update.append("image_url = :image_url")
             values["image_url"] = image_url
 
+        columns_to_update.append("version = version + 1")
+
         query = f"""
         UPDATE shows
         SET {", ".join(columns_to_update)}
-        WHERE id = :id;
+        WHERE id = :id AND deleted_at IS NULL;
         """
 
         values["id"] = show.id
 
-        await self._db.execute(query, values=values)
+        db = self._db.for_write()
+        await db.execute(query, values=values)
+        await publish_changes(self._invalidation, db, EntityKind.SHOW, [show.id])
 
     async def get_shows_from_schedule(
         self,
@@ -177,13 +430,19 @@ class ShowRepo:
         JOIN actors_to_shows ats ON ats.show_id = s.id
         JOIN actors a ON ats.actor_id = a.id
         JOIN shows_to_schedules sts ON sts.show_id = s.id
-        WHERE sts.user_id = :user_id
+        WHERE sts.user_id = :user_id AND s.deleted_at IS NULL
         LIMIT :limit
         OFFSET :offset;
         """
 
         values = dict(user_id=user_id, limit=limit, offset=offset)
-        records = await self._db.fetch_all(query, values)
+        records = await coalesce(
+            self._single_flight,
+            self._db,
+            "ShowRepo.get_shows_from_schedule",
+            (user_id, limit, offset),
+            lambda db: db.fetch_all(query, values),
+        )
         records = typing.cast(list[ShowRecord], records)
         grouped_records = group_show_records(records)
         shows = [map_show_records_to_model(rs) for rs in grouped_records]
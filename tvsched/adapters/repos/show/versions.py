@@ -0,0 +1,21 @@
+"""SQL for bumping version stamps of shows.
+
+Show contains its cast, so version of show is bumped by changes of show,
+of its cast and of actors from its cast.
+"""
+
+
+def bump_show_versions(show_ids_query: str) -> str:
+    """Returns statement which bumps versions of shows from `show_ids_query`.
+
+    Args:
+        show_ids_query (str): query selecting column `show_id`
+
+    Returns:
+        str
+    """
+
+    return f"""
+    UPDATE shows SET version = version + 1
+    WHERE id IN ({show_ids_query})
+    """
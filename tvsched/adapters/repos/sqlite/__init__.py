@@ -0,0 +1,35 @@
+import typing
+
+from tvsched.adapters.lazy import lazy_exports
+
+if typing.TYPE_CHECKING:
+    from tvsched.adapters.repos.sqlite.actor import SQLiteActorRepo
+    from tvsched.adapters.repos.sqlite.database import SQLiteDatabase
+    from tvsched.adapters.repos.sqlite.episode import SQLiteEpisodeRepo
+    from tvsched.adapters.repos.sqlite.schedule import SQLiteScheduleRepo
+    from tvsched.adapters.repos.sqlite.session import SQLiteSessionRepo
+    from tvsched.adapters.repos.sqlite.show import SQLiteShowRepo
+    from tvsched.adapters.repos.sqlite.user import SQLiteUserRepo
+
+__all__ = [
+    "SQLiteActorRepo",
+    "SQLiteDatabase",
+    "SQLiteEpisodeRepo",
+    "SQLiteScheduleRepo",
+    "SQLiteSessionRepo",
+    "SQLiteShowRepo",
+    "SQLiteUserRepo",
+]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "SQLiteActorRepo": "actor",
+        "SQLiteDatabase": "database",
+        "SQLiteEpisodeRepo": "episode",
+        "SQLiteScheduleRepo": "schedule",
+        "SQLiteSessionRepo": "session",
+        "SQLiteShowRepo": "show",
+        "SQLiteUserRepo": "user",
+    },
+)
@@ -0,0 +1,287 @@
+import sqlite3
+import typing
+from typing import Sequence
+
+from tvsched.adapters.repos.actor.models import ActorRecord
+from tvsched.adapters.repos.actor.utils import map_actor_record_to_model
+from tvsched.adapters.repos.batching import order_by_ids
+from tvsched.adapters.repos.sqlite.database import (
+    SQLiteDatabase,
+    is_constraint_error,
+)
+from tvsched.adapters.repos.sqlite.functions import WORD_SIMILARITY_THRESHOLD
+from tvsched.adapters.repos.sqlite.queries import json_ids
+from tvsched.application.exceptions.actor import (
+    ActorAlreadyInShowCastError,
+    ActorNotFoundError,
+    ActorOrShowNotFoundError,
+)
+from tvsched.application.exceptions.show import ShowNotFoundError
+from tvsched.application.models.actor import (
+    ActorAdd,
+    ActorInShowCast,
+    ActorUpdate,
+    ShowCast,
+    ShowCastChanges,
+)
+from tvsched.application.models.common import EntitiesByIds
+from tvsched.entities.actor import Actor
+
+# shows with actor in cast are changed with actor
+_BUMP_SHOWS_OF_ACTOR = """
+UPDATE shows SET version = version + 1
+WHERE id IN (SELECT show_id FROM actors_to_shows WHERE actor_id = :id);
+"""
+
+
+class SQLiteActorRepo:
+    def __init__(self, db: SQLiteDatabase) -> None:
+        self._db = db
+
+    async def get(self, actor_id: int) -> Actor:
+        """Returns actor from repo by `actor_id`.
+
+        Args:
+            actor_id (int)
+
+        Raises:
+            ActorNotFoundError: will be raised if actor with id `actor_id` not in repo
+
+        Returns:
+            Actor
+        """
+
+        query = "SELECT * FROM actors WHERE id = :id;"
+
+        values = dict(id=actor_id)
+        record = await self._db.fetch_one(query, values)
+
+        if record is None:
+            raise ActorNotFoundError(actor_id=actor_id)
+
+        return map_actor_record_to_model(typing.cast(ActorRecord, record))
+
+    async def get_many(self, actor_ids: Sequence[int]) -> EntitiesByIds[Actor]:
+        """Returns actors from repo by `actor_ids` with one query.
+
+        Args:
+            actor_ids (Sequence[int])
+
+        Returns:
+            EntitiesByIds[Actor]: actors ordered as `actor_ids` and ids of not found actors
+        """
+
+        query = """
+        SELECT * FROM actors
+        WHERE id IN (SELECT value FROM json_each(:ids));
+        """
+
+        values = dict(ids=json_ids(actor_ids))
+        records = await self._db.fetch_all(query, values)
+        records = typing.cast(list[ActorRecord], records)
+        actors = {r["id"]: map_actor_record_to_model(r) for r in records}
+
+        return order_by_ids(actor_ids, actors)
+
+    async def search(self, query: str, limit: int) -> list[Actor]:
+        """Returns actors with name similar to `query` ordered by relevance.
+
+        Args:
+            query (str): words of actor name, may contain typos
+            limit (int): max number of actors
+
+        Returns:
+            list[Actor]
+        """
+
+        sql_query = """
+        SELECT id, name, image_url FROM (
+            SELECT *, word_similarity(:query, name) AS rank FROM actors
+        )
+        WHERE rank >= :threshold
+        ORDER BY rank DESC, id
+        LIMIT :limit;
+        """
+
+        values = dict(query=query, limit=limit, threshold=WORD_SIMILARITY_THRESHOLD)
+        records = await self._db.fetch_all(sql_query, values)
+        records = typing.cast(list[ActorRecord], records)
+
+        return [map_actor_record_to_model(r) for r in records]
+
+    async def add(self, actor: ActorAdd) -> None:
+        """Adds new actor to repo.
+
+        Args:
+            actor (ActorAdd): data for adding actor to repo.
+        """
+
+        query = "INSERT INTO actors (name, image_url) VALUES (:name, :image_url);"
+
+        values = dict(name=actor.name, image_url=actor.image_url)
+        await self._db.execute(query, values)
+
+    async def update(self, actor: ActorUpdate) -> None:
+        """Updates actor in repo.
+
+        Args:
+            actor (ActorAdd): data for updating actor in repo
+        """
+
+        columns_to_update = []
+        values: dict[str, typing.Any] = {}
+
+        name = actor.name
+        if name is not None:
+            columns_to_update.append("name = :name")
+            values["name"] = name
+
+        image_url = actor.image_url
+        if image_url is not None:
+            columns_to_update.append("image_url = :image_url")
+            values["image_url"] = image_url
+
+        values["id"] = actor.id
+
+        query = f"""
+        UPDATE actors
+        SET {", ".join(columns_to_update)}
+        WHERE id = :id;
+        """
+
+        def update(conn: sqlite3.Connection) -> None:
+            if conn.execute(query, values).rowcount:
+                conn.execute(_BUMP_SHOWS_OF_ACTOR, dict(id=actor.id))
+
+        await self._db.transaction(update)
+
+    async def delete(self, actor_id: int) -> None:
+        """Deletes actor with id `actor_id` from repo.
+
+        Args:
+            actor_id (int)
+        """
+
+        def delete(conn: sqlite3.Connection) -> None:
+            values = dict(id=actor_id)
+            # versions are bumped before cast of actor is deleted by cascade
+            conn.execute(_BUMP_SHOWS_OF_ACTOR, values)
+            conn.execute("DELETE FROM actors WHERE id = :id;", values)
+
+        await self._db.transaction(delete)
+
+    async def add_actor_to_show_cast(self, actor_in_cast: ActorInShowCast) -> None:
+        """Adds actor with id `actor_in_cast.actor_id` to show cast with id `actor_in_cast.show_id`.
+
+        Args:
+            actor_in_cast (ActorInShowCast): data for adding actor to show cast
+
+        Raises:
+            ActorOrShowNotFoundError: will be raised if actor or show not in repo
+            ActorAlreadyInShowCastError: will be raised if actor already in show cast
+        """
+
+        values = dict(show_id=actor_in_cast.show_id, actor_id=actor_in_cast.actor_id)
+
+        def add(conn: sqlite3.Connection) -> None:
+            conn.execute(
+                "INSERT INTO actors_to_shows (show_id, actor_id)"
+                " VALUES (:show_id, :actor_id);",
+                values,
+            )
+            conn.execute(
+                "UPDATE shows SET version = version + 1 WHERE id = :show_id;", values
+            )
+
+        try:
+            await self._db.transaction(add)
+        except sqlite3.IntegrityError as e:
+            if is_constraint_error(e, "FOREIGN KEY"):
+                raise ActorOrShowNotFoundError(actor_in_cast)
+            if is_constraint_error(e, "UNIQUE"):
+                raise ActorAlreadyInShowCastError(actor_in_cast)
+            raise
+
+    async def delete_actor_from_show_cast(self, actor_in_cast: ActorInShowCast) -> None:
+        """Deletes actor with id `actor_in_cast.actor_id` from show cast with id `actor_in_cast.show_id`.
+
+        Args:
+            actor_in_cast (ActorInShowCast): data for deleting actor from show cast
+        """
+
+        values = dict(show_id=actor_in_cast.show_id, actor_id=actor_in_cast.actor_id)
+
+        def delete(conn: sqlite3.Connection) -> None:
+            deleted = conn.execute(
+                "DELETE FROM actors_to_shows"
+                " WHERE show_id = :show_id AND actor_id = :actor_id;",
+                values,
+            ).rowcount
+            if deleted:
+                conn.execute(
+                    "UPDATE shows SET version = version + 1 WHERE id = :show_id;",
+                    values,
+                )
+
+        await self._db.transaction(delete)
+
+    async def set_show_cast(self, show_cast: ShowCast) -> ShowCastChanges:
+        """Replaces cast of show with id `show_cast.show_id` with actors by `show_cast.actor_ids`.
+
+        Args:
+            show_cast (ShowCast): show id and ids of actors of new cast
+
+        Raises:
+            ShowNotFoundError: will be raised if show not in repo
+
+        Returns:
+            ShowCastChanges: ids of added, removed and missing actors
+        """
+
+        values = dict(show_id=show_cast.show_id, ids=json_ids(show_cast.actor_ids))
+
+        def set_cast(conn: sqlite3.Connection) -> ShowCastChanges:
+            show = conn.execute("SELECT 1 FROM shows WHERE id = :show_id;", values)
+            if show.fetchone() is None:
+                raise ShowNotFoundError(show_id=show_cast.show_id)
+
+            missing = conn.execute(
+                """
+                SELECT DISTINCT value FROM json_each(:ids)
+                WHERE value NOT IN (SELECT id FROM actors)
+                ORDER BY value;
+                """,
+                values,
+            ).fetchall()
+            removed = conn.execute(
+                """
+                DELETE FROM actors_to_shows
+                WHERE show_id = :show_id
+                AND actor_id NOT IN (SELECT value FROM json_each(:ids))
+                RETURNING actor_id;
+                """,
+                values,
+            ).fetchall()
+            added = conn.execute(
+                """
+                INSERT INTO actors_to_shows (show_id, actor_id)
+                SELECT :show_id, id FROM actors
+                WHERE id IN (SELECT value FROM json_each(:ids))
+                ON CONFLICT DO NOTHING
+                RETURNING actor_id;
+                """,
+                values,
+            ).fetchall()
+            if added or removed:
+                conn.execute(
+                    "UPDATE shows SET version = version + 1 WHERE id = :show_id;",
+                    values,
+                )
+
+            return ShowCastChanges(
+                added_actor_ids=sorted(r[0] for r in added),
+                removed_actor_ids=sorted(r[0] for r in removed),
+                missing_actor_ids=[r[0] for r in missing],
+            )
+
+        return await self._db.transaction(set_cast)
@@ -0,0 +1,69 @@
+"""Logging of changes of user schedule for delta sync in SQLite.
+
+Works like `tvsched.adapters.repos.schedule.changes`, but is called
+with connection inside of write transaction, which is already exclusive.
+"""
+
+import sqlite3
+import time
+from typing import Iterable
+
+from tvsched.entities.schedule import ScheduleChangeKind
+
+
+def log_schedule_changes(
+    conn: sqlite3.Connection,
+    kind: ScheduleChangeKind,
+    changed: Iterable[tuple[str, int]],
+    deleted: bool,
+) -> None:
+    """Logs change of targets with the next version of their user schedule.
+
+    Every user schedule gets one new version for all its changed targets.
+
+    Args:
+        conn (sqlite3.Connection): connection in transaction
+        kind (ScheduleChangeKind)
+        changed (Iterable[tuple[str, int]]): user id and id of changed
+            show or episode
+        deleted (bool): True if targets were deleted from schedule
+    """
+
+    targets_by_user: dict[str, list[int]] = {}
+    for user_id, target_id in changed:
+        targets_by_user.setdefault(user_id, []).append(target_id)
+
+    changed_at = time.time()
+    for user_id, target_ids in targets_by_user.items():
+        version = conn.execute(
+            """
+            INSERT INTO schedule_versions (user_id, version)
+            VALUES (:user_id, 1)
+            ON CONFLICT (user_id) DO UPDATE
+            SET version = schedule_versions.version + 1
+            RETURNING version;
+            """,
+            dict(user_id=user_id),
+        ).fetchone()[0]
+        conn.executemany(
+            """
+            INSERT INTO schedule_changes
+            (user_id, kind, target_id, version, deleted, changed_at)
+            VALUES (:user_id, :kind, :target_id, :version, :deleted, :changed_at)
+            ON CONFLICT (user_id, kind, target_id) DO UPDATE
+            SET version = excluded.version,
+                deleted = excluded.deleted,
+                changed_at = excluded.changed_at;
+            """,
+            [
+                dict(
+                    user_id=user_id,
+                    kind=kind.value,
+                    target_id=target_id,
+                    version=version,
+                    deleted=deleted,
+                    changed_at=changed_at,
+                )
+                for target_id in target_ids
+            ],
+        )
@@ -0,0 +1,216 @@
+import asyncio
+import concurrent.futures
+import functools
+import sqlite3
+from typing import Any, Callable, Mapping, Optional, TypeVar
+
+from tvsched.adapters.repos.sqlite.functions import word_similarity
+from tvsched.adapters.repos.sqlite.schema import SCHEMA
+
+T = TypeVar("T")
+
+# queries of repos use RETURNING
+MIN_SQLITE_VERSION = (3, 35, 0)
+
+DEFAULT_PRAGMAS: Mapping[str, Any] = {
+    # readers do not block writer and the other way round
+    "journal_mode": "WAL",
+    # WAL is durable on checkpoint, commit does not wait for fsync
+    "synchronous": "NORMAL",
+    "foreign_keys": "ON",
+    "busy_timeout": 5000,
+    "temp_store": "MEMORY",
+    # 64 MiB of page cache and memory mapped reads
+    "cache_size": -64_000,
+    "mmap_size": 256 * 1024 * 1024,
+}
+
+
+def is_constraint_error(error: sqlite3.IntegrityError, constraint: str) -> bool:
+    """Returns True if `error` is violation of constraint of kind `constraint`.
+
+    Example:
+        >>> error = sqlite3.IntegrityError("FOREIGN KEY constraint failed")
+        >>> is_constraint_error(error, "FOREIGN KEY")
+        True
+
+    Args:
+        error (sqlite3.IntegrityError)
+        constraint (str): UNIQUE, FOREIGN KEY, NOT NULL or CHECK
+
+    Returns:
+        bool
+    """
+
+    return str(error).startswith(f"{constraint} constraint failed")
+
+
+class SQLiteDatabase:
+    """SQLite database for embedded single-node deployments.
+
+    Connection is owned by one worker thread, so blocking sqlite3 calls
+    do not block event loop and are executed one by one. Every call is
+    one transaction. Schema is created on connect.
+    """
+
+    def __init__(
+        self, path: str = ":memory:", pragmas: Mapping[str, Any] = DEFAULT_PRAGMAS
+    ) -> None:
+        self._path = path
+        self._pragmas = pragmas
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._connection: Optional[sqlite3.Connection] = None
+
+    async def connect(self) -> None:
+        """Opens connection, applies pragmas and creates schema.
+
+        Raises:
+            RuntimeError: will be raised if SQLite library is older
+                than `MIN_SQLITE_VERSION`
+        """
+
+        if self._executor is not None:
+            return
+
+        if sqlite3.sqlite_version_info < MIN_SQLITE_VERSION:
+            required = ".".join(map(str, MIN_SQLITE_VERSION))
+            raise RuntimeError(
+                f"SQLite {required} or newer is required, got {sqlite3.sqlite_version}"
+            )
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sqlite"
+        )
+        self._connection = await self._run(self._connect)
+
+    async def disconnect(self) -> None:
+        """Closes connection."""
+
+        executor = self._executor
+        if executor is None:
+            return
+
+        await self._run(lambda: self._get_connection().close())
+        executor.shutdown()
+        self._executor = None
+        self._connection = None
+
+    async def __aenter__(self) -> "SQLiteDatabase":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.disconnect()
+
+    async def fetch_all(
+        self, query: str, values: Optional[Mapping[str, Any]] = None
+    ) -> list[sqlite3.Row]:
+        """Executes `query` and returns all rows.
+
+        Args:
+            query (str)
+            values (Optional[Mapping[str, Any]]): named parameters of `query`
+
+        Returns:
+            list[sqlite3.Row]
+        """
+
+        return await self._run(
+            functools.partial(
+                self._in_transaction,
+                lambda conn: conn.execute(query, values or {}).fetchall(),
+                "BEGIN",
+            )
+        )
+
+    async def fetch_one(
+        self, query: str, values: Optional[Mapping[str, Any]] = None
+    ) -> Optional[sqlite3.Row]:
+        """Executes `query` and returns the first row.
+
+        Args:
+            query (str)
+            values (Optional[Mapping[str, Any]]): named parameters of `query`
+
+        Returns:
+            Optional[sqlite3.Row]: None if there are no rows
+        """
+
+        return await self._run(
+            functools.partial(
+                self._in_transaction,
+                lambda conn: conn.execute(query, values or {}).fetchone(),
+                "BEGIN",
+            )
+        )
+
+    async def execute(
+        self, query: str, values: Optional[Mapping[str, Any]] = None
+    ) -> Any:
+        """Executes `query` and returns the first column of the first row.
+
+        Args:
+            query (str)
+            values (Optional[Mapping[str, Any]]): named parameters of `query`
+
+        Returns:
+            Any: None if there are no rows
+        """
+
+        row = await self.fetch_one(query, values)
+
+        return None if row is None else row[0]
+
+    async def transaction(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Calls `fn` with connection in worker thread in one transaction.
+
+        Write lock is taken at start of transaction, so `fn` may read
+        before writing. Transaction is rolled back if `fn` raises.
+
+        Args:
+            fn (Callable[[sqlite3.Connection], T])
+
+        Returns:
+            T: result of `fn`
+        """
+
+        return await self._run(
+            functools.partial(self._in_transaction, fn, "BEGIN IMMEDIATE")
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        # transactions are started explicitly
+        conn = sqlite3.connect(self._path, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        for name, value in self._pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        conn.create_function("word_similarity", 2, word_similarity, deterministic=True)
+        conn.executescript(SCHEMA)
+
+        return conn
+
+    def _in_transaction(self, fn: Callable[[sqlite3.Connection], T], begin: str) -> T:
+        conn = self._get_connection()
+        conn.execute(begin)
+        try:
+            res = fn(conn)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+        conn.execute("COMMIT")
+
+        return res
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            raise RuntimeError("SQLite database is not connected")
+
+        return self._connection
+
+    async def _run(self, fn: Callable[[], T]) -> T:
+        if self._executor is None:
+            raise RuntimeError("SQLite database is not connected")
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn)
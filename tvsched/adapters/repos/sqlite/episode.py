@@ -0,0 +1,288 @@
+import sqlite3
+import typing
+from typing import Any, Optional, Sequence
+
+from tvsched.adapters.repos.batching import order_by_ids
+from tvsched.adapters.repos.episode.models import EpisodeRecord, SeasonSummaryRecord
+from tvsched.adapters.repos.episode.utils import (
+    map_episode_record_to_model,
+    map_season_summary_record_to_model,
+    merge_episode_updates,
+    paginate_episodes,
+)
+from tvsched.adapters.repos.sqlite.database import SQLiteDatabase
+from tvsched.adapters.repos.sqlite.queries import json_ids
+from tvsched.application.exceptions.episode import EpisodeNotFoundError
+from tvsched.application.models.common import EntitiesByIds
+from tvsched.application.models.episode import (
+    EpisodeAdd,
+    EpisodesCursor,
+    EpisodesPage,
+    EpisodeUpdate,
+    SeasonAirDatesShift,
+)
+from tvsched.entities.episode import Episode, SeasonSummary
+
+
+class SQLiteEpisodeRepo:
+    def __init__(self, db: SQLiteDatabase) -> None:
+        self._db = db
+
+    async def get(self, episode_id: int) -> Episode:
+        """Returns episode from repo by `episode_id`.
+
+        Args:
+            episode_id (int)
+
+        Raises:
+            EpisodeNotFoundError: will be raised if episode with id `episode_id` not in repo
+
+        Returns:
+            Episode
+        """
+
+        query = "SELECT * FROM episodes WHERE id = :id;"
+
+        values = dict(id=episode_id)
+        record = await self._db.fetch_one(query, values)
+
+        if record is None:
+            raise EpisodeNotFoundError(episode_id=episode_id)
+
+        return map_episode_record_to_model(typing.cast(EpisodeRecord, record))
+
+    async def get_many(self, episode_ids: Sequence[int]) -> EntitiesByIds[Episode]:
+        """Returns episodes from repo by `episode_ids` with one query.
+
+        Args:
+            episode_ids (Sequence[int])
+
+        Returns:
+            EntitiesByIds[Episode]: episodes ordered as `episode_ids`
+                and ids of not found episodes
+        """
+
+        query = """
+        SELECT * FROM episodes
+        WHERE id IN (SELECT value FROM json_each(:ids));
+        """
+
+        values = dict(ids=json_ids(episode_ids))
+        records = await self._db.fetch_all(query, values)
+        records = typing.cast(list[EpisodeRecord], records)
+        episodes = {r["id"]: map_episode_record_to_model(r) for r in records}
+
+        return order_by_ids(episode_ids, episodes)
+
+    async def get_episodes(self, show_id: int) -> list[Episode]:
+        """Returns list of tv show episodes with tv show id `show_id`
+        ordered by season and number.
+
+        Args:
+            show_id (int)
+
+        Returns:
+            list[Episode]
+        """
+
+        query = """
+        SELECT * FROM episodes
+        WHERE show_id = :show_id
+        ORDER BY season, number, id;
+        """
+
+        values = dict(show_id=show_id)
+        records = await self._db.fetch_all(query, values)
+        records = typing.cast(list[EpisodeRecord], records)
+
+        return [map_episode_record_to_model(r) for r in records]
+
+    get_episodes_from_show = get_episodes
+
+    async def get_episodes_page(
+        self,
+        show_id: int,
+        season: Optional[int] = None,
+        after: Optional[EpisodesCursor] = None,
+        limit: int = 100,
+    ) -> EpisodesPage:
+        """Returns page of episodes of show with id `show_id`
+        ordered by season, number and id.
+
+        Args:
+            show_id (int)
+            season (Optional[int]): if not None only episodes of the season are returned
+            after (Optional[EpisodesCursor]): cursor of previous page.
+                If None the first page is returned
+            limit (int): max number of episodes of page
+
+        Returns:
+            EpisodesPage
+        """
+
+        conditions = ["show_id = :show_id"]
+        values: dict[str, Any] = dict(show_id=show_id, limit=limit + 1)
+
+        if season is not None:
+            conditions.append("season = :season")
+            values["season"] = season
+
+        if after is not None:
+            conditions.append(
+                "(season, number, id) > (:after_season, :after_number, :after_id)"
+            )
+            values.update(
+                after_season=after.season,
+                after_number=after.number,
+                after_id=after.id,
+            )
+
+        query = f"""
+        SELECT * FROM episodes
+        WHERE {" AND ".join(conditions)}
+        ORDER BY season, number, id
+        LIMIT :limit;
+        """
+
+        records = await self._db.fetch_all(query, values)
+        records = typing.cast(list[EpisodeRecord], records)
+        episodes = [map_episode_record_to_model(r) for r in records]
+
+        return paginate_episodes(episodes, limit)
+
+    async def get_season_summaries(self, show_id: int) -> list[SeasonSummary]:
+        """Returns number of episodes and range of air dates of every season
+        of show with id `show_id` ordered by season.
+
+        Args:
+            show_id (int)
+
+        Returns:
+            list[SeasonSummary]
+        """
+
+        query = """
+        SELECT season, count(*) AS episodes_count,
+        min(air_date) AS first_air_date, max(air_date) AS last_air_date
+        FROM episodes
+        WHERE show_id = :show_id
+        GROUP BY season
+        ORDER BY season;
+        """
+
+        values = dict(show_id=show_id)
+        records = await self._db.fetch_all(query, values)
+        records = typing.cast(list[SeasonSummaryRecord], records)
+
+        return [map_season_summary_record_to_model(r) for r in records]
+
+    async def add(self, episode: EpisodeAdd) -> None:
+        """Adds new episode to repo.
+
+        Args:
+            episode (EpisodeAdd): data for adding episode to repo.
+        """
+
+        query = """
+        INSERT INTO episodes (name, season, number, air_date, show_id)
+        VALUES (:name, :season, :number, :air_date, :show_id);
+        """
+
+        values = dict(
+            name=episode.name,
+            season=episode.season,
+            number=episode.number,
+            air_date=int(episode.air_date.timestamp()),
+            show_id=episode.show_id,
+        )
+        await self._db.execute(query, values)
+
+    async def update(self, episode: EpisodeUpdate) -> None:
+        """Updates episode in repo.
+
+        Args:
+            episode (EpisodeAdd): data for updating episode to repo
+        """
+
+        await self.update_many([episode])
+
+    async def update_many(self, episodes: Sequence[EpisodeUpdate]) -> None:
+        """Updates episodes in repo in one transaction.
+
+        If several updates have the same episode id, they are applied in order.
+
+        Args:
+            episodes (Sequence[EpisodeUpdate]): data for updating episodes in repo
+        """
+
+        merged = merge_episode_updates(episodes)
+        if not merged:
+            return
+
+        query = """
+        UPDATE episodes
+        SET name = COALESCE(:name, name),
+            season = COALESCE(:season, season),
+            number = COALESCE(:number, number),
+            air_date = COALESCE(:air_date, air_date),
+            show_id = COALESCE(:show_id, show_id)
+        WHERE id = :id;
+        """
+
+        values: list[dict[str, Any]] = [
+            dict(
+                id=e.id,
+                name=e.name,
+                season=e.season,
+                number=e.number,
+                air_date=None if e.air_date is None else int(e.air_date.timestamp()),
+                show_id=e.show_id,
+            )
+            for e in merged
+        ]
+
+        def update(conn: sqlite3.Connection) -> None:
+            conn.executemany(query, values)
+
+        # progress of schedules is computed on read, so it is not refreshed
+        await self._db.transaction(update)
+
+    async def shift_season_air_dates(self, shift: SeasonAirDatesShift) -> int:
+        """Shifts air dates of all episodes of show season by `shift.delta`
+        without reading episodes.
+
+        Args:
+            shift (SeasonAirDatesShift): data for shifting season air dates
+
+        Returns:
+            int: number of shifted episodes
+        """
+
+        query = """
+        UPDATE episodes
+        SET air_date = air_date + :delta
+        WHERE show_id = :show_id AND season = :season;
+        """
+
+        values = dict(
+            show_id=shift.show_id,
+            season=shift.season,
+            delta=int(shift.delta.total_seconds()),
+        )
+
+        def shift_air_dates(conn: sqlite3.Connection) -> int:
+            return conn.execute(query, values).rowcount
+
+        return await self._db.transaction(shift_air_dates)
+
+    async def delete(self, episode_id: int) -> None:
+        """Deletes episode with id `episode_id` from repo.
+
+        Args:
+            episode_id (int)
+        """
+
+        query = "DELETE FROM episodes WHERE id = :id;"
+
+        values = dict(id=episode_id)
+        await self._db.execute(query, values)
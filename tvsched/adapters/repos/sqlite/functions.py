@@ -0,0 +1,49 @@
+"""SQL functions registered in SQLite connection."""
+
+import re
+
+# SQLite stand-in of `<%` operator of pg_trgm
+WORD_SIMILARITY_THRESHOLD = 0.5
+
+_WORD = re.compile(r"\w+")
+
+
+def _word_trigrams(word: str) -> set[str]:
+    padded = f"  {word} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def word_similarity(query: str, text: str) -> float:
+    """Returns similarity of trigrams of `query` and the most similar
+    sequence of words of `text` like `word_similarity` of pg_trgm.
+
+    Example:
+        >>> word_similarity("thrones", "Game of Thrones")
+        1.0
+        >>> round(word_similarity("thrnes", "Game of Thrones"), 2)
+        0.5
+
+    Args:
+        query (str)
+        text (str)
+
+    Returns:
+        float: from 0 to 1
+    """
+
+    query_trigrams: set[str] = set()
+    for word in _WORD.findall(query.lower()):
+        query_trigrams |= _word_trigrams(word)
+    if not query_trigrams:
+        return 0.0
+
+    words = [_word_trigrams(w) for w in _WORD.findall(text.lower())]
+    best = 0.0
+    for start in range(len(words)):
+        trigrams: set[str] = set()
+        for word_trigrams in words[start:]:
+            trigrams |= word_trigrams
+            shared = len(query_trigrams & trigrams)
+            best = max(best, shared / len(query_trigrams | trigrams))
+
+    return best
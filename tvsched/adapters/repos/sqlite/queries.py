@@ -0,0 +1,43 @@
+"""SQL fragments shared by SQLite repos."""
+
+import json
+from typing import Any, Iterable
+
+
+def shows_with_cast(shows: str) -> str:
+    """Returns query of shows from subquery `shows` joined with their cast.
+
+    Rows of one show are adjacent, so they can be grouped
+    with `group_show_records`.
+
+    Args:
+        shows (str): subquery returning rows of `shows` table
+
+    Returns:
+        str
+    """
+
+    return f"""
+    SELECT s.id, s.name, s.seasons_count, s.image_url, s.version,
+    a.id AS actor_id, a.name AS actor_name, a.image_url AS actor_image_url
+    FROM ({shows}) s
+    JOIN actors_to_shows ats ON ats.show_id = s.id
+    JOIN actors a ON a.id = ats.actor_id
+    """
+
+
+def json_ids(ids: Iterable[Any]) -> str:
+    """Returns ids as JSON array for passing them to `json_each`.
+
+    Example:
+        >>> json_ids([3, 1])
+        '[3, 1]'
+
+    Args:
+        ids (Iterable[Any]): ints or strings
+
+    Returns:
+        str
+    """
+
+    return json.dumps(list(ids))
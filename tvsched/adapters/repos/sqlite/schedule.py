@@ -0,0 +1,473 @@
+import datetime
+import sqlite3
+import typing
+import uuid
+from typing import Any, Optional
+
+from tvsched.adapters.repos.episode.models import EpisodeRecord
+from tvsched.adapters.repos.schedule.models import (
+    ScheduleChangeRecord,
+    ScheduleShowVersionRecord,
+    ShowProgressRecord,
+)
+from tvsched.adapters.repos.schedule.utils import (
+    make_schedule_version,
+    map_episode_record_to_model,
+    map_schedule_change_records_to_model,
+    map_show_progress_record_to_model,
+)
+from tvsched.adapters.repos.show.models import ShowRecord
+from tvsched.adapters.repos.show.utils import (
+    group_show_records,
+    map_show_records_to_model,
+)
+from tvsched.adapters.repos.sqlite.changes import log_schedule_changes
+from tvsched.adapters.repos.sqlite.database import (
+    SQLiteDatabase,
+    is_constraint_error,
+)
+from tvsched.adapters.repos.sqlite.queries import shows_with_cast
+from tvsched.adapters.repos.sqlite.show import get_shows_from_schedule
+from tvsched.application.exceptions.schedule import (
+    EpisodeAlreadyMarkedAsWatchedError,
+    EpisodeOrScheduleNotFoundError,
+    ShowAlreadyExistsInScheduleError,
+    ShowOrScheduleNotFoundError,
+)
+from tvsched.application.models.schedule import EpisodeInSchedule, ShowInSchedule
+from tvsched.entities.episode import Episode
+from tvsched.entities.schedule import (
+    ScheduleChangeKind,
+    ScheduleChanges,
+    ShowProgress,
+)
+from tvsched.entities.show import Show
+
+# progress is computed on read from rows of `shows_to_schedules` with alias `sts`
+_NEXT_EPISODE_ID = """(
+    SELECT e.id FROM episodes e
+    WHERE e.show_id = sts.show_id
+    AND NOT EXISTS (
+        SELECT 1 FROM watched_episodes we
+        WHERE we.user_id = sts.user_id AND we.episode_id = e.id
+    )
+    ORDER BY e.season, e.number, e.id
+    LIMIT 1
+)"""
+
+
+class SQLiteScheduleRepo:
+    def __init__(self, db: SQLiteDatabase) -> None:
+        self._db = db
+
+    async def get_shows_from_schedule(
+        self,
+        user_id: uuid.UUID,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> list[Show]:
+        """Returns list of shows from user schedule.
+
+        Args:
+            user_id (uuid.UUID): user schedule user user_id
+
+        Returns:
+            list[Show]
+        """
+
+        return await get_shows_from_schedule(self._db, user_id, limit, offset)
+
+    async def add_show_to_schedule(self, show_in_schedule: ShowInSchedule) -> None:
+        """Adds show with id `show_in_schedule.show_id` to user schedule
+        with id `show_in_schedule.user_id`.
+
+        Args:
+            show_in_schedule (ShowInSchedule): data for adding show to schedule
+
+        Raises:
+            ShowOrScheduleNotFoundError: will be raised if show or user not in repo
+            ShowAlreadyExistsInScheduleError: will be raised if show already
+                in schedule
+        """
+
+        user_id = str(show_in_schedule.user_id)
+        show_id = show_in_schedule.show_id
+
+        def add(conn: sqlite3.Connection) -> None:
+            conn.execute(
+                "INSERT INTO shows_to_schedules (user_id, show_id)"
+                " VALUES (:user_id, :show_id);",
+                dict(user_id=user_id, show_id=show_id),
+            )
+            log_schedule_changes(
+                conn, ScheduleChangeKind.SHOW, [(user_id, show_id)], False
+            )
+
+        try:
+            await self._db.transaction(add)
+        except sqlite3.IntegrityError as e:
+            if is_constraint_error(e, "FOREIGN KEY"):
+                raise ShowOrScheduleNotFoundError(show_in_schedule)
+            if is_constraint_error(e, "UNIQUE"):
+                raise ShowAlreadyExistsInScheduleError(show_in_schedule)
+            raise
+
+    add_to_schedule = add_show_to_schedule
+
+    async def delete_show_from_schedule(self, show_in_schedule: ShowInSchedule) -> None:
+        """Deletes show with id `show_in_schedule.show_id` from user schedule
+        with id `show_in_schedule.user_id`.
+
+        Args:
+            show_in_schedule (ShowInSchedule): data for deleting show to schedule
+        """
+
+        user_id = str(show_in_schedule.user_id)
+        show_id = show_in_schedule.show_id
+
+        def delete(conn: sqlite3.Connection) -> None:
+            deleted = conn.execute(
+                "DELETE FROM shows_to_schedules"
+                " WHERE user_id = :user_id AND show_id = :show_id;",
+                dict(user_id=user_id, show_id=show_id),
+            ).rowcount
+            if deleted:
+                log_schedule_changes(
+                    conn, ScheduleChangeKind.SHOW, [(user_id, show_id)], True
+                )
+
+        await self._db.transaction(delete)
+
+    delete_from_schedule = delete_show_from_schedule
+
+    async def get_suggested_shows(self, user_id: uuid.UUID) -> list[Show]:
+        """Returns list of suggested shows for user with id `user_id`.
+
+        Args:
+            user_id (uuid.UUID)
+
+        Returns:
+            list[Show]
+        """
+
+        shows_query = """
+        SELECT * FROM shows WHERE id IN (
+            SELECT ats.show_id FROM actors_to_shows ats
+            WHERE ats.actor_id IN (
+                SELECT ats2.actor_id FROM shows_to_schedules sts
+                JOIN actors_to_shows ats2 ON ats2.show_id = sts.show_id
+                WHERE sts.user_id = :user_id
+            )
+        )
+        """
+        query = f"""
+        {shows_with_cast(shows_query)}
+        ORDER BY s.id, a.id;
+        """
+
+        values = dict(user_id=str(user_id))
+        records = await self._db.fetch_all(query, values)
+        records = typing.cast(list[ShowRecord], records)
+        grouped_records = group_show_records(records)
+
+        return [map_show_records_to_model(rs) for rs in grouped_records]
+
+    async def get_upcoming_episodes_from_schedule(
+        self,
+        user_id: uuid.UUID,
+        starts_at: datetime.datetime,
+        ends_at: datetime.datetime,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> list[Episode]:
+        """Returns episodes of shows from user schedule which air
+        from `starts_at` (inclusive) to `ends_at` (exclusive) ordered by air date.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+            starts_at (datetime.datetime)
+            ends_at (datetime.datetime)
+            limit (Optional[int]): max number of episodes. If None all episodes will be returned
+            offset (Optional[int])
+
+        Returns:
+            list[Episode]
+        """
+
+        query = """
+        SELECT e.*
+        FROM shows_to_schedules sts
+        JOIN episodes e ON e.show_id = sts.show_id
+        WHERE sts.user_id = :user_id
+        AND e.air_date >= :starts_at AND e.air_date < :ends_at
+        ORDER BY e.air_date, e.id
+        LIMIT COALESCE(:limit, -1) OFFSET COALESCE(:offset, 0);
+        """
+
+        values = dict(
+            user_id=str(user_id),
+            starts_at=int(starts_at.timestamp()),
+            ends_at=int(ends_at.timestamp()),
+            limit=limit,
+            offset=offset,
+        )
+        records = await self._db.fetch_all(query, values)
+        records = typing.cast(list[EpisodeRecord], records)
+
+        return [map_episode_record_to_model(r) for r in records]
+
+    async def get_first_unwatched_episodes_from_schedule(
+        self, user_id: uuid.UUID
+    ) -> list[Episode]:
+        """Returns first unwatched episode of each show from user schedule
+        ordered by show id.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+
+        Returns:
+            list[Episode]
+        """
+
+        query = f"""
+        SELECT e.* FROM shows_to_schedules sts
+        JOIN episodes e ON e.id = {_NEXT_EPISODE_ID}
+        WHERE sts.user_id = :user_id
+        ORDER BY sts.show_id;
+        """
+
+        values = dict(user_id=str(user_id))
+        records = await self._db.fetch_all(query, values)
+        records = typing.cast(list[EpisodeRecord], records)
+
+        return [map_episode_record_to_model(r) for r in records]
+
+    async def mark_episode_as_watched(
+        self, episode_in_schedule: EpisodeInSchedule
+    ) -> None:
+        """Marks episode with `episode_id` as watched in repo.
+
+        Args:
+            episode_in_schedule (EpisodeInSchedule): data for marking episode
+                as watched in schedule
+
+        Raises:
+            EpisodeOrScheduleNotFoundError: will be raised if episode or schedule does not exists
+            EpisodeAlreadyExistsInScheduleError: will be raised if episode already marked as watched in schedule
+        """
+
+        user_id = str(episode_in_schedule.user_id)
+        episode_id = episode_in_schedule.episode_id
+
+        def mark(conn: sqlite3.Connection) -> None:
+            conn.execute(
+                "INSERT INTO watched_episodes (user_id, episode_id)"
+                " VALUES (:user_id, :episode_id);",
+                dict(user_id=user_id, episode_id=episode_id),
+            )
+            log_schedule_changes(
+                conn,
+                ScheduleChangeKind.WATCHED_EPISODE,
+                [(user_id, episode_id)],
+                False,
+            )
+
+        try:
+            await self._db.transaction(mark)
+        except sqlite3.IntegrityError as e:
+            if is_constraint_error(e, "FOREIGN KEY"):
+                raise EpisodeOrScheduleNotFoundError(episode_in_schedule)
+            if is_constraint_error(e, "UNIQUE"):
+                raise EpisodeAlreadyMarkedAsWatchedError(episode_in_schedule)
+            raise
+
+    async def mark_episode_as_unwatched(
+        self, episode_in_schedule: EpisodeInSchedule
+    ) -> None:
+        """Marks episode with `episode_id` as unwatched in repo.
+
+        Args:
+            episode_in_schedule (EpisodeInSchedule): data for marking episode
+                as watched in schedule
+        """
+
+        user_id = str(episode_in_schedule.user_id)
+        episode_id = episode_in_schedule.episode_id
+
+        def unmark(conn: sqlite3.Connection) -> None:
+            deleted = conn.execute(
+                "DELETE FROM watched_episodes"
+                " WHERE user_id = :user_id AND episode_id = :episode_id;",
+                dict(user_id=user_id, episode_id=episode_id),
+            ).rowcount
+            if deleted:
+                log_schedule_changes(
+                    conn,
+                    ScheduleChangeKind.WATCHED_EPISODE,
+                    [(user_id, episode_id)],
+                    True,
+                )
+
+        await self._db.transaction(unmark)
+
+    async def get_schedule_progress(self, user_id: uuid.UUID) -> list[ShowProgress]:
+        """Returns progress of watching each show from user schedule.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+
+        Returns:
+            list[ShowProgress]
+        """
+
+        query = f"""
+        SELECT sts.show_id,
+        (
+            SELECT count(*) FROM watched_episodes we
+            JOIN episodes e ON e.id = we.episode_id
+            WHERE we.user_id = sts.user_id AND e.show_id = sts.show_id
+        ) AS watched_count,
+        (
+            SELECT count(*) FROM episodes e WHERE e.show_id = sts.show_id
+        ) AS total_count,
+        {_NEXT_EPISODE_ID} AS next_episode_id
+        FROM shows_to_schedules sts
+        WHERE sts.user_id = :user_id
+        ORDER BY sts.show_id;
+        """
+
+        values = dict(user_id=str(user_id))
+        records = await self._db.fetch_all(query, values)
+        records = typing.cast(list[ShowProgressRecord], records)
+
+        return [map_show_progress_record_to_model(r) for r in records]
+
+    async def get_schedule_version(self, user_id: uuid.UUID) -> str:
+        """Returns version stamp of shows from user schedule without loading them.
+
+        Stamp is built only from ids and versions of shows from schedule,
+        see `make_schedule_version`.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+
+        Returns:
+            str: version stamp, changes on every change of shows in schedule
+                or of scheduled shows and their casts
+        """
+
+        query = """
+        SELECT s.id, s.version
+        FROM shows_to_schedules sts
+        JOIN shows s ON s.id = sts.show_id
+        WHERE sts.user_id = :user_id;
+        """
+
+        values = dict(user_id=str(user_id))
+        records = await self._db.fetch_all(query, values)
+        records = typing.cast(list[ScheduleShowVersionRecord], records)
+
+        return make_schedule_version(records)
+
+    async def get_schedule_changes_since(
+        self, user_id: uuid.UUID, version: int
+    ) -> ScheduleChanges:
+        """Returns changes of user schedule after version `version`.
+
+        If changes after `version` were compacted or `version` is unknown,
+        returns reset flag and whole schedule state as changes.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+            version (int): version of schedule known by client, 0 for first sync
+
+        Returns:
+            ScheduleChanges
+        """
+
+        query = """
+        WITH r AS (
+            SELECT user_id, version AS current_version,
+            :version < purged_version OR :version > version AS reset
+            FROM schedule_versions
+            WHERE user_id = :user_id
+        )
+        SELECT r.current_version, r.reset,
+        c.kind, c.target_id, c.version, c.deleted
+        FROM r
+        LEFT JOIN schedule_changes c ON c.user_id = r.user_id AND CASE
+            WHEN r.reset THEN NOT c.deleted
+            ELSE c.version > :version
+        END
+        ORDER BY c.version;
+        """
+
+        values = dict(user_id=str(user_id), version=version)
+        rows = await self._db.fetch_all(query, values)
+
+        if not rows:
+            return ScheduleChanges(version=0, reset=version > 0, changes=[])
+
+        records = [_map_change_row(r) for r in rows]
+
+        return map_schedule_change_records_to_model(records)
+
+    async def compact_schedule_changes(
+        self, changed_before: datetime.datetime, batch_size: int = 10_000
+    ) -> int:
+        """Deletes changes about deleted shows and unwatched episodes
+        made before `changed_before`.
+
+        Purged versions are remembered, so clients with older cursors
+        get reset of their state.
+
+        Args:
+            changed_before (datetime.datetime)
+            batch_size (int): max number of deleted changes
+
+        Returns:
+            int: number of deleted changes
+        """
+
+        query = """
+        DELETE FROM schedule_changes
+        WHERE (user_id, kind, target_id) IN (
+            SELECT user_id, kind, target_id FROM schedule_changes
+            WHERE deleted AND changed_at < :changed_before
+            LIMIT :batch_size
+        )
+        RETURNING user_id, version;
+        """
+
+        purge_query = """
+        UPDATE schedule_versions
+        SET purged_version = max(purged_version, :version)
+        WHERE user_id = :user_id;
+        """
+
+        values = dict(changed_before=changed_before.timestamp(), batch_size=batch_size)
+
+        def compact(conn: sqlite3.Connection) -> int:
+            purged = conn.execute(query, values).fetchall()
+
+            purged_versions: dict[str, int] = {}
+            for user_id, version in purged:
+                purged_versions[user_id] = max(version, purged_versions.get(user_id, 0))
+            conn.executemany(
+                purge_query,
+                [dict(user_id=u, version=v) for u, v in purged_versions.items()],
+            )
+
+            return len(purged)
+
+        return await self._db.transaction(compact)
+
+
+def _map_change_row(row: sqlite3.Row) -> ScheduleChangeRecord:
+    # SQLite returns booleans as integers
+    record: dict[str, Any] = dict(row)
+    record["reset"] = bool(record["reset"])
+    if record["deleted"] is not None:
+        record["deleted"] = bool(record["deleted"])
+
+    return typing.cast(ScheduleChangeRecord, record)
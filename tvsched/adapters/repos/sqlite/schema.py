@@ -0,0 +1,98 @@
+"""Schema of SQLite database, mirrors Postgres schema with migrations.
+
+Ids of users are stored as text, air dates and times of changes
+as unix time.
+"""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    username TEXT NOT NULL UNIQUE,
+    password_hash TEXT NOT NULL,
+    role TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS shows (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    seasons_count INTEGER NOT NULL,
+    image_url TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1
+);
+
+CREATE TABLE IF NOT EXISTS actors (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    image_url TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS actors_to_shows (
+    show_id INTEGER NOT NULL REFERENCES shows (id) ON DELETE CASCADE,
+    actor_id INTEGER NOT NULL REFERENCES actors (id) ON DELETE CASCADE,
+    PRIMARY KEY (show_id, actor_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS actors_to_shows_actor_id_idx
+    ON actors_to_shows (actor_id);
+
+CREATE TABLE IF NOT EXISTS episodes (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    number INTEGER NOT NULL,
+    air_date INTEGER NOT NULL,
+    show_id INTEGER NOT NULL REFERENCES shows (id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS episodes_show_id_season_number_idx
+    ON episodes (show_id, season, number);
+CREATE INDEX IF NOT EXISTS episodes_show_id_air_date_idx
+    ON episodes (show_id, air_date);
+
+CREATE TABLE IF NOT EXISTS shows_to_schedules (
+    user_id TEXT NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    show_id INTEGER NOT NULL REFERENCES shows (id) ON DELETE CASCADE,
+    PRIMARY KEY (user_id, show_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS shows_to_schedules_show_id_idx
+    ON shows_to_schedules (show_id);
+
+CREATE TABLE IF NOT EXISTS watched_episodes (
+    user_id TEXT NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    episode_id INTEGER NOT NULL REFERENCES episodes (id) ON DELETE CASCADE,
+    PRIMARY KEY (user_id, episode_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS watched_episodes_episode_id_idx
+    ON watched_episodes (episode_id);
+
+CREATE TABLE IF NOT EXISTS schedule_versions (
+    user_id TEXT PRIMARY KEY REFERENCES users (id) ON DELETE CASCADE,
+    version INTEGER NOT NULL,
+    purged_version INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS schedule_changes (
+    user_id TEXT NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    target_id INTEGER NOT NULL,
+    version INTEGER NOT NULL,
+    deleted INTEGER NOT NULL,
+    changed_at REAL NOT NULL,
+    PRIMARY KEY (user_id, kind, target_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS schedule_changes_user_id_version_idx
+    ON schedule_changes (user_id, version);
+
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    token_hash TEXT NOT NULL UNIQUE,
+    user_id TEXT NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    expires_at REAL NOT NULL,
+    revoked_at REAL
+);
+
+CREATE INDEX IF NOT EXISTS sessions_user_id_idx ON sessions (user_id);
+"""
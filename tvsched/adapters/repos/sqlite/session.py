@@ -0,0 +1,83 @@
+import datetime
+import time
+import uuid
+
+from tvsched.adapters.repos.sqlite.database import SQLiteDatabase
+from tvsched.application.exceptions.auth import InvalidRefreshTokenError
+from tvsched.application.models.auth import SessionAdd, SessionInRepo, UserInToken
+from tvsched.entities.auth import Role
+
+
+class SQLiteSessionRepo:
+    def __init__(self, db: SQLiteDatabase) -> None:
+        self._db = db
+
+    async def add_session(self, session: SessionAdd) -> None:
+        """Adds session to repo.
+
+        Args:
+            session (SessionAdd)
+        """
+
+        query = """
+        INSERT INTO sessions (token_hash, user_id, expires_at)
+        VALUES (:token_hash, :user_id, :expires_at);
+        """
+
+        values = dict(
+            token_hash=session.token_hash,
+            user_id=str(session.user_id),
+            expires_at=session.expires_at.timestamp(),
+        )
+        await self._db.execute(query, values)
+
+    async def get_session(self, token_hash: str) -> SessionInRepo:
+        """Returns session by hash of its refresh token.
+
+        Args:
+            token_hash (str): sha256 hex digest of refresh token
+
+        Raises:
+            InvalidRefreshTokenError: will be raised if session not in repo
+                or revoked
+
+        Returns:
+            SessionInRepo
+        """
+
+        query = """
+        SELECT s.id, s.user_id, u.role, s.expires_at FROM sessions s
+        JOIN users u ON u.id = s.user_id
+        WHERE s.token_hash = :token_hash AND s.revoked_at IS NULL;
+        """
+
+        values = dict(token_hash=token_hash)
+        record = await self._db.fetch_one(query, values)
+
+        if record is None:
+            raise InvalidRefreshTokenError()
+
+        return SessionInRepo(
+            id=record["id"],
+            user=UserInToken(
+                id=uuid.UUID(record["user_id"]), role=Role(record["role"])
+            ),
+            expires_at=datetime.datetime.fromtimestamp(
+                record["expires_at"], datetime.timezone.utc
+            ),
+        )
+
+    async def revoke_session(self, token_hash: str) -> None:
+        """Revokes session by hash of its refresh token.
+
+        Args:
+            token_hash (str): sha256 hex digest of refresh token
+        """
+
+        query = """
+        UPDATE sessions SET revoked_at = :revoked_at
+        WHERE token_hash = :token_hash AND revoked_at IS NULL;
+        """
+
+        values = dict(token_hash=token_hash, revoked_at=time.time())
+        await self._db.execute(query, values)
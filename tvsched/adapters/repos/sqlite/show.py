@@ -0,0 +1,426 @@
+import sqlite3
+import typing
+import uuid
+from typing import Optional, Sequence
+
+from tvsched.adapters.repos.batching import order_by_ids
+from tvsched.adapters.repos.show.details import map_show_details_records_to_model
+from tvsched.adapters.repos.show.models import ShowDetailsRecord, ShowRecord
+from tvsched.adapters.repos.show.utils import (
+    group_show_records,
+    map_show_records_to_model,
+)
+from tvsched.adapters.repos.sqlite.changes import log_schedule_changes
+from tvsched.adapters.repos.sqlite.database import SQLiteDatabase
+from tvsched.adapters.repos.sqlite.functions import WORD_SIMILARITY_THRESHOLD
+from tvsched.adapters.repos.sqlite.queries import json_ids, shows_with_cast
+from tvsched.application.exceptions.show import ShowNotFoundError
+from tvsched.application.models.common import EntitiesByIds, Versioned
+from tvsched.application.models.show import ShowAdd, ShowUpdate
+from tvsched.entities.schedule import ScheduleChangeKind
+from tvsched.entities.show import Show, ShowDetails
+
+
+class SQLiteShowRepo:
+    def __init__(self, db: SQLiteDatabase) -> None:
+        self._db = db
+
+    async def get(self, show_id: int) -> Show:
+        """Returns show from repo by `show_id`.
+
+        Args:
+            show_id (show)
+
+        Raises:
+            ShowNotFoundError: will be raised if show with id `show_id` not in repo
+
+        Returns:
+            Show
+        """
+
+        query = f"""
+        {shows_with_cast("SELECT * FROM shows WHERE id = :show_id")}
+        ORDER BY a.id;
+        """
+
+        values = dict(show_id=show_id)
+        records = await self._db.fetch_all(query, values)
+        records = typing.cast(list[ShowRecord], records)
+
+        if not records:
+            raise ShowNotFoundError(show_id=show_id)
+
+        return map_show_records_to_model(records)
+
+    async def get_versioned(self, show_id: int) -> Versioned[Show]:
+        """Returns show from repo by `show_id` with its version stamp.
+
+        Show and version are read by one query.
+
+        Args:
+            show_id (show)
+
+        Raises:
+            ShowNotFoundError: will be raised if show with id `show_id` not in repo
+
+        Returns:
+            Versioned[Show]
+        """
+
+        query = f"""
+        {shows_with_cast("SELECT * FROM shows WHERE id = :show_id")}
+        ORDER BY a.id;
+        """
+
+        values = dict(show_id=show_id)
+        records = await self._db.fetch_all(query, values)
+        records = typing.cast(list[ShowRecord], records)
+
+        if not records:
+            raise ShowNotFoundError(show_id=show_id)
+
+        show = map_show_records_to_model(records)
+
+        return Versioned(version=str(records[0]["version"]), entity=show)
+
+    async def get_details(
+        self, show_id: int, user_id: Optional[uuid.UUID] = None
+    ) -> ShowDetails:
+        """Returns show with its cast and episodes grouped by seasons.
+
+        Show, cast and episodes are read in one transaction.
+
+        Args:
+            show_id (int)
+            user_id (Optional[uuid.UUID]): if not None ids of episodes
+                watched by user are returned too
+
+        Raises:
+            ShowNotFoundError: will be raised if show with id `show_id` not in repo
+
+        Returns:
+            ShowDetails
+        """
+
+        values = dict(show_id=show_id, user_id=str(user_id))
+
+        def get_details(conn: sqlite3.Connection) -> Optional[ShowDetails]:
+            record = conn.execute(
+                "SELECT id, name, seasons_count, image_url FROM shows"
+                " WHERE id = :show_id;",
+                values,
+            ).fetchone()
+            if record is None:
+                return None
+
+            cast = conn.execute(
+                """
+                SELECT a.* FROM actors_to_shows ats
+                JOIN actors a ON a.id = ats.actor_id
+                WHERE ats.show_id = :show_id
+                ORDER BY a.id;
+                """,
+                values,
+            ).fetchall()
+            episodes = conn.execute(
+                """
+                SELECT * FROM episodes
+                WHERE show_id = :show_id
+                ORDER BY season, number, id;
+                """,
+                values,
+            ).fetchall()
+            watched_episode_ids = None
+            if user_id is not None:
+                watched = conn.execute(
+                    """
+                    SELECT we.episode_id FROM watched_episodes we
+                    JOIN episodes e ON e.id = we.episode_id
+                    WHERE we.user_id = :user_id AND e.show_id = :show_id
+                    ORDER BY we.episode_id;
+                    """,
+                    values,
+                )
+                watched_episode_ids = [r[0] for r in watched]
+
+            return map_show_details_records_to_model(
+                record, cast, episodes, watched_episode_ids
+            )
+
+        details = await self._db.transaction(get_details)
+
+        if details is None:
+            raise ShowNotFoundError(show_id=show_id)
+
+        return details
+
+    async def get_version(self, show_id: int) -> str:
+        """Returns version stamp of show with id `show_id` without loading its cast.
+
+        Args:
+            show_id (int)
+
+        Raises:
+            ShowNotFoundError: will be raised if show with id `show_id` not in repo
+
+        Returns:
+            str: version stamp, changes on every update of show or its cast
+        """
+
+        query = "SELECT version FROM shows WHERE id = :show_id;"
+
+        values = dict(show_id=show_id)
+        version = await self._db.execute(query, values)
+
+        if version is None:
+            raise ShowNotFoundError(show_id=show_id)
+
+        return str(version)
+
+    async def get_many(self, show_ids: Sequence[int]) -> EntitiesByIds[Show]:
+        """Returns shows from repo by `show_ids` with one query.
+
+        Args:
+            show_ids (Sequence[int])
+
+        Returns:
+            EntitiesByIds[Show]: shows ordered as `show_ids` and ids of not found shows
+        """
+
+        shows_query = """
+        SELECT * FROM shows WHERE id IN (SELECT value FROM json_each(:show_ids))
+        """
+        query = f"""
+        {shows_with_cast(shows_query)}
+        ORDER BY s.id, a.id;
+        """
+
+        values = dict(show_ids=json_ids(show_ids))
+        records = await self._db.fetch_all(query, values)
+        records = typing.cast(list[ShowRecord], records)
+        grouped_records = group_show_records(records)
+        shows = {rs[0]["id"]: map_show_records_to_model(rs) for rs in grouped_records}
+
+        return order_by_ids(show_ids, shows)
+
+    async def get_shows(
+        self, limit: Optional[int] = None, offset: Optional[int] = None
+    ) -> list[Show]:
+        """Returns list of shows from repo by.
+
+        Args:
+            limit (Optional[int]): max number of shows. If None all shows will be returned
+            offset (Optional[int])
+
+        Returns:
+            list[Show]
+        """
+
+        shows_query = """
+        SELECT * FROM shows
+        ORDER BY id
+        LIMIT COALESCE(:limit, -1) OFFSET COALESCE(:offset, 0)
+        """
+        query = f"""
+        {shows_with_cast(shows_query)}
+        ORDER BY s.id, a.id;
+        """
+
+        values = dict(limit=limit, offset=offset)
+        records = await self._db.fetch_all(query, values)
+        records = typing.cast(list[ShowRecord], records)
+        grouped_records = group_show_records(records)
+
+        return [map_show_records_to_model(rs) for rs in grouped_records]
+
+    async def search(
+        self, query: str, limit: int, include_cast: bool = False
+    ) -> list[Show]:
+        """Returns shows with name similar to `query` ordered by relevance.
+
+        Args:
+            query (str): words of show name, may contain typos
+            limit (int): max number of shows
+            include_cast (bool): if True shows with actor name
+                similar to `query` will be returned too
+
+        Returns:
+            list[Show]
+        """
+
+        cast_matches = """
+            UNION ALL
+            SELECT ats.show_id AS id, word_similarity(:query, a.name) AS rank
+            FROM actors a
+            JOIN actors_to_shows ats ON ats.actor_id = a.id
+        """
+
+        sql_query = f"""
+        WITH matches AS (
+            SELECT id, word_similarity(:query, name) AS rank
+            FROM shows
+            {cast_matches if include_cast else ""}
+        ), ranked AS (
+            SELECT id, max(rank) AS rank
+            FROM matches
+            GROUP BY id
+            HAVING max(rank) >= :threshold
+            ORDER BY rank DESC, id
+            LIMIT :limit
+        )
+        {shows_with_cast("SELECT * FROM shows")}
+        JOIN ranked r ON r.id = s.id
+        ORDER BY r.rank DESC, s.id, a.id;
+        """
+
+        values = dict(query=query, limit=limit, threshold=WORD_SIMILARITY_THRESHOLD)
+        records = await self._db.fetch_all(sql_query, values)
+        records = typing.cast(list[ShowRecord], records)
+        grouped_records = group_show_records(records)
+
+        return [map_show_records_to_model(rs) for rs in grouped_records]
+
+    async def add(self, show: ShowAdd) -> None:
+        """Adds show to repo.
+
+        Args:
+            show (ShowAdd): data for adding show to repo
+        """
+
+        query = """
+        INSERT INTO shows (name, seasons_count, image_url)
+        VALUES (:name, :seasons_count, :image_url);
+        """
+
+        values = dict(
+            name=show.name, seasons_count=show.seasons_count, image_url=show.image_url
+        )
+        await self._db.execute(query, values)
+
+    async def delete(self, show_id: int) -> None:
+        """Deletes show from repo by `show_id`.
+
+        Episodes, cast and schedules with show are deleted with it
+        at once, deletions from schedules are logged for delta sync.
+
+        Args:
+            show_id (show)
+        """
+
+        def delete(conn: sqlite3.Connection) -> None:
+            values = dict(show_id=show_id)
+            schedules = conn.execute(
+                "SELECT user_id, show_id FROM shows_to_schedules"
+                " WHERE show_id = :show_id;",
+                values,
+            ).fetchall()
+            watched_episodes = conn.execute(
+                """
+                SELECT we.user_id, we.episode_id
+                FROM episodes e
+                JOIN watched_episodes we ON we.episode_id = e.id
+                WHERE e.show_id = :show_id;
+                """,
+                values,
+            ).fetchall()
+
+            conn.execute("DELETE FROM shows WHERE id = :show_id;", values)
+
+            log_schedule_changes(conn, ScheduleChangeKind.SHOW, schedules, True)
+            log_schedule_changes(
+                conn, ScheduleChangeKind.WATCHED_EPISODE, watched_episodes, True
+            )
+
+        await self._db.transaction(delete)
+
+    async def update(self, show: ShowUpdate) -> None:
+        """Updates show in repo.
+
+        Args:
+            show (ShowAdd): data for updating show to repo
+        """
+
+        columns_to_update = []
+        values: dict[str, typing.Any] = {}
+
+        name = show.name
+        if name is not None:
+            columns_to_update.append("name = :name")
+            values["name"] = name
+
+        seasons_count = show.seasons_count
+        if seasons_count is not None:
+            columns_to_update.append("seasons_count = :seasons_count")
+            values["seasons_count"] = seasons_count
+
+        image_url = show.image_url
+        if image_url is not None:
+            columns_to_update.append("image_url = :image_url")
+            values["image_url"] = image_url
+
+        columns_to_update.append("version = version + 1")
+
+        query = f"""
+        UPDATE shows
+        SET {", ".join(columns_to_update)}
+        WHERE id = :id;
+        """
+
+        values["id"] = show.id
+
+        await self._db.execute(query, values)
+
+    async def get_shows_from_schedule(
+        self,
+        user_id: uuid.UUID,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> list[Show]:
+        """Returns list of shows from user schedule.
+
+        Args:
+            user_id (uuid.UUID): user schedule user user_id
+
+        Returns:
+            list[Show]
+        """
+
+        return await get_shows_from_schedule(self._db, user_id, limit, offset)
+
+
+async def get_shows_from_schedule(
+    db: SQLiteDatabase,
+    user_id: uuid.UUID,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+) -> list[Show]:
+    """Returns list of shows from user schedule ordered by id.
+
+    Args:
+        db (SQLiteDatabase)
+        user_id (uuid.UUID): user schedule user id
+        limit (Optional[int]): max number of shows. If None all shows will be returned
+        offset (Optional[int])
+
+    Returns:
+        list[Show]
+    """
+
+    shows_query = """
+    SELECT s.* FROM shows_to_schedules sts
+    JOIN shows s ON s.id = sts.show_id
+    WHERE sts.user_id = :user_id
+    ORDER BY s.id
+    LIMIT COALESCE(:limit, -1) OFFSET COALESCE(:offset, 0)
+    """
+    query = f"""
+    {shows_with_cast(shows_query)}
+    ORDER BY s.id, a.id;
+    """
+
+    values = dict(user_id=str(user_id), limit=limit, offset=offset)
+    records = await db.fetch_all(query, values)
+    records = typing.cast(list[ShowRecord], records)
+    grouped_records = group_show_records(records)
+
+    return [map_show_records_to_model(rs) for rs in grouped_records]
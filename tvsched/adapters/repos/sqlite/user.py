@@ -0,0 +1,111 @@
+import sqlite3
+import uuid
+
+from tvsched.adapters.repos.sqlite.database import (
+    SQLiteDatabase,
+    is_constraint_error,
+)
+from tvsched.application.exceptions.auth import (
+    PasswordHashNotUpdatedError,
+    UserAlreadyExistsError,
+    UserNotFoundError,
+)
+from tvsched.application.models.auth import UserInRepo, UserInRepoAdd
+from tvsched.entities.auth import Role
+
+
+class SQLiteUserRepo:
+    def __init__(self, db: SQLiteDatabase) -> None:
+        self._db = db
+
+    async def add_user(self, user: UserInRepoAdd) -> None:
+        """Adds user to repo.
+
+        Args:
+            user (UserInRepoAdd): data for adding user to repo.
+
+        Raises:
+            UserAlreadyExistsError: will be raised when user already exists.
+        """
+
+        query = """
+        INSERT INTO users (id, username, password_hash, role)
+        VALUES (:id, :username, :password_hash, :role);
+        """
+
+        values = dict(
+            id=str(uuid.uuid4()),
+            username=user.username,
+            password_hash=user.password_hash,
+            role=user.role.value,
+        )
+        try:
+            await self._db.execute(query, values)
+        except sqlite3.IntegrityError as e:
+            if is_constraint_error(e, "UNIQUE"):
+                raise UserAlreadyExistsError(user.username)
+            raise
+
+    async def get_user_by_username(self, username: str) -> UserInRepo:
+        """Returns user by username from repo.
+
+        Args:
+            username (str)
+
+        Raises:
+            UserNotFoundError: will be raised if user with name `username` not in repo
+
+        Returns:
+            UserInRepo
+        """
+
+        query = "SELECT * FROM users WHERE username = :username;"
+
+        values = dict(username=username)
+        record = await self._db.fetch_one(query, values)
+
+        if record is None:
+            raise UserNotFoundError(username)
+
+        return UserInRepo(
+            id=uuid.UUID(record["id"]),
+            username=record["username"],
+            password_hash=record["password_hash"],
+            role=Role(record["role"]),
+        )
+
+    async def delete_user(self, user_id: uuid.UUID) -> None:
+        """Deletes user with id `user_id` with schedule and watched episodes.
+
+        Args:
+            user_id (uuid.UUID)
+        """
+
+        query = "DELETE FROM users WHERE id = :id;"
+
+        values = dict(id=str(user_id))
+        await self._db.execute(query, values)
+
+    async def update_password_hash(
+        self, user_id: uuid.UUID, password_hash: str
+    ) -> None:
+        """Replaces password hash of user with id `user_id`.
+
+        Does nothing if user not in repo.
+
+        Args:
+            user_id (uuid.UUID)
+            password_hash (str)
+
+        Raises:
+            PasswordHashNotUpdatedError: will be raised if database can not be
+                written, e.g. it is read-only or locked
+        """
+
+        query = "UPDATE users SET password_hash = :password_hash WHERE id = :id;"
+
+        values = dict(id=str(user_id), password_hash=password_hash)
+        try:
+            await self._db.execute(query, values)
+        except sqlite3.OperationalError as e:
+            raise PasswordHashNotUpdatedError(user_id) from e
@@ -0,0 +1,26 @@
+import typing
+
+from tvsched.adapters.lazy import lazy_exports
+
+if typing.TYPE_CHECKING:
+    from tvsched.adapters.repos.suggestion.graph import CoCastGraph
+    from tvsched.adapters.repos.suggestion.precomputed import PrecomputedSuggestionRepo
+    from tvsched.adapters.repos.suggestion.refresher import SuggestionRefresher
+    from tvsched.adapters.repos.suggestion.repo import CoCastSuggestionRepo
+
+__all__ = [
+    "CoCastGraph",
+    "CoCastSuggestionRepo",
+    "PrecomputedSuggestionRepo",
+    "SuggestionRefresher",
+]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "CoCastGraph": "graph",
+        "PrecomputedSuggestionRepo": "precomputed",
+        "SuggestionRefresher": "refresher",
+        "CoCastSuggestionRepo": "repo",
+    },
+)
@@ -0,0 +1,170 @@
+import array
+import heapq
+import itertools as it
+from collections import Counter
+from typing import Iterable, Optional, Sequence
+
+
+def build_csr(
+    edges: Iterable[tuple[int, int]], size: int
+) -> tuple["array.array[int]", "array.array[int]"]:
+    """Builds compressed sparse rows of adjacency lists from `edges`.
+
+    Neighbours of node `n` are `indices[indptr[n]:indptr[n + 1]]`.
+
+    Example:
+        >>> indptr, indices = build_csr([(2, 7), (0, 5), (2, 6)], size=3)
+        >>> list(indptr), list(indices)
+        ([0, 1, 1, 3], [5, 6, 7])
+
+    Args:
+        edges (Iterable[tuple[int, int]]): node and its neighbour
+        size (int): number of nodes, must be greater than max node
+
+    Returns:
+        tuple[array.array[int], array.array[int]]: indptr and indices
+    """
+
+    sorted_edges = sorted(edges)
+
+    counts = array.array("q", bytes(8 * (size + 1)))
+    for node, _ in sorted_edges:
+        counts[node + 1] += 1
+
+    indptr = array.array("q", it.accumulate(counts))
+    indices = array.array("i", (neighbour for _, neighbour in sorted_edges))
+
+    return indptr, indices
+
+
+class _Adjacency:
+    """Adjacency lists in CSR arrays with overrides of changed lists."""
+
+    def __init__(self, edges: Iterable[tuple[int, int]]) -> None:
+        edges = list(edges)
+        size = max((node for node, _ in edges), default=-1) + 1
+        self.size = size
+        self.indptr, self.indices = build_csr(edges, size)
+        self.overrides: dict[int, "array.array[int]"] = {}
+
+    def get(self, node: int) -> Sequence[int]:
+        override = self.overrides.get(node)
+        if override is not None:
+            return override
+
+        if node >= self.size:
+            return ()
+
+        return self.indices[self.indptr[node] : self.indptr[node + 1]]
+
+    def set(self, node: int, neighbours: Iterable[int]) -> None:
+        self.overrides[node] = array.array("i", sorted(set(neighbours)))
+
+    def edges(self) -> Iterable[tuple[int, int]]:
+        nodes = set(range(self.size)) | set(self.overrides)
+        for node in nodes:
+            for neighbour in self.get(node):
+                yield node, neighbour
+
+
+class CoCastGraph:
+    """Bipartite graph of shows and actors of their casts.
+
+    Adjacency lists of both sides are kept in compact CSR arrays.
+    Changed casts are stored as overrides until their number exceeds
+    `max_overrides`, then arrays are rebuilt.
+    """
+
+    def __init__(
+        self, cast_edges: Iterable[tuple[int, int]] = (), max_overrides: int = 100_000
+    ) -> None:
+        self._max_overrides = max_overrides
+        self.build(cast_edges)
+
+    def build(self, cast_edges: Iterable[tuple[int, int]]) -> None:
+        """Replaces graph with casts from `cast_edges`.
+
+        Args:
+            cast_edges (Iterable[tuple[int, int]]): show id and actor id
+        """
+
+        edges = list(cast_edges)
+        self._actors_of_show = _Adjacency(edges)
+        self._shows_of_actor = _Adjacency((a, s) for s, a in edges)
+
+    def get_cast(self, show_id: int) -> Sequence[int]:
+        """Returns ids of actors from cast of show with id `show_id`.
+
+        Args:
+            show_id (int)
+
+        Returns:
+            Sequence[int]
+        """
+
+        return self._actors_of_show.get(show_id)
+
+    def set_cast(self, show_id: int, actor_ids: Iterable[int]) -> None:
+        """Replaces cast of show with id `show_id`.
+
+        Args:
+            show_id (int)
+            actor_ids (Iterable[int]): empty for deleted show
+        """
+
+        old_cast = set(self.get_cast(show_id))
+        new_cast = set(actor_ids)
+        if old_cast == new_cast:
+            return
+
+        self._actors_of_show.set(show_id, new_cast)
+        for actor_id in old_cast - new_cast:
+            shows = set(self._shows_of_actor.get(actor_id))
+            shows.discard(show_id)
+            self._shows_of_actor.set(actor_id, shows)
+        for actor_id in new_cast - old_cast:
+            shows = set(self._shows_of_actor.get(actor_id))
+            shows.add(show_id)
+            self._shows_of_actor.set(actor_id, shows)
+
+        overrides = len(self._actors_of_show.overrides) + len(
+            self._shows_of_actor.overrides
+        )
+        if overrides > self._max_overrides:
+            self.build(self._actors_of_show.edges())
+
+    def score(
+        self, show_ids: Iterable[int], limit: Optional[int] = None
+    ) -> list[tuple[int, int]]:
+        """Scores shows by number of actors shared with casts of `show_ids`.
+
+        Shows from `show_ids` are not scored.
+
+        Args:
+            show_ids (Iterable[int])
+            limit (Optional[int]): max number of shows. If None all shows
+                with shared actors will be returned
+
+        Returns:
+            list[tuple[int, int]]: show ids and scores by descending score
+        """
+
+        scored_show_ids = set(show_ids)
+        actor_ids = set(
+            it.chain.from_iterable(map(self._actors_of_show.get, scored_show_ids))
+        )
+
+        # counting runs over concatenated adjacency lists in one C loop
+        scores = Counter(
+            it.chain.from_iterable(map(self._shows_of_actor.get, actor_ids))
+        )
+        for show_id in scored_show_ids:
+            scores.pop(show_id, None)
+
+        def rank(item: tuple[int, int]) -> tuple[int, int]:
+            return -item[1], item[0]
+
+        if limit is None:
+            return sorted(scores.items(), key=rank)
+
+        return heapq.nsmallest(limit, scores.items(), key=rank)
@@ -0,0 +1,63 @@
+import typing
+import uuid
+from typing import Union
+
+from databases.core import Connection
+
+from tvsched.adapters.repos.routing import ConnectionRouter
+from tvsched.adapters.repos.show.models import ShowRecord
+from tvsched.adapters.repos.show.utils import (
+    group_show_records,
+    map_show_records_to_model,
+)
+from tvsched.entities.schedule import SuggestedShows
+
+
+class PrecomputedSuggestionRepo:
+    """Reads suggested shows precomputed by `SuggestionRefresher`."""
+
+    def __init__(self, db: Union[Connection, ConnectionRouter]) -> None:
+        self._db = ConnectionRouter.of(db)
+
+    async def get_precomputed_suggested_shows(
+        self, user_id: uuid.UUID
+    ) -> SuggestedShows:
+        """Returns suggested shows precomputed for user with id `user_id`.
+
+        Args:
+            user_id (uuid.UUID)
+
+        Returns:
+            SuggestedShows: ranked shows and time of computation
+        """
+
+        query = """
+        SELECT us.computed_at, s.*, a.id as actor_id, a.name as actor_name,
+        a.image_url as actor_image_url
+        FROM user_suggestions us
+        LEFT JOIN LATERAL unnest(us.show_ids)
+            WITH ORDINALITY AS suggested(show_id, position) ON true
+        LEFT JOIN (
+            shows s
+            JOIN actors_to_shows ats ON ats.show_id = s.id
+            JOIN actors a ON ats.actor_id = a.id
+        ) ON s.id = suggested.show_id AND s.deleted_at IS NULL
+        WHERE us.user_id = :user_id
+        ORDER BY suggested.position, a.id;
+        """
+
+        values = dict(user_id=user_id)
+        db = await self._db.for_read()
+        records = await db.fetch_all(query, values=values)
+
+        if not records:
+            return SuggestedShows(shows=[], computed_at=None)
+
+        # suggested shows could be deleted after computation
+        show_records = typing.cast(
+            list[ShowRecord], [r for r in records if r["id"] is not None]
+        )
+        grouped_records = group_show_records(show_records)
+        shows = [map_show_records_to_model(rs) for rs in grouped_records]
+
+        return SuggestedShows(shows=shows, computed_at=records[0]["computed_at"])
@@ -0,0 +1,60 @@
+"""SQL for queueing refresh of precomputed suggestions of users.
+
+Suggestions of user are stale when their schedule or casts of shows
+from their schedule change. Queue is drained by `SuggestionRefresher`.
+"""
+
+
+def enqueue_users(users_query: str) -> str:
+    """Returns statement which queues users selected by `users_query`.
+
+    Args:
+        users_query (str): query selecting column `user_id`
+
+    Returns:
+        str
+    """
+
+    return f"""
+    INSERT INTO suggestion_refresh_queue (user_id)
+    {users_query}
+    ON CONFLICT (user_id) DO NOTHING
+    """
+
+
+def show_audience(show_ids_query: str) -> str:
+    """Returns query selecting users with shows from `show_ids_query`
+    in their schedule.
+
+    Args:
+        show_ids_query (str): query selecting column `show_id`
+
+    Returns:
+        str
+    """
+
+    return f"""
+    SELECT DISTINCT sts.user_id FROM shows_to_schedules sts
+    WHERE sts.show_id IN ({show_ids_query})
+    """
+
+
+def cast_change_shows(changed: str) -> str:
+    """Returns query selecting shows whose audience gets other suggestions
+    after actors were added to or deleted from show casts: the changed
+    shows and other shows with the changed actors.
+
+    Args:
+        changed (str): name of CTE with changed cast entries
+            returning columns `show_id` and `actor_id`
+
+    Returns:
+        str
+    """
+
+    return f"""
+    SELECT show_id FROM {changed}
+    UNION
+    SELECT show_id FROM actors_to_shows
+    WHERE actor_id IN (SELECT actor_id FROM {changed})
+    """
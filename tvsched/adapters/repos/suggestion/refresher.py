@@ -0,0 +1,125 @@
+import asyncio
+import contextlib
+import datetime
+from typing import Optional, Union
+
+from databases.core import Connection
+
+from tvsched.adapters.repos.routing import ConnectionRouter
+from tvsched.application.interfaces import ILogger
+
+
+class SuggestionRefresher:
+    """Recomputes precomputed suggestions of users from refresh queue.
+
+    Every batch is claimed, scored and stored by one statement, so several
+    workers can drain queue concurrently and failed batch stays queued.
+    Suggested shows are ranked by number of actors shared with casts
+    of shows from user schedule and do not contain scheduled shows.
+    """
+
+    _refresh_query = """
+    WITH claimed AS (
+        DELETE FROM suggestion_refresh_queue q
+        WHERE q.user_id IN (
+            SELECT user_id FROM suggestion_refresh_queue
+            ORDER BY enqueued_at
+            LIMIT :batch_size
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING q.user_id
+    ), user_actors AS (
+        SELECT DISTINCT c.user_id, ats.actor_id
+        FROM claimed c
+        JOIN shows_to_schedules sts ON sts.user_id = c.user_id
+        JOIN actors_to_shows ats ON ats.show_id = sts.show_id
+    ), scores AS (
+        SELECT ua.user_id, ats.show_id, count(*) AS score
+        FROM user_actors ua
+        JOIN actors_to_shows ats ON ats.actor_id = ua.actor_id
+        JOIN shows s ON s.id = ats.show_id AND s.deleted_at IS NULL
+        WHERE NOT EXISTS (
+            SELECT 1 FROM shows_to_schedules sts
+            WHERE sts.user_id = ua.user_id AND sts.show_id = ats.show_id
+        )
+        GROUP BY ua.user_id, ats.show_id
+    ), ranked AS (
+        SELECT user_id, show_id, row_number() OVER (
+            PARTITION BY user_id ORDER BY score DESC, show_id
+        ) AS position
+        FROM scores
+    )
+    INSERT INTO user_suggestions (user_id, show_ids, computed_at)
+    SELECT c.user_id,
+        COALESCE(
+            array_agg(r.show_id ORDER BY r.position)
+            FILTER (WHERE r.show_id IS NOT NULL),
+            '{}'
+        ),
+        now()
+    FROM claimed c
+    LEFT JOIN ranked r ON r.user_id = c.user_id AND r.position <= :limit
+    GROUP BY c.user_id
+    ON CONFLICT (user_id) DO UPDATE
+    SET show_ids = EXCLUDED.show_ids, computed_at = EXCLUDED.computed_at
+    RETURNING user_id;
+    """
+
+    def __init__(
+        self,
+        db: Union[Connection, ConnectionRouter],
+        logger: ILogger,
+        limit: int = 50,
+        batch_size: int = 100,
+        poll_interval: datetime.timedelta = datetime.timedelta(seconds=1),
+    ) -> None:
+        self._db = ConnectionRouter.of(db)
+        self._logger = logger
+        self._limit = limit
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    async def refresh_batch(self) -> int:
+        """Recomputes suggestions of next batch of queued users.
+
+        Returns:
+            int: number of refreshed users
+        """
+
+        values = dict(batch_size=self._batch_size, limit=self._limit)
+        db = self._db.for_write()
+        records = await db.fetch_all(self._refresh_query, values=values)
+
+        return len(records)
+
+    def start(self) -> None:
+        """Starts refreshing in background task."""
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._refresh_forever())
+
+    async def stop(self) -> None:
+        """Stops refreshing."""
+
+        task = self._task
+        self._task = None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _refresh_forever(self) -> None:
+        while True:
+            try:
+                refreshed = await self.refresh_batch()
+            except Exception:
+                self._logger.exception("Failed to refresh suggestions")
+                refreshed = 0
+
+            if refreshed:
+                self._logger.info(f"Refreshed suggestions of {refreshed} users")
+
+            # queue is drained without pauses while batches are full
+            if refreshed < self._batch_size:
+                await asyncio.sleep(self._poll_interval.total_seconds())
@@ -0,0 +1,184 @@
+import asyncio
+import typing
+import uuid
+from typing import Optional, Union
+
+from databases.core import Connection
+
+from tvsched.adapters.cache.invalidation import EntityChanged, EntityKind
+from tvsched.adapters.repos.batching import order_by_ids
+from tvsched.adapters.repos.routing import ConnectionRouter
+from tvsched.adapters.repos.show.models import ShowRecord
+from tvsched.adapters.repos.show.utils import (
+    group_show_records,
+    map_show_records_to_model,
+)
+from tvsched.adapters.repos.suggestion.graph import CoCastGraph
+from tvsched.application.interfaces import ILogger
+from tvsched.entities.show import Show
+
+
+class CoCastSuggestionRepo:
+    """Suggests shows by actors shared with shows from user schedule.
+
+    Implementation of `IGetSuggestedShowsUseCaseRepo` which scores
+    candidate shows in process over `CoCastGraph` loaded by `build`,
+    instead of joining casts in SQL on every call. Suggestions are ordered
+    by number of shared actors and do not contain shows from user schedule.
+
+    Subscribe it to `InvalidationBus`, so cast changes made by
+    `ActorRepo` on any worker are applied incrementally.
+    """
+
+    def __init__(
+        self,
+        db: Union[Connection, ConnectionRouter],
+        logger: ILogger,
+        limit: Optional[int] = None,
+    ) -> None:
+        self._db = ConnectionRouter.of(db)
+        self._logger = logger
+        self._limit = limit
+        self._graph = CoCastGraph()
+        self._dirty_show_ids: set[int] = set()
+        self._rebuild_required = False
+        self._refresh_task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def graph(self) -> CoCastGraph:
+        """Co-cast graph of all shows."""
+
+        return self._graph
+
+    async def build(self) -> None:
+        """Loads casts of all shows from repo."""
+
+        query = """
+        SELECT ats.show_id, ats.actor_id FROM actors_to_shows ats
+        JOIN shows s ON s.id = ats.show_id
+        WHERE s.deleted_at IS NULL;
+        """
+
+        db = await self._db.for_read()
+        records = await db.fetch_all(query)
+        edges = [(r["show_id"], r["actor_id"]) for r in records]
+
+        graph = CoCastGraph()
+        loop = asyncio.get_running_loop()
+        # building of large graph is CPU bound, so it does not block loop
+        await loop.run_in_executor(None, graph.build, edges)
+        self._graph = graph
+
+        self._logger.info(f"Built co-cast graph of {len(edges)} cast entries")
+
+    async def get_suggested_shows(self, user_id: uuid.UUID) -> list[Show]:
+        """Returns list of suggested shows for user with id `user_id`.
+
+        Args:
+            user_id (uuid.UUID)
+
+        Returns:
+            list[Show]
+        """
+
+        query = """
+        SELECT show_id FROM shows_to_schedules
+        WHERE user_id = :user_id;
+        """
+
+        values = dict(user_id=user_id)
+        db = await self._db.for_read()
+        records = await db.fetch_all(query, values=values)
+
+        scores = self._graph.score((r["show_id"] for r in records), self._limit)
+
+        return await self._get_shows([show_id for show_id, _ in scores])
+
+    def on_entity_changed(self, event: EntityChanged) -> None:
+        """Schedules reload of casts of changed shows.
+
+        Args:
+            event (EntityChanged)
+        """
+
+        if event.kind is not EntityKind.SHOW:
+            return
+
+        self._dirty_show_ids.update(event.ids)
+        self._schedule_refresh()
+
+    def on_flush(self) -> None:
+        """Schedules rebuild of graph."""
+
+        self._rebuild_required = True
+        self._schedule_refresh()
+
+    async def wait_refreshed(self) -> None:
+        """Waits until scheduled refresh is finished."""
+
+        task = self._refresh_task
+        if task is not None:
+            await asyncio.shield(task)
+
+    async def _get_shows(self, show_ids: list[int]) -> list[Show]:
+        if not show_ids:
+            return []
+
+        query = """
+        SELECT s.*, a.id as actor_id, a.name as actor_name,
+        a.image_url as actor_image_url
+        FROM shows s
+        JOIN actors_to_shows ats ON ats.show_id = s.id
+        JOIN actors a ON ats.actor_id = a.id
+        WHERE s.id = ANY(:show_ids) AND s.deleted_at IS NULL
+        ORDER BY s.id;
+        """
+
+        values = dict(show_ids=show_ids)
+        db = await self._db.for_read()
+        records = await db.fetch_all(query, values=values)
+        records = typing.cast(list[ShowRecord], records)
+        grouped_records = group_show_records(records)
+        shows = {rs[0]["id"]: map_show_records_to_model(rs) for rs in grouped_records}
+
+        return order_by_ids(show_ids, shows).found
+
+    def _schedule_refresh(self) -> None:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(self._refresh())
+
+    async def _refresh(self) -> None:
+        # changes received during refresh are applied by the next iteration
+        while self._rebuild_required or self._dirty_show_ids:
+            try:
+                if self._rebuild_required:
+                    self._rebuild_required = False
+                    self._dirty_show_ids.clear()
+                    await self.build()
+                    continue
+
+                show_ids = list(self._dirty_show_ids)
+                self._dirty_show_ids.clear()
+                await self._reload_casts(show_ids)
+            except Exception:
+                self._logger.exception("Failed to refresh co-cast graph")
+                self._rebuild_required = True
+                await asyncio.sleep(1)
+
+    async def _reload_casts(self, show_ids: list[int]) -> None:
+        query = """
+        SELECT ats.show_id, ats.actor_id FROM actors_to_shows ats
+        JOIN shows s ON s.id = ats.show_id
+        WHERE ats.show_id = ANY(:show_ids) AND s.deleted_at IS NULL;
+        """
+
+        values = dict(show_ids=show_ids)
+        db = await self._db.for_read()
+        records = await db.fetch_all(query, values=values)
+
+        casts: dict[int, list[int]] = {show_id: [] for show_id in show_ids}
+        for r in records:
+            casts[r["show_id"]].append(r["actor_id"])
+
+        for show_id, actor_ids in casts.items():
+            self._graph.set_cast(show_id, actor_ids)
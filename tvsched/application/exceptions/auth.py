@@ -1,3 +1,6 @@
+import uuid
+
+
 class UserNotFoundError(Exception):
     """Will be raised when user does not exist in repo."""
 
@@ -29,3 +32,23 @@ class InvalidUserPasswordError(Exception):
     @property
     def username(self) -> str:
         return self._username
+
+
+class PasswordHashNotUpdatedError(Exception):
+    """Will be raised if password hash of user can not be updated in repo,
+    e.g. repo is read-only."""
+
+    def __init__(self, user_id: uuid.UUID) -> None:
+        self._user_id = user_id
+
+    @property
+    def user_id(self) -> uuid.UUID:
+        return self._user_id
+
+
+class InvalidAccessTokenError(Exception):
+    """Will be raised if access token is malformed, expired or has unknown key."""
+
+
+class InvalidRefreshTokenError(Exception):
+    """Will be raised if refresh token is unknown, revoked or expired."""
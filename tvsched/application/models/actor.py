@@ -25,3 +25,20 @@ class ActorUpdate:
     id: int
     name: Optional[str] = None
     image_url: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ShowCast:
+    """Data for replacing show cast in repo"""
+
+    show_id: int
+    actor_ids: list[int]
+
+
+@dataclass(frozen=True)
+class ShowCastChanges:
+    """Result of replacing show cast in repo"""
+
+    added_actor_ids: list[int]
+    removed_actor_ids: list[int]
+    missing_actor_ids: list[int]
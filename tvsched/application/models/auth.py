@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+import datetime
 import uuid
 
 from tvsched.entities.auth import Role
@@ -54,3 +55,32 @@ class UserInToken:
 
     id: uuid.UUID
     role: Role
+
+
+@dataclass(frozen=True)
+class TokenPair:
+    """Access token with refresh token renewing it."""
+
+    access_token: str
+    refresh_token: str
+
+
+@dataclass(frozen=True)
+class SessionAdd:
+    """Data for adding session to repo.
+
+    Only sha256 hash of refresh token is stored.
+    """
+
+    token_hash: str
+    user_id: uuid.UUID
+    expires_at: datetime.datetime
+
+
+@dataclass(frozen=True)
+class SessionInRepo:
+    """Not revoked session of not deleted user."""
+
+    id: int
+    user: UserInToken
+    expires_at: datetime.datetime
@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class EntitiesByIds(Generic[T]):
+    """Entities found in repo by list of ids.
+
+    `found` is ordered as requested ids, `missing_ids` contains requested ids
+    not found in repo.
+    """
+
+    found: list[T]
+    missing_ids: list[int]
+
+
+@dataclass(frozen=True)
+class NameCompletion:
+    """Entity name completing type-ahead prefix"""
+
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class Versioned(Generic[T]):
+    """Entity with its version stamp.
+
+    `entity` is None if it was not modified since version known by client,
+    so it was not loaded from repo.
+    """
+
+    version: str
+    entity: Optional[T]
+
+    @property
+    def not_modified(self) -> bool:
+        return self.entity is None
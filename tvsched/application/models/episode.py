@@ -3,6 +3,8 @@ import datetime
 from dataclasses import dataclass
 from typing import Optional
 
+from tvsched.entities.episode import Episode
+
 
 @dataclass(frozen=True)
 class EpisodeAdd:
@@ -25,3 +27,33 @@ class EpisodeUpdate:
     number: Optional[int] = None
     air_date: Optional[datetime.datetime] = None
     show_id: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class SeasonAirDatesShift:
+    """Data for shifting air dates of all episodes of show season"""
+
+    show_id: int
+    season: int
+    delta: datetime.timedelta
+
+
+@dataclass(frozen=True)
+class EpisodesCursor:
+    """Position of episode in episodes of show ordered by season, number and id"""
+
+    season: int
+    number: int
+    id: int
+
+
+@dataclass(frozen=True)
+class EpisodesPage:
+    """Page of episodes of show ordered by season, number and id.
+
+    `next_cursor` is position of the last episode of page,
+    None if there are no more episodes.
+    """
+
+    episodes: list[Episode]
+    next_cursor: Optional[EpisodesCursor]
@@ -2,6 +2,10 @@ import uuid
 
 from dataclasses import dataclass
 
+from tvsched.entities.episode import Episode
+from tvsched.entities.schedule import ShowProgress
+from tvsched.entities.show import Show
+
 
 @dataclass(frozen=True)
 class ShowInSchedule:
@@ -17,3 +21,13 @@ class EpisodeInSchedule:
 
     episode_id: int
     user_id: uuid.UUID
+
+
+@dataclass(frozen=True)
+class SchedulePage:
+    """Data of user schedule page: shows with progress of watching them
+    and their first unwatched episodes"""
+
+    shows: list[Show]
+    progress: list[ShowProgress]
+    first_unwatched_episodes: list[Episode]
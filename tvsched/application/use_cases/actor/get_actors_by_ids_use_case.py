@@ -0,0 +1,50 @@
+from typing import Protocol, Sequence
+
+from tvsched.application.interfaces import ILogger
+from tvsched.application.models.common import EntitiesByIds
+from tvsched.entities.actor import Actor
+
+
+class IGetActorsByIdsUseCaseRepo(Protocol):
+    async def get_many(self, actor_ids: Sequence[int]) -> EntitiesByIds[Actor]:
+        """Gets actors by {actor_ids} from repo.
+
+        Args:
+            actor_ids (Sequence[int])
+
+        Returns:
+            EntitiesByIds[Actor]: actors ordered as `actor_ids` and ids of not found actors
+        """
+
+        raise NotImplementedError
+
+
+class GetActorsByIdsUseCase:
+    """Gets actors by list of ids with one repo call"""
+
+    def __init__(self, repo: IGetActorsByIdsUseCaseRepo, logger: ILogger) -> None:
+        self._repo = repo
+        self._logger = logger
+
+    async def execute(self, actor_ids: Sequence[int]) -> EntitiesByIds[Actor]:
+        """Gets actors by {actor_ids} from repo.
+
+        Args:
+            actor_ids (Sequence[int])
+
+        Returns:
+            EntitiesByIds[Actor]: actors ordered as `actor_ids` and ids of not found actors
+        """
+
+        logger = self._logger
+
+        logger.info(f"Start getting actors with ids {actor_ids} from repo")
+
+        actors = await self._repo.get_many(actor_ids)
+
+        if actors.missing_ids:
+            logger.info(f"Not found actors with ids {actors.missing_ids} in repo")
+
+        logger.info(f"Finish getting actors with ids {actor_ids} from repo")
+
+        return actors
@@ -0,0 +1,49 @@
+from typing import Protocol
+
+from tvsched.application.interfaces import ILogger
+from tvsched.entities.actor import Actor
+
+
+class ISearchActorsUseCaseRepo(Protocol):
+    async def search(self, query: str, limit: int) -> list[Actor]:
+        """Returns actors with name similar to `query` ordered by relevance.
+
+        Args:
+            query (str): words of actor name, may contain typos
+            limit (int): max number of actors
+
+        Returns:
+            list[Actor]
+        """
+        ...  # fix return type error
+
+
+class SearchActorsUseCase:
+    def __init__(self, repo: ISearchActorsUseCaseRepo, logger: ILogger) -> None:
+        self._repo = repo
+        self._logger = logger
+
+    async def execute(self, query: str, limit: int = 20) -> list[Actor]:
+        """Returns actors with name similar to `query` ordered by relevance.
+
+        Args:
+            query (str): words of actor name, may contain typos
+            limit (int): max number of actors
+
+        Returns:
+            list[Actor]: empty list if `query` is blank
+        """
+
+        logger = self._logger
+
+        query = " ".join(query.split())
+        if not query:
+            return []
+
+        logger.info(f"Start searching actors. Query - {query}, limit - {limit}")
+
+        actors = await self._repo.search(query, limit=limit)
+
+        logger.info(f"Finish searching actors. Query - {query}, found - {len(actors)}")
+
+        return actors
@@ -0,0 +1,59 @@
+from typing import Protocol
+
+from tvsched.application.exceptions.show import ShowNotFoundError
+from tvsched.application.interfaces import ILogger
+from tvsched.application.models.actor import ShowCast, ShowCastChanges
+
+
+class ISetShowCastUseCaseRepo(Protocol):
+    async def set_show_cast(self, data: ShowCast) -> ShowCastChanges:
+        """Replaces show cast in repo with one transaction.
+
+        Args:
+            data (ShowCast): show id and ids of actors of new cast
+
+        Raises:
+            ShowNotFoundError: will be raised if show not in repo
+
+        Returns:
+            ShowCastChanges
+        """
+        ...  # fix return type error
+
+
+class SetShowCastUseCase:
+    """Replaces show cast with actors by ids"""
+
+    def __init__(self, repo: ISetShowCastUseCaseRepo, logger: ILogger) -> None:
+        self._repo = repo
+        self._logger = logger
+
+    async def execute(self, data: ShowCast) -> ShowCastChanges:
+        """Replaces show cast in repo.
+
+        Actors not in repo are skipped and returned as missing,
+        the rest of cast is replaced anyway.
+
+        Args:
+            data (ShowCast): show id and ids of actors of new cast
+
+        Raises:
+            ShowNotFoundError: will be raised if show does not exist
+
+        Returns:
+            ShowCastChanges: ids of added, removed and missing actors
+        """
+
+        logger = self._logger
+
+        logger.info(f"Start setting show cast {data} in repo")
+
+        try:
+            changes = await self._repo.set_show_cast(data)
+        except ShowNotFoundError:
+            logger.info(f"Not found show with id {data.show_id}")
+            raise
+
+        logger.info(f"Finish setting show cast {data} in repo: {changes}")
+
+        return changes
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from tvsched.application.interfaces import ILogger
 from tvsched.application.models.auth import UserAdd, UserWithRoleAdd
 from tvsched.application.use_cases.auth.add_user_with_role_use_case import (
@@ -10,10 +12,15 @@ from tvsched.entities.auth import Role
 class AddUserUseCase:
     """Adds user with USER role to repo."""
 
-    def __init__(self, repo: IAddUserWithRoleUseCaseRepo, logger: ILogger) -> None:
+    def __init__(
+        self,
+        repo: IAddUserWithRoleUseCaseRepo,
+        logger: ILogger,
+        password_hash_rounds: Optional[int] = None,
+    ) -> None:
         self._repo = repo
         self._logger = logger
-        self._use_case = AddUserWithRoleUseCase(repo, logger)
+        self._use_case = AddUserWithRoleUseCase(repo, logger, password_hash_rounds)
 
     async def execute(self, user: UserAdd) -> None:
         """Adds user with USER role to repo.
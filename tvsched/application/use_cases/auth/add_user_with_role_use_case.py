@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import Optional, Protocol
 
 from tvsched.application.interfaces import ILogger
 from tvsched.application.exceptions.auth import UserAlreadyExistsError
@@ -23,9 +23,15 @@ class IAddUserWithRoleUseCaseRepo(Protocol):
 class AddUserWithRoleUseCase:
     """Adds user with specific role to repo"""
 
-    def __init__(self, repo: IAddUserWithRoleUseCaseRepo, logger: ILogger) -> None:
+    def __init__(
+        self,
+        repo: IAddUserWithRoleUseCaseRepo,
+        logger: ILogger,
+        password_hash_rounds: Optional[int] = None,
+    ) -> None:
         self._repo = repo
         self._logger = logger
+        self._password_hash_rounds = password_hash_rounds
 
     async def execute(self, user: UserWithRoleAdd) -> None:
         """Adds user with specific role to repo.
@@ -43,7 +49,7 @@ class AddUserWithRoleUseCase:
 
         username = user.username
 
-        password_hash = hash_password(user.password)
+        password_hash = hash_password(user.password, self._password_hash_rounds)
 
         user_in_repo = UserInRepoAdd(
             username=user.username, password_hash=password_hash, role=user.role
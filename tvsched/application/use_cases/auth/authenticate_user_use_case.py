@@ -0,0 +1,117 @@
+import uuid
+from typing import Optional, Protocol
+
+from tvsched.application.exceptions.auth import (
+    InvalidUserPasswordError,
+    PasswordHashNotUpdatedError,
+    UserNotFoundError,
+)
+from tvsched.application.interfaces import ILogger
+from tvsched.application.models.auth import UserInRepo, UserLogIn
+from tvsched.application.utils.auth import (
+    hash_password,
+    password_hash_needs_update,
+    verify_password,
+)
+
+
+class IAuthenticateUserUseCaseRepo(Protocol):
+    async def get_user_by_username(self, username: str) -> UserInRepo:
+        """Returns user by username from repo.
+
+        Args:
+            username (str)
+
+        Raises:
+            UserNotFoundError: will be raised if user with name `username` not in repo
+
+        Returns:
+            UserInRepo
+        """
+
+        raise NotImplementedError  # fix return type error
+
+    async def update_password_hash(
+        self, user_id: uuid.UUID, password_hash: str
+    ) -> None:
+        """Replaces password hash of user in repo.
+
+        Does nothing if user not in repo.
+
+        Args:
+            user_id (uuid.UUID)
+            password_hash (str)
+
+        Raises:
+            PasswordHashNotUpdatedError: will be raised if hash can not be
+                updated, e.g. repo is read-only
+        """
+
+        raise NotImplementedError  # fix return type error
+
+
+class AuthenticateUserUseCase:
+    """Checks username and password of user."""
+
+    def __init__(
+        self,
+        repo: IAuthenticateUserUseCaseRepo,
+        logger: ILogger,
+        password_hash_rounds: Optional[int] = None,
+    ) -> None:
+        self._repo = repo
+        self._logger = logger
+        self._password_hash_rounds = password_hash_rounds
+
+    async def execute(self, user: UserLogIn) -> UserInRepo:
+        """Returns user from repo if password is valid.
+
+        If `password_hash_rounds` is set and stored password hash was made
+        with other bcrypt cost, password is rehashed with configured cost,
+        so hashes converge to it without password reset. Rehash is best
+        effort: if hash can not be updated, e.g. repo is read-only,
+        user is authenticated anyway and rehash is retried on next log in.
+
+        Args:
+            user (UserLogIn)
+
+        Raises:
+            UserNotFoundError: will be raised when user with `username` does not exist.
+            InvalidUserPasswordError: will be raised if password is invalid.
+
+        Returns:
+            UserInRepo
+        """
+
+        repo = self._repo
+        logger = self._logger
+
+        username = user.username
+        logger.info(f"Start authenticating user with username {username}")
+
+        try:
+            user_in_repo = await repo.get_user_by_username(username)
+        except UserNotFoundError:
+            logger.info(f"Not found user with username {username}")
+            raise
+
+        if not verify_password(user.password, user_in_repo.password_hash):
+            logger.info(f"Invalid password for username {username}")
+            raise InvalidUserPasswordError(username=username)
+
+        rounds = self._password_hash_rounds
+        if rounds is not None and password_hash_needs_update(
+            user_in_repo.password_hash, rounds
+        ):
+            logger.info(f"Rehash password of user {username} with {rounds} rounds")
+            try:
+                password_hash = hash_password(user.password, rounds)
+                await repo.update_password_hash(user_in_repo.id, password_hash)
+            except (PasswordHashNotUpdatedError, ValueError):
+                logger.warning(
+                    f"Failed to rehash password of user {username}", exc_info=True
+                )
+
+        logger.info(f"Finish authenticating user with username {username}")
+
+        return user_in_repo
@@ -0,0 +1,38 @@
+import uuid
+from typing import Protocol
+
+from tvsched.application.interfaces import ILogger
+
+
+class IDeleteUserUseCaseRepo(Protocol):
+    async def delete_user(self, user_id: uuid.UUID) -> None:
+        """Soft-deletes user with id `user_id` and starts deletion of user data.
+
+        Args:
+            user_id (uuid.UUID)
+        """
+
+
+class DeleteUserUseCase:
+    """Deletes user with schedule and watched episodes."""
+
+    def __init__(self, repo: IDeleteUserUseCaseRepo, logger: ILogger) -> None:
+        self._repo = repo
+        self._logger = logger
+
+    async def execute(self, user_id: uuid.UUID) -> None:
+        """Deletes user from repo.
+
+        User is hidden at once, user data is deleted in background.
+
+        Args:
+            user_id (uuid.UUID)
+        """
+
+        logger = self._logger
+
+        logger.info(f"Start deleting user with id {user_id}")
+
+        await self._repo.delete_user(user_id)
+
+        logger.info(f"Finish deleting user with id {user_id}")
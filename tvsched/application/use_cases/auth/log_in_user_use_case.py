@@ -1,36 +1,19 @@
 import datetime
-from typing import Protocol
-from tvsched.application.exceptions.auth import (
-    InvalidUserPasswordError,
-    UserNotFoundError,
-)
+from typing import Optional, Protocol
 
 from tvsched.application.interfaces import ILogger
-from tvsched.application.models.auth import UserInRepo, UserInToken, UserLogIn
-from tvsched.application.utils.auth import (
-    create_access_token_for_user,
-    verify_password,
+from tvsched.application.models.auth import UserInToken, UserLogIn
+from tvsched.application.use_cases.auth.authenticate_user_use_case import (
+    AuthenticateUserUseCase,
+    IAuthenticateUserUseCaseRepo,
 )
+from tvsched.application.utils.auth import create_access_token_for_user
+from tvsched.application.utils.token_issuer import TokenIssuer
 
 
-class ILogInUserUseCaseRepo(Protocol):
+class ILogInUserUseCaseRepo(IAuthenticateUserUseCaseRepo, Protocol):
     """"""
 
-    async def get_user_by_username(self, username: str) -> UserInRepo:
-        """Returns user by username from repo.
-
-        Args:
-            user (UserInRepo): data for adding user to repo.
-
-        Raises:
-            UserAlreadyExistsError: will be raised when user already exists.
-
-        Returns:
-            UserInRepo
-        """
-
-        raise NotImplementedError  # fix return type error
-
 
 class LogInUserUseCase:
     """Generates token for user."""
@@ -42,54 +25,49 @@ class LogInUserUseCase:
         jwt_secret: str,
         jwt_expires_in: datetime.timedelta,
         jwt_algorithm: str,
+        password_hash_rounds: Optional[int] = None,
+        token_issuer: Optional[TokenIssuer] = None,
     ) -> None:
         self._repo = repo
         self._logger = logger
+        self._authenticate = AuthenticateUserUseCase(repo, logger, password_hash_rounds)
         self._jwt_secret = jwt_secret
         self._jwt_expires_in = jwt_expires_in
         self._jwt_algorithm = jwt_algorithm
+        self._token_issuer = token_issuer
 
     async def execute(self, user: UserLogIn) -> str:
         """Log in user.
 
-        Generates token.
+        Generates token. Password hash is updated as in
+        `AuthenticateUserUseCase` when `password_hash_rounds` is set.
+        Token is issued by `token_issuer` with preloaded keys if it is set,
+        otherwise it is signed with `jwt_secret`.
 
         Args:
             user (UserLogIn): data for adding user to repo.
 
         Raises:
             UserNotFoundError: will be raised when user with `username` does not exist.
+            InvalidUserPasswordError: will be raised if password is invalid.
 
         Returns:
             str: access token
         """
 
-        repo = self._repo
-        logger = self._logger
-
-        username = user.username
-        logger.info(f"Start log in user with username {username}")
-
-        try:
-            user_in_repo = await repo.get_user_by_username(username)
-        except UserNotFoundError:
-            logger.info("Not found user with username {username}")
-            raise
-
-        if not verify_password(user.password, user_in_repo.password_hash):
-            logger.info("Invalid password for username {username}")
-            raise InvalidUserPasswordError(username=username)
+        user_in_repo = await self._authenticate.execute(user)
 
         user_in_token = UserInToken(id=user_in_repo.id, role=user_in_repo.role)
         created_at = datetime.datetime.utcnow()
-        token = create_access_token_for_user(
-            user=user_in_token,
-            created_at=created_at,
-            key=self._jwt_secret,
-            expires_in=self._jwt_expires_in,
-            algorithm=self._jwt_algorithm,
-        )
-
-        logger.info(f"Finish log in user with username {username}")
+        if self._token_issuer is not None:
+            token = self._token_issuer.issue(user_in_token, created_at)
+        else:
+            token = create_access_token_for_user(
+                user=user_in_token,
+                created_at=created_at,
+                key=self._jwt_secret,
+                expires_in=self._jwt_expires_in,
+                algorithm=self._jwt_algorithm,
+            )
 
         return token
@@ -0,0 +1,85 @@
+import datetime
+from typing import Optional, Protocol
+
+from tvsched.application.interfaces import ILogger
+from tvsched.application.models.auth import (
+    SessionAdd,
+    TokenPair,
+    UserInToken,
+    UserLogIn,
+)
+from tvsched.application.use_cases.auth.authenticate_user_use_case import (
+    AuthenticateUserUseCase,
+)
+from tvsched.application.use_cases.auth.log_in_user_use_case import (
+    ILogInUserUseCaseRepo,
+)
+from tvsched.application.utils.auth import generate_refresh_token, hash_refresh_token
+from tvsched.application.utils.token_issuer import TokenIssuer
+
+
+class ILogInUserWithRefreshTokenUseCaseSessionRepo(Protocol):
+    async def add_session(self, session: SessionAdd) -> None:
+        """Adds session to repo.
+
+        Args:
+            session (SessionAdd)
+        """
+
+
+class LogInUserWithRefreshTokenUseCase:
+    """Generates access token and refresh token for user."""
+
+    def __init__(
+        self,
+        repo: ILogInUserUseCaseRepo,
+        session_repo: ILogInUserWithRefreshTokenUseCaseSessionRepo,
+        logger: ILogger,
+        token_issuer: TokenIssuer,
+        refresh_token_expires_in: datetime.timedelta,
+        password_hash_rounds: Optional[int] = None,
+    ) -> None:
+        self._session_repo = session_repo
+        self._logger = logger
+        self._authenticate = AuthenticateUserUseCase(repo, logger, password_hash_rounds)
+        self._token_issuer = token_issuer
+        self._refresh_token_expires_in = refresh_token_expires_in
+
+    async def execute(self, user: UserLogIn) -> TokenPair:
+        """Log in user.
+
+        Starts session renewed by refresh token, so access token
+        is renewed by `RefreshAccessTokenUseCase` without password check.
+
+        Args:
+            user (UserLogIn)
+
+        Raises:
+            UserNotFoundError: will be raised when user with `username` does not exist.
+            InvalidUserPasswordError: will be raised if password is invalid.
+
+        Returns:
+            TokenPair
+        """
+
+        logger = self._logger
+
+        logger.info(f"Start logging in user with username {user.username}")
+
+        user_in_repo = await self._authenticate.execute(user)
+
+        created_at = datetime.datetime.now(datetime.timezone.utc)
+        refresh_token = generate_refresh_token()
+        session = SessionAdd(
+            token_hash=hash_refresh_token(refresh_token),
+            user_id=user_in_repo.id,
+            expires_at=created_at + self._refresh_token_expires_in,
+        )
+        await self._session_repo.add_session(session)
+
+        user_in_token = UserInToken(id=user_in_repo.id, role=user_in_repo.role)
+        access_token = self._token_issuer.issue(user_in_token, created_at)
+
+        logger.info(f"Finish logging in user with username {user.username}")
+
+        return TokenPair(access_token=access_token, refresh_token=refresh_token)
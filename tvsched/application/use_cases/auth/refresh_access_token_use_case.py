@@ -0,0 +1,76 @@
+import datetime
+from typing import Protocol
+
+from tvsched.application.exceptions.auth import InvalidRefreshTokenError
+from tvsched.application.interfaces import ILogger
+from tvsched.application.models.auth import SessionInRepo
+from tvsched.application.utils.auth import hash_refresh_token
+from tvsched.application.utils.token_issuer import TokenIssuer
+
+
+class IRefreshAccessTokenUseCaseRepo(Protocol):
+    async def get_session(self, token_hash: str) -> SessionInRepo:
+        """Returns session by hash of its refresh token.
+
+        Args:
+            token_hash (str): sha256 hex digest of refresh token
+
+        Raises:
+            InvalidRefreshTokenError: will be raised if session not in repo,
+                revoked or its user is deleted
+
+        Returns:
+            SessionInRepo
+        """
+        ...  # fix return type error
+
+
+class RefreshAccessTokenUseCase:
+    """Renews access token by refresh token."""
+
+    def __init__(
+        self,
+        repo: IRefreshAccessTokenUseCaseRepo,
+        logger: ILogger,
+        token_issuer: TokenIssuer,
+    ) -> None:
+        self._repo = repo
+        self._logger = logger
+        self._token_issuer = token_issuer
+
+    async def execute(self, refresh_token: str) -> str:
+        """Returns new access token for user of refresh token session.
+
+        Password is not checked, so renewal costs one session lookup.
+
+        Args:
+            refresh_token (str)
+
+        Raises:
+            InvalidRefreshTokenError: will be raised if refresh token is unknown,
+                revoked or expired
+
+        Returns:
+            str: access token
+        """
+
+        logger = self._logger
+
+        logger.info("Start refreshing access token")
+
+        try:
+            session = await self._repo.get_session(hash_refresh_token(refresh_token))
+        except InvalidRefreshTokenError:
+            logger.info("Not found session of refresh token")
+            raise
+
+        created_at = datetime.datetime.now(datetime.timezone.utc)
+        if session.expires_at <= created_at:
+            logger.info(f"Session with id {session.id} is expired")
+            raise InvalidRefreshTokenError()
+
+        token = self._token_issuer.issue(session.user, created_at)
+
+        logger.info(f"Finish refreshing access token of session with id {session.id}")
+
+        return token
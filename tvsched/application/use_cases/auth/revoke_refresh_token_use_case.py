@@ -0,0 +1,40 @@
+from typing import Protocol
+
+from tvsched.application.interfaces import ILogger
+from tvsched.application.utils.auth import hash_refresh_token
+
+
+class IRevokeRefreshTokenUseCaseRepo(Protocol):
+    async def revoke_session(self, token_hash: str) -> None:
+        """Revokes session by hash of its refresh token.
+
+        Does nothing if session not in repo or already revoked.
+
+        Args:
+            token_hash (str): sha256 hex digest of refresh token
+        """
+
+
+class RevokeRefreshTokenUseCase:
+    """Ends session of refresh token, e.g. on log out."""
+
+    def __init__(self, repo: IRevokeRefreshTokenUseCaseRepo, logger: ILogger) -> None:
+        self._repo = repo
+        self._logger = logger
+
+    async def execute(self, refresh_token: str) -> None:
+        """Revokes refresh token, so it does not renew access tokens anymore.
+
+        Access tokens issued before stay valid until they expire.
+
+        Args:
+            refresh_token (str)
+        """
+
+        logger = self._logger
+
+        logger.info("Start revoking refresh token")
+
+        await self._repo.revoke_session(hash_refresh_token(refresh_token))
+
+        logger.info("Finish revoking refresh token")
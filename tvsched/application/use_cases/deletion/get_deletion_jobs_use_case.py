@@ -0,0 +1,64 @@
+from typing import Optional, Protocol
+
+from tvsched.application.interfaces import ILogger
+from tvsched.entities.deletion import DeletionJob
+
+
+class IGetDeletionJobsUseCaseRepo(Protocol):
+    async def get_deletion_jobs(
+        self,
+        unfinished_only: bool = False,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> list[DeletionJob]:
+        """Returns deletion jobs from the newest.
+
+        Args:
+            unfinished_only (bool): if True only running jobs will be returned
+            limit (Optional[int]): max number of jobs. If None all jobs will be returned
+            offset (Optional[int])
+
+        Returns:
+            list[DeletionJob]
+        """
+        ...  # fix return type error
+
+
+class GetDeletionJobsUseCase:
+    """Gets progress of background deletions of shows and users"""
+
+    def __init__(self, repo: IGetDeletionJobsUseCaseRepo, logger: ILogger) -> None:
+        self._repo = repo
+        self._logger = logger
+
+    async def execute(
+        self,
+        unfinished_only: bool = False,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> list[DeletionJob]:
+        """Returns deletion jobs from the newest.
+
+        Args:
+            unfinished_only (bool): if True only running jobs will be returned
+            limit (Optional[int]): max number of jobs. If None all jobs will be returned
+            offset (Optional[int])
+
+        Returns:
+            list[DeletionJob]
+        """
+
+        logger = self._logger
+
+        logger.info(
+            f"Start getting deletion jobs. Unfinished only - {unfinished_only}, "
+            f"offset - {offset}, limit - {limit}"
+        )
+
+        jobs = await self._repo.get_deletion_jobs(
+            unfinished_only=unfinished_only, limit=limit, offset=offset
+        )
+
+        logger.info(f"Finish getting deletion jobs. Found {len(jobs)} jobs")
+
+        return jobs
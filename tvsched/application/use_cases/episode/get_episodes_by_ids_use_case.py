@@ -0,0 +1,54 @@
+from typing import Protocol, Sequence
+
+from tvsched.application.interfaces import ILogger
+from tvsched.application.models.common import EntitiesByIds
+from tvsched.entities.episode import Episode
+
+
+class IGetEpisodesByIdsUseCaseRepo(Protocol):
+    """"""
+
+    async def get_many(self, episode_ids: Sequence[int]) -> EntitiesByIds[Episode]:
+        """Returns episodes from repo by `episode_ids`.
+
+        Args:
+            episode_ids (Sequence[int])
+
+        Returns:
+            EntitiesByIds[Episode]: episodes ordered as `episode_ids`
+                and ids of not found episodes
+        """
+
+        raise NotImplementedError
+
+
+class GetEpisodesByIdsUseCase:
+    """Gets tv show episodes by list of ids with one repo call"""
+
+    def __init__(self, repo: IGetEpisodesByIdsUseCaseRepo, logger: ILogger) -> None:
+        self._repo = repo
+        self._logger = logger
+
+    async def execute(self, episode_ids: Sequence[int]) -> EntitiesByIds[Episode]:
+        """Returns episodes from repo by `episode_ids`.
+
+        Args:
+            episode_ids (Sequence[int])
+
+        Returns:
+            EntitiesByIds[Episode]: episodes ordered as `episode_ids`
+                and ids of not found episodes
+        """
+
+        logger = self._logger
+
+        logger.info(f"Start getting episodes with ids {episode_ids}")
+
+        episodes = await self._repo.get_many(episode_ids)
+
+        if episodes.missing_ids:
+            logger.info(f"Not found episodes with ids {episodes.missing_ids}")
+
+        logger.info(f"Finish getting episodes with ids {episode_ids}")
+
+        return episodes
@@ -0,0 +1,72 @@
+from typing import Optional, Protocol
+
+from tvsched.application.interfaces import ILogger
+from tvsched.application.models.episode import EpisodesCursor, EpisodesPage
+
+
+class IGetEpisodesPageUseCaseRepo(Protocol):
+    async def get_episodes_page(
+        self,
+        show_id: int,
+        season: Optional[int] = None,
+        after: Optional[EpisodesCursor] = None,
+        limit: int = 100,
+    ) -> EpisodesPage:
+        """Returns page of episodes of show with id `show_id`
+        ordered by season, number and id.
+
+        Args:
+            show_id (int)
+            season (Optional[int]): if not None only episodes of the season are returned
+            after (Optional[EpisodesCursor]): cursor of previous page.
+                If None the first page is returned
+            limit (int): max number of episodes of page
+
+        Returns:
+            EpisodesPage
+        """
+        ...  # fix return type error
+
+
+class GetEpisodesPageUseCase:
+    """Gets page of tv show episodes ordered by season and number"""
+
+    def __init__(self, repo: IGetEpisodesPageUseCaseRepo, logger: ILogger) -> None:
+        self._repo = repo
+        self._logger = logger
+
+    async def execute(
+        self,
+        show_id: int,
+        season: Optional[int] = None,
+        after: Optional[EpisodesCursor] = None,
+        limit: int = 100,
+    ) -> EpisodesPage:
+        """Returns page of episodes of show with id `show_id` from repo.
+
+        Args:
+            show_id (int)
+            season (Optional[int]): if not None only episodes of the season are returned
+            after (Optional[EpisodesCursor]): `next_cursor` of previous page.
+                If None the first page is returned
+            limit (int): max number of episodes of page
+
+        Returns:
+            EpisodesPage
+        """
+
+        logger = self._logger
+
+        logger.info(
+            f"Start getting episodes from show with id {show_id}. Season - {season}, after - {after}, limit - {limit}"
+        )
+
+        page = await self._repo.get_episodes_page(
+            show_id, season=season, after=after, limit=limit
+        )
+
+        logger.info(
+            f"Finish getting episodes from show with id {show_id}. Season - {season}, after - {after}, limit - {limit}"
+        )
+
+        return page
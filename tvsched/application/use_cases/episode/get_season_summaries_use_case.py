@@ -0,0 +1,46 @@
+from typing import Protocol
+
+from tvsched.application.interfaces import ILogger
+from tvsched.entities.episode import SeasonSummary
+
+
+class IGetSeasonSummariesUseCaseRepo(Protocol):
+    async def get_season_summaries(self, show_id: int) -> list[SeasonSummary]:
+        """Returns number of episodes and range of air dates of every season
+        of show with id `show_id` ordered by season.
+
+        Args:
+            show_id (int)
+
+        Returns:
+            list[SeasonSummary]
+        """
+        ...  # fix return type error
+
+
+class GetSeasonSummariesUseCase:
+    """Gets summaries of tv show seasons"""
+
+    def __init__(self, repo: IGetSeasonSummariesUseCaseRepo, logger: ILogger) -> None:
+        self._repo = repo
+        self._logger = logger
+
+    async def execute(self, show_id: int) -> list[SeasonSummary]:
+        """Returns summaries of seasons of show with id `show_id` from repo.
+
+        Args:
+            show_id (int)
+
+        Returns:
+            list[SeasonSummary]
+        """
+
+        logger = self._logger
+
+        logger.info(f"Start getting seasons of show with id {show_id}")
+
+        summaries = await self._repo.get_season_summaries(show_id)
+
+        logger.info(f"Finish getting seasons of show with id {show_id}")
+
+        return summaries
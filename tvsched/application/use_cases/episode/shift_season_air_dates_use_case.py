@@ -0,0 +1,45 @@
+from typing import Protocol
+
+from tvsched.application.interfaces import ILogger
+from tvsched.application.models.episode import SeasonAirDatesShift
+
+
+class IShiftSeasonAirDatesUseCaseRepo(Protocol):
+    async def shift_season_air_dates(self, shift: SeasonAirDatesShift) -> int:
+        """Shifts air dates of all episodes of show season by `shift.delta`.
+
+        Args:
+            shift (SeasonAirDatesShift): data for shifting season air dates
+
+        Returns:
+            int: number of shifted episodes
+        """
+        ...  # fix return type error
+
+
+class ShiftSeasonAirDatesUseCase:
+    """Reschedules all episodes of tv show season"""
+
+    def __init__(self, repo: IShiftSeasonAirDatesUseCaseRepo, logger: ILogger) -> None:
+        self._repo = repo
+        self._logger = logger
+
+    async def execute(self, shift: SeasonAirDatesShift) -> int:
+        """Shifts air dates of all episodes of show season.
+
+        Args:
+            shift (SeasonAirDatesShift): data for shifting season air dates
+
+        Returns:
+            int: number of shifted episodes
+        """
+
+        logger = self._logger
+
+        logger.info(f"Start shifting air dates {shift}")
+
+        shifted = await self._repo.shift_season_air_dates(shift)
+
+        logger.info(f"Finish shifting air dates {shift}. Shifted {shifted} episodes")
+
+        return shifted
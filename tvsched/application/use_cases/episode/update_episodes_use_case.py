@@ -0,0 +1,36 @@
+from typing import Protocol, Sequence
+
+from tvsched.application.interfaces import ILogger
+from tvsched.application.models.episode import EpisodeUpdate
+
+
+class IUpdateEpisodesUseCaseRepo(Protocol):
+    async def update_many(self, episodes: Sequence[EpisodeUpdate]) -> None:
+        """Updates episodes in repo with one statement in transaction.
+
+        Args:
+            episodes (Sequence[EpisodeUpdate]): data for updating episodes in repo
+        """
+
+
+class UpdateEpisodesUseCase:
+    """Updates many tv show episodes in repo at once"""
+
+    def __init__(self, repo: IUpdateEpisodesUseCaseRepo, logger: ILogger) -> None:
+        self._repo = repo
+        self._logger = logger
+
+    async def execute(self, episodes: Sequence[EpisodeUpdate]) -> None:
+        """Updates tv show episodes in repo.
+
+        Args:
+            episodes (Sequence[EpisodeUpdate]): data for updating episodes
+        """
+
+        logger = self._logger
+
+        logger.info(f"Start updating {len(episodes)} episodes in repo")
+
+        await self._repo.update_many(episodes)
+
+        logger.info(f"Finish updating {len(episodes)} episodes in repo")
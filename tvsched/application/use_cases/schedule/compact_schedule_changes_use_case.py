@@ -0,0 +1,66 @@
+import datetime
+from typing import Protocol
+
+from tvsched.application.interfaces import ILogger
+
+
+class ICompactScheduleChangesUseCaseRepo(Protocol):
+    async def compact_schedule_changes(
+        self, changed_before: datetime.datetime, batch_size: int = 10_000
+    ) -> int:
+        """Deletes changes about deleted shows and unwatched episodes
+        made before `changed_before`.
+
+        Args:
+            changed_before (datetime.datetime)
+            batch_size (int): max number of deleted changes
+
+        Returns:
+            int: number of deleted changes
+        """
+        ...  # fix return type error
+
+
+class CompactScheduleChangesUseCase:
+    """Purges old changes of schedules about deleted shows and unwatched episodes"""
+
+    def __init__(
+        self, repo: ICompactScheduleChangesUseCaseRepo, logger: ILogger
+    ) -> None:
+        self._repo = repo
+        self._logger = logger
+
+    async def execute(
+        self,
+        retention: datetime.timedelta = datetime.timedelta(days=30),
+        batch_size: int = 10_000,
+    ) -> int:
+        """Purges changes older than `retention` in batches.
+
+        Clients which did not sync during `retention` get reset of their state.
+
+        Args:
+            retention (datetime.timedelta)
+            batch_size (int): max number of changes deleted by one statement
+
+        Returns:
+            int: number of deleted changes
+        """
+
+        logger = self._logger
+
+        changed_before = datetime.datetime.now(datetime.timezone.utc) - retention
+        logger.info(f"Start compacting schedule changes before {changed_before}")
+
+        purged = 0
+        while True:
+            batch = await self._repo.compact_schedule_changes(
+                changed_before, batch_size=batch_size
+            )
+            purged += batch
+            if batch < batch_size:
+                break
+
+        logger.info(f"Finish compacting schedule changes. Purged {purged} changes")
+
+        return purged
@@ -0,0 +1,53 @@
+import uuid
+from typing import Protocol
+
+from tvsched.application.interfaces import ILogger
+from tvsched.entities.schedule import SuggestedShows
+
+
+class IGetPrecomputedSuggestedShowsUseCaseRepo(Protocol):
+    async def get_precomputed_suggested_shows(
+        self, user_id: uuid.UUID
+    ) -> SuggestedShows:
+        """Returns suggested shows precomputed for user with id `user_id`.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+
+        Returns:
+            SuggestedShows: ranked shows and time of computation
+        """
+        ...  # fix return type error
+
+
+class GetPrecomputedSuggestedShowsUseCase:
+    """Gets suggested shows precomputed in background for user schedule"""
+
+    def __init__(
+        self, repo: IGetPrecomputedSuggestedShowsUseCaseRepo, logger: ILogger
+    ) -> None:
+        self._repo = repo
+        self._logger = logger
+
+    async def execute(self, user_id: uuid.UUID) -> SuggestedShows:
+        """Returns suggested shows precomputed for schedule with user id `user_id`.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+
+        Returns:
+            SuggestedShows: ranked shows and time of computation
+        """
+
+        logger = self._logger
+
+        logger.info(f"Start getting precomputed suggested shows for user {user_id}")
+
+        suggested = await self._repo.get_precomputed_suggested_shows(user_id)
+
+        logger.info(
+            f"Finish getting precomputed suggested shows for user {user_id}. "
+            f"Computed at {suggested.computed_at}"
+        )
+
+        return suggested
@@ -0,0 +1,60 @@
+import uuid
+from typing import Protocol
+
+from tvsched.application.interfaces import ILogger
+from tvsched.entities.schedule import ScheduleChanges
+
+
+class IGetScheduleChangesSinceUseCaseRepo(Protocol):
+    async def get_schedule_changes_since(
+        self, user_id: uuid.UUID, version: int
+    ) -> ScheduleChanges:
+        """Returns changes of user schedule after version `version`.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+            version (int): version of schedule known by client, 0 for first sync
+
+        Returns:
+            ScheduleChanges
+        """
+        ...  # fix return type error
+
+
+class GetScheduleChangesSinceUseCase:
+    """Gets changes of shows in user schedule and watched episodes
+    after client cursor"""
+
+    def __init__(
+        self, repo: IGetScheduleChangesSinceUseCaseRepo, logger: ILogger
+    ) -> None:
+        self._repo = repo
+        self._logger = logger
+
+    async def execute(self, user_id: uuid.UUID, version: int = 0) -> ScheduleChanges:
+        """Returns changes of schedule with user id `user_id` after `version`.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+            version (int): version of schedule from previous sync, 0 for first sync
+
+        Returns:
+            ScheduleChanges: changes and version for the next sync
+        """
+
+        logger = self._logger
+
+        logger.info(
+            f"Start getting changes of schedule with user id {user_id} "
+            f"since version {version}"
+        )
+
+        changes = await self._repo.get_schedule_changes_since(user_id, version)
+
+        logger.info(
+            f"Finish getting changes of schedule with user id {user_id} "
+            f"since version {version}. Found {len(changes.changes)} changes, "
+            f"reset - {changes.reset}"
+        )
+
+        return changes
@@ -0,0 +1,93 @@
+import uuid
+from typing import Protocol
+
+from tvsched.application.interfaces import ILogger
+from tvsched.application.models.schedule import SchedulePage
+from tvsched.application.utils.concurrency import DEFAULT_FAN_OUT_BUDGET, fan_out
+from tvsched.entities.episode import Episode
+from tvsched.entities.schedule import ShowProgress
+from tvsched.entities.show import Show
+
+
+class IGetSchedulePageUseCaseRepo(Protocol):
+    async def get_shows_from_schedule(self, user_id: uuid.UUID) -> list[Show]:
+        """Returns list of shows from user schedule.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+
+        Returns:
+            list[Show]
+        """
+        ...  # fix return type error
+
+    async def get_schedule_progress(self, user_id: uuid.UUID) -> list[ShowProgress]:
+        """Returns progress of watching each show from user schedule.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+
+        Returns:
+            list[ShowProgress]
+        """
+        ...  # fix return type error
+
+    async def get_first_unwatched_episodes_from_schedule(
+        self, user_id: uuid.UUID
+    ) -> list[Episode]:
+        """Returns first unwatched episode of each show from user schedule.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+
+        Returns:
+            list[Episode]
+        """
+        ...  # fix return type error
+
+
+class GetSchedulePageUseCase:
+    """Gets shows from user schedule with progress and first unwatched episodes"""
+
+    def __init__(
+        self,
+        repo: IGetSchedulePageUseCaseRepo,
+        logger: ILogger,
+        budget: int = DEFAULT_FAN_OUT_BUDGET,
+    ) -> None:
+        self._repo = repo
+        self._logger = logger
+        self._budget = budget
+
+    async def execute(self, user_id: uuid.UUID) -> SchedulePage:
+        """Returns data of schedule page of user with id `user_id`.
+
+        Reads are independent, so they run concurrently on up to
+        `budget` connections. They may go to different replicas and see
+        different snapshots, so page is not consistent snapshot of schedule:
+        e.g. show added to schedule meanwhile may be returned without progress.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+
+        Returns:
+            SchedulePage
+        """
+
+        logger = self._logger
+        repo = self._repo
+
+        logger.info(f"Start getting schedule page of user with id {user_id}")
+
+        shows, progress, episodes = await fan_out(
+            lambda: repo.get_shows_from_schedule(user_id),
+            lambda: repo.get_schedule_progress(user_id),
+            lambda: repo.get_first_unwatched_episodes_from_schedule(user_id),
+            budget=self._budget,
+        )
+
+        logger.info(f"Finish getting schedule page of user with id {user_id}")
+
+        return SchedulePage(
+            shows=shows, progress=progress, first_unwatched_episodes=episodes
+        )
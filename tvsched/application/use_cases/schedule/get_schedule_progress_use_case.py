@@ -0,0 +1,47 @@
+import uuid
+from typing import Protocol
+
+from tvsched.application.interfaces import ILogger
+from tvsched.entities.schedule import ShowProgress
+
+
+class IGetScheduleProgressUseCaseRepo(Protocol):
+    async def get_schedule_progress(self, user_id: uuid.UUID) -> list[ShowProgress]:
+        """Returns progress of watching each show from user schedule.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+
+        Returns:
+            list[ShowProgress]
+        """
+        ...  # fix return type error
+
+
+class GetScheduleProgressUseCase:
+    """Gets progress of watching shows from user schedule"""
+
+    def __init__(self, repo: IGetScheduleProgressUseCaseRepo, logger: ILogger) -> None:
+        self._repo = repo
+        self._logger = logger
+
+    async def execute(self, user_id: uuid.UUID) -> list[ShowProgress]:
+        """Returns progress of watching each show from user schedule
+        with user id `user_id`.
+
+        Args:
+            user_id (uuid.UUID): user schedule id
+
+        Returns:
+            list[ShowProgress]
+        """
+
+        logger = self._logger
+
+        logger.info(f"Start getting progress of schedule with user id {user_id}")
+
+        progress = await self._repo.get_schedule_progress(user_id)
+
+        logger.info(f"Finish getting progress of schedule with user id {user_id}")
+
+        return progress
@@ -0,0 +1,87 @@
+import datetime
+import uuid
+from typing import Optional, Protocol
+
+from tvsched.application.interfaces import ILogger
+from tvsched.entities.episode import Episode
+
+
+class IGetUpcomingEpisodesFromScheduleUseCaseRepo(Protocol):
+    """"""
+
+    async def get_upcoming_episodes_from_schedule(
+        self,
+        user_id: uuid.UUID,
+        starts_at: datetime.datetime,
+        ends_at: datetime.datetime,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> list[Episode]:
+        """Returns episodes of shows from user schedule which air
+        from `starts_at` (inclusive) to `ends_at` (exclusive) ordered by air date.
+
+        Args:
+            user_id (uuid.UUID): user schedule id
+            starts_at (datetime.datetime)
+            ends_at (datetime.datetime)
+            limit (Optional[int]): max number of episodes. If None all episodes will be returned
+            offset (Optional[int])
+
+        Returns:
+            list[Episode]
+        """
+
+        raise NotImplementedError
+
+
+class GetUpcomingEpisodesFromScheduleUseCase:
+    """Gets episodes of shows from schedule which air in the time window"""
+
+    def __init__(
+        self, repo: IGetUpcomingEpisodesFromScheduleUseCaseRepo, logger: ILogger
+    ) -> None:
+        self._repo = repo
+        self._logger = logger
+
+    async def execute(
+        self,
+        user_id: uuid.UUID,
+        period: datetime.timedelta = datetime.timedelta(days=7),
+        starts_at: Optional[datetime.datetime] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> list[Episode]:
+        """Returns episodes of shows from schedule which air
+        in `period` after `starts_at` ordered by air date.
+
+        Args:
+            user_id (uuid.UUID): user schedule id
+            period (datetime.timedelta): length of time window
+            starts_at (Optional[datetime.datetime]): start of time window.
+                If None current time will be used
+            limit (Optional[int]): max number of episodes. If None all episodes will be returned
+            offset (Optional[int])
+
+        Returns:
+            list[Episode]
+        """
+
+        logger = self._logger
+
+        if starts_at is None:
+            starts_at = datetime.datetime.now()
+        ends_at = starts_at + period
+
+        logger.info(
+            f"Start getting upcoming episodes from {starts_at} to {ends_at} in schedule with user id {user_id}. Offset - {offset}, limit - {limit}"
+        )
+
+        episodes = await self._repo.get_upcoming_episodes_from_schedule(
+            user_id, starts_at=starts_at, ends_at=ends_at, limit=limit, offset=offset
+        )
+
+        logger.info(
+            f"Finish getting upcoming episodes from {starts_at} to {ends_at} in schedule with user id {user_id}. Offset - {offset}, limit - {limit}"
+        )
+
+        return episodes
@@ -0,0 +1,81 @@
+import uuid
+from typing import Optional, Protocol
+
+from tvsched.application.interfaces import ILogger
+from tvsched.application.models.common import Versioned
+from tvsched.entities.show import Show
+
+
+class IGetVersionedShowsFromScheduleUseCaseRepo(Protocol):
+    async def get_schedule_version(self, user_id: uuid.UUID) -> str:
+        """Returns version stamp of shows from user schedule without loading them.
+
+        Args:
+            user_id (uuid.UUID): user schedule user id
+
+        Returns:
+            str: version stamp, changes on every change of shows in schedule
+                or of scheduled shows and their casts
+        """
+        ...  # fix return type error
+
+    async def get_shows_from_schedule(self, user_id: uuid.UUID) -> list[Show]:
+        """Returns list of shows from user schedule.
+
+        Args:
+            user_id (uuid.UUID): user schedule user user_id
+
+        Returns:
+            list[Show]
+        """
+        ...  # fix return type error
+
+
+class GetVersionedShowsFromScheduleUseCase:
+    """Gets shows from user schedule with version stamp if they were
+    modified since version known by client"""
+
+    def __init__(
+        self, repo: IGetVersionedShowsFromScheduleUseCaseRepo, logger: ILogger
+    ) -> None:
+        self._repo = repo
+        self._logger = logger
+
+    async def execute(
+        self, user_id: uuid.UUID, if_version: Optional[str] = None
+    ) -> Versioned[list[Show]]:
+        """Returns list of tv shows from user schedule with user id `user_id`
+        if version of schedule is not `if_version`.
+
+        Args:
+            user_id (uuid.UUID): user schedule id
+            if_version (Optional[str]): version of schedule known by client.
+                If None shows are always returned
+
+        Returns:
+            Versioned[list[Show]]: without shows if they were not modified
+        """
+
+        logger = self._logger
+
+        logger.info(
+            f"Start getting shows in schedule with user id {user_id} "
+            f"if not {if_version}"
+        )
+
+        version = await self._repo.get_schedule_version(user_id)
+        if version == if_version:
+            logger.info(
+                f"Finish getting shows in schedule with user id {user_id}. "
+                "Not modified"
+            )
+            return Versioned(version=version, entity=None)
+
+        shows = await self._repo.get_shows_from_schedule(user_id)
+
+        logger.info(
+            f"Finish getting shows in schedule with user id {user_id} "
+            f"of version {version}"
+        )
+
+        return Versioned(version=version, entity=shows)
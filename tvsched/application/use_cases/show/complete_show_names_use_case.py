@@ -0,0 +1,50 @@
+from typing import Protocol
+
+from tvsched.application.interfaces import ILogger
+from tvsched.application.models.common import NameCompletion
+
+
+class ICompleteShowNamesUseCaseRepo(Protocol):
+    async def complete_show_names(
+        self, prefix: str, limit: int
+    ) -> list[NameCompletion]:
+        """Returns names of the most popular shows with word starting with `prefix`.
+
+        Args:
+            prefix (str)
+            limit (int): max number of names
+
+        Returns:
+            list[NameCompletion]
+        """
+        ...  # fix return type error
+
+
+class CompleteShowNamesUseCase:
+    def __init__(self, repo: ICompleteShowNamesUseCaseRepo, logger: ILogger) -> None:
+        self._repo = repo
+        self._logger = logger
+
+    async def execute(self, prefix: str, limit: int = 10) -> list[NameCompletion]:
+        """Returns type-ahead completions of show names by descending popularity.
+
+        Args:
+            prefix (str): typed part of show name
+            limit (int): max number of names
+
+        Returns:
+            list[NameCompletion]
+        """
+
+        logger = self._logger
+
+        logger.info(f"Start completing show names. Prefix - {prefix}, limit - {limit}")
+
+        completions = await self._repo.complete_show_names(prefix, limit=limit)
+
+        logger.info(
+            f"Finish completing show names. Prefix - {prefix}, "
+            f"found - {len(completions)}"
+        )
+
+        return completions
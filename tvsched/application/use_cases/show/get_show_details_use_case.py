@@ -0,0 +1,65 @@
+import uuid
+from typing import Optional, Protocol
+
+from tvsched.application.exceptions.show import ShowNotFoundError
+from tvsched.application.interfaces import ILogger
+from tvsched.entities.show import ShowDetails
+
+
+class IGetShowDetailsUseCaseRepo(Protocol):
+    async def get_details(
+        self, show_id: int, user_id: Optional[uuid.UUID] = None
+    ) -> ShowDetails:
+        """Returns show with its cast and episodes grouped by seasons.
+
+        Args:
+            show_id (int)
+            user_id (Optional[uuid.UUID]): if not None ids of episodes
+                watched by user are returned too
+
+        Raises:
+            ShowNotFoundError: will be raised if show with id `show_id` not in repo
+
+        Returns:
+            ShowDetails
+        """
+        ...  # fix return type error
+
+
+class GetShowDetailsUseCase:
+    """Gets show with its cast and seasons of episodes"""
+
+    def __init__(self, repo: IGetShowDetailsUseCaseRepo, logger: ILogger) -> None:
+        self._repo = repo
+        self._logger = logger
+
+    async def execute(
+        self, show_id: int, user_id: Optional[uuid.UUID] = None
+    ) -> ShowDetails:
+        """Returns show with its cast and episodes grouped by seasons from repo.
+
+        Args:
+            show_id (int)
+            user_id (Optional[uuid.UUID]): user whose watched episodes are
+                returned. If None watched episodes are not returned
+
+        Raises:
+            ShowNotFoundError: will be raised if show with id `show_id` not in repo
+
+        Returns:
+            ShowDetails
+        """
+
+        logger = self._logger
+
+        logger.info(f"Start getting details of show with id {show_id} for {user_id}")
+
+        try:
+            details = await self._repo.get_details(show_id, user_id=user_id)
+        except ShowNotFoundError:
+            logger.info(f"Not found show with id {show_id}")
+            raise
+
+        logger.info(f"Finish getting details of show with id {show_id} for {user_id}")
+
+        return details
@@ -0,0 +1,49 @@
+from typing import Protocol, Sequence
+
+from tvsched.application.interfaces import ILogger
+from tvsched.application.models.common import EntitiesByIds
+from tvsched.entities.show import Show
+
+
+class IGetShowsByIdsUseCaseRepo(Protocol):
+    async def get_many(self, show_ids: Sequence[int]) -> EntitiesByIds[Show]:
+        """Returns shows from repo by `show_ids`.
+
+        Args:
+            show_ids (Sequence[int])
+
+        Returns:
+            EntitiesByIds[Show]: shows ordered as `show_ids` and ids of not found shows
+        """
+        ...  # fix return type error
+
+
+class GetShowsByIdsUseCase:
+    """Gets tv shows by list of ids with one repo call"""
+
+    def __init__(self, repo: IGetShowsByIdsUseCaseRepo, logger: ILogger) -> None:
+        self._repo = repo
+        self._logger = logger
+
+    async def execute(self, show_ids: Sequence[int]) -> EntitiesByIds[Show]:
+        """Returns tv shows from repo by `show_ids`.
+
+        Args:
+            show_ids (Sequence[int])
+
+        Returns:
+            EntitiesByIds[Show]: shows ordered as `show_ids` and ids of not found shows
+        """
+
+        logger = self._logger
+
+        logger.info(f"Start getting shows with ids {show_ids}")
+
+        shows = await self._repo.get_many(show_ids)
+
+        if shows.missing_ids:
+            logger.info(f"Not found shows with ids {shows.missing_ids}")
+
+        logger.info(f"Finish getting shows with ids {show_ids}")
+
+        return shows
@@ -0,0 +1,88 @@
+from typing import Optional, Protocol
+
+from tvsched.application.exceptions.show import ShowNotFoundError
+from tvsched.application.interfaces import ILogger
+from tvsched.application.models.common import Versioned
+from tvsched.entities.show import Show
+
+
+class IGetVersionedShowUseCaseRepo(Protocol):
+    async def get_version(self, show_id: int) -> str:
+        """Returns version stamp of show with id `show_id` without loading its cast.
+
+        Args:
+            show_id (int)
+
+        Raises:
+            ShowNotFoundError: will be raised if show with id `show_id` not in repo
+
+        Returns:
+            str: version stamp, changes on every update of show or its cast
+        """
+        ...  # fix return type error
+
+    async def get_versioned(self, show_id: int) -> Versioned[Show]:
+        """Returns show from repo by `show_id` with its version stamp.
+
+        Args:
+            show_id (show)
+
+        Raises:
+            ShowNotFoundError: will be raised if show with id `show_id` not in repo
+
+        Returns:
+            Versioned[Show]: version read together with show
+        """
+        ...  # fix return type error
+
+
+class GetVersionedShowUseCase:
+    """Gets show with its version stamp if it was modified since version
+    known by client"""
+
+    def __init__(self, repo: IGetVersionedShowUseCaseRepo, logger: ILogger) -> None:
+        self._repo = repo
+        self._logger = logger
+
+    async def execute(
+        self, show_id: int, if_version: Optional[str] = None
+    ) -> Versioned[Show]:
+        """Returns tv show from repo if its version is not `if_version`.
+
+        Version is compared without loading show. Returned show is read
+        together with its version, so returned version is always version
+        of returned show.
+
+        Args:
+            show_id (int)
+            if_version (Optional[str]): version of show known by client.
+                If None show is always returned
+
+        Raises:
+            ShowNotFound: raises if show with id `show_id` not in repo
+
+        Returns:
+            Versioned[Show]: without show if it was not modified
+        """
+
+        logger = self._logger
+
+        logger.info(f"Start getting show with id {show_id} if not {if_version}")
+
+        try:
+            if if_version is not None:
+                version = await self._repo.get_version(show_id)
+                if version == if_version:
+                    logger.info(f"Finish getting show with id {show_id}. Not modified")
+                    return Versioned(version=version, entity=None)
+
+            versioned_show = await self._repo.get_versioned(show_id)
+        except ShowNotFoundError:
+            logger.info(f"Not found show with id {show_id}")
+            raise
+
+        logger.info(
+            f"Finish getting show with id {show_id} of version {versioned_show.version}"
+        )
+
+        return versioned_show
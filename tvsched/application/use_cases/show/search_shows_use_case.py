@@ -0,0 +1,60 @@
+from typing import Protocol
+
+from tvsched.application.interfaces import ILogger
+from tvsched.entities.show import Show
+
+
+class ISearchShowsUseCaseRepo(Protocol):
+    async def search(
+        self, query: str, limit: int, include_cast: bool = False
+    ) -> list[Show]:
+        """Returns shows with name similar to `query` ordered by relevance.
+
+        Args:
+            query (str): words of show name, may contain typos
+            limit (int): max number of shows
+            include_cast (bool): if True shows with actor name
+                similar to `query` will be returned too
+
+        Returns:
+            list[Show]
+        """
+        ...  # fix return type error
+
+
+class SearchShowsUseCase:
+    def __init__(self, repo: ISearchShowsUseCaseRepo, logger: ILogger) -> None:
+        self._repo = repo
+        self._logger = logger
+
+    async def execute(
+        self, query: str, limit: int = 20, include_cast: bool = False
+    ) -> list[Show]:
+        """Returns shows with name similar to `query` ordered by relevance.
+
+        Args:
+            query (str): words of show name, may contain typos
+            limit (int): max number of shows
+            include_cast (bool): if True shows with actor name
+                similar to `query` will be returned too
+
+        Returns:
+            list[Show]: empty list if `query` is blank
+        """
+
+        logger = self._logger
+
+        query = " ".join(query.split())
+        if not query:
+            return []
+
+        logger.info(
+            f"Start searching shows. Query - {query}, limit - {limit}, "
+            f"include cast - {include_cast}"
+        )
+
+        shows = await self._repo.search(query, limit=limit, include_cast=include_cast)
+
+        logger.info(f"Finish searching shows. Query - {query}, found - {len(shows)}")
+
+        return shows
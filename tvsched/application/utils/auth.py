@@ -1,24 +1,37 @@
-import dataclasses
 import datetime
-from typing import Any
-
-import jwt
-from passlib.hash import bcrypt
+import hashlib
+import secrets
+import statistics
+import time
+from typing import Any, Optional
 
 from tvsched.application.models.auth import UserInToken
 
+# bcrypt cost factors supported by passlib
+MIN_PASSWORD_HASH_ROUNDS = 4
+MAX_PASSWORD_HASH_ROUNDS = 31
+
 
-def hash_password(password: str) -> str:
+def hash_password(password: str, rounds: Optional[int] = None) -> str:
     """Returns password hashed by bcrypt algorithm.
 
     Args:
         password (str)
+        rounds (Optional[int]): bcrypt cost factor,
+            if None passlib default is used
 
     Returns:
         str
     """
 
-    return bcrypt.hash(password)
+    # passlib and jwt are imported on first use, so importing use cases
+    # does not load bcrypt backend and crypto libraries
+    from passlib.hash import bcrypt
+
+    if rounds is None:
+        return bcrypt.hash(password)
+
+    return bcrypt.using(rounds=rounds).hash(password)
 
 
 def verify_password(password: str, password_hash: str) -> bool:
@@ -32,9 +45,71 @@ def verify_password(password: str, password_hash: str) -> bool:
         bool
     """
 
+    from passlib.hash import bcrypt
+
     return bcrypt.verify(password, password_hash)
 
 
+def password_hash_needs_update(password_hash: str, rounds: int) -> bool:
+    """Returns True if password hash was not made by bcrypt with `rounds` cost.
+
+    Args:
+        password_hash (str)
+        rounds (int): configured bcrypt cost factor
+
+    Returns:
+        bool
+    """
+
+    from passlib.hash import bcrypt
+
+    return bcrypt.using(rounds=rounds).needs_update(password_hash)
+
+
+def calibrate_password_hash_rounds(
+    target: datetime.timedelta,
+    min_rounds: int = MIN_PASSWORD_HASH_ROUNDS,
+    max_rounds: int = MAX_PASSWORD_HASH_ROUNDS,
+    samples: int = 5,
+) -> int:
+    """Returns max bcrypt cost whose verify on current machine fits `target`.
+
+    Every extra round doubles hashing time, so rounds are increased
+    one by one while verify with next round is expected to fit `target`.
+    `min_rounds` is returned if even it does not fit. Verify time of every
+    cost is median of `samples` measurements, so one slow or fast run
+    does not shift result.
+
+    Args:
+        target (datetime.timedelta): wanted verify latency
+        min_rounds (int)
+        max_rounds (int)
+        samples (int): number of verify measurements per cost
+
+    Returns:
+        int
+    """
+
+    target_seconds = target.total_seconds()
+    password = "calibration password"
+
+    rounds = min_rounds
+    while rounds < max_rounds:
+        password_hash = hash_password(password, rounds)
+        elapsed_samples = []
+        for _ in range(samples):
+            started_at = time.perf_counter()
+            verify_password(password, password_hash)
+            elapsed_samples.append(time.perf_counter() - started_at)
+        elapsed = statistics.median(elapsed_samples)
+
+        if elapsed * 2 > target_seconds:
+            break
+        rounds += 1
+
+    return rounds
+
+
 def create_access_token(
     payload: dict[str, Any],
     created_at: datetime.datetime,
@@ -57,6 +132,8 @@ def create_access_token(
         str: jwt token
     """
 
+    import jwt
+
     expires_at = created_at + expires_in
     payload = {**payload, "iat": created_at, "exp": expires_at}
     token = jwt.encode(payload, key, algorithm=algorithm)
@@ -85,7 +162,7 @@ def create_access_token_for_user(
     """
 
     user_id = str(user.id)
-    payload = {"user": {**dataclasses.asdict(user), "id": user_id}, "sub": user_id}
+    payload = {"user": {"id": user_id, "role": user.role}, "sub": user_id}
     token = create_access_token(
         payload,
         created_at=created_at,
@@ -95,3 +172,29 @@ def create_access_token_for_user(
     )
 
     return token
+
+
+def generate_refresh_token() -> str:
+    """Returns random url-safe refresh token with 256 bits of entropy.
+
+    Returns:
+        str
+    """
+
+    return secrets.token_urlsafe(32)
+
+
+def hash_refresh_token(token: str) -> str:
+    """Returns sha256 hex digest of refresh token.
+
+    Refresh tokens are random, so fast hash is enough to keep
+    stolen sessions table from being used as tokens.
+
+    Args:
+        token (str)
+
+    Returns:
+        str
+    """
+
+    return hashlib.sha256(token.encode()).hexdigest()
@@ -0,0 +1,58 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+# independent reads of one request run concurrently on up to this
+# number of connections, so one request can not drain connection pool
+DEFAULT_FAN_OUT_BUDGET = 4
+
+
+async def fan_out(
+    *calls: Callable[[], Awaitable[Any]], budget: int = DEFAULT_FAN_OUT_BUDGET
+) -> list[Any]:
+    """Runs independent repo calls concurrently and returns their results.
+
+    At most `budget` calls run at once. Repos with pooled connections
+    run every call on its own connection. Errors do not depend on
+    which call finishes first: all calls are awaited and exception of
+    the first failed call in order of `calls` is raised as is,
+    so domain exceptions reach callers unchanged.
+
+    Example:
+        >>> async def one() -> int:
+        ...     return 1
+        >>> async def fail() -> int:
+        ...     raise KeyError("fail")
+        >>> asyncio.run(fan_out(one, lambda: asyncio.sleep(0, 2)))
+        [1, 2]
+        >>> asyncio.run(fan_out(one, fail))
+        Traceback (most recent call last):
+        ...
+        KeyError: 'fail'
+
+    Args:
+        calls (Callable[[], Awaitable[Any]]): functions starting repo calls
+        budget (int): max number of concurrent calls
+
+    Raises:
+        ValueError: will be raised if `budget` is less than 1
+
+    Returns:
+        list[Any]: results ordered as `calls`
+    """
+
+    if budget < 1:
+        raise ValueError(f"Fan-out budget must be positive, got {budget}")
+
+    semaphore = asyncio.Semaphore(budget)
+
+    async def run(call: Callable[[], Awaitable[Any]]) -> Any:
+        async with semaphore:
+            return await call()
+
+    results = await asyncio.gather(*(run(c) for c in calls), return_exceptions=True)
+
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+    return results
@@ -0,0 +1,198 @@
+import calendar
+import datetime
+import json
+import uuid
+from typing import Any, Mapping, Union
+
+from tvsched.application.exceptions.auth import InvalidAccessTokenError
+from tvsched.application.models.auth import UserInToken
+from tvsched.entities.auth import Role
+
+# payload of `create_access_token_for_user` serialized without spaces,
+# so tokens of issuer and of function decode to equal claims
+PAYLOAD_TEMPLATE = '{"user":{"id":"%s","role":%s},"sub":"%s","iat":%d,"exp":%d}'
+
+
+class TokenIssuer:
+    """Issues jwt access tokens for users with preloaded signing keys.
+
+    Keys are parsed and checked once, when they are loaded, instead of
+    on every `jwt.encode` call. Header of token is encoded once per key
+    and payload is filled into template, so issuing token costs one
+    signature. Tokens carry id of signing key in `kid` header, so after
+    rotation tokens signed with previous keys are valid until the key
+    is retired.
+    """
+
+    def __init__(
+        self,
+        keys: Mapping[str, Union[str, bytes]],
+        current_key_id: str,
+        algorithm: str,
+        expires_in: datetime.timedelta,
+    ) -> None:
+        """
+        Args:
+            keys (Mapping[str, Union[str, bytes]]): signing keys by key ids,
+                private keys in PEM format for asymmetric algorithms
+            current_key_id (str): id of key signing new tokens
+            algorithm (str): jwt algorithm
+            expires_in (datetime.timedelta): token life time
+
+        Raises:
+            ValueError: will be raised if algorithm is not supported
+                or `current_key_id` not in `keys`
+            InvalidKeyError: will be raised if key does not fit algorithm
+        """
+
+        # jwt is imported on first use, see `tvsched.application.utils.auth`
+        from jwt.algorithms import get_default_algorithms
+
+        algorithms = get_default_algorithms()
+        if algorithm not in algorithms or algorithm == "none":
+            raise ValueError(f"Unsupported jwt algorithm {algorithm}")
+        if current_key_id not in keys:
+            raise ValueError(f"Not found current key with id {current_key_id}")
+
+        self._algorithm = algorithm
+        self._signer = algorithms[algorithm]
+        self._expires_in = int(expires_in.total_seconds())
+        self._roles = {role: json.dumps(role.value) for role in Role}
+        self._signing_keys: dict[str, Any] = {}
+        self._verifying_keys: dict[str, Any] = {}
+        self._headers: dict[str, bytes] = {}
+
+        for key_id, key in keys.items():
+            self._load_key(key_id, key)
+
+        self._current_key_id = current_key_id
+
+    @property
+    def current_key_id(self) -> str:
+        return self._current_key_id
+
+    def issue(self, user: UserInToken, created_at: datetime.datetime) -> str:
+        """Creates access token for user signed by current key.
+
+        Adds iat, exp claims like `create_access_token_for_user`.
+
+        Args:
+            user (UserInToken): data about user
+            created_at (datetime.datetime): date of creation token
+
+        Returns:
+            str: jwt token
+        """
+
+        from jwt.utils import base64url_encode
+
+        key_id = self._current_key_id
+        user_id = str(user.id)
+        issued_at = calendar.timegm(created_at.utctimetuple())
+        payload = PAYLOAD_TEMPLATE % (
+            user_id,
+            self._roles[user.role],
+            user_id,
+            issued_at,
+            issued_at + self._expires_in,
+        )
+
+        signing_input = (
+            self._headers[key_id] + b"." + base64url_encode(payload.encode())
+        )
+        signature = self._signer.sign(signing_input, self._signing_keys[key_id])
+
+        return (signing_input + b"." + base64url_encode(signature)).decode()
+
+    def decode(self, token: str) -> UserInToken:
+        """Returns user from access token signed by one of loaded keys.
+
+        Args:
+            token (str): jwt token
+
+        Raises:
+            InvalidAccessTokenError: will be raised if token is malformed,
+                expired or signed by unknown key
+
+        Returns:
+            UserInToken
+        """
+
+        import jwt
+
+        try:
+            key_id = jwt.get_unverified_header(token).get("kid")
+            key = self._verifying_keys.get(key_id)
+            if key is None:
+                raise InvalidAccessTokenError()
+
+            payload = jwt.decode(token, key, algorithms=[self._algorithm])
+            user = payload["user"]
+
+            return UserInToken(id=uuid.UUID(user["id"]), role=Role(user["role"]))
+        except (jwt.InvalidTokenError, KeyError, TypeError, ValueError) as e:
+            raise InvalidAccessTokenError() from e
+
+    def rotate(self, key_id: str, key: Union[str, bytes]) -> None:
+        """Loads key and signs new tokens with it.
+
+        Tokens signed by previous keys stay valid until keys are retired.
+
+        Args:
+            key_id (str)
+            key (Union[str, bytes])
+
+        Raises:
+            InvalidKeyError: will be raised if key does not fit algorithm
+        """
+
+        self._load_key(key_id, key)
+        self._current_key_id = key_id
+
+    def retire(self, key_id: str) -> None:
+        """Unloads key, so tokens signed by it are not valid anymore.
+
+        Args:
+            key_id (str)
+
+        Raises:
+            ValueError: will be raised if key signs new tokens
+        """
+
+        if key_id == self._current_key_id:
+            raise ValueError(f"Can not retire current key with id {key_id}")
+
+        self._signing_keys.pop(key_id, None)
+        self._verifying_keys.pop(key_id, None)
+        self._headers.pop(key_id, None)
+
+    def _load_key(self, key_id: str, key: Union[str, bytes]) -> None:
+        from jwt.exceptions import InvalidKeyError
+        from jwt.utils import base64url_encode
+
+        signer = self._signer
+        # checks that key can sign, e.g. public key is not passed instead
+        # of private one, and that signature is verified by derived key
+        probe = b"probe"
+        try:
+            signing_key = signer.prepare_key(key)
+            # private keys of asymmetric algorithms verify with their public keys
+            public_key = getattr(signing_key, "public_key", None)
+            verifying_key = public_key() if public_key is not None else signing_key
+            verified = signer.verify(
+                probe, verifying_key, signer.sign(probe, signing_key)
+            )
+        except InvalidKeyError:
+            raise
+        except (AttributeError, TypeError, ValueError) as e:
+            raise InvalidKeyError(f"Key with id {key_id} can not sign tokens") from e
+
+        if not verified:
+            raise ValueError(f"Key with id {key_id} does not verify own signature")
+
+        header = {"alg": self._algorithm, "kid": key_id, "typ": "JWT"}
+        header_json = json.dumps(header, separators=(",", ":"), sort_keys=True)
+
+        self._signing_keys[key_id] = signing_key
+        self._verifying_keys[key_id] = verifying_key
+        self._headers[key_id] = base64url_encode(header_json.encode())
@@ -0,0 +1,35 @@
+import datetime
+import enum
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+
+class DeletionTargetKind(str, enum.Enum):
+    """Kind of entity deleted by deletion job."""
+
+    SHOW = "SHOW"
+    USER = "USER"
+
+
+@dataclass(frozen=True)
+class DeletionJob:
+    """Progress of background deletion of show or user with dependent data.
+
+    Job runs `steps_count` steps, every step deletes one kind of dependent
+    rows in chunks. `finished_at` is None until all steps are done.
+    """
+
+    id: int
+    kind: DeletionTargetKind
+    show_id: Optional[int]
+    user_id: Optional[uuid.UUID]
+    step: int
+    steps_count: int
+    deleted_rows: int
+    created_at: datetime.datetime
+    finished_at: Optional[datetime.datetime]
+
+    @property
+    def finished(self) -> bool:
+        return self.finished_at is not None
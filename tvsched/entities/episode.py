@@ -12,3 +12,21 @@ class Episode:
     number: int
     air_date: datetime.datetime
     show_id: int
+
+
+@dataclass(frozen=True)
+class Season:
+    """Episodes of TV show season ordered by number"""
+
+    number: int
+    episodes: list[Episode]
+
+
+@dataclass(frozen=True)
+class SeasonSummary:
+    """Number of episodes of TV show season and range of their air dates"""
+
+    number: int
+    episodes_count: int
+    first_air_date: datetime.datetime
+    last_air_date: datetime.datetime
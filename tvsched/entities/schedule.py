@@ -0,0 +1,62 @@
+import datetime
+import enum
+from dataclasses import dataclass
+from typing import Optional
+
+from tvsched.entities.show import Show
+
+
+@dataclass(frozen=True)
+class ShowProgress:
+    """Progress of watching show from user schedule."""
+
+    show_id: int
+    watched_count: int
+    total_count: int
+    next_episode_id: Optional[int]
+
+
+@dataclass(frozen=True)
+class SuggestedShows:
+    """Suggested shows precomputed for user schedule.
+
+    `computed_at` is None if suggestions were not computed yet.
+    """
+
+    shows: list[Show]
+    computed_at: Optional[datetime.datetime]
+
+
+class ScheduleChangeKind(str, enum.Enum):
+    """Kind of change of user schedule."""
+
+    SHOW = "SHOW"
+    WATCHED_EPISODE = "WATCHED_EPISODE"
+
+
+@dataclass(frozen=True)
+class ScheduleChange:
+    """Latest change of show in user schedule or of watched episode.
+
+    `deleted` is True if show was deleted from schedule
+    or episode was marked as unwatched.
+    """
+
+    kind: ScheduleChangeKind
+    target_id: int
+    version: int
+    deleted: bool
+
+
+@dataclass(frozen=True)
+class ScheduleChanges:
+    """Changes of user schedule after client cursor.
+
+    `version` is cursor for the next sync. If `reset` is True, changes
+    after cursor were compacted and `changes` contain whole schedule state
+    which replaces state of client.
+    """
+
+    version: int
+    reset: bool
+    changes: list[ScheduleChange]
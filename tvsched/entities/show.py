@@ -1,6 +1,8 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from tvsched.entities.actor import Actor
+from tvsched.entities.episode import Season
 
 
 @dataclass(frozen=True)
@@ -12,3 +14,16 @@ class Show:
     seasons_count: int
     image_url: str
     cast: list[Actor]
+
+
+@dataclass(frozen=True)
+class ShowDetails:
+    """TV show with its cast and episodes grouped by seasons.
+
+    `watched_episode_ids` are ids of episodes of show watched by user,
+    None if they were not requested.
+    """
+
+    show: Show
+    seasons: list[Season]
+    watched_episode_ids: Optional[list[int]]